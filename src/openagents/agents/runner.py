@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
 import asyncio
+from collections import deque
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from openagents.agents.orchestrator import orchestrate_agent
 from openagents.config.llm_configs import (
@@ -21,12 +23,19 @@ from openagents.models.event import Event
 from openagents.models.event_context import EventContext
 from openagents.models.tool import AgentTool
 from openagents.core.client import AgentClient
+from openagents.core.dedup_window import EventDedupWindow
 from openagents.utils.mod_loaders import load_mod_adapters
 from openagents.utils.verbose import verbose_print
 from openagents.models.event_response import EventResponse
 
 logger = logging.getLogger(__name__)
 
+# Number of dequeued events that may wait for a worker, per unit of max_concurrency
+PENDING_EVENTS_PER_WORKER = 4
+
+# Number of recently dequeued event IDs remembered to skip redelivered events
+PROCESSED_EVENT_WINDOW_SIZE = 10000
+
 
 class AgentRunner(ABC):
     """Base class for agent runners in OpenAgents.
@@ -45,6 +54,8 @@ class AgentRunner(ABC):
         client: Optional[AgentClient] = None,
         interval: Optional[int] = 1,
         ignored_sender_ids: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        sender_rate_limit: Optional[float] = None,
     ):
         """Initialize the agent runner.
 
@@ -55,6 +66,8 @@ class AgentRunner(ABC):
             client: Agent client to use for the agent. Optional, if provided, the runner will use the client to obtain required mod adapters.
             interval: Interval in seconds between checking for new messages.
             ignored_sender_ids: List of sender IDs to ignore.
+            max_concurrency: Maximum number of events reacted to in parallel. Events in the same thread are always processed in order. Optional, defaults to the agent config value or 1.
+            sender_rate_limit: Maximum number of reactions per second to events from the same sender. Optional, defaults to the agent config value (unlimited if not set).
 
         Note:
             Either mod_names or mod_adapters should be provided, not both.
@@ -69,12 +82,34 @@ class AgentRunner(ABC):
         self._custom_tools = []
         self._supported_mods = None
         self._running = False
-        self._processed_message_ids = set()
+        self._processed_message_ids = EventDedupWindow(
+            max_size=PROCESSED_EVENT_WINDOW_SIZE
+        )
+        # Per-thread views of the dequeued events, shared with EventContext
+        self._thread_views: Dict[str, EventThread] = {}
         self._interval = interval
         self._agent_config = agent_config
         self._ignored_sender_ids = (
             set(ignored_sender_ids) if ignored_sender_ids is not None else set()
         )
+
+        # Concurrent event processing: one worker per busy thread, bounded by a semaphore
+        if max_concurrency is None:
+            max_concurrency = agent_config.max_concurrency if agent_config else 1
+        if sender_rate_limit is None and agent_config:
+            sender_rate_limit = agent_config.sender_rate_limit
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._max_concurrency = max_concurrency
+        self._sender_rate_limit = sender_rate_limit
+        self._react_semaphore: Optional[asyncio.Semaphore] = None
+        self._pending_slots: Optional[asyncio.Semaphore] = None
+        # Queued events with the length of their thread when they were dequeued; the
+        # offsets count the events trimmed from each view so that length stays valid
+        self._thread_backlogs: Dict[str, Deque[Tuple[Event, int]]] = {}
+        self._thread_view_offsets: Dict[str, int] = {}
+        self._thread_workers: Dict[str, asyncio.Task] = {}
+        self._sender_next_reaction: Dict[str, float] = {}
         
         # MCP (Model Context Protocol) client management
         self._mcp_connector = MCPConnector()
@@ -425,141 +460,55 @@ class AgentRunner(ABC):
         This is the internal async implementation that should not be called directly.
         """
         # print(f"🔄 Agent loop starting for {self._agent_id}...")
+        # Events are delivered through a timestamp-ordered queue fed by the client,
+        # so each event costs O(1) to pick up regardless of the thread history
+        event_queue = self.client.open_event_queue()
         try:
             while self._running:
-                # Get all message threads from the client
-                event_threads = self.client.get_event_threads()
-                logger.debug(
-                    f"🔍 AGENT_RUNNER: Checking for messages... Found {len(event_threads)} threads"
-                )
+                unprocessed_message = event_queue.pop()
+                if unprocessed_message is None:
+                    await event_queue.wait(timeout=self._interval or 1)
+                    # print("😴 No unprocessed messages found, sleeping...")
+                    continue
 
-                # Find the first unprocessed message across all threads
-                unprocessed_message = None
-                unprocessed_thread_id = None
-                earliest_timestamp = float("inf")
-
-                total_messages = 0
-                unprocessed_count = 0
-
-                for thread_id, thread in event_threads.items():
-                    # Only log thread summary once when messages change, not on every poll
-                    for message in thread.events:
-                        total_messages += 1
-                        # Check if message hasn't been processed (regardless of requires_response)
-                        message_id = str(message.message_id)
-                        if message_id not in self._processed_message_ids:
-                            unprocessed_count += 1
-                            # Find the earliest unprocessed message by timestamp
-                            if message.timestamp < earliest_timestamp:
-                                earliest_timestamp = message.timestamp
-                                unprocessed_message = message
-                                unprocessed_thread_id = thread_id
-
-                # print(f"📊 Total messages: {total_messages}, Unprocessed: {unprocessed_count}")
-
-                # If we found an unprocessed message, process it
-                if unprocessed_message and unprocessed_thread_id:
-                    # Get message payload for better logging
-                    import json
-                    msg_payload_preview = "None"
-                    if hasattr(unprocessed_message, 'payload') and unprocessed_message.payload:
-                        try:
-                            payload_str = json.dumps(unprocessed_message.payload, indent=2, default=str)
-                            if len(payload_str) > 300:
-                                msg_payload_preview = payload_str[:300] + "..."
-                            else:
-                                msg_payload_preview = payload_str
-                        except:
-                            msg_payload_preview = str(unprocessed_message.payload)[:300]
-
-                    event_name = getattr(unprocessed_message, 'event_name', 'unknown')
-                    destination_id = getattr(unprocessed_message, 'destination_id', None)
-
-                    # Commented out - too verbose for normal operation
-                    # # Print colored box for event processing
-                    # from openagents.utils.cli_display import print_box
-                    #
-                    # lines = [
-                    #     f"Event:  {event_name}",
-                    #     f"Source: {unprocessed_message.source_id}",
-                    #     f"Target: {destination_id or 'None'}",
-                    #     "─" * 66,  # Separator
-                    # ]
-                    #
-                    # # Add payload lines
-                    # for line in msg_payload_preview.split('\n'):
-                    #     lines.append(line)
-                    #
-                    # print_box("🎯 AGENT PROCESSING EVENT", lines, color_code="\033[94m")
-
-                    # Mark the message as processed to avoid processing it again
-                    self._processed_message_ids.add(str(unprocessed_message.message_id))
-
-                    # Skip system events (system.*) - these are internal and should not trigger orchestration
-                    if event_name.startswith("system."):
-                        logger.debug(f"⏭️  Skipping system event: {event_name}")
-                        continue
-
-                    # Skip events sent by this agent itself - avoid self-reaction loops
-                    if unprocessed_message.source_id == self.agent_id:
-                        logger.debug(f"⏭️  Skipping self-sent event from {self.agent_id}")
-                        continue
-
-                    # If the sender is in the ignored list, skip the message
-                    if unprocessed_message.source_id in self._ignored_sender_ids:
-                        # print(f"⏭️  Skipping message from ignored sender {unprocessed_message.source_id}")
-                        continue
-
-                    # Create a copy of conversation threads that doesn't include future messages
-                    # But always include the agent's own messages so it can see what it said
-                    # Also exclude system threads (thread:system) - these contain internal events/logs
-                    current_time = unprocessed_message.timestamp
-                    filtered_threads = {}
-
-                    for thread_id, thread in event_threads.items():
-                        # Skip system threads - they contain internal events and logs, not for agent prompts
-                        if thread_id.startswith("thread:system"):
-                            continue
-
-                        # Create a new thread with only messages up to the current message's timestamp
-                        # Exception: always include agent's own messages regardless of timestamp
-                        # This ensures the agent can see its own previous responses in the conversation
-                        filtered_thread = EventThread()
-                        filtered_thread.events = [
-                            msg
-                            for msg in thread.events
-                            if msg.timestamp <= current_time or msg.source_id == self.agent_id
-                        ]
-                        filtered_threads[thread_id] = filtered_thread
+                # Mark the message as processed to avoid processing it again; an
+                # event requeued after a dropped stream can be delivered twice
+                message_id = str(unprocessed_message.message_id)
+                if self._processed_message_ids.check_and_add(message_id):
+                    continue
+
+                unprocessed_thread_id = unprocessed_message.thread_name
+                self._add_to_thread_view(unprocessed_message)
 
-                    # Apply reaction delay if configured
-                    if self._agent_config and self._agent_config.reaction_delay:
-                        delay = self._agent_config.get_reaction_delay()
-                        if delay > 0:
-                            print(f"⏳ Applying reaction delay: {delay:.2f}s")
-                            await asyncio.sleep(delay)
+                event_name = getattr(unprocessed_message, 'event_name', 'unknown')
 
+                # Skip system events (system.*) - these are internal and should not trigger orchestration
+                if event_name.startswith("system."):
+                    logger.debug(f"⏭️  Skipping system event: {event_name}")
+                    continue
+
+                # Skip events sent by this agent itself - avoid self-reaction loops
+                if unprocessed_message.source_id == self.agent_id:
+                    logger.debug(f"⏭️  Skipping self-sent event from {self.agent_id}")
+                    continue
+
+                # If the sender is in the ignored list, skip the message
+                if unprocessed_message.source_id in self._ignored_sender_ids:
+                    # print(f"⏭️  Skipping message from ignored sender {unprocessed_message.source_id}")
+                    continue
+
+                if self._max_concurrency == 1:
                     # Create EventContext and call react
                     context = EventContext(
                         incoming_event=unprocessed_message,
-                        event_threads=filtered_threads,
+                        event_threads=self._thread_views,
                         incoming_thread_id=unprocessed_thread_id,
                     )
-                    print(f"🔧 AGENT_RUNNER: Calling react method for event {event_name}")
-                    
-                    import time
-                    start_time = time.time()
-                    await self.react(context)
-                    elapsed = time.time() - start_time
-                    
-                    print(f"✅ AGENT RESPONSE COMPLETED: {unprocessed_message.message_id[:8]}")
-                    print(f"   Processing time: {elapsed:.2f}s")
-                    if elapsed > 1.0:
-                        print(f"   🤖 LLM API call detected (response time > 1s)")
-                    print(f"   Message marked as processed")
+                    await self._process_context(context)
                 else:
-                    await asyncio.sleep(self._interval or 1)
-                    # print("😴 No unprocessed messages found, sleeping...")
+                    # Wait for a free slot so the backlogs cannot outgrow the workers
+                    await self._acquire_pending_slot()
+                    self._dispatch_event(unprocessed_message, unprocessed_thread_id)
 
         except Exception as e:
             verbose_print(f"💥 Agent loop interrupted by exception: {e}")
@@ -571,6 +520,149 @@ class AgentRunner(ABC):
             await self._async_stop()
             # Re-raise the exception after cleanup
             raise
+        finally:
+            self.client.close_event_queue(event_queue)
+            for worker in list(self._thread_workers.values()):
+                worker.cancel()
+
+    async def _process_context(self, context: EventContext) -> None:
+        """Apply the configured delays to an event and call react."""
+        message = context.incoming_event
+        event_name = message.event_name
+
+        if self._sender_rate_limit:
+            await self._wait_for_sender_slot(message.source_id)
+
+        # Apply reaction delay if configured
+        if self._agent_config and self._agent_config.reaction_delay:
+            delay = self._agent_config.get_reaction_delay()
+            if delay > 0:
+                print(f"⏳ Applying reaction delay: {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+        print(f"🔧 AGENT_RUNNER: Calling react method for event {event_name}")
+
+        start_time = time.time()
+        if self._react_semaphore is None:
+            await self.react(context)
+        else:
+            async with self._react_semaphore:
+                await self.react(context)
+        elapsed = time.time() - start_time
+
+        print(f"✅ AGENT RESPONSE COMPLETED: {message.message_id[:8]}")
+        print(f"   Processing time: {elapsed:.2f}s")
+        if elapsed > 1.0:
+            print(f"   🤖 LLM API call detected (response time > 1s)")
+        print(f"   Message marked as processed")
+
+    async def _wait_for_sender_slot(self, sender_id: str) -> None:
+        """Delay a reaction until the sender is within its rate limit."""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._sender_next_reaction.get(sender_id, now))
+        self._sender_next_reaction[sender_id] = slot + 1.0 / self._sender_rate_limit
+        if slot > now:
+            logger.debug(f"Rate limiting events from {sender_id} for {slot - now:.2f}s")
+            await asyncio.sleep(slot - now)
+
+    async def _acquire_pending_slot(self) -> None:
+        """Wait until fewer than the allowed number of events are queued for workers."""
+        if self._pending_slots is None:
+            # Created here so the semaphores are bound to the running loop
+            self._react_semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._pending_slots = asyncio.Semaphore(
+                self._max_concurrency * PENDING_EVENTS_PER_WORKER
+            )
+        await self._pending_slots.acquire()
+
+    def _dispatch_event(self, event: Event, thread_id: str) -> None:
+        """Queue an event for its thread's worker, starting the worker if idle.
+
+        Only the length of the event's thread is recorded, so queueing an event
+        does not copy the thread views.
+        """
+        view = self._thread_views.get(thread_id)
+        cutoff = self._thread_view_offsets.get(thread_id, 0) + (
+            len(view.events) if view is not None else 0
+        )
+        self._thread_backlogs.setdefault(thread_id, deque()).append((event, cutoff))
+        if thread_id not in self._thread_workers:
+            self._thread_workers[thread_id] = asyncio.create_task(
+                self._run_thread_worker(thread_id)
+            )
+
+    async def _run_thread_worker(self, thread_id: str) -> None:
+        """Process the queued events of a thread one at a time, in order."""
+        backlog = self._thread_backlogs[thread_id]
+        try:
+            while backlog:
+                event, cutoff = backlog.popleft()
+                try:
+                    await self._process_context(
+                        self._make_thread_context(event, thread_id, cutoff)
+                    )
+                except Exception as e:
+                    # Keep the other threads and the rest of this thread going
+                    logger.error(
+                        f"Error reacting to event {event.event_id} in {thread_id}: {e}"
+                    )
+                    import traceback
+
+                    traceback.print_exc()
+                finally:
+                    self._pending_slots.release()
+        finally:
+            self._thread_backlogs.pop(thread_id, None)
+            self._thread_workers.pop(thread_id, None)
+
+    def _make_thread_context(
+        self, event: Event, thread_id: str, cutoff: int
+    ) -> EventContext:
+        """Build the context of an event reacted to by a thread worker.
+
+        Later events of the same thread may have been dequeued since, so the
+        event's own thread is cut at the length it had when the event arrived.
+        The other threads are handed over as their live views.
+        """
+        event_threads = dict(self._thread_views)
+        view = event_threads.get(thread_id)
+        if view is not None:
+            end = max(cutoff - self._thread_view_offsets.get(thread_id, 0), 0)
+            if end < len(view.events):
+                event_threads[thread_id] = EventThread.model_construct(
+                    events=view.events[:end]
+                )
+        return EventContext(
+            incoming_event=event,
+            event_threads=event_threads,
+            incoming_thread_id=thread_id,
+        )
+
+    def _add_to_thread_view(self, event: Event) -> None:
+        """Add a dequeued event to the thread views handed to EventContext.
+
+        The views only grow as events are dequeued in timestamp order, so they
+        hold the messages up to the event being processed without copying the
+        threads for every event. System threads (thread:system*) contain internal
+        events and logs and are kept out of agent prompts.
+        """
+        thread_id = event.thread_name
+        if thread_id is None or thread_id.startswith("thread:system"):
+            return
+        if thread_id not in self._thread_views:
+            self._thread_views[thread_id] = EventThread()
+        view = self._thread_views[thread_id]
+        view.add_event(event)
+
+        # Keep the views within the client's per-thread retention limits
+        min_timestamp = None
+        if self.client.max_event_age is not None:
+            min_timestamp = time.time() - self.client.max_event_age
+        evicted = view.trim(self.client.max_events_per_thread, min_timestamp)
+        if evicted:
+            self._thread_view_offsets[thread_id] = self._thread_view_offsets.get(
+                thread_id, 0
+            ) + len(evicted)
 
     async def _async_start(
         self,
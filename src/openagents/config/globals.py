@@ -38,6 +38,10 @@ DEFAULT_TRANSPORT_ADDRESS = {
 DEFAULT_CLIENT_TIMEOUT = 30.0
 DEFAULT_MAX_MESSAGE_SIZE = 104857600  # 100MB
 
+# Client-side event retention
+DEFAULT_MAX_EVENTS_PER_THREAD = 1000
+DEFAULT_MAX_CACHED_EVENTS = 20000
+
 # Workspace defaults
 DEFAULT_WORKSPACE_CLIENT_PREFIX = "workspace-client"
 
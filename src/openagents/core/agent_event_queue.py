@@ -0,0 +1,127 @@
+"""
+Bounded per-agent event queue for OpenAgents.
+
+This module provides the queue the event gateway uses to hold events pending
+delivery to an agent. The queue is bounded so a stalled agent cannot grow memory
+without limit; what happens to new events once it is full is decided by a
+QueueOverflowPolicy.
+"""
+
+import asyncio
+import logging
+from typing import Iterable
+
+from openagents.core.event_envelope import EventEnvelope
+from openagents.models.network_config import QueueOverflowPolicy
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of AgentEventQueue.offer
+QUEUED = "queued"
+DROPPED_OLDEST = "dropped_oldest"
+DROPPED_NEWEST = "dropped_newest"
+COALESCED = "coalesced"
+REJECTED = "rejected"
+
+# Event metadata key identifying events that supersede each other under the coalesce policy
+COALESCE_KEY = "coalesce_key"
+
+
+class AgentEventQueue(asyncio.Queue):
+    """
+    asyncio.Queue of event envelopes for one agent with a size limit and overflow policy.
+
+    The underlying asyncio.Queue is unbounded so ``put`` never blocks the gateway on
+    a slow agent; ``max_size`` is enforced by ``offer`` instead:
+
+    - ``drop_oldest``: discard the oldest queued event to make room
+    - ``drop_newest``: discard the incoming event
+    - ``coalesce``: replace the newest queued event with the same ``coalesce_key``
+      metadata value in place, otherwise discard the oldest queued event
+    - ``reject``: discard the incoming event and report it so the sender gets an error
+    """
+
+    def __init__(
+        self,
+        max_size: int = 0,
+        overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.DROP_OLDEST,
+    ):
+        """Initialize the queue.
+
+        Args:
+            max_size: Maximum number of queued events, 0 for unbounded
+            overflow_policy: What to do with new events once the queue is full
+        """
+        super().__init__()
+        self.max_size = max_size
+        self.overflow_policy = QueueOverflowPolicy(overflow_policy)
+        self.overflow_counts = {
+            DROPPED_OLDEST: 0,
+            DROPPED_NEWEST: 0,
+            COALESCED: 0,
+            REJECTED: 0,
+        }
+
+    def is_full(self) -> bool:
+        """Whether the queue has reached max_size."""
+        return 0 < self.max_size <= self.qsize()
+
+    def offer(self, envelope: EventEnvelope) -> str:
+        """Queue an event envelope, applying the overflow policy if the queue is full.
+
+        Args:
+            envelope: The envelope to queue
+
+        Returns:
+            str: QUEUED, or the overflow outcome (DROPPED_OLDEST, DROPPED_NEWEST,
+                COALESCED or REJECTED)
+        """
+        if not self.is_full():
+            self.put_nowait(envelope)
+            return QUEUED
+
+        if self.overflow_policy == QueueOverflowPolicy.DROP_NEWEST:
+            outcome = DROPPED_NEWEST
+        elif self.overflow_policy == QueueOverflowPolicy.REJECT:
+            outcome = REJECTED
+        elif (
+            self.overflow_policy == QueueOverflowPolicy.COALESCE
+            and self._coalesce(envelope)
+        ):
+            outcome = COALESCED
+        else:
+            # Drop the oldest event; it has been waiting longest and is most likely stale
+            self.get_nowait()
+            self.put_nowait(envelope)
+            outcome = DROPPED_OLDEST
+
+        self.overflow_counts[outcome] += 1
+        return outcome
+
+    def requeue(self, envelopes: Iterable[EventEnvelope]) -> None:
+        """Put envelopes taken from the queue back at its front, keeping their order.
+
+        Used when taken events could not be handed to the agent. The envelopes were
+        already admitted once, so max_size and the overflow policy do not apply.
+
+        Args:
+            envelopes: The envelopes to put back, oldest first
+        """
+        envelopes = list(envelopes)
+        self._queue.extendleft(reversed(envelopes))
+        for _ in envelopes:
+            self._unfinished_tasks += 1
+            self._finished.clear()
+            self._wakeup_next(self._getters)
+
+    def _coalesce(self, envelope: EventEnvelope) -> bool:
+        """Replace the newest queued event sharing the event's coalesce key."""
+        key = (envelope.event.metadata or {}).get(COALESCE_KEY)
+        if key is None:
+            return False
+        for index in range(len(self._queue) - 1, -1, -1):
+            queued = self._queue[index]
+            if (queued.event.metadata or {}).get(COALESCE_KEY) == key:
+                self._queue[index] = envelope
+                return True
+        return False
@@ -3,6 +3,7 @@ from typing import (
     Callable,
     Dict,
     Any,
+    Iterable,
     Optional,
     List,
     Set,
@@ -24,9 +25,13 @@ if TYPE_CHECKING:
     from openagents.models.tool import AgentTool
 from openagents.models.event_response import EventResponse
 from openagents.models.messages import Event, EventNames
+from openagents.models.event import event_name_matches_pattern
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of event names whose matching handlers are cached per mod
+MAX_DISPATCH_CACHE_SIZE = 4096
+
 
 def mod_event_handler(pattern: str):
     """
@@ -102,6 +107,8 @@ class BaseMod(ABC):
         self._network = None  # Will be set when registered with a network
         self._config = {}
         self._event_handlers: List[EventHandlerEntry] = []
+        # event name -> handlers matching it, in registration order
+        self._handler_cache: Dict[str, List[EventHandlerEntry]] = {}
         self._workspace_manager = None  # Will be set when registered with a network
 
         self._register_default_event_handlers()
@@ -185,6 +192,7 @@ class BaseMod(ABC):
         self._event_handlers.append(
             EventHandlerEntry(handler=handler, patterns=patterns)
         )
+        self._invalidate_handler_cache()
 
     def unregister_event_handler(
         self, handler: Callable[[Event], Awaitable[EventResponse]]
@@ -197,6 +205,55 @@ class BaseMod(ABC):
         self._event_handlers = [
             entry for entry in self._event_handlers if entry.handler != handler
         ]
+        self._invalidate_handler_cache()
+
+    def _invalidate_handler_cache(self) -> None:
+        """Drop cached handler lookups after the registered handlers change."""
+        self._handler_cache = {}
+        # The network's dispatch table lists mods by their handlers
+        if self._network is not None:
+            self._network.event_gateway.mod_event_processor.invalidate_dispatch_table()
+
+    def get_event_handlers(self, event_name: str) -> List[EventHandlerEntry]:
+        """Get the handlers whose patterns match an event name, in registration order.
+
+        Lookups are cached per event name until the registered handlers change.
+
+        Args:
+            event_name: The event name to match
+
+        Returns:
+            List[EventHandlerEntry]: The matching handler entries
+        """
+        handlers = self._handler_cache.get(event_name)
+        if handlers is None:
+            handlers = [
+                entry
+                for entry in self._event_handlers
+                if any(
+                    event_name_matches_pattern(event_name, pattern)
+                    for pattern in entry.patterns
+                )
+            ]
+            if len(self._handler_cache) >= MAX_DISPATCH_CACHE_SIZE:
+                self._handler_cache = {}
+            self._handler_cache[event_name] = handlers
+        return handlers
+
+    def can_handle_event(self, event_name: str) -> bool:
+        """Check whether processing an event with this name could produce a response.
+
+        Mods that override process_event are always considered able to handle an event.
+
+        Args:
+            event_name: The event name to check
+
+        Returns:
+            bool: False if process_event would certainly return None
+        """
+        if type(self).process_event is not BaseMod.process_event:
+            return True
+        return bool(self.get_event_handlers(event_name))
 
     @property
     def mod_name(self) -> str:
@@ -322,16 +379,22 @@ class BaseMod(ABC):
         """
         self._config.update(config)
 
-    async def send_event(self, event: Event) -> Optional[EventResponse]:
+    async def send_event(
+        self, event: Event, recipient_ids: Optional[Iterable[str]] = None
+    ) -> Optional[EventResponse]:
         """Send an event to the network.
 
         Args:
             event: The event to send
+            recipient_ids: Explicit agents to deliver the event to instead of its
+                destination; the event is processed once and fanned out on delivery
 
         Returns:
             Optional[EventResponse]: The response to the event, or None if the event is not processed
         """
-        return await self.network.process_event(event)
+        if recipient_ids is None:
+            return await self.network.process_event(event)
+        return await self.network.process_event(event, recipient_ids=recipient_ids)
 
     async def process_event(self, event: Event) -> Optional[EventResponse]:
         """Process an event and return the response.
@@ -347,11 +410,8 @@ class BaseMod(ABC):
             Optional[EventResponse]: The response to the event, or None if the event is not processed
         """
         response = None
-        for handler_entry in self._event_handlers:
-            if any(
-                event.matches_pattern(pattern) for pattern in handler_entry.patterns
-            ):
-                response = await handler_entry.handler(event)
-                if response:
-                    break
+        for handler_entry in self.get_event_handlers(event.event_name):
+            response = await handler_entry.handler(event)
+            if response:
+                break
         return response
@@ -1,8 +1,9 @@
-from typing import Dict, Any, Optional, List
+from typing import Awaitable, Callable, Dict, Any, Optional, List
 from abc import ABC, abstractmethod
 from openagents.core.connectors.grpc_connector import GRPCNetworkConnector
 from openagents.models.messages import Event, EventNames
 from openagents.models.event import Event
+from openagents.models.event_response import EventResponse
 from openagents.models.tool import AgentTool
 from openagents.models.event_thread import EventThread
 
@@ -151,6 +152,34 @@ class BaseModAdapter(ABC):
         """
         return event
 
+    async def request(
+        self,
+        event: Event,
+        timeout: float = 10.0,
+        send: Optional[Callable[[Event], Awaitable[Optional[EventResponse]]]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Send a request event to the network and wait for its response.
+
+        Args:
+            event: The request event
+            timeout: Maximum time to wait for the response in seconds
+            send: Coroutine function used to send the event (default: the connector's send_event)
+
+        Returns:
+            Optional[Dict[str, Any]]: The response data with a "success" flag, or None
+            if no response arrived in time
+        """
+        send = send or self.connector.send_event
+        if self.agent_client is not None:
+            return await self.agent_client.request(event, timeout=timeout, send=send)
+
+        # Without a client no response events are delivered, so only the direct
+        # response can carry the result
+        response = await send(event)
+        if isinstance(response, EventResponse):
+            return response.result_data()
+        return None
+
     def get_tools(self) -> List[AgentTool]:
         """Get the tools for the mod adapter.
 
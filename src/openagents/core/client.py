@@ -1,4 +1,6 @@
 import asyncio
+import heapq
+import itertools
 from typing import (
     TYPE_CHECKING,
     Dict,
@@ -10,6 +12,7 @@ from typing import (
     Callable,
     Awaitable,
 )
+import time
 import uuid
 import logging
 
@@ -28,7 +31,10 @@ from openagents.core.base_mod_adapter import BaseModAdapter
 from openagents.models.messages import Event, EventNames
 from openagents.config.globals import (
     AGENT_EVENT_MESSAGE,
+    DEFAULT_CLIENT_TIMEOUT,
     DEFAULT_HTTP_TRANSPORT_PORT,
+    DEFAULT_MAX_CACHED_EVENTS,
+    DEFAULT_MAX_EVENTS_PER_THREAD,
     SYSTEM_EVENT_LIST_AGENTS,
     SYSTEM_EVENT_LIST_MODS,
     SYSTEM_EVENT_GET_MOD_MANIFEST,
@@ -65,6 +71,56 @@ class EventWaitingEntry:
         self.result = result if result is not None else {}
 
 
+class PendingEventQueue:
+    """Timestamp-ordered queue of events waiting to be processed by a consumer.
+
+    The client pushes every event it adds to an event thread; consumers pop the
+    earliest event and wait on the queue instead of polling the threads. Events
+    with equal timestamps are popped in arrival order.
+    """
+
+    def __init__(self):
+        self._heap: List[Any] = []
+        self._counter = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def put(self, event: Event) -> None:
+        """Add an event and wake up a waiting consumer."""
+        heapq.heappush(self._heap, (event.timestamp, next(self._counter), event))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def pop(self) -> Optional[Event]:
+        """Remove and return the earliest pending event, or None if empty."""
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[2]
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until an event is pending.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely
+
+        Returns:
+            bool: True if an event is pending, False if the wait timed out
+        """
+        if self._heap:
+            return True
+        # Created lazily so the event is bound to the consumer's running loop
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return bool(self._heap)
+
+
 class AgentClient:
     """Core client implementation for OpenAgents.
 
@@ -75,12 +131,18 @@ class AgentClient:
         self,
         agent_id: Optional[str] = None,
         mod_adapters: Optional[List[BaseModAdapter]] = None,
+        max_events_per_thread: Optional[int] = DEFAULT_MAX_EVENTS_PER_THREAD,
+        max_cached_events: Optional[int] = DEFAULT_MAX_CACHED_EVENTS,
+        max_event_age: Optional[float] = None,
     ):
         """Initialize an agent.
 
         Args:
             name: Optional human-readable name for the agent
             mod_adapters: Optional list of mod instances to register with the agent
+            max_events_per_thread: Maximum number of events kept per event thread (None for no limit)
+            max_cached_events: Maximum number of events kept across all event threads (None for no limit)
+            max_event_age: Maximum age in seconds of kept events (None for no limit)
         """
         self.agent_id = agent_id or "Agent-" + str(uuid.uuid4())[:8]
         self.mod_adapters: Dict[str, BaseModAdapter] = {}
@@ -96,6 +158,20 @@ class AgentClient:
         self._event_threads: Dict[str, EventThread] = {}
         self._event_id_map: Dict[str, Event] = {}
 
+        # Queues fed with every event added to a thread
+        self._event_queues: List[PendingEventQueue] = []
+
+        # Futures of requests waiting for their response, keyed by request event ID
+        self._response_futures: Dict[str, asyncio.Future] = {}
+
+        # Retention of the event threads; the oldest events are evicted first
+        self.max_events_per_thread = max_events_per_thread
+        self.max_cached_events = max_cached_events
+        self.max_event_age = max_event_age
+        self._event_count = 0
+        self._retention_heap: List[Any] = []
+        self._retention_counter = itertools.count()
+
         # Register mod adapters if provided
         if mod_adapters:
             for mod_adapter in mod_adapters:
@@ -395,6 +471,9 @@ class AgentClient:
 
     async def disconnect(self) -> bool:
         """Disconnect from the network server."""
+        for future in self._response_futures.values():
+            future.cancel()
+        self._response_futures.clear()
         for mod_adapter in self.mod_adapters.values():
             mod_adapter.on_disconnect()
         if self.connector is None:
@@ -556,21 +635,10 @@ class AgentClient:
                 
                 verbose_print(f"🚀 Sending event via connector...")
                 result = await self.connector.send_event(processed_event)
-                self._event_id_map[processed_event.event_id] = processed_event
 
                 # Add outgoing event to event_threads so agents can see their own messages
                 # This ensures the conversation context includes both incoming and outgoing messages
-                if processed_event.thread_name is None:
-                    # Compute thread_name using same logic as _handle_event for incoming events
-                    if "." in processed_event.event_name:
-                        processed_event.thread_name = "thread:" + processed_event.event_name.rsplit(".", 1)[0]
-                    else:
-                        processed_event.thread_name = "thread:" + processed_event.event_name
-
-
-                if processed_event.thread_name not in self._event_threads:
-                    self._event_threads[processed_event.thread_name] = EventThread()
-                self._event_threads[processed_event.thread_name].add_event(processed_event)
+                self._record_outgoing_event(processed_event)
 
                 # Enhanced result logging
                 success = getattr(result, 'success', 'Unknown') if result else False
@@ -598,6 +666,235 @@ class AgentClient:
             traceback.print_exc()
             return None
 
+    async def send_events(
+        self, events: List[Event], concurrent: bool = False
+    ) -> List[Optional[EventResponse]]:
+        """Send several events to the network in as few requests as possible.
+
+        Each event goes through the mod adapters like in send_event, then all remaining
+        events are submitted together through the connector.
+
+        Args:
+            events: The events to send
+            concurrent: Whether the events are independent, so the network may process
+                them concurrently instead of strictly in order
+
+        Returns:
+            List[Optional[EventResponse]]: One response per event, in order, with None
+                for events filtered out by a mod adapter
+        """
+        if self.connector is None:
+            logger.warning(f"Cannot send events: agent {self.agent_id} is not connected")
+            return [None] * len(events)
+
+        responses: List[Optional[EventResponse]] = [None] * len(events)
+        outgoing: List[Event] = []
+        indexes: List[int] = []
+        for index, event in enumerate(events):
+            processed_event = event
+            try:
+                for mod_adapter in self.mod_adapters.values():
+                    processed_event = await mod_adapter.process_outgoing_event(
+                        processed_event
+                    )
+                    if processed_event is None:
+                        break
+            except Exception as e:
+                logger.error(f"Error processing outgoing event {event.event_id}: {e}")
+                continue
+            if processed_event is not None:
+                outgoing.append(processed_event)
+                indexes.append(index)
+
+        if not outgoing:
+            return responses
+
+        try:
+            results = await self.connector.send_events(outgoing, concurrent)
+        except Exception as e:
+            logger.error(f"Connector failed to send events: {e}")
+            return responses
+
+        for index, processed_event, result in zip(indexes, outgoing, results):
+            self._record_outgoing_event(processed_event)
+            responses[index] = result
+        return responses
+
+    def expect_response(self, request_id: str) -> asyncio.Future:
+        """Get a future resolved by the response to a request.
+
+        The future is resolved with the payload of the first incoming event whose
+        response_to, or payload request_id, matches the request ID.
+
+        Args:
+            request_id: Event ID of the request
+
+        Returns:
+            asyncio.Future: Future resolved with the response payload
+        """
+        future = self._response_futures.get(request_id)
+        if future is None or future.done():
+            future = asyncio.get_running_loop().create_future()
+            self._response_futures[request_id] = future
+        return future
+
+    def discard_response(self, request_id: str) -> None:
+        """Stop waiting for the response to a request."""
+        future = self._response_futures.pop(request_id, None)
+        if future is not None and not future.done():
+            future.cancel()
+
+    def _resolve_response(self, event: Event) -> None:
+        """Resolve the future of the request an incoming event responds to."""
+        if not self._response_futures:
+            return
+        request_ids = [event.response_to]
+        if isinstance(event.payload, dict):
+            request_ids.append(event.payload.get("request_id"))
+        for request_id in request_ids:
+            future = self._response_futures.pop(request_id, None) if request_id else None
+            if future is not None and not future.done():
+                future.set_result(dict(event.payload or {}))
+                return
+
+    async def request(
+        self,
+        event: Event,
+        timeout: float = DEFAULT_CLIENT_TIMEOUT,
+        send: Optional[Callable[[Event], Awaitable[Optional[EventResponse]]]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Send a request event and wait for its response.
+
+        The result is taken from the EventResponse returned for the event when it
+        carries data, otherwise from the first response event correlated with the
+        request (see expect_response). Cancelling the caller cancels the wait.
+
+        Args:
+            event: The request event
+            timeout: Maximum time to wait for the response in seconds
+            send: Coroutine function used to send the event (default: send_event)
+
+        Returns:
+            Optional[Dict[str, Any]]: The response data with a "success" flag, or None
+            if no response arrived in time
+        """
+        future = self.expect_response(event.event_id)
+        try:
+            response = await (send or self.send_event)(event)
+            if isinstance(response, EventResponse):
+                result = response.result_data()
+                if result is not None:
+                    return result
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Request {event.event_name} ({event.event_id}) timed out after {timeout}s"
+            )
+            return None
+        finally:
+            self.discard_response(event.event_id)
+
+    def _record_outgoing_event(self, event: Event) -> None:
+        """Remember a sent event and add it to its event thread."""
+        self._event_id_map[event.event_id] = event
+        if event.thread_name is None:
+            # Compute thread_name using same logic as _handle_event for incoming events
+            if "." in event.event_name:
+                event.thread_name = "thread:" + event.event_name.rsplit(".", 1)[0]
+            else:
+                event.thread_name = "thread:" + event.event_name
+
+        self._add_event_to_thread(event)
+
+    def _add_event_to_thread(self, event: Event) -> None:
+        """Add an event to its thread and feed it to the pending event queues."""
+        thread = self._event_threads.get(event.thread_name)
+        if thread is None:
+            thread = self._event_threads[event.thread_name] = EventThread()
+        if not thread.add_event(event):
+            return
+        self._event_count += 1
+        if self.max_cached_events is not None or self.max_event_age is not None:
+            heapq.heappush(
+                self._retention_heap,
+                (
+                    event.timestamp,
+                    next(self._retention_counter),
+                    event.thread_name,
+                    event.event_id,
+                ),
+            )
+        for queue in self._event_queues:
+            queue.put(event)
+        self._enforce_event_retention(thread)
+
+    def _enforce_event_retention(self, thread: EventThread) -> None:
+        """Evict the oldest events once the retention limits are exceeded.
+
+        Args:
+            thread: The thread that just received an event
+        """
+        evicted = thread.trim(max_events=self.max_events_per_thread)
+
+        # The retention heap holds every kept event ordered by timestamp; entries
+        # of events already evicted from their thread are skipped when popped
+        min_timestamp = None
+        if self.max_event_age is not None:
+            min_timestamp = time.time() - self.max_event_age
+        while self._retention_heap:
+            timestamp, _, thread_name, event_id = self._retention_heap[0]
+            over_count = (
+                self.max_cached_events is not None
+                and self._event_count - len(evicted) > self.max_cached_events
+            )
+            too_old = min_timestamp is not None and timestamp < min_timestamp
+            if not (over_count or too_old):
+                break
+            heapq.heappop(self._retention_heap)
+            owner = self._event_threads.get(thread_name)
+            event = owner.remove_event(event_id, timestamp) if owner else None
+            if event is not None:
+                evicted.append(event)
+
+        if not evicted:
+            return
+        self._event_count -= len(evicted)
+        for event in evicted:
+            self._event_id_map.pop(event.event_id, None)
+            owner = self._event_threads.get(event.thread_name)
+            if owner is not None and not owner.events:
+                del self._event_threads[event.thread_name]
+        if len(self._retention_heap) > 2 * self._event_count + 64:
+            self._retention_heap = [
+                (e.timestamp, next(self._retention_counter), name, e.event_id)
+                for name, t in self._event_threads.items()
+                for e in t.events
+            ]
+            heapq.heapify(self._retention_heap)
+
+    def open_event_queue(self, include_existing: bool = True) -> PendingEventQueue:
+        """Open a queue that receives every event added to an event thread.
+
+        Args:
+            include_existing: Whether to seed the queue with the events already
+                stored in the event threads
+
+        Returns:
+            PendingEventQueue: The opened queue
+        """
+        queue = PendingEventQueue()
+        if include_existing:
+            for thread in self._event_threads.values():
+                for event in thread.events:
+                    queue.put(event)
+        self._event_queues.append(queue)
+        return queue
+
+    def close_event_queue(self, queue: PendingEventQueue) -> None:
+        """Stop feeding a queue opened with open_event_queue."""
+        if queue in self._event_queues:
+            self._event_queues.remove(queue)
+
     async def list_mods(self) -> List[Dict[str, Any]]:
         """Get a list of available mods from the network server.
 
@@ -769,6 +1066,9 @@ class AgentClient:
             f"📥 RECEIVED EVENT: {event.event_name} | Source: {event.source_id} | Target: {event.destination_id or 'None'}"
         )
 
+        # Resolve a request waiting for this response
+        self._resolve_response(event)
+
         # Notify any waiting functions
         await self._notify_event_waiters(event)
 
@@ -804,13 +1104,9 @@ class AgentClient:
             else:
                 event.thread_name = "thread:" + event.event_name
 
-        # Try to add the event to any available mod adapter's event threads
-        if event.thread_name not in self._event_threads:
-            self._event_threads[event.thread_name] = EventThread()
-
         # Add the Event to the thread
         self._event_id_map[event.event_id] = event
-        self._event_threads[event.thread_name].add_event(event)
+        self._add_event_to_thread(event)
     
     def get_cached_event(self, event_id: str) -> Optional[Event]:
         """Get an event by its ID from the cache."""
@@ -909,9 +1205,9 @@ class AgentClient:
         poll_count = 0
         while True:
             try:
-                await asyncio.sleep(
-                    1.0
-                )  # Poll every 1 second for faster message delivery
+                # Connectors that long-poll or stream report a zero interval since
+                # poll_messages itself blocks until events arrive
+                await asyncio.sleep(getattr(self.connector, "poll_interval", 1.0))
                 poll_count += 1
                 logger.debug(
                     f"🔧 CLIENT: Polling attempt #{poll_count} for agent {self.agent_id}"
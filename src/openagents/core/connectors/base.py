@@ -15,6 +15,10 @@ from openagents.models.event_response import EventResponse
 
 logger = logging.getLogger(__name__)
 
+# Seconds before reopening a closed event stream, doubled after each failed attempt
+STREAM_RECONNECT_DELAY = 1.0
+STREAM_RECONNECT_MAX_DELAY = 60.0
+
 
 class NetworkConnector(ABC):
     """Abstract base class for network connectors.
@@ -57,6 +61,11 @@ class NetworkConnector(ABC):
         self.system_handlers = {}
         self.event_listener_task = None
 
+        # Push delivery over a server event stream, see _listen_event_stream
+        self.use_event_stream = False
+        self._stream_connected = False
+        self._stream_task: Optional[asyncio.Task] = None
+
     @abstractmethod
     async def connect_to_server(self) -> bool:
         """Connect to a network server.
@@ -127,6 +136,28 @@ class NetworkConnector(ABC):
         """
         pass
 
+    async def send_events(
+        self, messages: List[Event], concurrent: bool = False
+    ) -> List[EventResponse]:
+        """Send several events via the network connector.
+
+        The default implementation sends the events one by one, or all at once when
+        ``concurrent`` is set. Connectors supporting batch submission override it to
+        send the events in a single request.
+
+        Args:
+            messages: Events to send
+            concurrent: Whether the events are independent and may be processed concurrently
+
+        Returns:
+            List[EventResponse]: One response per event, in order
+        """
+        if concurrent:
+            return list(
+                await asyncio.gather(*(self.send_event(message) for message in messages))
+            )
+        return [await self.send_event(message) for message in messages]
+
     async def poll_messages(self) -> List[Event]:
         """Poll for queued messages from the network server.
 
@@ -189,6 +220,40 @@ class NetworkConnector(ABC):
         """
         return EventResponse(success=True, message=message, data=data)
 
+    async def _listen_event_stream(self) -> None:
+        """Keep the server event stream open while connected.
+
+        While the stream is unavailable, poll_messages falls back to polling; the
+        stream is reopened with exponential backoff. Connectors set use_event_stream
+        to False once the server turns out not to support streaming.
+        """
+        delay = STREAM_RECONNECT_DELAY
+        while self.is_connected and self.use_event_stream:
+            self._stream_task = asyncio.create_task(self._receive_event_stream())
+            if await self._stream_task:
+                delay = STREAM_RECONNECT_DELAY
+            if not (self.is_connected and self.use_event_stream):
+                break
+            logger.debug(f"Reopening event stream of agent {self.agent_id} in {delay}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, STREAM_RECONNECT_MAX_DELAY)
+
+    async def _receive_event_stream(self) -> bool:
+        """Receive events pushed by the server until the stream closes.
+
+        Connectors that support push delivery override this method.
+
+        Returns:
+            bool: True if the stream was opened
+        """
+        self.use_event_stream = False
+        return False
+
+    async def _wait_for_event_stream(self, timeout: float) -> None:
+        """Park a poll while the event stream delivers events, until it drops or the timeout expires."""
+        # Waiting does not raise the stream task's outcome, which it handles itself
+        await asyncio.wait({self._stream_task}, timeout=timeout)
+
     async def start_event_listener(self) -> None:
         """Start the event listener task.
 
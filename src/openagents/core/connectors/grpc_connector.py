@@ -41,6 +41,7 @@ class GRPCNetworkConnector(NetworkConnector):
         ssl_client_cert: Optional[str] = None,
         ssl_client_key: Optional[str] = None,
         ssl_verify: bool = True,
+        use_event_stream: bool = True,
     ):
         """Initialize a gRPC network connector.
 
@@ -56,6 +57,8 @@ class GRPCNetworkConnector(NetworkConnector):
             ssl_client_cert: Path to client certificate for mTLS
             ssl_client_key: Path to client private key for mTLS
             ssl_verify: Whether to verify server certificate (default: True)
+            use_event_stream: Whether to receive events over the StreamEvents RPC when the
+                server supports it (default: True)
         """
         # Initialize base connector
         super().__init__(host, port, agent_id, metadata)
@@ -63,6 +66,7 @@ class GRPCNetworkConnector(NetworkConnector):
         self.max_message_size = max_message_size
         self.password_hash = password_hash
         self.is_polling = True  # gRPC uses polling for message retrieval
+        self.use_event_stream = use_event_stream
 
         # SSL/TLS configuration
         self.use_tls = use_tls
@@ -190,10 +194,15 @@ class GRPCNetworkConnector(NetworkConnector):
 
             logger.info(f"Connected to {'gRPCS' if self.use_tls else 'gRPC'} network successfully")
 
-            # For now, skip bidirectional streaming and use unary calls
-            # TODO: Implement proper streaming later
             self.is_connected = True
-            logger.debug("gRPC connection established (using unary calls)")
+            logger.debug("gRPC connection established")
+
+            # Receive events over the StreamEvents RPC; polling takes over whenever
+            # the stream is unavailable
+            if self.use_event_stream:
+                self.event_listener_task = asyncio.create_task(
+                    self._listen_event_stream()
+                )
 
             return True
 
@@ -246,7 +255,7 @@ class GRPCNetworkConnector(NetworkConnector):
 
             # Cancel message listener task if exists
             if (
-                hasattr(self, "message_listener_task")
+                hasattr(self, "event_listener_task")
                 and self.event_listener_task
                 and not self.event_listener_task.done()
             ):
@@ -285,8 +294,72 @@ class GRPCNetworkConnector(NetworkConnector):
             logger.error(f"Error disconnecting from gRPC network: {e}")
             return False
 
-    # Note: Streaming methods removed for simplicity
-    # TODO: Implement bidirectional streaming for better performance
+    @property
+    def poll_interval(self) -> float:
+        """Seconds the client should sleep between poll_messages calls.
+
+        While the event stream is open poll_messages blocks until it closes, so no
+        extra delay is needed.
+        """
+        return 0.0 if self._stream_connected else 1.0
+
+    async def _receive_event_stream(self) -> bool:
+        """Receive events pushed by the server over the StreamEvents RPC.
+
+        Returns when the stream is unavailable or closed.
+
+        Returns:
+            bool: True if the stream was opened
+        """
+        from openagents.core.transports.grpc import STREAM_OPEN_METADATA
+
+        stream_closed = asyncio.Event()
+
+        async def outbound_events():
+            # The first event opens the stream and authenticates the agent; the
+            # client's side then stays open until the stream ends
+            yield self._to_grpc_event(
+                Event(
+                    event_name=SYSTEM_EVENT_POLL_MESSAGES,
+                    source_id=self.agent_id,
+                    destination_id="system:system",
+                    payload={"agent_id": self.agent_id},
+                    secret=self.secret,
+                )
+            )
+            await stream_closed.wait()
+
+        try:
+            self.stream = self.stub.StreamEvents(outbound_events())
+            initial_metadata = await self.stream.initial_metadata()
+            if tuple(STREAM_OPEN_METADATA) not in tuple(initial_metadata or ()):
+                logger.info("gRPC server has no event stream, using polling")
+                self.use_event_stream = False
+                return False
+
+            self._stream_connected = True
+            logger.info(f"🔧 GRPC: Event stream opened for agent {self.agent_id}")
+
+            async for grpc_event in self.stream:
+                event = self._from_grpc_event(grpc_event)
+                if event:
+                    await self.consume_message(event)
+            return True
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if self.grpc is not None and getattr(e, "code", None) and (
+                e.code() == self.grpc.StatusCode.UNIMPLEMENTED
+            ):
+                logger.info("gRPC server has no event stream, using polling")
+                self.use_event_stream = False
+            elif self.is_connected:
+                logger.warning(f"gRPC event stream error, falling back to polling: {e}")
+            return self._stream_connected
+        finally:
+            self._stream_connected = False
+            stream_closed.set()
 
     async def send_event(self, message: Event) -> EventResponse:
         """Send an event via gRPC.
@@ -405,6 +478,11 @@ class GRPCNetworkConnector(NetworkConnector):
             logger.debug(f"Agent {self.agent_id} is not connected to gRPC network")
             return []
 
+        if self._stream_connected:
+            # Events are pushed over the stream; park until it drops
+            await self._wait_for_event_stream(30.0)
+            return []
+
         try:
             # Create poll messages event
             poll_event = Event(
@@ -559,6 +637,37 @@ class GRPCNetworkConnector(NetworkConnector):
 
         return grpc_event
 
+    def _from_grpc_event(self, grpc_event) -> Optional[Event]:
+        """Convert an event pushed over StreamEvents to an internal Event."""
+        from openagents.core.transports.grpc import STREAM_EVENT_DATA_TYPE
+
+        try:
+            if grpc_event.payload.type_url == STREAM_EVENT_DATA_TYPE:
+                # The payload carries the whole event as JSON
+                return Event(**json.loads(grpc_event.payload.value.decode("utf-8")))
+
+            payload = {}
+            if grpc_event.payload and grpc_event.payload.value:
+                from google.protobuf.struct_pb2 import Struct
+                from google.protobuf.json_format import MessageToDict
+
+                struct = Struct()
+                if grpc_event.payload.Unpack(struct):
+                    payload = MessageToDict(struct)
+            return Event(
+                event_id=grpc_event.event_id,
+                event_name=grpc_event.event_name,
+                source_id=grpc_event.source_id,
+                destination_id=grpc_event.target_agent_id or None,
+                payload=payload,
+                timestamp=grpc_event.timestamp or int(time.time()),
+                metadata=dict(grpc_event.metadata),
+                visibility=grpc_event.visibility or "network",
+            )
+        except Exception as e:
+            logger.error(f"🔧 GRPC: Error processing streamed event: {e}")
+            return None
+
     def _make_json_serializable(self, obj):
         """Convert an object to be JSON serializable, handling gRPC types."""
         import json
@@ -34,6 +34,9 @@ class HTTPNetworkConnector(NetworkConnector):
         metadata: Optional[Dict[str, Any]] = None,
         password_hash: Optional[str] = None,
         timeout: int = 30,
+        long_poll_timeout: float = 25.0,
+        use_event_stream: bool = True,
+        max_batch_size: int = 1000,
     ):
         """Initialize an HTTP network connector.
 
@@ -44,6 +47,12 @@ class HTTPNetworkConnector(NetworkConnector):
             metadata: Agent metadata to send during registration
             password_hash: Password hash for agent group authentication
             timeout: Request timeout in seconds (default 30)
+            long_poll_timeout: Seconds a poll request may be parked on the server waiting
+                for events (default 25). 0 disables long polling.
+            use_event_stream: Whether to receive events over the server-sent event stream
+                when the server supports it (default True)
+            max_batch_size: Maximum number of events sent in one send_events request
+                (default 1000)
         """
         # Initialize base connector
         super().__init__(host, port, agent_id, metadata)
@@ -51,6 +60,13 @@ class HTTPNetworkConnector(NetworkConnector):
         self.timeout = timeout
         self.password_hash = password_hash
         self.is_polling = True  # HTTP uses polling for message retrieval
+        self.long_poll_timeout = long_poll_timeout
+        self.use_event_stream = use_event_stream
+        # Set once the server echoes a wait_timeout, i.e. it supports long polling
+        self.long_poll_supported = False
+        # Cleared if the server has no batch endpoint
+        self.batch_supported = True
+        self.max_batch_size = max_batch_size
 
         # HTTP client session
         self.session = None
@@ -156,6 +172,13 @@ class HTTPNetworkConnector(NetworkConnector):
             self.is_connected = True
             logger.debug("HTTP connection established")
 
+            # Receive events over the server-sent event stream; polling takes over
+            # whenever the stream is unavailable
+            if self.use_event_stream:
+                self.event_listener_task = asyncio.create_task(
+                    self._listen_event_stream()
+                )
+
             return True
 
         except Exception as e:
@@ -246,16 +269,7 @@ class HTTPNetworkConnector(NetworkConnector):
                 message.secret = self.secret
 
             # Prepare HTTP request data
-            event_data = {
-                "event_id": message.event_id,
-                "event_name": message.event_name,
-                "source_id": message.source_id,
-                "target_agent_id": message.destination_id or "",
-                "payload": message.payload or {},
-                "metadata": message.metadata or {},
-                "visibility": getattr(message, "visibility", "network"),
-                "secret": getattr(message, "secret", "") or "",
-            }
+            event_data = self._event_to_request_data(message)
 
             # Send the event to the server
             async with self.session.post(
@@ -297,6 +311,110 @@ class HTTPNetworkConnector(NetworkConnector):
             logger.error(error_message)
             return self._create_error_response(error_message)
 
+    async def send_events(
+        self, messages: List[Event], concurrent: bool = False
+    ) -> List[EventResponse]:
+        """Send several events in batch requests to the HTTP network server.
+
+        Falls back to one request per event if the server has no batch endpoint.
+
+        Args:
+            messages: Events to send
+            concurrent: Whether the events are independent and may be processed concurrently
+
+        Returns:
+            List[EventResponse]: One response per event, in order
+        """
+        if not self.is_connected:
+            logger.debug(f"Agent {self.agent_id} is not connected to HTTP network")
+            return [
+                self._create_error_response("Agent is not connected to HTTP network")
+                for _ in messages
+            ]
+        if not self.batch_supported:
+            return await super().send_events(messages, concurrent)
+
+        responses: List[EventResponse] = []
+        for start in range(0, len(messages), self.max_batch_size):
+            chunk = messages[start : start + self.max_batch_size]
+            chunk_responses = await self._send_event_batch(chunk, concurrent)
+            if chunk_responses is None:
+                # The server does not support batches; send the rest individually
+                return responses + await super().send_events(messages[start:], concurrent)
+            responses.extend(chunk_responses)
+        return responses
+
+    async def _send_event_batch(
+        self, messages: List[Event], concurrent: bool
+    ) -> Optional[List[EventResponse]]:
+        """Send one batch request, returning None if the server lacks the batch endpoint."""
+        responses: List[Optional[EventResponse]] = [None] * len(messages)
+        events_data = []
+        indexes = []
+        for index, message in enumerate(messages):
+            if not self._validate_event(message):
+                responses[index] = self._create_error_response("Event validation failed")
+                continue
+            if self.secret and not message.secret:
+                message.secret = self.secret
+            events_data.append(self._event_to_request_data(message))
+            indexes.append(index)
+
+        if not events_data:
+            return responses
+
+        try:
+            async with self.session.post(
+                f"{self.base_url}/send_events",
+                json={"events": events_data, "concurrent": concurrent},
+            ) as response:
+                if response.status in (404, 405):
+                    logger.info("HTTP server does not support batch events, sending individually")
+                    self.batch_supported = False
+                    return None
+                if response.status != 200:
+                    error_message = f"HTTP request failed with status {response.status}"
+                    logger.error(error_message)
+                    for index in indexes:
+                        responses[index] = self._create_error_response(error_message)
+                    return responses
+
+                response_data = await response.json()
+
+            for index, result in zip(indexes, response_data.get("responses", [])):
+                if result.get("success", False):
+                    responses[index] = self._create_success_response(
+                        result.get("message", "Success"), result.get("data")
+                    )
+                else:
+                    responses[index] = self._create_error_response(
+                        result.get("message", "Unknown error")
+                    )
+            for index in indexes:
+                if responses[index] is None:
+                    responses[index] = self._create_error_response("No response for event")
+            return responses
+
+        except Exception as e:
+            error_message = f"Failed to send HTTP event batch: {str(e)}"
+            logger.error(error_message)
+            for index in indexes:
+                responses[index] = self._create_error_response(error_message)
+            return responses
+
+    def _event_to_request_data(self, message: Event) -> Dict[str, Any]:
+        """Build the send_event request data for an event."""
+        return {
+            "event_id": message.event_id,
+            "event_name": message.event_name,
+            "source_id": message.source_id,
+            "target_agent_id": message.destination_id or "",
+            "payload": message.payload or {},
+            "metadata": message.metadata or {},
+            "visibility": getattr(message, "visibility", "network"),
+            "secret": getattr(message, "secret", "") or "",
+        }
+
     async def poll_messages(self) -> List[Event]:
         """Poll for queued messages from the HTTP network server.
 
@@ -307,14 +425,26 @@ class HTTPNetworkConnector(NetworkConnector):
             logger.debug(f"Agent {self.agent_id} is not connected to HTTP network")
             return []
 
+        if self._stream_connected:
+            # Events are pushed over the stream; park until it drops or the wait expires
+            await self._wait_for_event_stream(self.long_poll_timeout or 1.0)
+            return []
+
         try:
             # Send poll request with authentication
             params = {"agent_id": self.agent_id}
             if hasattr(self, 'secret') and self.secret:
                 params["secret"] = self.secret
+            request_timeout = None
+            if self.long_poll_timeout > 0:
+                # Ask the server to hold the request until an event arrives
+                params["wait"] = str(self.long_poll_timeout)
+                request_timeout = self.aiohttp.ClientTimeout(
+                    total=self.timeout + self.long_poll_timeout
+                )
 
             async with self.session.get(
-                f"{self.base_url}/poll", params=params
+                f"{self.base_url}/poll", params=params, timeout=request_timeout
             ) as response:
                 if response.status != 200:
                     logger.warning(
@@ -330,6 +460,8 @@ class HTTPNetworkConnector(NetworkConnector):
                     )
                     return []
 
+                self.long_poll_supported = "wait_timeout" in response_data
+
                 # Extract messages from response
                 messages = []
                 response_messages = response_data.get("messages", [])
@@ -340,41 +472,9 @@ class HTTPNetworkConnector(NetworkConnector):
 
                 # Convert each message to Event object
                 for message_data in response_messages:
-                    try:
-                        if isinstance(message_data, dict):
-                            if "event_name" in message_data:
-                                # This is already an Event structure
-                                event = Event(**message_data)
-                                messages.append(event)
-                                logger.debug(
-                                    f"🔧 HTTP: Successfully converted message to Event: {event.event_id}"
-                                )
-                            else:
-                                # This might be a legacy message format - try to parse it
-                                from openagents.utils.message_util import (
-                                    parse_message_dict,
-                                )
-
-                                event = parse_message_dict(message_data)
-                                if event:
-                                    messages.append(event)
-                                    logger.debug(
-                                        f"🔧 HTTP: Successfully parsed legacy message to Event: {event.event_id}"
-                                    )
-                                else:
-                                    logger.warning(
-                                        f"🔧 HTTP: Failed to parse message data: {message_data}"
-                                    )
-                        else:
-                            logger.warning(
-                                f"🔧 HTTP: Invalid message format in poll response: {message_data}"
-                            )
-
-                    except Exception as e:
-                        logger.error(f"🔧 HTTP: Error processing polled message: {e}")
-                        logger.debug(
-                            f"🔧 HTTP: Problematic message data: {message_data}"
-                        )
+                    event = self._parse_polled_message(message_data)
+                    if event:
+                        messages.append(event)
 
                 logger.info(
                     f"🔧 HTTP: Successfully converted {len(messages)} messages to Events"
@@ -386,3 +486,140 @@ class HTTPNetworkConnector(NetworkConnector):
         except Exception as e:
             logger.error(f"Failed to poll messages: {e}")
             return []
+
+    @property
+    def poll_interval(self) -> float:
+        """Seconds the client should sleep between poll_messages calls.
+
+        Long polling and the event stream already block until events arrive, so no
+        extra delay is needed once either is in use.
+        """
+        if self._stream_connected or self.long_poll_supported:
+            return 0.0
+        return 1.0
+
+    def _parse_polled_message(self, message_data: Any) -> Optional[Event]:
+        """Convert a polled or streamed message dict to an Event.
+
+        Args:
+            message_data: Message data received from the server
+
+        Returns:
+            Optional[Event]: The parsed event, or None if it could not be parsed
+        """
+        try:
+            if isinstance(message_data, dict):
+                if "event_name" in message_data:
+                    # This is already an Event structure
+                    event = Event(**message_data)
+                    logger.debug(
+                        f"🔧 HTTP: Successfully converted message to Event: {event.event_id}"
+                    )
+                    return event
+
+                # This might be a legacy message format - try to parse it
+                from openagents.utils.message_util import parse_message_dict
+
+                event = parse_message_dict(message_data)
+                if event:
+                    logger.debug(
+                        f"🔧 HTTP: Successfully parsed legacy message to Event: {event.event_id}"
+                    )
+                    return event
+                logger.warning(f"🔧 HTTP: Failed to parse message data: {message_data}")
+            else:
+                logger.warning(
+                    f"🔧 HTTP: Invalid message format in poll response: {message_data}"
+                )
+
+        except Exception as e:
+            logger.error(f"🔧 HTTP: Error processing polled message: {e}")
+            logger.debug(f"🔧 HTTP: Problematic message data: {message_data}")
+        return None
+
+    async def _receive_event_stream(self) -> bool:
+        """Receive events pushed by the server over the /poll/stream endpoint.
+
+        Returns when the stream is unavailable or closed.
+
+        Returns:
+            bool: True if the stream was opened
+        """
+        params = {"agent_id": self.agent_id}
+        if self.secret:
+            params["secret"] = self.secret
+        if self.long_poll_timeout > 0:
+            params["wait"] = str(self.long_poll_timeout)
+
+        try:
+            # The stream stays open indefinitely; only bound the connection attempt
+            timeout = self.aiohttp.ClientTimeout(
+                total=None, sock_connect=self.timeout
+            )
+            async with self.session.get(
+                f"{self.base_url}/poll/stream",
+                params=params,
+                timeout=timeout,
+                headers={"Accept": "text/event-stream"},
+            ) as response:
+                if response.status == 404:
+                    logger.info("HTTP server has no event stream endpoint, using polling")
+                    self.use_event_stream = False
+                    return False
+                if response.status != 200:
+                    logger.info(
+                        f"HTTP event stream unavailable (status {response.status}), using polling"
+                    )
+                    return False
+
+                self._stream_connected = True
+                logger.info(f"🔧 HTTP: Event stream opened for agent {self.agent_id}")
+
+                event_type = "message"
+                data_lines = []
+                buffer = bytearray()
+                # Split lines ourselves so large events are not limited by the
+                # stream reader's line length; lines are sliced at a moving offset
+                # and consumed once per chunk, so a burst of events stays linear
+                async for chunk in response.content.iter_any():
+                    # The buffered bytes hold no complete line
+                    end = len(buffer)
+                    buffer += chunk
+                    start = 0
+                    while True:
+                        end = buffer.find(b"\n", end)
+                        if end < 0:
+                            break
+                        line = buffer[start:end].decode("utf-8").rstrip("\r")
+                        start = end = end + 1
+                        if line.startswith(":"):
+                            # Keep-alive comment
+                            continue
+                        if line.startswith("event:"):
+                            event_type = line[len("event:"):].strip()
+                        elif line.startswith("data:"):
+                            data_lines.append(line[len("data:"):].strip())
+                        elif not line and data_lines:
+                            data = json.loads("\n".join(data_lines))
+                            data_lines = []
+                            if event_type == "error":
+                                logger.warning(
+                                    f"HTTP event stream closed by server: {data.get('error_message')}"
+                                )
+                                return True
+                            event = self._parse_polled_message(data)
+                            if event:
+                                await self.consume_message(event)
+                            event_type = "message"
+                    del buffer[:start]
+
+                return True
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if self.is_connected:
+                logger.warning(f"HTTP event stream error, falling back to polling: {e}")
+            return self._stream_connected
+        finally:
+            self._stream_connected = False
@@ -0,0 +1,98 @@
+"""
+Duplicate event suppression for OpenAgents.
+
+This module provides a bounded window of recently processed event IDs. IDs are
+kept in arrival order so the oldest ones are evicted first, with amortized O(1)
+cost per event.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EventDedupWindow:
+    """
+    Insertion-ordered set of recently seen event IDs, bounded by count and optionally by age.
+
+    An event ID is remembered until either ``max_size`` newer IDs have been added or,
+    if ``ttl`` is set, ``ttl`` seconds have passed since it was first seen. Because IDs
+    are stored in arrival order, both limits evict from the front of the window.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 100000,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the window.
+
+        Args:
+            max_size: Maximum number of event IDs remembered
+            ttl: Seconds an event ID is remembered, None to only bound by count
+            clock: Time source, overridable for tests
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        # event_id -> time first seen, oldest first
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+        self.total_added = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, event_id: str) -> bool:
+        self._expire()
+        return event_id in self._seen
+
+    def check_and_add(self, event_id: str) -> bool:
+        """Record an event ID and report whether it was already in the window.
+
+        Args:
+            event_id: The event ID to record
+
+        Returns:
+            bool: True if the event ID is a duplicate
+        """
+        now = self._expire()
+        if event_id in self._seen:
+            self.hits += 1
+            return True
+
+        self._seen[event_id] = now
+        self.total_added += 1
+        if len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+            self.evictions += 1
+        return False
+
+    def _expire(self) -> float:
+        """Evict event IDs older than the ttl and return the current time."""
+        now = self._clock()
+        if self.ttl is not None:
+            cutoff = now - self.ttl
+            while self._seen:
+                oldest_id, first_seen = next(iter(self._seen.items()))
+                if first_seen > cutoff:
+                    break
+                del self._seen[oldest_id]
+                self.evictions += 1
+        return now
+
+    def get_stats(self) -> dict:
+        """Get the dedup window statistics."""
+        return {
+            "size": len(self._seen),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "total_added": self.total_added,
+            "hits": self.hits,
+            "evictions": self.evictions,
+        }
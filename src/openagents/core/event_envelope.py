@@ -0,0 +1,91 @@
+"""
+Shared delivery envelopes for OpenAgents events.
+
+When an event fans out to many agents, every recipient's queue holds the same
+EventEnvelope. The event is serialized once per delivery, and each transport
+encoding of it (JSON text, protobuf message, ...) is computed once and cached,
+so broadcast cost does not grow with the number of recipients times the payload
+size.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from openagents.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+
+class SerializedEvent(dict):
+    """
+    Serialized form of a delivered event, shared by all recipients of the delivery.
+
+    It is a plain dict for every consumer that expects one, and additionally caches
+    encodings of itself. Because the same instance is handed to every recipient it
+    must be treated as read-only.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        super().__init__(data)
+        self._encodings: Dict[str, Any] = {}
+
+    def get_encoding(self, key: str, encoder: Callable[["SerializedEvent"], Any]) -> Any:
+        """Get an encoding of the event, computing it on first use.
+
+        Args:
+            key: Name of the encoding, e.g. "json" or "grpc"
+            encoder: Function producing the encoding from this dict
+
+        Returns:
+            Any: The cached encoding
+        """
+        encoding = self._encodings.get(key)
+        if encoding is None:
+            encoding = encoder(self)
+            self._encodings[key] = encoding
+        return encoding
+
+    def to_json(self) -> str:
+        """Get the event encoded as JSON text."""
+        return self.get_encoding("json", lambda data: json.dumps(data, default=str))
+
+
+class EventEnvelope:
+    """An event queued for delivery, shared by all of its recipients."""
+
+    __slots__ = ("event", "_serialized")
+
+    def __init__(self, event: Event):
+        self.event = event
+        self._serialized: Optional[SerializedEvent] = None
+
+    def to_dict(self) -> SerializedEvent:
+        """Get the serialized event, computing it once for all recipients."""
+        if self._serialized is None:
+            self._serialized = SerializedEvent(self.event.to_dict())
+        return self._serialized
+
+
+def encode_json(data: Any) -> str:
+    """Encode data as JSON, reusing the cached encoding of a SerializedEvent."""
+    if isinstance(data, SerializedEvent):
+        return data.to_json()
+    return json.dumps(data, default=str)
+
+
+def encode_json_object(fields: Dict[str, Any]) -> str:
+    """Encode a dict as a JSON object, reusing the cached encoding of its events.
+
+    Each value is encoded with encode_json, and list values item by item, so a
+    response listing many events splices in their cached JSON instead of
+    encoding them again.
+    """
+    parts = []
+    for key, value in fields.items():
+        if isinstance(value, list):
+            encoded = "[" + ", ".join(encode_json(item) for item in value) + "]"
+        else:
+            encoded = encode_json(value)
+        parts.append(json.dumps(str(key)) + ": " + encoded)
+    return "{" + ", ".join(parts) + "}"
@@ -1,9 +1,13 @@
 import time
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List
 import asyncio
 import logging
 from typing import Any, TYPE_CHECKING, Optional
+from openagents.core.agent_event_queue import AgentEventQueue, QUEUED, REJECTED
+from openagents.core.dedup_window import EventDedupWindow
+from openagents.core.event_envelope import EventEnvelope
 from openagents.core.event_processor import ModEventProcessor
+from openagents.core.subscription_index import SubscriptionIndex
 from openagents.core.system_commands import SystemCommandProcessor
 from openagents.models.event import Event, EventSubscription
 from openagents.models.event_response import EventResponse
@@ -14,8 +18,6 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-MAX_PROCESSED_EVENT_IDS = 100000
-
 
 class EventGateway:
     """
@@ -67,6 +69,9 @@ class EventGateway:
         specific events with event name patterns. Once subscribed, only the events that match the subscription will be
         delivered to the agent.
 
+        Subscription patterns are compiled into a SubscriptionIndex, so the subscribed agents matching an event are
+        resolved with a single lookup per delivery instead of scanning every subscription of every recipient.
+
     Delivery of events:
 
     - After processed by the event processor, there are two outcomes:
@@ -85,6 +90,11 @@ class EventGateway:
     The event gateway maintains a queue for each agent to temporarily store delivered events. An event notifier will monitor
     the queue and deliver the events to the agent. In some cases, the agent can also poll the queue to get new events.
 
+    Each queue is bounded by `agent_queue_max_size` in the network config. Once a queue is full,
+    `agent_queue_overflow_policy` decides whether the oldest or newest event is dropped, events are coalesced by
+    their `coalesce_key` metadata, or the event is rejected and the sender gets an error response. Overflows are
+    counted in `get_stats()`.
+
     Key responsibilities of the event gateway:
     1. Route events to appropriate processors (system commands vs regular events)
     2. Maintain event subscriptions for agents
@@ -97,10 +107,16 @@ class EventGateway:
 
     def __init__(self, network: "AgentNetwork"):
         self.network = network
-        self.processed_event_ids: Set[str] = set()
+        self.processed_event_ids = EventDedupWindow(
+            max_size=network.config.event_dedup_window_size,
+            ttl=network.config.event_dedup_ttl,
+        )
         self.agent_subscriptions: Dict[str, List[EventSubscription]] = {}
+        self.subscription_index = SubscriptionIndex()
         self.channel_members: Dict[str, List[str]] = {}
-        self.agent_event_queues: Dict[str, asyncio.Queue] = {}
+        self.agent_event_queues: Dict[str, AgentEventQueue] = {}
+        # Overflow outcome -> count across all agent queues, including removed ones
+        self.queue_overflow_counts: Dict[str, int] = {}
         self.system_command_processor = SystemCommandProcessor(network)
         self.mod_event_processor = ModEventProcessor(network.mods)
 
@@ -122,26 +138,20 @@ class EventGateway:
             f"🔧 NETWORK: Processing regular event: {event_id}|{event.event_name}"
         )
 
-        # Prevent infinite loops by tracking processed messages
-        if event_id in self.processed_event_ids:
+        # Prevent infinite loops by tracking processed messages; the window evicts the
+        # oldest IDs itself so memory stays bounded
+        if self.processed_event_ids.check_and_add(event_id):
             logger.info(f"🔧 Skipping already processed event {event_id}")
             return
 
-        # Mark message as processed
-        self.processed_event_ids.add(event_id)
-
-        # Clean up old processed message IDs to prevent memory leak (keep last 1000)
-        if len(self.processed_event_ids) > MAX_PROCESSED_EVENT_IDS:
-            # Remove oldest half
-            old_ids = list(self.processed_event_ids)[: MAX_PROCESSED_EVENT_IDS // 2]
-            for old_id in old_ids:
-                self.processed_event_ids.remove(old_id)
-
         response = await self.mod_event_processor.process_event(event)
         return response
 
     async def process_event(
-        self, event: Event, enable_delivery: bool = True
+        self,
+        event: Event,
+        enable_delivery: bool = True,
+        recipient_ids: Optional[Iterable[str]] = None,
     ) -> EventResponse:
         """
         Process an event coming from the transport layer.
@@ -151,6 +161,9 @@ class EventGateway:
         Args:
             event: The event to process
             enable_delivery: Whether to enable delivery of the event to the destination
+            recipient_ids: Explicit agents to deliver the event to instead of resolving its
+                destination (multicast). The event is processed once and only fanned out
+                at the queue level.
 
         Returns:
             EventResponse: The event response
@@ -178,7 +191,13 @@ class EventGateway:
             return response
         # Deliver the event to the destination if the event is not intercepted by the system or regular event processor
         if enable_delivery:
-            await self.deliver_event(event)
+            rejected_agents = await self.deliver_event(event, recipient_ids)
+            if rejected_agents:
+                return EventResponse(
+                    success=False,
+                    message=f"Event {event.event_name} rejected: event queue full for agents {', '.join(rejected_agents)}",
+                    data={"rejected_agents": rejected_agents},
+                )
             return EventResponse(
                 success=True,
                 message=f"Event {event.event_name} delivered to destination",
@@ -189,27 +208,58 @@ class EventGateway:
                 message=f"Event {event.event_name} processed but not delivered",
             )
 
-    async def deliver_event(self, event: Event):
+    async def deliver_event(
+        self, event: Event, recipient_ids: Optional[Iterable[str]] = None
+    ) -> List[str]:
         """
         Deliver an event to corresponding agent queue.
 
+        If recipient_ids is given, the event is delivered to exactly those agents.
         If the event has `channel:...` specified, it will be delivered to all member agents in the channel.
         If the event has `agent:...` specified, it will be delivered to the target agent directly.
         If the event has `agent:broadcast` specified, it will be delivered to all agents in the network.
+
+        All recipients share a single EventEnvelope, so the event is serialized once per delivery
+        rather than once per recipient.
+
+        Args:
+            event: The event to deliver
+            recipient_ids: Explicit agents to deliver the event to instead of its destination
+
+        Returns:
+            List[str]: IDs of agents whose full queue rejected the event
         """
+        rejected_agents = []
+        envelope = EventEnvelope(event)
         destination = event.parse_destination()
         logger.debug(
             f"Delivering event: {event.event_name} from {event.source_id} to {event.destination_id}"
         )
 
+        # Resolve subscription matches once for all recipients of this event
+        matched_subscriptions = self.subscription_index.match(event.event_name)
+
+        # Handle multicast delivery to an explicit recipient set
+        if recipient_ids is not None:
+            for agent_id in recipient_ids:
+                outcome = self._enqueue_for_agent(
+                    envelope, agent_id, matched_subscriptions
+                )
+                if outcome == REJECTED:
+                    rejected_agents.append(agent_id)
+
         # Handle channel-based delivery
-        if destination.role == NetworkRole.CHANNEL:
+        elif destination.role == NetworkRole.CHANNEL:
             channel_id = destination.desitnation_id
             logger.debug(f"Delivering event to channel: {channel_id}")
             if channel_id in self.channel_members:
                 for agent_id in self.channel_members[channel_id]:
                     if agent_id != event.source_id:  # Don't deliver to sender
-                        await self.deliver_to_agent(event, agent_id)
+                        outcome = self._enqueue_for_agent(
+                            envelope, agent_id, matched_subscriptions
+                        )
+                        if outcome == REJECTED:
+                            rejected_agents.append(agent_id)
             else:
                 logger.warning(f"Channel {channel_id} has no members")
 
@@ -222,7 +272,11 @@ class EventGateway:
                 logger.info(f"Delivering event to {len(group_members)} agents in group '{group_id}'")
                 for agent_id in group_members:
                     if agent_id != event.source_id:  # Don't deliver to sender
-                        await self.deliver_to_agent(event, agent_id)
+                        outcome = self._enqueue_for_agent(
+                            envelope, agent_id, matched_subscriptions
+                        )
+                        if outcome == REJECTED:
+                            rejected_agents.append(agent_id)
             else:
                 logger.warning(f"Group '{group_id}' has no members or does not exist")
 
@@ -233,31 +287,76 @@ class EventGateway:
                 logger.debug("Broadcasting event to all agents")
                 for agent_id in self.agent_event_queues.keys():
                     if agent_id != event.source_id:  # Don't deliver to sender
-                        await self.deliver_to_agent(event, agent_id)
+                        outcome = self._enqueue_for_agent(
+                            envelope, agent_id, matched_subscriptions
+                        )
+                        if outcome == REJECTED:
+                            rejected_agents.append(agent_id)
             else:
                 # Direct delivery to specific agent
                 logger.debug(
                     f"Delivering event directly to agent: {destination.desitnation_id}"
                 )
-                await self.deliver_to_agent(event, destination.desitnation_id)
+                outcome = self._enqueue_for_agent(
+                    envelope, destination.desitnation_id, matched_subscriptions
+                )
+                if outcome == REJECTED:
+                    rejected_agents.append(destination.desitnation_id)
 
         else:
             logger.debug("No valid destination specified, skipping delivery")
 
-    async def deliver_to_agent(self, event: Event, agent_id: str):
+        return rejected_agents
+
+    async def deliver_to_agent(
+        self,
+        event: Event,
+        agent_id: str,
+        matched_subscriptions: Optional[Dict[str, List[EventSubscription]]] = None,
+    ) -> Optional[str]:
         """
         Deliver an event to a specific agent's queue, filtered by agent's subscriptions.
+
+        Args:
+            event: The event to deliver
+            agent_id: The ID of the target agent
+            matched_subscriptions: Subscriptions matching the event name grouped by agent ID,
+                as returned by SubscriptionIndex.match. Looked up if not provided.
+
+        Returns:
+            Optional[str]: The queue outcome (see AgentEventQueue.offer), or None if the event
+                was not meant for the agent
         """
+        return self._enqueue_for_agent(
+            EventEnvelope(event), agent_id, matched_subscriptions
+        )
+
+    def _enqueue_for_agent(
+        self,
+        envelope: EventEnvelope,
+        agent_id: str,
+        matched_subscriptions: Optional[Dict[str, List[EventSubscription]]] = None,
+    ) -> Optional[str]:
+        """
+        Queue an event envelope for an agent if the agent's subscriptions allow it.
+
+        See deliver_to_agent for the arguments and return value.
+        """
+        event = envelope.event
         if agent_id not in self.agent_event_queues:
             logger.debug(f"Agent {agent_id} has no event queue, skipping delivery")
-            return
+            return None
 
         # Check if agent has any subscriptions
         if agent_id in self.agent_subscriptions and self.agent_subscriptions[agent_id]:
             # Agent has subscriptions - check if event matches any of them
+            if matched_subscriptions is None:
+                matched_subscriptions = self.subscription_index.match(event.event_name)
             event_matches = False
-            for subscription in self.agent_subscriptions[agent_id]:
-                if subscription.is_active and subscription.matches_event(event):
+            for subscription in matched_subscriptions.get(agent_id, []):
+                if subscription.is_active and event.is_visible_to_agent(
+                    subscription.agent_id
+                ):
                     event_matches = True
                     logger.debug(
                         f"Event {event.event_name} matches subscription {subscription.subscription_id} for agent {agent_id}"
@@ -268,7 +367,7 @@ class EventGateway:
                 logger.debug(
                     f"Event {event.event_name} does not match any subscriptions for agent {agent_id}, skipping delivery"
                 )
-                return
+                return None
         else:
             # Agent has no subscriptions - deliver all events (default behavior)
             logger.debug(
@@ -276,33 +375,98 @@ class EventGateway:
             )
 
         # Deliver the event to the agent's queue
-        await self.agent_event_queues[agent_id].put(event)
-        logger.debug(f"Delivered event {event.event_name} to agent {agent_id}")
+        outcome = self.agent_event_queues[agent_id].offer(envelope)
+        if outcome == QUEUED:
+            logger.debug(f"Delivered event {event.event_name} to agent {agent_id}")
+        else:
+            self.queue_overflow_counts[outcome] = (
+                self.queue_overflow_counts.get(outcome, 0) + 1
+            )
+            logger.warning(
+                f"Event queue for agent {agent_id} is full, event {event.event_name} {outcome}"
+            )
+        return outcome
 
-    async def poll_events(self, agent_id: str) -> List[Event]:
+    async def poll_events(self, agent_id: str, wait_timeout: float = 0.0) -> List[Event]:
         """
         Poll events from a specific agent's queue.
+
+        Args:
+            agent_id: The ID of the agent to poll events for
+            wait_timeout: If the queue is empty, wait up to this many seconds for an event to
+                arrive before returning (long polling). 0 returns immediately.
+
+        Returns:
+            List[Event]: The events drained from the agent's queue
+        """
+        envelopes = await self.poll_envelopes(agent_id, wait_timeout=wait_timeout)
+        return [envelope.event for envelope in envelopes]
+
+    async def poll_envelopes(
+        self, agent_id: str, wait_timeout: float = 0.0
+    ) -> List[EventEnvelope]:
+        """
+        Poll event envelopes from a specific agent's queue.
+
+        Unlike poll_events, this keeps the envelopes shared with the other recipients, so
+        transports can reuse their cached serialization. See poll_events for the arguments.
+
+        Returns:
+            List[EventEnvelope]: The envelopes drained from the agent's queue
         """
         # Record heartbeat
         await self.network.topology.record_heartbeat(agent_id)
 
         if agent_id in self.agent_event_queues:
             queue = self.agent_event_queues[agent_id]
-            events = []
+            envelopes = []
+            if queue.empty() and wait_timeout > 0:
+                try:
+                    envelopes.append(
+                        await asyncio.wait_for(queue.get(), timeout=wait_timeout)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                # The agent was alive for the whole wait
+                try:
+                    await self.network.topology.record_heartbeat(agent_id)
+                except asyncio.CancelledError:
+                    # The poller went away; keep the event for the next poll
+                    self.requeue_envelopes(agent_id, envelopes)
+                    raise
             while not queue.empty():
-                event = queue.get_nowait()
-                events.append(event)
-            return events
+                envelopes.append(queue.get_nowait())
+            return envelopes
         else:
             logger.debug(f"Agent {agent_id} has no event queue, returning empty list")
             return []
 
+    def requeue_envelopes(self, agent_id: str, envelopes: List[EventEnvelope]) -> None:
+        """
+        Put polled envelopes back at the front of an agent's queue.
+
+        Transports call this for events they polled but could not deliver, e.g.
+        because the agent's connection closed, so the next poll returns them.
+
+        Args:
+            agent_id: The ID of the agent the envelopes were polled for
+            envelopes: The undelivered envelopes, oldest first
+        """
+        if agent_id in self.agent_event_queues:
+            self.agent_event_queues[agent_id].requeue(envelopes)
+            logger.debug(f"Requeued {len(envelopes)} undelivered events for agent {agent_id}")
+        else:
+            logger.debug(f"Agent {agent_id} has no event queue, dropping {len(envelopes)} undelivered events")
+
     def register_agent(self, agent_id: str):
         """
         Register an agent with the event gateway by creating an event queue.
         """
         if agent_id not in self.agent_event_queues:
-            self.agent_event_queues[agent_id] = asyncio.Queue()
+            self.agent_event_queues[agent_id] = AgentEventQueue(
+                max_size=self.network.config.agent_queue_max_size,
+                overflow_policy=self.network.config.agent_queue_overflow_policy,
+            )
             logger.debug(f"Created event queue for agent {agent_id}")
         else:
             logger.debug(f"Agent {agent_id} already has an event queue")
@@ -326,6 +490,7 @@ class EventGateway:
             channels=set(channels) if channels else set(),
         )
         self.agent_subscriptions[agent_id].append(subscription)
+        self.subscription_index.add(subscription)
         logger.info(f"Agent {agent_id} subscribed to patterns {event_patterns}")
         return subscription
 
@@ -338,6 +503,7 @@ class EventGateway:
             for subscription in list(subscriptions):
                 if subscription.subscription_id == subscription_id:
                     subscriptions.remove(subscription)
+                    self.subscription_index.remove(subscription_id)
                     logger.info(
                         f"Agent {agent_id} unsubscribed from patterns {subscription.event_patterns}"
                     )
@@ -349,7 +515,7 @@ class EventGateway:
         Unsubscribe an agent from all events.
         """
         if agent_id in self.agent_subscriptions:
-            for subscription in self.agent_subscriptions[agent_id]:
+            for subscription in list(self.agent_subscriptions[agent_id]):
                 self.unsubscribe(subscription.subscription_id)
         return None
 
@@ -364,8 +530,23 @@ class EventGateway:
         Get the statistics of the event gateway.
         """
         return {
-            "total_events": len(self.processed_event_ids),
+            "total_events": self.processed_event_ids.total_added,
+            "dedup": self.processed_event_ids.get_stats(),
             "active_subscriptions": len(self.agent_subscriptions),
+            "queued_events": sum(
+                queue.qsize() for queue in self.agent_event_queues.values()
+            ),
+            "queue_overflows": dict(self.queue_overflow_counts),
+            "agent_queue_overflows": {
+                agent_id: {
+                    outcome: count
+                    for outcome, count in queue.overflow_counts.items()
+                    if count
+                }
+                for agent_id, queue in self.agent_event_queues.items()
+                if any(queue.overflow_counts.values())
+            },
+            "heartbeats": self.network.topology.heartbeat_deadlines.get_stats(),
         }
 
     def remove_agent_event_queue(self, agent_id: str):
@@ -436,42 +617,46 @@ class EventGateway:
     def _get_group_members(self, group_id: str) -> List[str]:
         """
         Get the list of agent IDs that belong to a specific group.
-        
+
+        Agents assigned to the group at registration are taken from the topology's
+        group members index; agents listed in the group's configuration are added.
+
         Args:
             group_id: The ID of the agent group
-            
+
         Returns:
             List of agent IDs in the group, empty list if group not found
         """
         try:
+            agents = sorted(self.network.topology.get_group_members(group_id))
+
             # Access network configuration to get agent groups
+            configured_agents = []
             if hasattr(self.network, 'config') and hasattr(self.network.config, 'agent_groups'):
                 agent_groups = self.network.config.agent_groups
                 if group_id in agent_groups:
                     group_info = agent_groups[group_id]
-                    
+
                     # Handle Pydantic AgentGroupConfig objects
                     if hasattr(group_info, 'metadata'):
                         metadata = group_info.metadata
                         if isinstance(metadata, dict) and 'agents' in metadata:
-                            agents = metadata['agents']
-                            logger.debug(f"Found {len(agents)} agents in group '{group_id}': {agents}")
-                            return agents
-                    
+                            configured_agents = metadata['agents']
+
                     # Handle dictionary format (backward compatibility)
                     elif isinstance(group_info, dict):
                         if 'metadata' in group_info and 'agents' in group_info['metadata']:
-                            agents = group_info['metadata']['agents']
-                            logger.debug(f"Found {len(agents)} agents in group '{group_id}': {agents}")
-                            return agents
+                            configured_agents = group_info['metadata']['agents']
                         elif 'agents' in group_info:
-                            agents = group_info['agents']
-                            logger.debug(f"Found {len(agents)} agents in group '{group_id}': {agents}")
-                            return agents
-                    
-            logger.debug(f"Group '{group_id}' not found or has no agents defined")
-            return []
-            
+                            configured_agents = group_info['agents']
+
+            agents.extend(agent_id for agent_id in configured_agents if agent_id not in agents)
+            if agents:
+                logger.debug(f"Found {len(agents)} agents in group '{group_id}': {agents}")
+            else:
+                logger.debug(f"Group '{group_id}' not found or has no agents defined")
+            return agents
+
         except Exception as e:
             logger.error(f"Error looking up group members for '{group_id}': {e}")
             return []
@@ -481,6 +666,8 @@ class EventGateway:
         Cleanup an agent's event subscription and queue.
         """
         if agent_id in self.agent_subscriptions:
+            for subscription in self.agent_subscriptions[agent_id]:
+                self.subscription_index.remove(subscription.subscription_id)
             del self.agent_subscriptions[agent_id]
         if agent_id in self.agent_event_queues:
             self.remove_agent_event_queue(agent_id)
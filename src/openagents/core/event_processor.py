@@ -6,7 +6,7 @@ messages through mods in a structured, predictable way.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, TYPE_CHECKING, OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING, OrderedDict
 
 from openagents.models.event_response import EventResponse
 from openagents.models.network_role import NetworkRole
@@ -18,6 +18,9 @@ from openagents.models.event import Event
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of event names kept in the mod dispatch table
+MAX_DISPATCH_TABLE_SIZE = 4096
+
 
 class ModEventProcessor:
     """
@@ -36,6 +39,11 @@ class ModEventProcessor:
     Special rules:
     - If an event has a `mod:...` destination, then the event will be processed by the specific mod only, bypassing all other mods.
     - If an event is sent from a mod, then the event will not by processed by the same mod.
+
+    To avoid awaiting every mod for every event, the processor keeps a dispatch table mapping event names
+    to the mods that have a handler for them (or override process_event), in pipeline order. Whoever changes
+    the set of mods or a bound mod's event handlers calls invalidate_dispatch_table(), so the table is rebuilt
+    and the first mod to respond still wins.
     """
 
     def __init__(self, mods: OrderedDict[str, "BaseMod"]):
@@ -45,6 +53,40 @@ class ModEventProcessor:
             network: The network instance this processor belongs to
         """
         self.mods = mods
+        # event name -> (mod name, mod) pairs that may handle it, in pipeline order
+        self._dispatch_table: Dict[str, List[Tuple[str, "BaseMod"]]] = {}
+        # Bumped whenever the mods or their handlers change; the table is built for _dispatch_version
+        self.mods_version = 0
+        self._dispatch_version = 0
+
+    def invalidate_dispatch_table(self) -> None:
+        """Rebuild the dispatch table on next use, after mods or their handlers changed."""
+        self.mods_version += 1
+
+    def get_dispatch_mods(self, event_name: str) -> List[Tuple[str, "BaseMod"]]:
+        """Get the mods that may handle an event, in pipeline order.
+
+        Args:
+            event_name: The name of the event
+
+        Returns:
+            List[Tuple[str, BaseMod]]: (mod name, mod) pairs whose handlers can match the event
+        """
+        if self._dispatch_version != self.mods_version:
+            self._dispatch_table = {}
+            self._dispatch_version = self.mods_version
+
+        dispatch_mods = self._dispatch_table.get(event_name)
+        if dispatch_mods is None:
+            dispatch_mods = [
+                (mod_name, mod)
+                for mod_name, mod in self.mods.items()
+                if not hasattr(mod, "can_handle_event") or mod.can_handle_event(event_name)
+            ]
+            if len(self._dispatch_table) >= MAX_DISPATCH_TABLE_SIZE:
+                self._dispatch_table = {}
+            self._dispatch_table[event_name] = dispatch_mods
+        return dispatch_mods
 
     async def process_event(self, event: Event) -> Optional[EventResponse]:
         """Process an event through the appropriate pipeline.
@@ -55,14 +97,13 @@ class ModEventProcessor:
         Returns:
             Optional[EventResponse]: The event response, or None if the event is not processed
         """
-        incoming_event = event.model_copy()
-
         # Parse destination to check if it's targeting a specific mod
         destination = event.parse_destination()
         source = event.parse_source()
 
         # If destination is mod:..., only process through that specific mod
         if destination.role == NetworkRole.MOD:
+            incoming_event = event.model_copy()
             target_mod = destination.desitnation_id
             if target_mod in self.mods:
                 mod = self.mods[target_mod]
@@ -97,7 +138,11 @@ class ModEventProcessor:
             # Process through all mods in order, skipping the source mod if event came from a mod
             source_mod = source.source_id if source.role == NetworkRole.MOD else None
 
-            for mod_name, mod in self.mods.items():
+            dispatch_mods = self.get_dispatch_mods(event.event_name)
+            if dispatch_mods:
+                incoming_event = event.model_copy()
+
+            for mod_name, mod in dispatch_mods:
                 # Skip processing if this mod is the source of the event
                 if source_mod and mod_name == source_mod:
                     logger.debug(
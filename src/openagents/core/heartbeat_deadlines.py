@@ -0,0 +1,133 @@
+"""
+Heartbeat expiry tracking for OpenAgents.
+
+This module provides a min-heap of agent heartbeat deadlines. Recording a heartbeat
+only updates the agent's last-seen time; the heap is corrected lazily when an entry
+comes due, so expiry checks touch only agents whose deadline has passed instead of
+scanning every registered agent.
+"""
+
+import heapq
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class HeartbeatDeadlines:
+    """
+    Tracks when each agent's heartbeat expires.
+
+    An agent expires once ``timeout + grace_period`` seconds have passed since its last
+    heartbeat. Each tracked agent has one live heap entry. When that entry comes due and
+    the agent has sent a heartbeat since it was scheduled, the entry is pushed back to
+    the new deadline instead of expiring the agent. Entries left behind by removed
+    agents are discarded when they reach the top of the heap.
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        grace_period: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            timeout: Seconds without a heartbeat after which an agent is stale
+            grace_period: Extra seconds allowed past the timeout before expiry
+            clock: Time source, overridable for tests; must match the clock used for
+                heartbeat timestamps
+        """
+        self.timeout = timeout
+        self.grace_period = grace_period
+        self._clock = clock
+        # (deadline, agent_id); entries not matching _scheduled are stale
+        self._heap: List[Tuple[float, str]] = []
+        self._scheduled: Dict[str, float] = {}
+        self._last_seen: Dict[str, float] = {}
+        self.expired = 0
+        self.rescheduled = 0
+
+    def __len__(self) -> int:
+        return len(self._last_seen)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._last_seen
+
+    @property
+    def expiry_after(self) -> float:
+        """Seconds from the last heartbeat until an agent expires."""
+        return self.timeout + self.grace_period
+
+    def touch(self, agent_id: str, timestamp: Optional[float] = None) -> None:
+        """Record a heartbeat from an agent, starting to track it if needed.
+
+        Args:
+            agent_id: The agent that sent the heartbeat
+            timestamp: Time of the heartbeat, defaults to now
+        """
+        if timestamp is None:
+            timestamp = self._clock()
+        if agent_id not in self._scheduled:
+            self._schedule(agent_id, timestamp + self.expiry_after)
+        self._last_seen[agent_id] = timestamp
+
+    def remove(self, agent_id: str) -> None:
+        """Stop tracking an agent; its heap entry is discarded when it comes due."""
+        self._scheduled.pop(agent_id, None)
+        self._last_seen.pop(agent_id, None)
+
+    def next_deadline(self) -> Optional[float]:
+        """Get the earliest scheduled deadline, or None if no agent is tracked."""
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_expired(self, now: Optional[float] = None) -> List[str]:
+        """Remove and return the agents whose heartbeat has expired.
+
+        Args:
+            now: Current time, defaults to the tracker's clock
+
+        Returns:
+            List[str]: IDs of the expired agents, no longer tracked
+        """
+        if now is None:
+            now = self._clock()
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_stale(entry):
+                continue
+            agent_id = entry[1]
+            deadline = self._last_seen[agent_id] + self.expiry_after
+            if deadline > now:
+                # Heartbeats arrived since the entry was scheduled
+                self._schedule(agent_id, deadline)
+                self.rescheduled += 1
+                continue
+            self.remove(agent_id)
+            expired.append(agent_id)
+        self.expired += len(expired)
+        return expired
+
+    def _schedule(self, agent_id: str, deadline: float) -> None:
+        self._scheduled[agent_id] = deadline
+        heapq.heappush(self._heap, (deadline, agent_id))
+
+    def _is_stale(self, entry: Tuple[float, str]) -> bool:
+        """Whether a heap entry was superseded or belongs to a removed agent."""
+        deadline, agent_id = entry
+        return self._scheduled.get(agent_id) != deadline
+
+    def get_stats(self) -> dict:
+        """Get the heartbeat tracking statistics."""
+        return {
+            "tracked_agents": len(self._last_seen),
+            "timeout": self.timeout,
+            "grace_period": self.grace_period,
+            "expired": self.expired,
+            "rescheduled": self.rescheduled,
+        }
@@ -4,6 +4,7 @@ Agent network implementation for OpenAgents.
 This module provides the network architecture using the transport and topology abstractions.
 """
 
+import asyncio
 import logging
 import uuid
 import time
@@ -15,6 +16,7 @@ from typing import (
     Optional,
     Callable,
     Awaitable,
+    Iterable,
     OrderedDict,
     Union,
     Set,
@@ -235,6 +237,7 @@ class AgentNetwork:
                     mod_instance.bind_network(network)
                     network.mods[mod_name] = mod_instance
                     logger.info(f"Registered network mod: {mod_name}")
+                network.event_gateway.mod_event_processor.invalidate_dispatch_table()
 
                 logger.info(f"Successfully loaded {len(mods)} network mods")
 
@@ -377,6 +380,8 @@ class AgentNetwork:
         """Register internal message handlers."""
         assert self.topology is not None
         self.topology.register_event_handler(self.process_external_event)
+        self.topology.register_batch_event_handler(self.process_external_events)
+        self.topology.register_agent_expiry_handler(self.unregister_agent)
         
         # Register system event handlers for dynamic mod loading
         self.event_gateway.system_command_processor.command_handlers["system.mod.load"] = self._handle_system_mod_load
@@ -793,6 +798,71 @@ class AgentNetwork:
         Args:
             event: Transport event to handle
         """
+        auth_error = self._authenticate_external_event(event)
+        if auth_error is not None:
+            return auth_error
+        return await self.event_gateway.process_event(event)
+
+    async def process_external_events(
+        self, events: List[Event], concurrent: bool = False
+    ) -> List[EventResponse]:
+        """Handle a batch of incoming transport events.
+
+        Each distinct source/secret pair in the batch is authenticated once. Events are
+        processed in order; with ``concurrent`` enabled, events for different
+        destinations are processed concurrently while events for the same destination
+        keep their relative order.
+
+        Args:
+            events: Transport events to handle
+            concurrent: Whether to process independent events concurrently
+
+        Returns:
+            List[EventResponse]: One response per event, in the order of ``events``
+        """
+        responses: List[Optional[EventResponse]] = [None] * len(events)
+        auth_cache: Dict[tuple, bool] = {}
+        # destination -> indexes of the events for it, in order
+        chains: Dict[Optional[str], List[int]] = {}
+
+        for index, event in enumerate(events):
+            auth_error = self._authenticate_external_event(event, auth_cache)
+            if auth_error is not None:
+                responses[index] = auth_error
+            elif concurrent:
+                chains.setdefault(event.destination_id, []).append(index)
+            else:
+                responses[index] = await self._process_batched_event(event)
+
+        async def process_chain(indexes: List[int]) -> None:
+            for index in indexes:
+                responses[index] = await self._process_batched_event(events[index])
+
+        if chains:
+            await asyncio.gather(*(process_chain(indexes) for indexes in chains.values()))
+        return responses
+
+    async def _process_batched_event(self, event: Event) -> EventResponse:
+        """Process one event of a batch, turning errors into a failed response."""
+        try:
+            return await self.event_gateway.process_event(event)
+        except Exception as e:
+            logger.error(f"Error processing batched event {event.event_id}: {e}")
+            return EventResponse(success=False, message=f"Error processing event: {e}")
+
+    def _authenticate_external_event(
+        self, event: Event, auth_cache: Optional[Dict[tuple, bool]] = None
+    ) -> Optional[EventResponse]:
+        """Check the authentication of an incoming transport event.
+
+        Args:
+            event: Transport event to check
+            auth_cache: Optional cache of validation results keyed by (source_id, secret),
+                used to validate each sender of a batch only once
+
+        Returns:
+            Optional[EventResponse]: A failed response if authentication failed, None otherwise
+        """
         # Skip authentication for system events that don't have secrets
         # But authenticate system events that do include secrets (like authenticated polling/unregistration)
         # Special cases: polling and unregistration always require authentication
@@ -804,21 +874,32 @@ class AgentNetwork:
         if is_system_event and not has_secret and not is_polling_event and not is_unregister_event:
             # System events without secrets bypass authentication (registration, etc.)
             # But polling and unregistration always require authentication
-            return await self.event_gateway.process_event(event)
+            return None
 
         # Validate authentication secret for all other events (unless disabled for testing)
-        if not self.config.disable_agent_secret_verification and not self._validate_event_authentication(
-            event
-        ):
+        if self.config.disable_agent_secret_verification:
+            return None
+
+        if auth_cache is None:
+            is_valid = self._validate_event_authentication(event)
+        else:
+            cache_key = (event.source_id, event.secret)
+            is_valid = auth_cache.get(cache_key)
+            if is_valid is None:
+                is_valid = self._validate_event_authentication(event)
+                auth_cache[cache_key] = is_valid
+
+        if not is_valid:
             logger.warning(f"Authentication failed for event from {event.source_id}")
             return EventResponse(
                 success=False,
                 message="Authentication failed: Invalid or missing secret",
             )
+        return None
 
-        return await self.event_gateway.process_event(event)
-
-    async def process_event(self, event: Event) -> EventResponse:
+    async def process_event(
+        self, event: Event, recipient_ids: Optional[Iterable[str]] = None
+    ) -> EventResponse:
         """Handle internal events from mods that bypass authentication.
         
         This method should be used by mods when sending internal notifications
@@ -826,9 +907,11 @@ class AgentNetwork:
         
         Args:
             event: Internal event to handle
+            recipient_ids: Explicit agents to deliver the event to instead of its
+                destination, so a notification for many agents is processed once
         """
         logger.debug(f"Processing internal event: {event.event_name} from {event.source_id}")
-        return await self.event_gateway.process_event(event)
+        return await self.event_gateway.process_event(event, recipient_ids=recipient_ids)
 
     def _validate_event_authentication(self, event: Event) -> bool:
         """Validate the authentication secret for an event.
@@ -978,6 +1061,7 @@ class AgentNetwork:
 
             # Add to network.mods so ModEventProcessor can process events through this mod
             self.mods[mod_path] = mod_instance
+            self.event_gateway.mod_event_processor.invalidate_dispatch_table()
 
             # Track as dynamically loaded
             self._dynamic_mod_ids.add(mod_id)
@@ -1024,6 +1108,7 @@ class AgentNetwork:
                 mod_instance.shutdown()
                 # Remove from network.mods
                 del self.mods[mod_path]
+                self.event_gateway.mod_event_processor.invalidate_dispatch_table()
 
             # Remove from dynamic tracking
             self._dynamic_mod_ids.discard(mod_id)
@@ -1162,6 +1247,7 @@ class AgentNetwork:
                             mod_instance.bind_network(self)
                             self.mods[mod_name] = mod_instance
                             logger.info(f"Registered mod: {mod_name}")
+                        self.event_gateway.mod_event_processor.invalidate_dispatch_table()
 
                         logger.info(f"Successfully loaded {len(mods)} mods")
 
@@ -1201,6 +1287,7 @@ class AgentNetwork:
                                 mod_instance.bind_network(self)
                                 self.mods[mod_name] = mod_instance
                                 logger.info(f"Registered mod: {mod_name}")
+                            self.event_gateway.mod_event_processor.invalidate_dispatch_table()
 
                             logger.info(f"Successfully loaded {len(mods)} mods from reloaded config")
 
@@ -0,0 +1,163 @@
+"""
+Group-scoped entry notifications for OpenAgents mods.
+
+Mods that share entries between agents (caches, artifacts, ...) notify the
+agents allowed to access an entry when it changes. Each notification is
+processed once and multicast to the members of the entry's allowed agent groups,
+and bursts of updates to the same entry can be folded into one notification
+(see the notification_coalesce_window mod option).
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from openagents.models.event import Event
+
+if TYPE_CHECKING:
+    from openagents.core.base_mod import BaseMod
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CoalescingWindow:
+    """An open window folding the update notifications of one entry."""
+
+    event_name: str
+    payload: Dict[str, Any]
+    allowed_groups: List[str]
+    updated_by: Set[Optional[str]] = field(default_factory=set)
+    task: Optional[asyncio.Task] = None
+
+
+class NotificationCoalescer:
+    """Multicasts a mod's entry notifications and coalesces rapid updates.
+
+    With the mod's notification_coalesce_window set, the first update of an
+    entry is notified right away and further updates within the window are
+    folded into a single notification sent when the window closes.
+    """
+
+    def __init__(self, mod: "BaseMod"):
+        """Initialize the coalescer.
+
+        Args:
+            mod: The mod sending the notifications; its network and config are
+                read when notifications are sent
+        """
+        self.mod = mod
+        # entry_id -> open update notification coalescing window
+        self.windows: Dict[str, CoalescingWindow] = {}
+
+    async def notify(
+        self,
+        event_name: str,
+        entry_id: str,
+        payload: Dict[str, Any],
+        allowed_groups: List[str],
+        exclude_agent: Optional[str] = None,
+        coalesce: bool = False,
+    ) -> None:
+        """Notify the agents with access to an entry.
+
+        Args:
+            event_name: Name of the notification event
+            entry_id: ID of the entry that was modified
+            payload: Payload of the notification
+            allowed_groups: Agent groups with access to the entry (empty = all agents)
+            exclude_agent: Optional agent ID to exclude from notifications
+            coalesce: Whether the notification is an update that may be folded
+                into the entry's coalescing window
+        """
+        coalesce_window = self.mod.config.get("notification_coalesce_window", 0)
+        if coalesce and coalesce_window > 0:
+            window = self.windows.get(entry_id)
+            if window is not None:
+                # The folded notification describes the entry after the last update
+                window.payload = payload
+                window.allowed_groups = allowed_groups
+                window.updated_by.add(exclude_agent)
+                return
+            window = CoalescingWindow(event_name, payload, allowed_groups)
+            window.task = asyncio.create_task(
+                self._close_window(entry_id, window, coalesce_window)
+            )
+            self.windows[entry_id] = window
+
+        await self.multicast(event_name, payload, allowed_groups, exclude_agent)
+
+    def discard(self, entry_id: str) -> None:
+        """Drop the pending update notification of an entry, e.g. once it is deleted."""
+        window = self.windows.pop(entry_id, None)
+        if window is not None and window.task is not None:
+            window.task.cancel()
+
+    def close(self) -> None:
+        """Drop all pending update notifications."""
+        for entry_id in list(self.windows):
+            self.discard(entry_id)
+
+    async def _close_window(
+        self, entry_id: str, window: CoalescingWindow, delay: float
+    ) -> None:
+        """Send the update notification folding the updates made during a window."""
+        await asyncio.sleep(delay)
+        if self.windows.get(entry_id) is not window:
+            return
+        del self.windows[entry_id]
+        if not window.updated_by:
+            return
+
+        # Only the agent that made all of the folded updates already knows about them
+        updated_by = window.updated_by
+        exclude_agent = next(iter(updated_by)) if len(updated_by) == 1 else None
+        await self.multicast(
+            window.event_name, window.payload, window.allowed_groups, exclude_agent
+        )
+
+    async def multicast(
+        self,
+        event_name: str,
+        payload: Dict[str, Any],
+        allowed_groups: List[str],
+        exclude_agent: Optional[str] = None,
+    ) -> None:
+        """Process a notification once and fan it out to the agents with access.
+
+        Args:
+            event_name: Name of the notification event
+            payload: Payload of the notification
+            allowed_groups: Agent groups with access to the entry (empty = all agents)
+            exclude_agent: Optional agent ID to exclude from notifications
+        """
+        network = self.mod.network
+        topology = network.topology
+        if allowed_groups:
+            # Notify only agents in allowed groups
+            notify_agents = set()
+            for group in allowed_groups:
+                notify_agents.update(topology.get_group_members(group))
+        else:
+            # Notify all registered agents
+            notify_agents = set(topology.agent_registry.keys())
+
+        # Exclude the agent who triggered the notification
+        if exclude_agent:
+            notify_agents.discard(exclude_agent)
+
+        if not notify_agents:
+            return
+
+        notification = Event(
+            event_name=event_name,
+            source_id=network.network_id,
+            destination_id=next(iter(notify_agents)) if len(notify_agents) == 1 else None,
+            payload=payload,
+        )
+        try:
+            await network.process_event(notification, recipient_ids=notify_agents)
+            logger.debug(f"Sent {event_name} notification to {len(notify_agents)} agents")
+        except Exception as e:
+            logger.error(f"Failed to send {event_name} notification: {e}")
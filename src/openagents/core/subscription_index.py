@@ -0,0 +1,157 @@
+"""
+Subscription routing index for OpenAgents.
+
+This module provides a compiled routing structure for event subscriptions so the
+event gateway can resolve the set of subscribed agents for an event name in a
+single lookup instead of scanning every subscription of every recipient.
+"""
+
+import logging
+from typing import Dict, List, Optional, Set
+
+from openagents.models.event import EventSubscription
+
+logger = logging.getLogger(__name__)
+
+
+class _TrieNode:
+    """A node of the subscription trie, keyed on one dotted event name segment."""
+
+    __slots__ = ("children", "exact", "wildcards")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Subscriptions whose pattern ends exactly at this node, e.g. "project.created"
+        self.exact: Dict[str, EventSubscription] = {}
+        # Subscriptions whose pattern is a trailing wildcard below this node, keyed by
+        # the partial segment before the "*" (e.g. "project.run*" -> "run")
+        self.wildcards: Dict[str, Dict[str, EventSubscription]] = {}
+
+    def is_empty(self) -> bool:
+        return not (self.children or self.exact or self.wildcards)
+
+
+class SubscriptionIndex:
+    """
+    Trie of subscription patterns keyed on dotted event name segments.
+
+    The index mirrors the semantics of ``Event.matches_pattern``:
+
+    - ``*`` matches every event
+    - ``prefix*`` matches every event name starting with ``prefix``
+    - any other pattern matches the event name exactly
+
+    A trailing wildcard pattern is split into its complete segments, which are
+    walked in the trie, and a partial last segment, which is matched as a string
+    prefix of the next event name segment. Lookups therefore cost
+    O(segments × wildcards per node) regardless of how many agents are subscribed.
+
+    The index only answers the pattern question. Active state and visibility are
+    still checked by the caller, since both can change without going through
+    ``subscribe``/``unsubscribe``.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        # subscription_id -> subscription, for removal
+        self._subscriptions: Dict[str, EventSubscription] = {}
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def __contains__(self, subscription_id: str) -> bool:
+        return subscription_id in self._subscriptions
+
+    @staticmethod
+    def _split_pattern(pattern: str):
+        """Split a pattern into (segments, partial) where partial is None for exact patterns."""
+        if pattern.endswith("*"):
+            prefix = pattern[:-1]
+            segments = prefix.split(".")
+            partial = segments.pop()
+            return segments, partial
+        return pattern.split("."), None
+
+    def add(self, subscription: EventSubscription) -> None:
+        """Add a subscription to the index."""
+        if subscription.subscription_id in self._subscriptions:
+            self.remove(subscription.subscription_id)
+        self._subscriptions[subscription.subscription_id] = subscription
+
+        for pattern in set(subscription.event_patterns):
+            segments, partial = self._split_pattern(pattern)
+            node = self._root
+            for segment in segments:
+                node = node.children.setdefault(segment, _TrieNode())
+            if partial is None:
+                node.exact[subscription.subscription_id] = subscription
+            else:
+                node.wildcards.setdefault(partial, {})[
+                    subscription.subscription_id
+                ] = subscription
+
+    def remove(self, subscription_id: str) -> Optional[EventSubscription]:
+        """Remove a subscription from the index and prune empty trie nodes."""
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return None
+
+        for pattern in set(subscription.event_patterns):
+            segments, partial = self._split_pattern(pattern)
+            path = [self._root]
+            for segment in segments:
+                child = path[-1].children.get(segment)
+                if child is None:
+                    break
+                path.append(child)
+            else:
+                node = path[-1]
+                if partial is None:
+                    node.exact.pop(subscription_id, None)
+                elif partial in node.wildcards:
+                    node.wildcards[partial].pop(subscription_id, None)
+                    if not node.wildcards[partial]:
+                        del node.wildcards[partial]
+                # Prune nodes that no longer hold any pattern
+                for depth in range(len(segments), 0, -1):
+                    if not path[depth].is_empty():
+                        break
+                    del path[depth - 1].children[segments[depth - 1]]
+
+        return subscription
+
+    def match(self, event_name: str) -> Dict[str, List[EventSubscription]]:
+        """
+        Find all subscriptions with a pattern matching the event name.
+
+        Args:
+            event_name: The event name to match
+
+        Returns:
+            Dict[str, List[EventSubscription]]: Matching subscriptions grouped by agent ID
+        """
+        matched: Dict[str, EventSubscription] = {}
+        segments = event_name.split(".")
+        node = self._root
+        depth = 0
+        while node is not None:
+            if node.wildcards and depth < len(segments):
+                # A partial segment matches as a prefix of the rest of the event name
+                remainder = segments[depth]
+                for partial, subscriptions in node.wildcards.items():
+                    if remainder.startswith(partial):
+                        matched.update(subscriptions)
+            if depth == len(segments):
+                matched.update(node.exact)
+                break
+            node = node.children.get(segments[depth])
+            depth += 1
+
+        by_agent: Dict[str, List[EventSubscription]] = {}
+        for subscription in matched.values():
+            by_agent.setdefault(subscription.agent_id, []).append(subscription)
+        return by_agent
+
+    def matching_agents(self, event_name: str) -> Set[str]:
+        """Get the IDs of agents with at least one subscription matching the event name."""
+        return set(self.match(event_name).keys())
@@ -512,67 +512,26 @@ class SystemCommandProcessor:
             self.logger.warning(f"Agent {requesting_agent_id} not registered")
             return EventResponse(success=False, message="Agent not registered")
 
-        # Get queued messages for the agent from event gateway
-        messages = await self.network.event_gateway.poll_events(requesting_agent_id)
-
-        # Convert messages to serializable format
-        serialized_messages = []
-        for i, message in enumerate(messages):
-            self.logger.debug(
-                f"🔧 POLL_MESSAGES: Serializing message {i}: {type(message)}"
-            )
-            serialized_msg = None
-
-            # Try to_dict() first (works for Event objects)
-            if hasattr(message, "to_dict"):
-                try:
-                    serialized_msg = message.to_dict()
-                    self.logger.info(
-                        f"🔧 POLL_MESSAGES: Used to_dict() for message {i}"
-                    )
-                except Exception as to_dict_error:
-                    self.logger.error(
-                        f"🔧 POLL_MESSAGES: to_dict() failed for message {i}: {to_dict_error}"
-                    )
-                    serialized_msg = None
-            elif hasattr(message, "model_dump"):
-                try:
-                    serialized_msg = message.model_dump()
-                    self.logger.info(
-                        f"🔧 POLL_MESSAGES: Used model_dump() for message {i}"
-                    )
-                except Exception as model_dump_error:
-                    self.logger.warning(
-                        f"🔧 POLL_MESSAGES: model_dump failed for message {i}: {model_dump_error}"
-                    )
-                    serialized_msg = None
-            elif hasattr(message, "dict"):
-                serialized_msg = message.dict()
-                self.logger.info(f"🔧 POLL_MESSAGES: Used dict() for message {i}")
-            elif hasattr(message, "__dict__"):
-                import datetime
-
-                serialized_msg = {}
-                for key, value in message.__dict__.items():
-                    # Handle datetime objects
-                    if isinstance(value, datetime.datetime):
-                        serialized_msg[key] = value.isoformat()
-                    else:
-                        serialized_msg[key] = value
-                self.logger.info(
-                    f"🔧 POLL_MESSAGES: Used __dict__ with datetime handling for message {i}"
+        # Long polling: park the request until an event arrives or the wait timeout expires
+        wait_timeout = 0.0
+        if event.payload.get("wait_timeout"):
+            try:
+                wait_timeout = min(
+                    max(float(event.payload["wait_timeout"]), 0.0),
+                    self.network.config.long_poll_timeout,
                 )
-            else:
-                serialized_msg = str(message)
-                self.logger.info(f"🔧 POLL_MESSAGES: Used str() for message {i}")
-
-            if serialized_msg is not None:
-                serialized_messages.append(serialized_msg)
-            else:
-                self.logger.error(
-                    f"🔧 POLL_MESSAGES: Failed to serialize message {i} - all methods failed"
+            except (TypeError, ValueError):
+                self.logger.warning(
+                    f"Invalid wait_timeout in poll_messages: {event.payload['wait_timeout']}"
                 )
-                serialized_messages.append({})
+
+        # Get queued messages for the agent from event gateway
+        envelopes = await self.network.event_gateway.poll_envelopes(
+            requesting_agent_id, wait_timeout=wait_timeout
+        )
+
+        # Each envelope is serialized once and shared by every recipient of the event
+        serialized_messages = [envelope.to_dict() for envelope in envelopes]
 
         self.logger.info(
             f"🔧 POLL_MESSAGES: Serialized {len(serialized_messages)} messages"
@@ -582,6 +541,7 @@ class SystemCommandProcessor:
             "type": "system_response",
             "command": "poll_messages",
             "messages": serialized_messages,
+            "wait_timeout": wait_timeout,
         }
 
         # Include request_id if it was provided in the original request
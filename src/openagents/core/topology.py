@@ -17,6 +17,8 @@ import uuid
 
 from openagents.config.globals import DEFAULT_TRANSPORT_ADDRESS
 from openagents.models.event import Event
+from openagents.models.event_response import EventResponse
+from openagents.core.heartbeat_deadlines import HeartbeatDeadlines
 
 from .transports import Transport, Message
 from openagents.models.transport import TransportType, AgentConnection
@@ -39,6 +41,8 @@ class NetworkTopology(ABC):
         # Agent group membership tracking
         # Maps agent_id -> group_name
         self.agent_group_membership: Dict[str, str] = {}
+        # Reverse index of agent_group_membership, maps group_name -> agent IDs
+        self.agent_group_members: Dict[str, Set[str]] = {}
 
         # A2A registry (initialized if A2A transport is used)
         self.a2a_registry: Optional["A2AAgentRegistry"] = None
@@ -49,6 +53,13 @@ class NetworkTopology(ABC):
         self.kicked_agents: Dict[str, float] = {}
         self.kick_cooldown_seconds: float = 60.0  # Default 60 second cooldown
 
+        # Heartbeat expiry deadlines of registered agents (A2A agents are health checked separately)
+        agent_timeout = getattr(config, "agent_timeout", None) or config.connection_timeout * 6
+        self.heartbeat_deadlines = HeartbeatDeadlines(
+            agent_timeout, getattr(config, "heartbeat_grace_period", 0.0)
+        )
+        self.agent_expiry_handler: Optional[Callable[[str], Awaitable[Any]]] = None
+
     @abstractmethod
     async def initialize(self) -> bool:
         """Initialize the network topology.
@@ -187,8 +198,27 @@ class NetworkTopology(ABC):
 
     async def record_heartbeat(self, agent_id: str):
         """Record a heartbeat for an agent."""
-        if agent_id in self.agent_registry:
-            self.agent_registry[agent_id].last_seen = time.time()
+        connection = self.agent_registry.get(agent_id)
+        if connection is not None:
+            connection.last_seen = time.time()
+            if agent_id in self.heartbeat_deadlines:
+                self.heartbeat_deadlines.touch(agent_id, connection.last_seen)
+
+    def register_agent_expiry_handler(self, handler: Callable[[str], Awaitable[Any]]):
+        """Register a handler called with the ID of each agent whose heartbeat expired.
+
+        Without a handler, expired agents are only removed from the topology.
+
+        Args:
+            handler: Async function that takes an agent ID and unregisters the agent
+        """
+        self.agent_expiry_handler = handler
+
+    def _track_heartbeat(self, connection: AgentConnection) -> None:
+        """Start tracking the heartbeat of a newly registered agent."""
+        # A2A agents have their own health check mechanism
+        if connection.transport_type != TransportType.A2A:
+            self.heartbeat_deadlines.touch(connection.agent_id, connection.last_seen)
 
     def get_agent_registry(self) -> Dict[str, AgentConnection]:
         """Get all registered agents.
@@ -206,6 +236,32 @@ class NetworkTopology(ABC):
         """
         return self.agent_group_membership.copy()
 
+    def get_group_members(self, group_name: str) -> Set[str]:
+        """Get the agents currently assigned to a group.
+
+        Args:
+            group_name: Name of the agent group
+
+        Returns:
+            Set[str]: IDs of the group's agents, empty if the group has none
+        """
+        return set(self.agent_group_members.get(group_name, ()))
+
+    def _set_agent_group(self, agent_id: str, group_name: str) -> None:
+        """Record an agent's group, keeping the group members index in sync."""
+        self._remove_agent_group(agent_id)
+        self.agent_group_membership[agent_id] = group_name
+        self.agent_group_members.setdefault(group_name, set()).add(agent_id)
+
+    def _remove_agent_group(self, agent_id: str) -> None:
+        """Forget an agent's group, keeping the group members index in sync."""
+        group_name = self.agent_group_membership.pop(agent_id, None)
+        members = self.agent_group_members.get(group_name)
+        if members is not None:
+            members.discard(agent_id)
+            if not members:
+                del self.agent_group_members[group_name]
+
     def get_agent_connection(self, agent_id: str) -> Optional[AgentConnection]:
         """Get information about a specific agent.
 
@@ -242,6 +298,18 @@ class NetworkTopology(ABC):
         for transport in self.transports.values():
             transport.register_event_handler(handler)
 
+    def register_batch_event_handler(
+        self, handler: Callable[[List[Event], bool], Awaitable[List[EventResponse]]]
+    ):
+        """Register a handler processing batches of events submitted in one request.
+
+        Args:
+            handler: Async function that takes a list of events and a concurrency flag
+                and returns one EventResponse per event
+        """
+        for transport in self.transports.values():
+            transport.register_batch_event_handler(handler)
+
     def _assign_agent_to_group(
         self,
         agent_id: str,
@@ -291,7 +359,7 @@ class NetworkTopology(ABC):
             # Check if it's the default group (may not be in agent_groups)
             if requested_group == self.config.default_agent_group:
                 # Default group with no password requirement
-                self.agent_group_membership[agent_id] = requested_group
+                self._set_agent_group(agent_id, requested_group)
                 logger.info(f"Agent {agent_id} assigned to default group '{requested_group}'")
                 return requested_group
 
@@ -314,7 +382,7 @@ class NetworkTopology(ABC):
                 return None
 
         # Password valid or not required - assign to group
-        self.agent_group_membership[agent_id] = requested_group
+        self._set_agent_group(agent_id, requested_group)
         logger.info(f"Agent {agent_id} assigned to requested group '{requested_group}'")
         return requested_group
 
@@ -346,13 +414,13 @@ class NetworkTopology(ABC):
                 logger.warning(f"Agent {agent_id} registration rejected: password required")
                 return None
             # Otherwise assign to default group
-            self.agent_group_membership[agent_id] = default_group
+            self._set_agent_group(agent_id, default_group)
             return default_group
 
         # Try to match password hash with configured groups
         for group_name, group_config in self.config.agent_groups.items():
             if group_config.password_hash and password_hash == group_config.password_hash:
-                self.agent_group_membership[agent_id] = group_name
+                self._set_agent_group(agent_id, group_name)
                 logger.info(f"Agent {agent_id} assigned to group '{group_name}'")
                 return group_name
 
@@ -368,7 +436,7 @@ class NetworkTopology(ABC):
             logger.warning(
                 f"Agent {agent_id} provided invalid credentials, assigning to '{default_group}' group"
             )
-            self.agent_group_membership[agent_id] = default_group
+            self._set_agent_group(agent_id, default_group)
             return default_group
 
     async def cleanup_agent(self, agent_id: str):
@@ -386,10 +454,10 @@ class NetworkTopology(ABC):
                 self.a2a_registry.cleanup_agent(agent_id)
 
             del self.agent_registry[agent_id]
+        self.heartbeat_deadlines.remove(agent_id)
 
         # Remove from group membership
-        if agent_id in self.agent_group_membership:
-            del self.agent_group_membership[agent_id]
+        self._remove_agent_group(agent_id)
 
     def _init_a2a_registry(self) -> None:
         """Initialize the A2A registry if A2A transport is configured."""
@@ -558,48 +626,45 @@ class CentralizedTopology(NetworkTopology):
                 self.a2a_registry.cleanup_agent(agent_id)
 
             del self.agent_registry[agent_id]
+        self.heartbeat_deadlines.remove(agent_id)
 
         # Remove from group membership
-        if agent_id in self.agent_group_membership:
-            del self.agent_group_membership[agent_id]
+        self._remove_agent_group(agent_id)
 
     async def _heartbeat_monitor(self) -> None:
         """Monitor agent connections and clean up stale ones."""
         heartbeat_interval = self.config.heartbeat_interval
-        # Use connection_timeout as agent_timeout if agent_timeout not available
-        agent_timeout = getattr(
-            self.config, "agent_timeout", self.config.connection_timeout * 6
-        )
         logger.info(
-            f"Starting heartbeat monitor (interval: {heartbeat_interval}s, timeout: {agent_timeout}s)"
+            f"Starting heartbeat monitor (interval: {heartbeat_interval}s, "
+            f"timeout: {self.heartbeat_deadlines.timeout}s, "
+            f"grace period: {self.heartbeat_deadlines.grace_period}s)"
         )
 
         while self.is_running:
             try:
-                current_time = asyncio.get_event_loop().time()
-                stale_agents = []
+                current_time = time.time()
 
-                # Check all connected agents for activity
-                for agent_id, connection in self.agent_registry.items():
-                    # Skip A2A agents - they have their own health check mechanism
-                    if connection.transport_type == TransportType.A2A:
+                # Only agents whose deadline has passed are checked
+                for agent_id in self.heartbeat_deadlines.pop_expired(current_time):
+                    connection = self.agent_registry.get(agent_id)
+                    if connection is None:
                         continue
-
-                    time_since_activity = current_time - connection.last_seen
-
-                    if time_since_activity > agent_timeout:
-                        stale_agents.append(agent_id)
-                        logger.warning(
-                            f"Agent {agent_id} failed heartbeat check (inactive for {time_since_activity:.1f}s)"
-                        )
-
-                # Clean up stale agents
-                for agent_id in stale_agents:
+                    logger.warning(
+                        f"Agent {agent_id} failed heartbeat check "
+                        f"(inactive for {current_time - connection.last_seen:.1f}s)"
+                    )
                     logger.info(f"Cleaning up stale agent {agent_id}")
-                    self.unregister_agent(agent_id)
-
-                # Wait for next heartbeat interval
-                await asyncio.sleep(heartbeat_interval)
+                    if self.agent_expiry_handler:
+                        await self.agent_expiry_handler(agent_id)
+                    else:
+                        await self.unregister_agent(agent_id)
+
+                # Sleep until the next deadline, waking at least every heartbeat interval
+                delay = heartbeat_interval
+                next_deadline = self.heartbeat_deadlines.next_deadline()
+                if next_deadline is not None:
+                    delay = min(delay, max(0.0, next_deadline - time.time()))
+                await asyncio.sleep(delay)
 
             except asyncio.CancelledError:
                 logger.info("Heartbeat monitor cancelled")
@@ -656,6 +721,7 @@ class CentralizedTopology(NetworkTopology):
             return False
 
         self.agent_registry[agent_info.agent_id] = agent_info
+        self._track_heartbeat(agent_info)
         # TODO: send out an event in the system
 
         logger.info(f"Registered agent {agent_info.agent_id} in centralized registry (group: {assigned_group})")
@@ -5,9 +5,10 @@ This module provides the abstract base class for transport implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Callable, Awaitable
+from typing import Dict, Any, List, Optional, Callable, Awaitable, TYPE_CHECKING
 import logging
 
+from openagents.core.event_envelope import EventEnvelope
 from openagents.models.event_response import EventResponse
 from openagents.models.transport import (
     TransportType,
@@ -18,6 +19,9 @@ from openagents.models.transport import (
 )
 from openagents.models.event import Event
 
+if TYPE_CHECKING:
+    from openagents.core.network import AgentNetwork
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,10 +67,28 @@ class Transport(ABC):
         self.is_listening = False
         self.is_notifiable = is_notifiable
         self.event_handler: Optional[Callable[[Event], Awaitable[EventResponse]]] = None
+        self.batch_event_handler: Optional[
+            Callable[[List[Event], bool], Awaitable[List[EventResponse]]]
+        ] = None
         self.peer_connections: Dict[str, ConnectionInfo] = {}
         self.peer_connection_handlers: List[
             Callable[[str, ConnectionState], Awaitable[None]]
         ] = []
+        # Set by the network once its topology is initialized
+        self.network_instance: Optional["AgentNetwork"] = None
+
+    def requeue_messages(self, agent_id: str, messages: List[Dict[str, Any]]) -> None:
+        """Put polled but undelivered events back on the agent's queue."""
+        if self.network_instance is None:
+            logger.warning(f"Dropping {len(messages)} undelivered events for agent {agent_id}")
+            return
+        envelopes = []
+        for message in messages:
+            try:
+                envelopes.append(EventEnvelope(Event.from_dict(message)))
+            except Exception as e:
+                logger.error(f"Failed to requeue event for agent {agent_id}: {e}")
+        self.network_instance.event_gateway.requeue_envelopes(agent_id, envelopes)
 
     def notifiable(self) -> bool:
         """
@@ -124,6 +146,29 @@ class Transport(ABC):
         logger.warning("No event handler registered")
         return EventResponse(success=False, message="No event handler registered")
 
+    def register_batch_event_handler(
+        self, handler: Callable[[List[Event], bool], Awaitable[List[EventResponse]]]
+    ):
+        """Register a handler processing a batch of events submitted in one request.
+
+        Args:
+            handler: Async function that takes a list of events and a flag allowing
+                concurrent processing, and returns one EventResponse per event in order
+        """
+        self.batch_event_handler = handler
+
+    async def call_batch_event_handler(
+        self, events: List[Event], concurrent: bool = False
+    ) -> List[EventResponse]:
+        """Call the registered batch event handler.
+
+        Falls back to calling the event handler for each event in order when no batch
+        handler is registered.
+        """
+        if self.batch_event_handler:
+            return await self.batch_event_handler(events, concurrent)
+        return [await self.call_event_handler(event) for event in events]
+
     def register_peer_connection_handler(
         self, handler: Callable[[str, ConnectionState], Awaitable[None]]
     ):
@@ -4,28 +4,39 @@ gRPC Transport Implementation for OpenAgents.
 This module provides the gRPC transport implementation and servicer for agent communication.
 """
 
+import asyncio
 import json
 import logging
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import time
 
 import grpc
 from grpc import aio
 from openagents.config.globals import (
     SYSTEM_EVENT_HEARTBEAT,
+    SYSTEM_EVENT_POLL_MESSAGES,
     SYSTEM_EVENT_REGISTER_AGENT,
     SYSTEM_EVENT_UNREGISTER_AGENT,
 )
 from openagents.proto import agent_service_pb2_grpc, agent_service_pb2
 
 from .base import Transport
+from openagents.core.event_envelope import SerializedEvent, encode_json
 from openagents.models.transport import TransportType, ConnectionState, ConnectionInfo
 from openagents.models.event import Event
 from openagents.models.event_response import EventResponse
 
 logger = logging.getLogger(__name__)
 
+# Initial metadata sent once a StreamEvents call is authenticated, so clients can tell
+# a live event stream apart from servers that do not implement the RPC
+STREAM_OPEN_METADATA = ("openagents-stream", "open")
+# Seconds each StreamEvents poll waits for new events (capped by long_poll_timeout)
+STREAM_POLL_WAIT = 30.0
+# type_url of the JSON-encoded event carried in the payload of pushed events
+STREAM_EVENT_DATA_TYPE = "type.googleapis.com/openagents.EventData"
+
 
 class OpenAgentsGRPCServicer(agent_service_pb2_grpc.AgentServiceServicer):
     """gRPC servicer for the OpenAgents transport."""
@@ -40,21 +51,8 @@ class OpenAgentsGRPCServicer(agent_service_pb2_grpc.AgentServiceServicer):
                 f"gRPC unified event: {request.event_name} from {request.source_id}"
             )
 
-            # Extract payload from protobuf Any field
-            payload = self._extract_payload_from_protobuf(request.payload)
-
             # Create internal Event from gRPC Event
-            event = Event(
-                event_name=request.event_name,
-                source_id=request.source_id,
-                destination_id=request.target_agent_id or None,
-                payload=payload,
-                event_id=request.event_id,
-                timestamp=request.timestamp if request.timestamp else int(time.time()),
-                metadata=dict(request.metadata) if request.metadata else {},
-                visibility=request.visibility if request.visibility else "network",
-                secret=request.secret if hasattr(request, 'secret') else None,
-            )
+            event = self._from_grpc_event(request)
 
             # Route through unified handler
             event_response = await self._handle_sent_event(event)
@@ -103,6 +101,163 @@ class OpenAgentsGRPCServicer(agent_service_pb2_grpc.AgentServiceServicer):
                 success=False, message=str(e), event_name=request.event_name
             )
 
+    async def StreamEvents(self, request_iterator, context):
+        """Bidirectional event stream for push delivery.
+
+        The first event sent by the client opens the stream and identifies the agent
+        through its source_id and secret. Events queued for the agent are then pushed
+        as they arrive, and further events from the client are handled like SendEvent.
+        """
+        request_iterator = request_iterator.__aiter__()
+        try:
+            first_event = self._from_grpc_event(await request_iterator.__anext__())
+        except StopAsyncIteration:
+            return
+        agent_id = first_event.source_id
+        secret = first_event.secret
+
+        # The opening event is normally a poll_messages request; handle anything else
+        if first_event.event_name != SYSTEM_EVENT_POLL_MESSAGES:
+            await self._handle_sent_event(first_event)
+
+        # Authenticate with an immediate poll before committing to the stream
+        response = await self._poll_agent_events(agent_id, secret, 0.0)
+        if not response or not response.success:
+            await context.abort(
+                grpc.StatusCode.UNAUTHENTICATED,
+                response.message if response else "No response from event handler",
+            )
+            return
+        # Events are removed from the agent's queue when polled, so the ones not
+        # yet handed to the client when the stream ends are put back
+        messages = self._extract_polled_messages(response)
+        delivered = 0
+        reader_task = None
+        poll_task = None
+        try:
+            await context.send_initial_metadata((STREAM_OPEN_METADATA,))
+            logger.debug(f"gRPC: Opened event stream for agent {agent_id}")
+            reader_task = asyncio.create_task(
+                self._consume_stream_events(request_iterator)
+            )
+            while True:
+                for message in messages:
+                    if isinstance(message, SerializedEvent):
+                        # Build the protobuf message once for all streaming recipients
+                        yield message.get_encoding("grpc", self._to_grpc_event)
+                    else:
+                        yield self._to_grpc_event(message)
+                    delivered += 1
+                # Wait on the reader too, so a client that closed its side of the
+                # stream does not keep a poll parked on its queue
+                poll_task = asyncio.create_task(
+                    self._poll_agent_events(agent_id, secret, STREAM_POLL_WAIT)
+                )
+                await asyncio.wait(
+                    {poll_task, reader_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not poll_task.done():
+                    break
+                response = poll_task.result()
+                if not response or not response.success:
+                    break
+                messages = self._extract_polled_messages(response)
+                delivered = 0
+        finally:
+            if poll_task is not None:
+                poll_task.cancel()
+            if reader_task is not None:
+                reader_task.cancel()
+            if delivered < len(messages):
+                self.transport.requeue_messages(agent_id, messages[delivered:])
+            logger.debug(f"gRPC: Closed event stream for agent {agent_id}")
+
+    async def _consume_stream_events(self, request_iterator):
+        """Handle events sent by the client over an open StreamEvents call."""
+        async for request in request_iterator:
+            try:
+                event_response = await self._handle_sent_event(
+                    self._from_grpc_event(request)
+                )
+                if event_response and not event_response.success:
+                    logger.warning(
+                        f"Streamed event {request.event_name} from {request.source_id} failed: {event_response.message}"
+                    )
+            except Exception as e:
+                logger.error(f"Error handling streamed gRPC event {request.event_name}: {e}")
+
+    async def _poll_agent_events(
+        self, agent_id: str, secret: Optional[str], wait_timeout: float
+    ) -> EventResponse:
+        """Send an authenticated poll_messages event through the event handler."""
+        payload = {"agent_id": agent_id}
+        if wait_timeout:
+            payload["wait_timeout"] = wait_timeout
+        poll_event = Event(
+            event_name=SYSTEM_EVENT_POLL_MESSAGES,
+            source_id=agent_id,
+            destination_id="system:system",
+            payload=payload,
+            secret=secret,
+        )
+        return await self.transport.call_event_handler(poll_event)
+
+    def _extract_polled_messages(self, response: EventResponse) -> List[Dict[str, Any]]:
+        """Get the event dicts from a poll_messages response."""
+        if isinstance(response.data, dict):
+            messages = response.data.get("messages", [])
+        elif isinstance(response.data, list):
+            messages = response.data
+        else:
+            return []
+        return [
+            message
+            for message in messages
+            if isinstance(message, dict) and "event_name" in message
+        ]
+
+    def _from_grpc_event(self, request) -> Event:
+        """Convert a gRPC Event to an internal Event."""
+        # Extract payload from protobuf Any field
+        payload = self._extract_payload_from_protobuf(request.payload)
+
+        return Event(
+            event_name=request.event_name,
+            source_id=request.source_id,
+            destination_id=request.target_agent_id or None,
+            payload=payload,
+            event_id=request.event_id,
+            timestamp=request.timestamp if request.timestamp else int(time.time()),
+            metadata=dict(request.metadata) if request.metadata else {},
+            visibility=request.visibility if request.visibility else "network",
+            secret=request.secret if hasattr(request, 'secret') else None,
+        )
+
+    def _to_grpc_event(self, message: Dict[str, Any]):
+        """Convert a polled event dict to a gRPC Event for pushing to a client.
+
+        The payload carries the whole event as JSON, the same representation polling
+        returns, so fields without a protobuf counterpart and integer values survive.
+        """
+        from google.protobuf.any_pb2 import Any
+
+        visibility = message.get("visibility") or "network"
+        grpc_event = agent_service_pb2.Event(
+            event_id=message.get("event_id") or "",
+            event_name=message.get("event_name") or "",
+            source_id=message.get("source_id") or "",
+            target_agent_id=message.get("destination_id") or "",
+            timestamp=int(message.get("timestamp") or 0),
+            visibility=getattr(visibility, "value", visibility),
+            relevant_mod=message.get("relevant_mod") or "",
+        )
+
+        event_any = Any()
+        event_any.type_url = STREAM_EVENT_DATA_TYPE
+        event_any.value = encode_json(message).encode("utf-8")
+        grpc_event.payload.CopyFrom(event_any)
+        return grpc_event
+
     async def Heartbeat(self, request, context):
         """Handle heartbeat requests."""
         logger.debug(f"gRPC Heartbeat received from {request.agent_id}")
@@ -12,12 +12,11 @@ import logging
 import mimetypes
 import time
 import html
-import base64
 import os
 import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable, TYPE_CHECKING
+from typing import Dict, Any, Optional, List, Set, Callable, TYPE_CHECKING
 from urllib.parse import urlencode
 
 import aiohttp
@@ -40,6 +39,7 @@ from aiohttp import web
 from .base import Transport
 from openagents.models.transport import TransportType, ConnectionState, ConnectionInfo, RemoteAgentStatus
 from openagents.models.event import Event, EventVisibility
+from openagents.core.event_envelope import EventEnvelope, encode_json, encode_json_object
 from openagents.models.a2a import (
     AgentCard,
     AgentSkill,
@@ -73,6 +73,9 @@ logger = logging.getLogger(__name__)
 # Default relay server URL
 DEFAULT_RELAY_URL = "wss://relay.openagents.org"
 
+# Maximum number of events accepted by one /api/send_events request
+MAX_BATCH_EVENTS = 1000
+
 # MCP Protocol version (when serve_mcp is enabled)
 MCP_PROTOCOL_VERSION = "2025-03-26"
 
@@ -90,6 +93,12 @@ class MCPSession:
 # Maximum file size for uploads (50 MB)
 MAX_FILE_SIZE = 50 * 1024 * 1024
 
+# Size of the chunks file uploads are streamed to disk in
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+SHARED_CACHE_MOD = "openagents.mods.core.shared_cache"
+SHARED_ARTIFACT_MOD = "openagents.mods.workspace.shared_artifact"
+
 
 class HttpTransport(Transport):
     """
@@ -114,6 +123,10 @@ class HttpTransport(Transport):
         self.runner = None  # AppRunner instance for proper cleanup
         self.network_instance: Optional["AgentNetwork"] = None  # Reference to network instance
 
+        # Poll handlers parked on an agent's queue (long polls and event streams),
+        # cancelled on shutdown so the runner does not wait for them to time out
+        self._parked_poll_tasks: Set[asyncio.Task] = set()
+
         # MCP serving configuration (enabled via serve_mcp: true)
         self._serve_mcp = self.config.get("serve_mcp", False)
         self._mcp_sessions: Dict[str, MCPSession] = {}
@@ -166,7 +179,9 @@ class HttpTransport(Transport):
         self.app.router.add_post("/api/register", self.register_agent)
         self.app.router.add_post("/api/unregister", self.unregister_agent)
         self.app.router.add_get("/api/poll", self.poll_messages)
+        self.app.router.add_get("/api/poll/stream", self.poll_messages_stream)
         self.app.router.add_post("/api/send_event", self.send_message)
+        self.app.router.add_post("/api/send_events", self.send_events)
 
         # Network management endpoints (admin only)
         self.app.router.add_get("/api/network/export", self.export_network)
@@ -192,6 +207,7 @@ class HttpTransport(Transport):
         self.app.router.add_post("/api/cache/upload", self.cache_upload)
         self.app.router.add_get("/api/cache/download/{cache_id}", self.cache_download)
         self.app.router.add_get("/api/cache/info/{cache_id}", self.cache_info)
+        self.app.router.add_get("/api/artifacts/download/{artifact_id}", self.artifact_download)
         # Agent management endpoints
         self.app.router.add_get("/api/agents/service", self.get_service_agents)
         self.app.router.add_post("/api/agents/service/{agent_id}/start", self.start_service_agent)
@@ -345,6 +361,10 @@ class HttpTransport(Transport):
                 session.is_active = False
             self._mcp_sessions.clear()
 
+        for task in list(self._parked_poll_tasks):
+            task.cancel()
+        self._parked_poll_tasks.clear()
+
         if self.site:
             await self.site.stop()
             self.site = None
@@ -834,6 +854,7 @@ class HttpTransport(Transport):
         try:
             agent_id = request.query.get("agent_id")
             secret = request.query.get("secret")
+            wait_timeout = request.query.get("wait")
 
             if not agent_id:
                 return web.json_response(
@@ -846,17 +867,14 @@ class HttpTransport(Transport):
 
             logger.debug(f"HTTP polling messages for agent: {agent_id}")
 
-            # Create poll messages event with authentication
-            poll_event = Event(
-                event_name=SYSTEM_EVENT_POLL_MESSAGES,
-                source_id=agent_id,
-                destination_id="system:system",
-                payload={"agent_id": agent_id},
-                secret=secret,
-            )
-
-            # Send the poll request through event handler
-            response = await self.call_event_handler(poll_event)
+            # Send the poll request through event handler; with ?wait=<seconds> the
+            # request is parked until an event arrives or the wait expires (long polling)
+            task = asyncio.current_task()
+            self._parked_poll_tasks.add(task)
+            try:
+                response = await self._call_poll_handler(agent_id, secret, wait_timeout)
+            finally:
+                self._parked_poll_tasks.discard(task)
 
             if not response or not response.success:
                 logger.warning(
@@ -875,130 +893,253 @@ class HttpTransport(Transport):
                     }
                 )
 
-            # Extract messages from response data
-            messages = []
-            if response.data:
-                try:
-                    # Handle different response data structures
-                    response_messages = []
+            messages = self._extract_polled_messages(response, agent_id)
+
+            poll_response = {"success": True, "agent_id": agent_id}
+            if isinstance(response.data, dict) and "wait_timeout" in response.data:
+                # Lets clients detect long-poll support
+                poll_response["wait_timeout"] = response.data["wait_timeout"]
+            # Splice in the messages' cached JSON instead of re-encoding each payload
+            # for every agent that polls the same event
+            poll_response["messages"] = messages
+            return web.Response(
+                text=encode_json_object(poll_response), content_type="application/json"
+            )
+
+        except Exception as e:
+            logger.error(f"Error in HTTP poll_messages: {e}")
+            return web.json_response(
+                {"success": False, "error_message": str(e)}, status=500
+            )
 
-                    if isinstance(response.data, list):
-                        # Direct list of messages
-                        response_messages = response.data
+    def _extract_polled_messages(self, response, agent_id: str) -> List[Dict[str, Any]]:
+        """Convert a poll_messages event response into a list of event dicts."""
+        messages = []
+        if response.data:
+            try:
+                # Handle different response data structures
+                response_messages = []
+
+                if isinstance(response.data, list):
+                    # Direct list of messages
+                    response_messages = response.data
+                    logger.debug(
+                        f"🔧 HTTP: Received direct list of {len(response_messages)} messages"
+                    )
+                elif isinstance(response.data, dict):
+                    if "messages" in response.data:
+                        # Response wrapped in a dict with 'messages' key
+                        response_messages = response.data["messages"]
                         logger.debug(
-                            f"🔧 HTTP: Received direct list of {len(response_messages)} messages"
+                            f"🔧 HTTP: Extracted {len(response_messages)} messages from response dict"
                         )
-                    elif isinstance(response.data, dict):
-                        if "messages" in response.data:
-                            # Response wrapped in a dict with 'messages' key
-                            response_messages = response.data["messages"]
-                            logger.debug(
-                                f"🔧 HTTP: Extracted {len(response_messages)} messages from response dict"
-                            )
-                        else:
-                            logger.warning(
-                                f"🔧 HTTP: Dict response missing 'messages' key: {list(response.data.keys())}"
-                            )
-                            response_messages = []
                     else:
                         logger.warning(
-                            f"🔧 HTTP: Unexpected poll_messages response format: {type(response.data)} - {response.data}"
+                            f"🔧 HTTP: Dict response missing 'messages' key: {list(response.data.keys())}"
                         )
                         response_messages = []
-
-                    logger.info(
-                        f"🔧 HTTP: Processing {len(response_messages)} polled messages for {agent_id}"
+                else:
+                    logger.warning(
+                        f"🔧 HTTP: Unexpected poll_messages response format: {type(response.data)} - {response.data}"
                     )
+                    response_messages = []
 
-                    # Convert each message to dict format for HTTP response
-                    for message_data in response_messages:
-                        try:
-                            if isinstance(message_data, dict):
-                                if "event_name" in message_data:
-                                    # This is already an Event structure - use as is
-                                    messages.append(message_data)
-                                    logger.debug(
-                                        f"🔧 HTTP: Successfully included message: {message_data.get('event_id', 'no-id')}"
-                                    )
-                                else:
-                                    # This might be a legacy message format - try to parse it
-                                    from openagents.utils.message_util import (
-                                        parse_message_dict,
-                                    )
+                logger.info(
+                    f"🔧 HTTP: Processing {len(response_messages)} polled messages for {agent_id}"
+                )
 
-                                    event = parse_message_dict(message_data)
-                                    if event:
-                                        # Convert Event object to dict
-                                        event_dict = {
-                                            "event_id": event.event_id,
-                                            "event_name": event.event_name,
-                                            "source_id": event.source_id,
-                                            "destination_id": event.destination_id,
-                                            "payload": event.payload,
-                                            "timestamp": event.timestamp,
-                                            "metadata": event.metadata,
-                                            "visibility": getattr(
-                                                event, "visibility", "network"
-                                            ),
-                                        }
-                                        messages.append(event_dict)
-                                        logger.debug(
-                                            f"🔧 HTTP: Successfully parsed legacy message to Event: {event.event_id}"
-                                        )
-                                    else:
-                                        logger.warning(
-                                            f"🔧 HTTP: Failed to parse message data: {message_data}"
-                                        )
+                # Convert each message to dict format for HTTP response
+                for message_data in response_messages:
+                    try:
+                        if isinstance(message_data, dict):
+                            if "event_name" in message_data:
+                                # This is already an Event structure - use as is
+                                messages.append(message_data)
+                                logger.debug(
+                                    f"🔧 HTTP: Successfully included message: {message_data.get('event_id', 'no-id')}"
+                                )
                             else:
-                                logger.warning(
-                                    f"🔧 HTTP: Invalid message format in poll response: {message_data}"
+                                # This might be a legacy message format - try to parse it
+                                from openagents.utils.message_util import (
+                                    parse_message_dict,
                                 )
 
-                        except Exception as e:
-                            logger.error(
-                                f"🔧 HTTP: Error processing polled message: {e}"
-                            )
-                            logger.debug(
-                                f"🔧 HTTP: Problematic message data: {message_data}"
+                                event = parse_message_dict(message_data)
+                                if event:
+                                    # Convert Event object to dict
+                                    event_dict = {
+                                        "event_id": event.event_id,
+                                        "event_name": event.event_name,
+                                        "source_id": event.source_id,
+                                        "destination_id": event.destination_id,
+                                        "payload": event.payload,
+                                        "timestamp": event.timestamp,
+                                        "metadata": event.metadata,
+                                        "visibility": getattr(
+                                            event, "visibility", "network"
+                                        ),
+                                    }
+                                    messages.append(event_dict)
+                                    logger.debug(
+                                        f"🔧 HTTP: Successfully parsed legacy message to Event: {event.event_id}"
+                                    )
+                                else:
+                                    logger.warning(
+                                        f"🔧 HTTP: Failed to parse message data: {message_data}"
+                                    )
+                        else:
+                            logger.warning(
+                                f"🔧 HTTP: Invalid message format in poll response: {message_data}"
                             )
 
-                    logger.info(
-                        f"🔧 HTTP: Successfully converted {len(messages)} messages for HTTP response"
-                    )
+                    except Exception as e:
+                        logger.error(
+                            f"🔧 HTTP: Error processing polled message: {e}"
+                        )
+                        logger.debug(
+                            f"🔧 HTTP: Problematic message data: {message_data}"
+                        )
 
-                except Exception as e:
-                    logger.error(f"🔧 HTTP: Error parsing poll_messages response: {e}")
-                    messages = []
-            else:
-                logger.debug(f"🔧 HTTP: No messages in poll response")
+                logger.info(
+                    f"🔧 HTTP: Successfully converted {len(messages)} messages for HTTP response"
+                )
+
+            except Exception as e:
+                logger.error(f"🔧 HTTP: Error parsing poll_messages response: {e}")
                 messages = []
+        else:
+            logger.debug(f"🔧 HTTP: No messages in poll response")
+            messages = []
+        return messages
 
+    async def _call_poll_handler(
+        self, agent_id: str, secret: Optional[str], wait_timeout: Optional[Any] = None
+    ):
+        """Send an authenticated poll_messages event through the event handler."""
+        payload = {"agent_id": agent_id}
+        if wait_timeout:
+            payload["wait_timeout"] = wait_timeout
+        poll_event = Event(
+            event_name=SYSTEM_EVENT_POLL_MESSAGES,
+            source_id=agent_id,
+            destination_id="system:system",
+            payload=payload,
+            secret=secret,
+        )
+        return await self.call_event_handler(poll_event)
+
+    async def poll_messages_stream(self, request):
+        """Stream events to an HTTP agent as server-sent events.
+
+        Each queued event is sent as a `data:` line containing the event JSON. While no
+        events arrive a keep-alive comment is sent every `wait` seconds (default 15).
+        The stream ends when the agent is unregistered or authentication fails.
+        """
+        agent_id = request.query.get("agent_id")
+        secret = request.query.get("secret")
+        if not agent_id:
             return web.json_response(
-                {"success": True, "messages": messages, "agent_id": agent_id}
+                {
+                    "success": False,
+                    "error_message": "agent_id query parameter is required",
+                },
+                status=400,
             )
+        try:
+            keepalive_interval = float(request.query.get("wait", 15))
+        except ValueError:
+            keepalive_interval = 15.0
 
-        except Exception as e:
-            logger.error(f"Error in HTTP poll_messages: {e}")
+        # Authenticate before committing to a stream response
+        response = await self._call_poll_handler(agent_id, secret)
+        if not response or not response.success:
             return web.json_response(
-                {"success": False, "error_message": str(e)}, status=500
+                {
+                    "success": False,
+                    "error_message": (
+                        response.message if response else "No response from event handler"
+                    ),
+                },
+                status=403,
             )
 
+        stream = web.StreamResponse(
+            headers={
+                "Content-Type": "text/event-stream",
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+            }
+        )
+        await stream.prepare(request)
+        logger.debug(f"HTTP: Opened event stream for agent {agent_id}")
+
+        task = asyncio.current_task()
+        self._parked_poll_tasks.add(task)
+        try:
+            while response and response.success:
+                messages = self._extract_polled_messages(response, agent_id)
+                if not await self._write_stream_events(request, stream, agent_id, messages):
+                    logger.debug(f"HTTP: Event stream for agent {agent_id} closed by client")
+                    return stream
+                # aiohttp does not cancel the handler when the client goes away, so
+                # stop before the next poll takes events off the agent's queue
+                if self._is_stream_closed(request):
+                    logger.debug(f"HTTP: Event stream for agent {agent_id} closed by client")
+                    return stream
+                response = await self._call_poll_handler(
+                    agent_id, secret, keepalive_interval
+                )
+            error_message = response.message if response else "No response from event handler"
+            await stream.write(
+                f"event: error\ndata: {json.dumps({'error_message': error_message})}\n\n".encode("utf-8")
+            )
+        except ConnectionResetError:
+            logger.debug(f"HTTP: Event stream for agent {agent_id} closed by client")
+        except asyncio.CancelledError:
+            logger.debug(f"HTTP: Event stream for agent {agent_id} cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"Error in HTTP poll_messages_stream: {e}")
+        finally:
+            self._parked_poll_tasks.discard(task)
+        return stream
+
+    @staticmethod
+    def _is_stream_closed(request) -> bool:
+        """Whether the client of a streaming request has disconnected."""
+        return request.transport is None or request.transport.is_closing()
+
+    async def _write_stream_events(
+        self, request, stream, agent_id: str, messages: List[Dict[str, Any]]
+    ) -> bool:
+        """Write polled events to an event stream, or a keep-alive if there are none.
+
+        Events that could not be written are put back on the agent's queue.
+
+        Returns:
+            bool: False if the client has disconnected
+        """
+        written = 0
+        try:
+            if self._is_stream_closed(request):
+                return False
+            if not messages:
+                await stream.write(b": keep-alive\n\n")
+            for message in messages:
+                await stream.write(f"data: {encode_json(message)}\n\n".encode("utf-8"))
+                written += 1
+            return True
+        finally:
+            if written < len(messages):
+                self.requeue_messages(agent_id, messages[written:])
+
     async def send_message(self, request):
         """Handle sending events/messages via HTTP."""
         try:
             data = await request.json()
 
-            # Extract event data similar to gRPC SendEvent
-            event_name = data.get("event_name")
-            source_id = data.get("source_id")
-            target_agent_id = data.get("target_agent_id")
-            payload = data.get("payload", {})
-            event_id = data.get("event_id")
-            metadata = data.get("metadata", {})
-            visibility = data.get("visibility", "network")
-            secret = data.get("secret")
-
-            if not event_name or not source_id:
+            event = self._event_from_request_data(data)
+            if event is None:
                 return web.json_response(
                     {
                         "success": False,
@@ -1007,49 +1148,130 @@ class HttpTransport(Transport):
                     status=400,
                 )
 
-            logger.debug(f"HTTP unified event: {event_name} from {source_id}")
-
-            # Create internal Event from HTTP request
-            event = Event(
-                event_name=event_name,
-                source_id=source_id,
-                destination_id=target_agent_id,
-                payload=payload,
-                event_id=event_id,
-                timestamp=int(time.time()),
-                metadata=metadata,
-                visibility=visibility,
-                secret=secret,
-            )
+            logger.debug(f"HTTP unified event: {event.event_name} from {event.source_id}")
 
             # Route through unified handler (similar to gRPC)
             event_response = await self._handle_sent_event(event)
 
-            # Extract response data from EventResponse
-            response_data = None
-            if (
-                event_response
-                and hasattr(event_response, "data")
-                and event_response.data
-            ):
-                response_data = event_response.data
+            return web.json_response(
+                self._event_response_data(event, data.get("event_id"), event_response)
+            )
+
+        except Exception as e:
+            logger.error(f"Error handling HTTP send_message: {e}")
+            return web.json_response(
+                {"success": False, "error_message": str(e)}, status=500
+            )
+
+    async def send_events(self, request):
+        """Handle sending a batch of events in one HTTP request.
+
+        The body is ``{"events": [...], "concurrent": false}`` with each event in the
+        format accepted by /api/send_event. The response holds one result per event,
+        in order, under ``responses``.
+        """
+        try:
+            data = await request.json()
+            events_data = data.get("events")
+            if not isinstance(events_data, list):
+                return web.json_response(
+                    {"success": False, "error_message": "events must be a list"},
+                    status=400,
+                )
+            if len(events_data) > MAX_BATCH_EVENTS:
+                return web.json_response(
+                    {
+                        "success": False,
+                        "error_message": f"Batch exceeds {MAX_BATCH_EVENTS} events",
+                    },
+                    status=413,
+                )
+
+            # Events missing required fields fail individually without failing the batch
+            results: List[Optional[Dict[str, Any]]] = [None] * len(events_data)
+            events: List[Event] = []
+            indexes: List[int] = []
+            for index, event_data in enumerate(events_data):
+                event = (
+                    self._event_from_request_data(event_data)
+                    if isinstance(event_data, dict)
+                    else None
+                )
+                if event is None:
+                    results[index] = {
+                        "success": False,
+                        "message": "event_name and source_id are required",
+                        "event_id": event_data.get("event_id") if isinstance(event_data, dict) else None,
+                        "data": None,
+                        "event_name": event_data.get("event_name") if isinstance(event_data, dict) else None,
+                    }
+                    continue
+                events.append(event)
+                indexes.append(index)
+
+            logger.debug(f"HTTP batch of {len(events)} events")
+            event_responses = await self.call_batch_event_handler(
+                events, bool(data.get("concurrent", False))
+            )
+            for index, event, event_response in zip(indexes, events, event_responses):
+                results[index] = self._event_response_data(
+                    event, events_data[index].get("event_id"), event_response
+                )
 
             return web.json_response(
                 {
-                    "success": event_response.success if event_response else True,
-                    "message": event_response.message if event_response else "",
-                    "event_id": event_id,
-                    "data": response_data,
-                    "event_name": event_name,
+                    "success": all(result["success"] for result in results),
+                    "responses": results,
                 }
             )
 
         except Exception as e:
-            logger.error(f"Error handling HTTP send_message: {e}")
+            logger.error(f"Error handling HTTP send_events: {e}")
             return web.json_response(
                 {"success": False, "error_message": str(e)}, status=500
             )
 
+    def _event_from_request_data(self, data: Dict[str, Any]) -> Optional[Event]:
+        """Build an Event from send_event request data, or None if it is incomplete."""
+        event_name = data.get("event_name")
+        source_id = data.get("source_id")
+        if not event_name or not source_id:
+            return None
+
+        # Create internal Event from HTTP request
+        return Event(
+            event_name=event_name,
+            source_id=source_id,
+            destination_id=data.get("target_agent_id"),
+            payload=data.get("payload", {}),
+            event_id=data.get("event_id"),
+            timestamp=int(time.time()),
+            metadata=data.get("metadata", {}),
+            visibility=data.get("visibility", "network"),
+            secret=data.get("secret"),
+        )
+
+    def _event_response_data(
+        self, event: Event, event_id: Optional[str], event_response
+    ) -> Dict[str, Any]:
+        """Build the JSON result for a processed event."""
+        # Extract response data from EventResponse
+        response_data = None
+        if (
+            event_response
+            and hasattr(event_response, "data")
+            and event_response.data
+        ):
+            response_data = event_response.data
+
+        return {
+            "success": event_response.success if event_response else True,
+            "message": event_response.message if event_response else "",
+            "event_id": event_id,
+            "data": response_data,
+            "event_name": event.event_name,
+        }
+
     async def _handle_sent_event(self, event):
         """Unified event handler that routes both regular messages and system commands."""
         logger.debug(
@@ -1616,8 +1838,19 @@ class HttpTransport(Transport):
                 "error": str(e),
             }, status=500)
 
+    def _get_network_mod(self, mod_path: str):
+        """Get a mod loaded in the network this transport serves, if any."""
+        if not self.network_instance:
+            return None
+        return self.network_instance.mods.get(mod_path)
+
     async def cache_upload(self, request):
-        """Handle file upload to shared cache via HTTP multipart form."""
+        """Handle file upload to shared cache via HTTP multipart form.
+
+        The file part is streamed to a blob in the shared cache storage and the
+        upload event only carries a reference to it.
+        """
+        blob_path = None
         try:
             # Check content type
             content_type = request.content_type
@@ -1627,28 +1860,48 @@ class HttpTransport(Transport):
                     status=400,
                 )
 
+            cache_mod = self._get_network_mod(SHARED_CACHE_MOD)
+            if cache_mod is None or cache_mod.incoming_path is None:
+                return web.json_response(
+                    {"success": False, "error": "Shared cache is not available"},
+                    status=503,
+                )
+
             # Parse multipart form data
             reader = await request.multipart()
 
-            file_data = None
             filename = None
+            file_size = 0
             mime_type = "application/octet-stream"
             agent_id = None
             secret = None
             allowed_agent_groups = []
 
+            loop = asyncio.get_running_loop()
             async for part in reader:
                 if part.name == "file":
-                    filename = part.filename or "unnamed_file"
-                    mime_type = part.headers.get("Content-Type", "application/octet-stream")
-                    # Read file content
-                    file_content = await part.read(decode=False)
-                    if len(file_content) > MAX_FILE_SIZE:
+                    if blob_path is not None:
                         return web.json_response(
-                            {"success": False, "error": f"File size exceeds maximum allowed ({MAX_FILE_SIZE} bytes)"},
-                            status=413,
+                            {"success": False, "error": "Only one file can be uploaded per request"},
+                            status=400,
                         )
-                    file_data = base64.b64encode(file_content).decode("utf-8")
+                    filename = part.filename or "unnamed_file"
+                    mime_type = part.headers.get("Content-Type", "application/octet-stream")
+                    # Stream file content to disk; writes run in the default executor so
+                    # a slow disk does not stall the event loop
+                    blob_path = cache_mod.create_blob_path()
+                    with open(blob_path, "wb") as f:
+                        while True:
+                            chunk = await part.read_chunk(UPLOAD_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            file_size += len(chunk)
+                            if file_size > MAX_FILE_SIZE:
+                                return web.json_response(
+                                    {"success": False, "error": f"File size exceeds maximum allowed ({MAX_FILE_SIZE} bytes)"},
+                                    status=413,
+                                )
+                            await loop.run_in_executor(None, f.write, chunk)
                 elif part.name == "agent_id":
                     agent_id = (await part.read(decode=True)).decode("utf-8")
                 elif part.name == "secret":
@@ -1660,7 +1913,7 @@ class HttpTransport(Transport):
                 elif part.name == "mime_type":
                     mime_type = (await part.read(decode=True)).decode("utf-8")
 
-            if not file_data:
+            if blob_path is None or not file_size:
                 return web.json_response(
                     {"success": False, "error": "No file provided"},
                     status=400,
@@ -1672,16 +1925,16 @@ class HttpTransport(Transport):
                     status=400,
                 )
 
-            logger.info(f"HTTP cache upload: {filename} from {agent_id}")
+            logger.info(f"HTTP cache upload: {filename} ({file_size} bytes) from {agent_id}")
 
             # Create file upload event for the shared cache mod
             upload_event = Event(
                 event_name="shared_cache.file.upload",
                 source_id=agent_id,
-                relevant_mod="openagents.mods.core.shared_cache",
+                relevant_mod=SHARED_CACHE_MOD,
                 visibility=EventVisibility.MOD_ONLY,
                 payload={
-                    "file_data": file_data,
+                    "blob_id": blob_path.name,
                     "filename": filename,
                     "mime_type": mime_type,
                     "allowed_agent_groups": allowed_agent_groups,
@@ -1698,7 +1951,7 @@ class HttpTransport(Transport):
                     "success": True,
                     "cache_id": event_response.data.get("cache_id") if event_response.data else None,
                     "filename": event_response.data.get("filename") if event_response.data else filename,
-                    "file_size": event_response.data.get("file_size") if event_response.data else None,
+                    "file_size": event_response.data.get("file_size") if event_response.data else file_size,
                     "mime_type": event_response.data.get("mime_type") if event_response.data else mime_type,
                 })
             else:
@@ -1715,9 +1968,29 @@ class HttpTransport(Transport):
                 {"success": False, "error": str(e)},
                 status=500,
             )
+        finally:
+            # The mod moves accepted blobs into its storage
+            if blob_path is not None:
+                blob_path.unlink(missing_ok=True)
+
+    def _file_response(self, file_path: Path, filename: str, mime_type: str) -> web.FileResponse:
+        """Serve a stored file, letting aiohttp handle sendfile and Range requests."""
+        safe_filename = os.path.basename(filename)
+        return web.FileResponse(
+            file_path,
+            chunk_size=UPLOAD_CHUNK_SIZE,
+            headers={
+                "Content-Type": mime_type,
+                "Content-Disposition": f'attachment; filename="{safe_filename}"',
+            },
+        )
 
     async def cache_download(self, request):
-        """Handle file download from shared cache via HTTP."""
+        """Handle file download from shared cache via HTTP.
+
+        Access is checked by the shared cache mod and the file is then served
+        from disk, with support for Range requests.
+        """
         try:
             cache_id = request.match_info.get("cache_id")
             agent_id = request.query.get("agent_id")
@@ -1729,15 +2002,22 @@ class HttpTransport(Transport):
                     status=400,
                 )
 
+            cache_mod = self._get_network_mod(SHARED_CACHE_MOD)
+            if cache_mod is None:
+                return web.json_response(
+                    {"success": False, "error": "Shared cache is not available"},
+                    status=503,
+                )
+
             logger.info(f"HTTP cache download: {cache_id} by {agent_id}")
 
             # Create file download event for the shared cache mod
             download_event = Event(
                 event_name="shared_cache.file.download",
                 source_id=agent_id or "anonymous",
-                relevant_mod="openagents.mods.core.shared_cache",
+                relevant_mod=SHARED_CACHE_MOD,
                 visibility=EventVisibility.MOD_ONLY,
-                payload={"cache_id": cache_id},
+                payload={"cache_id": cache_id, "include_data": False},
                 secret=secret,
             )
 
@@ -1746,40 +2026,89 @@ class HttpTransport(Transport):
 
             if event_response and event_response.success and event_response.data:
                 data = event_response.data
-                file_data_b64 = data.get("file_data")
-                filename = data.get("filename", "download")
-                mime_type = data.get("mime_type", "application/octet-stream")
+                file_path = cache_mod.get_file_path(cache_id)
+                if file_path is None:
+                    return web.json_response(
+                        {"success": False, "error": "File not found on disk"},
+                        status=404,
+                    )
 
-                if file_data_b64:
-                    file_bytes = base64.b64decode(file_data_b64)
+                logger.info(f"✅ Serving file {cache_id}")
+                return self._file_response(
+                    file_path,
+                    data.get("filename") or "download",
+                    data.get("mime_type") or "application/octet-stream",
+                )
+            else:
+                error_message = event_response.message if event_response else "No response from event handler"
+                logger.error(f"❌ Cache download failed: {error_message}")
+                return web.json_response(
+                    {"success": False, "error": error_message},
+                    status=404 if "not found" in error_message.lower() else 403,
+                )
 
-                    # Return file as binary response
-                    response = web.Response(
-                        body=file_bytes,
-                        content_type=mime_type,
-                    )
-                    # Set content-disposition to suggest filename
-                    safe_filename = os.path.basename(filename)
-                    response.headers["Content-Disposition"] = f'attachment; filename="{safe_filename}"'
-                    response.headers["Content-Length"] = str(len(file_bytes))
+        except Exception as e:
+            logger.error(f"Error in HTTP cache_download: {e}")
+            return web.json_response(
+                {"success": False, "error": str(e)},
+                status=500,
+            )
 
-                    logger.info(f"✅ Successfully downloaded file {cache_id}")
-                    return response
-                else:
+    async def artifact_download(self, request):
+        """Handle artifact file download via HTTP.
+
+        Access is checked by the shared artifact mod and the file is then served
+        from disk, with support for Range requests.
+        """
+        try:
+            artifact_id = request.match_info.get("artifact_id")
+            agent_id = request.query.get("agent_id")
+            secret = request.query.get("secret")
+
+            artifact_mod = self._get_network_mod(SHARED_ARTIFACT_MOD)
+            if artifact_mod is None:
+                return web.json_response(
+                    {"success": False, "error": "Shared artifacts are not available"},
+                    status=503,
+                )
+
+            logger.info(f"HTTP artifact download: {artifact_id} by {agent_id}")
+
+            # Check access through the shared artifact mod without reading the content
+            get_event = Event(
+                event_name="shared_artifact.get",
+                source_id=agent_id or "anonymous",
+                relevant_mod=SHARED_ARTIFACT_MOD,
+                visibility=EventVisibility.MOD_ONLY,
+                payload={"artifact_id": artifact_id, "include_content": False},
+                secret=secret,
+            )
+            event_response = await self.call_event_handler(get_event)
+
+            if event_response and event_response.success and event_response.data:
+                data = event_response.data
+                file_path = artifact_mod.get_file_path(artifact_id)
+                if file_path is None:
                     return web.json_response(
-                        {"success": False, "error": "File data not found in response"},
-                        status=500,
+                        {"success": False, "error": "File not found on disk"},
+                        status=404,
                     )
+
+                return self._file_response(
+                    file_path,
+                    data.get("name") or artifact_id,
+                    data.get("mime_type") or "application/octet-stream",
+                )
             else:
                 error_message = event_response.message if event_response else "No response from event handler"
-                logger.error(f"❌ Cache download failed: {error_message}")
+                logger.error(f"❌ Artifact download failed: {error_message}")
                 return web.json_response(
                     {"success": False, "error": error_message},
                     status=404 if "not found" in error_message.lower() else 403,
                 )
 
         except Exception as e:
-            logger.error(f"Error in HTTP cache_download: {e}")
+            logger.error(f"Error in HTTP artifact_download: {e}")
             return web.json_response(
                 {"success": False, "error": str(e)},
                 status=500,
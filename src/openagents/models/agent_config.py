@@ -120,6 +120,18 @@ class AgentConfig(BaseModel):
         description="Delay before reacting to messages. Can be a number (seconds) or 'random(min, max)' for random delay"
     )
 
+    # Concurrent event processing
+    max_concurrency: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of events reacted to in parallel; events in the same thread are always processed in order",
+    )
+    sender_rate_limit: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Maximum number of reactions per second to events from the same sender (unlimited if not set)",
+    )
+
     @field_validator("model_name")
     @classmethod
     def validate_model_name(cls, v):
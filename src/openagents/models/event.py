@@ -5,20 +5,32 @@ This module defines the fundamental event structures that replace all
 message types (Direct, Broadcast, Mod) with a single unified Event type.
 """
 
-from ast import Tuple
 import time
 import uuid
 from enum import Enum
-from typing import Dict, Any, Optional, Set, List
+from typing import Dict, Any, Optional, Set, List, Tuple
 import logging
 from aiohttp.hdrs import DESTINATION
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 from openagents.models.network_role import NetworkRole
 
 logger = logging.getLogger(__name__)
 
 
+def event_name_matches_pattern(event_name: str, pattern: str) -> bool:
+    """Check if an event name matches a subscription pattern."""
+    if pattern == "*":
+        return True
+
+    # Support wildcard patterns like "project.*", "channel.message.*"
+    if pattern.endswith("*"):
+        return event_name.startswith(pattern[:-1])
+
+    # Exact match
+    return event_name == pattern
+
+
 class EventVisibility(str, Enum):
     """Defines who can see and receive events."""
 
@@ -30,18 +42,48 @@ class EventVisibility(str, Enum):
     MOD_ONLY = "mod_only"  # Only specific mod can process
 
 
-class EventDestination(BaseModel):
-    """Defines the destination for an event."""
+class EventDestination:
+    """Defines the destination for an event.
+
+    A plain slotted class rather than a pydantic model, since one is built for
+    every routed event.
+    """
+
+    __slots__ = ("role", "desitnation_id")
+
+    def __init__(self, role: NetworkRole, desitnation_id: Optional[str]):
+        self.role = role
+        self.desitnation_id = desitnation_id
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, EventDestination):
+            return NotImplemented
+        return (self.role, self.desitnation_id) == (other.role, other.desitnation_id)
+
+    def __repr__(self) -> str:
+        return f"EventDestination(role={self.role!r}, desitnation_id={self.desitnation_id!r})"
+
 
-    role: NetworkRole
-    desitnation_id: str
+class EventSource:
+    """Defines the source for an event.
 
+    A plain slotted class rather than a pydantic model, since one is built for
+    every routed event.
+    """
+
+    __slots__ = ("role", "source_id")
+
+    def __init__(self, role: NetworkRole, source_id: Optional[str]):
+        self.role = role
+        self.source_id = source_id
 
-class EventSource(BaseModel):
-    """Defines the source for an event."""
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, EventSource):
+            return NotImplemented
+        return (self.role, self.source_id) == (other.role, other.source_id)
 
-    role: NetworkRole
-    source_id: str
+    def __repr__(self) -> str:
+        return f"EventSource(role={self.role!r}, source_id={self.source_id!r})"
 
 
 class Event(BaseModel):
@@ -137,6 +179,13 @@ class Event(BaseModel):
 
     model_config = {"use_enum_values": True, "arbitrary_types_allowed": True}
 
+    # Parsed routing info cached with the ID it was parsed from, so a changed
+    # source_id/destination_id is re-parsed on the next call
+    _parsed_source: Optional[Tuple[Optional[str], EventSource]] = PrivateAttr(default=None)
+    _parsed_destination: Optional[Tuple[Optional[str], EventDestination]] = PrivateAttr(
+        default=None
+    )
+
     @property
     def id(self) -> str:
         return self.event_id
@@ -207,7 +256,14 @@ class Event(BaseModel):
         return v
 
     def parse_source(self) -> EventSource:
-        """Parse the source_id into a EventSource object."""
+        """Parse the source_id into a EventSource object.
+
+        The result is cached until source_id changes and must not be modified.
+        """
+        cached = self._parsed_source
+        if cached is not None and cached[0] == self.source_id:
+            return cached[1]
+
         if self.source_id:
             # Special cases
             if self.source_id == "system" or self.source_id == "mod":
@@ -223,10 +279,19 @@ class Event(BaseModel):
             role = NetworkRole.UNKNOWN
             source_id = None
 
-        return EventSource(role=NetworkRole(role), source_id=source_id)
+        parsed = EventSource(role=NetworkRole(role), source_id=source_id)
+        self._parsed_source = (self.source_id, parsed)
+        return parsed
 
     def parse_destination(self) -> EventDestination:
-        """Parse the destination_id into a EventDestination object."""
+        """Parse the destination_id into a EventDestination object.
+
+        The result is cached until destination_id changes and must not be modified.
+        """
+        cached = self._parsed_destination
+        if cached is not None and cached[0] == self.destination_id:
+            return cached[1]
+
         if self.destination_id:
             # Special cases
             if self.destination_id == "broadcast" or self.destination_id == "all":
@@ -254,7 +319,9 @@ class Event(BaseModel):
             role = NetworkRole.SYSTEM
             target_id = "system"
 
-        return EventDestination(role=role, desitnation_id=target_id)
+        parsed = EventDestination(role=role, desitnation_id=target_id)
+        self._parsed_destination = (self.destination_id, parsed)
+        return parsed
 
     @model_validator(mode="after")
     def auto_set_visibility(self):
@@ -265,16 +332,7 @@ class Event(BaseModel):
 
     def matches_pattern(self, pattern: str) -> bool:
         """Check if this event matches a subscription pattern."""
-        if pattern == "*":
-            return True
-
-        # Support wildcard patterns like "project.*", "channel.message.*"
-        if pattern.endswith("*"):
-            prefix = pattern[:-1]
-            return self.event_name.startswith(prefix)
-
-        # Exact match
-        return self.event_name == pattern
+        return event_name_matches_pattern(self.event_name, pattern)
 
     def is_visible_to_agent(
         self, agent_id: str, agent_channels: Optional[Set[str]] = None
@@ -9,3 +9,24 @@ class EventResponse(BaseModel):
     message: Optional[str] = Field(None, description="Message of the event response")
     data: Optional[Any] = Field(None, description="Data of the event response")
     event_name: Optional[str] = Field(None, description="Original event name")
+
+    def result_data(self) -> Optional[Dict[str, Any]]:
+        """Get the result of a request from this response.
+
+        Returns:
+            Optional[Dict[str, Any]]: The response data with a "success" flag (and
+            an "error" message on failure), or None if a successful response carries
+            no data and the result is delivered by a separate response event
+        """
+        if isinstance(self.data, dict):
+            result = dict(self.data)
+        elif self.data is not None:
+            result = {"data": self.data}
+        elif self.success:
+            return None
+        else:
+            result = {}
+        result.setdefault("success", self.success)
+        if not result["success"]:
+            result.setdefault("error", self.message or "Unknown error")
+        return result
@@ -1,31 +1,134 @@
-from typing import List
-from pydantic import BaseModel, Field
+import bisect
+from typing import List, Optional, Set
+from pydantic import BaseModel, Field, PrivateAttr
 from openagents.models.event import Event
 
 
 class EventThread(BaseModel):
     """
     A event thread maintains a list of events in a channel.
+
+    Events are kept ordered by timestamp and indexed by event ID, so adding an
+    event and checking for duplicates take constant time for in-order arrivals.
     """
 
     events: List[Event] = Field(
         default_factory=list, description="The list of messages in the thread"
     )
 
-    def add_event(self, message: Event):
+    _event_ids: Set[str] = PrivateAttr(default_factory=set)
+    _timestamps: List[float] = PrivateAttr(default_factory=list)
+    _indexed_events: Optional[List[Event]] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context) -> None:
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Sort the events by timestamp and rebuild the ID and timestamp indexes."""
+        self.events.sort(key=lambda x: x.timestamp)
+        self._event_ids = {e.event_id for e in self.events}
+        self._timestamps = [e.timestamp for e in self.events]
+        self._indexed_events = self.events
+
+    def _sync_index(self) -> None:
+        """Rebuild the indexes if the events list was replaced or changed directly."""
+        if self._indexed_events is not self.events or len(self._timestamps) != len(
+            self.events
+        ):
+            self._rebuild_index()
+
+    def add_event(self, message: Event) -> bool:
         """
         Add a message to the message thread.
         Skips adding if an event with the same event_id already exists (deduplication).
+
+        Returns:
+            bool: True if the message was added, False if it was a duplicate
         """
+        self._sync_index()
         # Check for duplicate event_id to prevent adding the same event twice
         # This can happen when an agent sends a message and also receives it back from the network
-        if any(e.event_id == message.event_id for e in self.events):
-            return
-        self.events.append(message)
+        if message.event_id in self._event_ids:
+            return False
+        timestamp = message.timestamp
+        if not self._timestamps or timestamp >= self._timestamps[-1]:
+            self.events.append(message)
+            self._timestamps.append(timestamp)
+        else:
+            index = bisect.bisect_right(self._timestamps, timestamp)
+            self.events.insert(index, message)
+            self._timestamps.insert(index, timestamp)
+        self._event_ids.add(message.event_id)
+        return True
+
+    def has_event(self, event_id: str) -> bool:
+        """
+        Check whether an event with the given ID is in the thread.
+        """
+        self._sync_index()
+        return event_id in self._event_ids
+
+    def remove_event(self, event_id: str, timestamp: Optional[float] = None) -> Optional[Event]:
+        """
+        Remove an event from the thread.
+
+        Args:
+            event_id: ID of the event to remove
+            timestamp: Timestamp of the event, if known, to locate it without a scan
+
+        Returns:
+            Optional[Event]: The removed event, or None if it is not in the thread
+        """
+        self._sync_index()
+        if event_id not in self._event_ids:
+            return None
+        start = 0
+        if timestamp is not None:
+            start = bisect.bisect_left(self._timestamps, timestamp)
+        for index in range(start, len(self.events)):
+            if self.events[index].event_id == event_id:
+                break
+        else:
+            index = next(
+                i for i, e in enumerate(self.events) if e.event_id == event_id
+            )
+        event = self.events.pop(index)
+        del self._timestamps[index]
+        self._event_ids.discard(event_id)
+        return event
+
+    def trim(
+        self, max_events: Optional[int] = None, min_timestamp: Optional[float] = None
+    ) -> List[Event]:
+        """
+        Evict the oldest messages to keep the thread within its retention limits.
+
+        Args:
+            max_events: Maximum number of messages to keep
+            min_timestamp: Messages older than this timestamp are evicted
+
+        Returns:
+            List[Event]: The evicted messages, oldest first
+        """
+        self._sync_index()
+        count = 0
+        if min_timestamp is not None:
+            count = bisect.bisect_left(self._timestamps, min_timestamp)
+        if max_events is not None:
+            count = max(count, len(self.events) - max_events)
+        if count <= 0:
+            return []
+        evicted = self.events[:count]
+        del self.events[:count]
+        del self._timestamps[:count]
+        for event in evicted:
+            self._event_ids.discard(event.event_id)
+        return evicted
 
     def get_events(self) -> List[Event]:
         """
         Get the messages in the message thread.
         """
-        # sort the messages by timestamp
-        return list(sorted(self.events, key=lambda x: x.timestamp))
+        # The messages are kept sorted by timestamp
+        self._sync_index()
+        return list(self.events)
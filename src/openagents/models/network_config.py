@@ -17,6 +17,15 @@ class NetworkMode(str, Enum):
     DECENTRALIZED = "decentralized"
 
 
+class QueueOverflowPolicy(str, Enum):
+    """What to do with new events once an agent's event queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    COALESCE = "coalesce"
+    REJECT = "reject"
+
+
 class ProtocolConfig(BaseModel):
     """Base configuration for a protocol."""
 
@@ -137,6 +146,14 @@ class NetworkConfig(BaseModel):
     connection_timeout: float = Field(30.0, description="Connection timeout in seconds")
     retry_attempts: int = Field(3, description="Number of retry attempts")
     heartbeat_interval: int = Field(30, description="Heartbeat interval in seconds")
+    agent_timeout: Optional[float] = Field(
+        None,
+        description="Seconds without a heartbeat after which an agent is considered stale (None for 6x connection_timeout)",
+    )
+    heartbeat_grace_period: float = Field(
+        0.0,
+        description="Extra seconds a stale agent is kept before it is unregistered",
+    )
 
     # Mods configuration
     mods: List[ModConfig] = Field(
@@ -146,6 +163,26 @@ class NetworkConfig(BaseModel):
     # Messaging configuration
     message_queue_size: int = Field(1000, description="Maximum message queue size")
     message_timeout: float = Field(30.0, description="Message timeout in seconds")
+    long_poll_timeout: float = Field(
+        30.0,
+        description="Maximum time in seconds a poll request may wait for new events before returning empty",
+    )
+    event_dedup_window_size: int = Field(
+        100000,
+        description="Number of recent event IDs remembered to suppress duplicate processing",
+    )
+    event_dedup_ttl: Optional[float] = Field(
+        None,
+        description="Seconds an event ID is remembered for duplicate suppression (None to only bound by count)",
+    )
+    agent_queue_max_size: int = Field(
+        10000,
+        description="Maximum number of events queued for delivery to a single agent (0 for unbounded)",
+    )
+    agent_queue_overflow_policy: QueueOverflowPolicy = Field(
+        QueueOverflowPolicy.DROP_OLDEST,
+        description="What to do with new events once an agent's event queue is full",
+    )
 
     # Agent groups configuration
     agent_groups: Dict[str, AgentGroupConfig] = Field(
@@ -3,10 +3,18 @@ Agent-level shared cache adapter for OpenAgents.
 
 This adapter provides tools for agents to interact with the shared cache system.
 Supports both string values and binary file storage.
+
+Entries read with get_cache can optionally be kept in a local read-through
+cache (``local_cache_size`` > 0 in the adapter config). Local entries are
+dropped when an updated or deleted notification arrives and are revalidated
+against the mod once they are older than ``local_cache_ttl`` seconds or after
+a reconnect, when notifications may have been missed.
 """
 
 import logging
 import base64
+import time
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
@@ -19,6 +27,19 @@ logger = logging.getLogger(__name__)
 # Maximum file size (50 MB)
 MAX_FILE_SIZE = 50 * 1024 * 1024
 
+# Seconds a locally cached entry is served without revalidation
+DEFAULT_LOCAL_CACHE_TTL = 30.0
+
+
+class LocalCacheEntry:
+    """A cache entry held by the adapter's local read-through cache."""
+
+    def __init__(self, data: Dict[str, Any], fetched_at: float, epoch: int, stale: bool):
+        self.data = data
+        self.fetched_at = fetched_at  # Monotonic time of the last fetch or revalidation
+        self.epoch = epoch  # Connection epoch the entry was validated in
+        self.stale = stale  # Must be revalidated before it is served again
+
 
 class SharedCacheAdapter(BaseModAdapter):
     """Agent-level shared cache adapter implementation.
@@ -27,13 +48,27 @@ class SharedCacheAdapter(BaseModAdapter):
     shared cache entries.
     """
 
-    def __init__(self):
-        """Initialize the shared cache adapter for an agent."""
+    def __init__(self, mod_config: Optional[Dict[str, Any]] = None):
+        """Initialize the shared cache adapter for an agent.
+
+        Args:
+            mod_config: Optional configuration dictionary with keys:
+                - local_cache_size: int (default 0) - Entries kept locally, 0 disables the local cache
+                - local_cache_ttl: float (default 30) - Seconds a local entry is served before revalidation
+        """
         super().__init__(mod_name="shared_cache")
 
-        # Track pending requests
-        self.pending_requests: Dict[str, Dict[str, Any]] = {}
-        self.completed_requests: Dict[str, Dict[str, Any]] = {}
+        config = mod_config or {}
+        self.local_cache_size = int(config.get("local_cache_size", 0))
+        self.local_cache_ttl = float(config.get("local_cache_ttl", DEFAULT_LOCAL_CACHE_TTL))
+
+        # cache_id -> LocalCacheEntry, least recently used first
+        self.local_cache: "OrderedDict[str, LocalCacheEntry]" = OrderedDict()
+        self.local_stats = {"hits": 0, "misses": 0, "revalidations": 0}
+        # Bumped on every (re)connect and disconnect so entries cached before are revalidated
+        self._connection_epoch = 0
+        # Bumped on every invalidation so fetches racing with one are not trusted
+        self._invalidation_count = 0
 
         logger.info(f"Initializing Shared Cache adapter for agent")
 
@@ -52,12 +87,30 @@ class SharedCacheAdapter(BaseModAdapter):
         Returns:
             bool: True if shutdown was successful, False otherwise
         """
-        # Clear all state
-        self.pending_requests.clear()
-        self.completed_requests.clear()
-
+        self.local_cache.clear()
         return True
 
+    def on_connect(self) -> None:
+        """Require revalidation of local entries, notifications may have been missed."""
+        self._connection_epoch += 1
+
+    def on_disconnect(self) -> None:
+        """Require revalidation of local entries, notifications may have been missed."""
+        self._connection_epoch += 1
+
+    async def process_incoming_event(self, event: Event) -> Optional[Event]:
+        """Process incoming events for shared cache notifications.
+
+        Args:
+            event: The incoming event
+
+        Returns:
+            The event, unchanged
+        """
+        if event.event_name.startswith("shared_cache.notification."):
+            await self.process_incoming_mod_message(event)
+        return event
+
     async def process_incoming_mod_message(self, message: Event) -> None:
         """Process an incoming mod message.
 
@@ -69,19 +122,7 @@ class SharedCacheAdapter(BaseModAdapter):
         # Handle different event types based on event name
         event_name = message.event_name
 
-        if event_name == "shared_cache.create.response":
-            await self._handle_cache_create_response(message)
-        elif event_name == "shared_cache.get.response":
-            await self._handle_cache_get_response(message)
-        elif event_name == "shared_cache.update.response":
-            await self._handle_cache_update_response(message)
-        elif event_name == "shared_cache.delete.response":
-            await self._handle_cache_delete_response(message)
-        elif event_name == "shared_cache.file.upload.response":
-            await self._handle_file_upload_response(message)
-        elif event_name == "shared_cache.file.download.response":
-            await self._handle_file_download_response(message)
-        elif event_name == "shared_cache.notification.created":
+        if event_name == "shared_cache.notification.created":
             await self._handle_cache_created_notification(message)
         elif event_name == "shared_cache.notification.updated":
             await self._handle_cache_updated_notification(message)
@@ -126,39 +167,23 @@ class SharedCacheAdapter(BaseModAdapter):
                 },
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "create",
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent cache creation request")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(50):  # 50 * 0.2 = 10 seconds
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        cache_id = result.get("cache_id")
-                        logger.info(f"Cache entry created: {cache_id}")
-                        return cache_id
-                    else:
-                        logger.error(
-                            f"Cache creation failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return None
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning("Cache creation timed out")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return None
+            logger.debug(f"Sending cache creation request")
+
+            # Send event and wait for the response
+            result = await self.request(message, timeout=10)
+            if result is None:
+                logger.warning("Cache creation timed out")
+                return None
+
+            if result.get("success"):
+                cache_id = result.get("cache_id")
+                logger.info(f"Cache entry created: {cache_id}")
+                return cache_id
+            else:
+                logger.error(
+                    f"Cache creation failed: {result.get('error', 'Unknown error')}"
+                )
+                return None
 
         except Exception as e:
             logger.error(f"Error creating cache: {e}")
@@ -167,64 +192,98 @@ class SharedCacheAdapter(BaseModAdapter):
     async def get_cache(self, cache_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a cache entry.
 
+        With the local cache enabled, a fresh local copy is returned without a
+        request and an older one is revalidated by version with the mod.
+
         Args:
             cache_id: ID of the cache entry to retrieve
 
         Returns:
             Optional[Dict[str, Any]]: Cache entry if successful, None otherwise
         """
+        local_entry = self.local_cache.get(cache_id)
+        if local_entry is not None and self._is_local_entry_fresh(local_entry):
+            self.local_cache.move_to_end(cache_id)
+            self.local_stats["hits"] += 1
+            logger.debug(f"Cache entry {cache_id} served from the local cache")
+            return dict(local_entry.data)
+
         if self.connector is None:
             logger.error(f"Cannot get cache: connector is None for agent {self.agent_id}")
             return None
 
         try:
+            payload = {"cache_id": cache_id}
+            if local_entry is not None:
+                payload["if_version"] = local_entry.data.get("version")
+
             # Create cache get event
             message = Event(
                 event_name="shared_cache.get",
                 source_id=self.agent_id,
                 relevant_mod="openagents.mods.core.shared_cache",
                 visibility=EventVisibility.MOD_ONLY,
-                payload={"cache_id": cache_id},
+                payload=payload,
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "get",
-                "cache_id": cache_id,
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent cache get request for {cache_id}")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(50):  # 50 * 0.2 = 10 seconds
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        logger.info(f"Cache entry retrieved: {cache_id}")
-                        return result
-                    else:
-                        logger.error(
-                            f"Cache retrieval failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return None
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning(f"Cache retrieval timed out for {cache_id}")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return None
+            logger.debug(f"Sending cache get request for {cache_id}")
+
+            # Send event and wait for the response
+            invalidation_count = self._invalidation_count
+            result = await self.request(message, timeout=10)
+            if result is None:
+                logger.warning(f"Cache retrieval timed out for {cache_id}")
+                return None
+
+            if result.get("success"):
+                if result.get("not_modified") and local_entry is not None:
+                    self.local_stats["revalidations"] += 1
+                    result = dict(local_entry.data, expires_at=result.get("expires_at"))
+                else:
+                    self.local_stats["misses"] += 1
+                    logger.info(f"Cache entry retrieved: {cache_id}")
+                self._store_local_entry(
+                    cache_id, result, stale=invalidation_count != self._invalidation_count
+                )
+                return result
+            else:
+                self._invalidate_local_entry(cache_id)
+                logger.error(
+                    f"Cache retrieval failed: {result.get('error', 'Unknown error')}"
+                )
+                return None
 
         except Exception as e:
             logger.error(f"Error retrieving cache: {e}")
             return None
 
+    def _is_local_entry_fresh(self, local_entry: LocalCacheEntry) -> bool:
+        """Check whether a local entry can be served without revalidation."""
+        expires_at = local_entry.data.get("expires_at")
+        return (
+            not local_entry.stale
+            and local_entry.epoch == self._connection_epoch
+            and time.monotonic() - local_entry.fetched_at < self.local_cache_ttl
+            and (expires_at is None or time.time() < expires_at)
+        )
+
+    def _store_local_entry(self, cache_id: str, data: Dict[str, Any], stale: bool = False) -> None:
+        """Keep a retrieved entry in the local cache, evicting the least recently used."""
+        if self.local_cache_size <= 0:
+            return
+        self.local_cache[cache_id] = LocalCacheEntry(
+            dict(data), time.monotonic(), self._connection_epoch, stale
+        )
+        self.local_cache.move_to_end(cache_id)
+        while len(self.local_cache) > self.local_cache_size:
+            self.local_cache.popitem(last=False)
+
+    def _invalidate_local_entry(self, cache_id: Optional[str]) -> None:
+        """Drop an entry from the local cache."""
+        self._invalidation_count += 1
+        if cache_id is not None:
+            self.local_cache.pop(cache_id, None)
+
     async def update_cache(self, cache_id: str, value: str) -> bool:
         """Update a cache entry.
 
@@ -251,39 +310,24 @@ class SharedCacheAdapter(BaseModAdapter):
                 payload={"cache_id": cache_id, "value": value},
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "update",
-                "cache_id": cache_id,
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent cache update request for {cache_id}")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(50):  # 50 * 0.2 = 10 seconds
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        logger.info(f"Cache entry updated: {cache_id}")
-                        return True
-                    else:
-                        logger.error(
-                            f"Cache update failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return False
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning(f"Cache update timed out for {cache_id}")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return False
+            logger.debug(f"Sending cache update request for {cache_id}")
+
+            # Send event and wait for the response. The mod does not notify the
+            # updating agent, so the local copy is dropped here
+            result = await self.request(message, timeout=10)
+            self._invalidate_local_entry(cache_id)
+            if result is None:
+                logger.warning(f"Cache update timed out for {cache_id}")
+                return False
+
+            if result.get("success"):
+                logger.info(f"Cache entry updated: {cache_id}")
+                return True
+            else:
+                logger.error(
+                    f"Cache update failed: {result.get('error', 'Unknown error')}"
+                )
+                return False
 
         except Exception as e:
             logger.error(f"Error updating cache: {e}")
@@ -314,88 +358,28 @@ class SharedCacheAdapter(BaseModAdapter):
                 payload={"cache_id": cache_id},
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "delete",
-                "cache_id": cache_id,
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent cache delete request for {cache_id}")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(50):  # 50 * 0.2 = 10 seconds
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        logger.info(f"Cache entry deleted: {cache_id}")
-                        return True
-                    else:
-                        logger.error(
-                            f"Cache deletion failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return False
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning(f"Cache deletion timed out for {cache_id}")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return False
+            logger.debug(f"Sending cache delete request for {cache_id}")
+
+            # Send event and wait for the response
+            result = await self.request(message, timeout=10)
+            self._invalidate_local_entry(cache_id)
+            if result is None:
+                logger.warning(f"Cache deletion timed out for {cache_id}")
+                return False
+
+            if result.get("success"):
+                logger.info(f"Cache entry deleted: {cache_id}")
+                return True
+            else:
+                logger.error(
+                    f"Cache deletion failed: {result.get('error', 'Unknown error')}"
+                )
+                return False
 
         except Exception as e:
             logger.error(f"Error deleting cache: {e}")
             return False
 
-    async def _handle_cache_create_response(self, message: Event) -> None:
-        """Handle cache create response.
-
-        Args:
-            message: The response message
-        """
-        request_id = message.response_to
-        if request_id and request_id in self.pending_requests:
-            self.completed_requests[request_id] = message.payload or {}
-            del self.pending_requests[request_id]
-
-    async def _handle_cache_get_response(self, message: Event) -> None:
-        """Handle cache get response.
-
-        Args:
-            message: The response message
-        """
-        request_id = message.response_to
-        if request_id and request_id in self.pending_requests:
-            self.completed_requests[request_id] = message.payload or {}
-            del self.pending_requests[request_id]
-
-    async def _handle_cache_update_response(self, message: Event) -> None:
-        """Handle cache update response.
-
-        Args:
-            message: The response message
-        """
-        request_id = message.response_to
-        if request_id and request_id in self.pending_requests:
-            self.completed_requests[request_id] = message.payload or {}
-            del self.pending_requests[request_id]
-
-    async def _handle_cache_delete_response(self, message: Event) -> None:
-        """Handle cache delete response.
-
-        Args:
-            message: The response message
-        """
-        request_id = message.response_to
-        if request_id and request_id in self.pending_requests:
-            self.completed_requests[request_id] = message.payload or {}
-            del self.pending_requests[request_id]
-
     async def _handle_cache_created_notification(self, message: Event) -> None:
         """Handle cache created notification.
 
@@ -418,6 +402,7 @@ class SharedCacheAdapter(BaseModAdapter):
         payload = message.payload or {}
         cache_id = payload.get("cache_id")
         logger.info(f"Received cache updated notification for {cache_id}")
+        self._invalidate_local_entry(cache_id)
 
         # Notify any registered handlers if needed
 
@@ -430,31 +415,10 @@ class SharedCacheAdapter(BaseModAdapter):
         payload = message.payload or {}
         cache_id = payload.get("cache_id")
         logger.info(f"Received cache deleted notification for {cache_id}")
+        self._invalidate_local_entry(cache_id)
 
         # Notify any registered handlers if needed
 
-    async def _handle_file_upload_response(self, message: Event) -> None:
-        """Handle file upload response.
-
-        Args:
-            message: The response message
-        """
-        request_id = message.response_to
-        if request_id and request_id in self.pending_requests:
-            self.completed_requests[request_id] = message.payload or {}
-            del self.pending_requests[request_id]
-
-    async def _handle_file_download_response(self, message: Event) -> None:
-        """Handle file download response.
-
-        Args:
-            message: The response message
-        """
-        request_id = message.response_to
-        if request_id and request_id in self.pending_requests:
-            self.completed_requests[request_id] = message.payload or {}
-            del self.pending_requests[request_id]
-
     async def upload_file(
         self,
         file_path: str,
@@ -517,40 +481,23 @@ class SharedCacheAdapter(BaseModAdapter):
                 },
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "upload",
-                "filename": filename,
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent file upload request for {filename}")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(100):  # 100 * 0.2 = 20 seconds (longer for file uploads)
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        cache_id = result.get("cache_id")
-                        logger.info(f"File uploaded successfully: {cache_id}")
-                        return result
-                    else:
-                        logger.error(
-                            f"File upload failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return None
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning(f"File upload timed out for {filename}")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return None
+            logger.debug(f"Sending file upload request for {filename}")
+
+            # Send event and wait for the response
+            result = await self.request(message, timeout=20)
+            if result is None:
+                logger.warning(f"File upload timed out for {filename}")
+                return None
+
+            if result.get("success"):
+                cache_id = result.get("cache_id")
+                logger.info(f"File uploaded successfully: {cache_id}")
+                return result
+            else:
+                logger.error(
+                    f"File upload failed: {result.get('error', 'Unknown error')}"
+                )
+                return None
 
         except Exception as e:
             logger.error(f"Error uploading file: {e}")
@@ -586,50 +533,33 @@ class SharedCacheAdapter(BaseModAdapter):
                 payload={"cache_id": cache_id},
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "download",
-                "cache_id": cache_id,
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent file download request for {cache_id}")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(100):  # 100 * 0.2 = 20 seconds (longer for file downloads)
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        logger.info(f"File downloaded successfully: {cache_id}")
-
-                        # Save to file if path provided
-                        if save_path and result.get("file_data"):
-                            file_bytes = base64.b64decode(result["file_data"])
-                            with open(save_path, "wb") as f:
-                                f.write(file_bytes)
-                            logger.info(f"File saved to: {save_path}")
-                            # Remove file_data from result to save memory
-                            result["saved_to"] = save_path
-                            del result["file_data"]
-
-                        return result
-                    else:
-                        logger.error(
-                            f"File download failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return None
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning(f"File download timed out for {cache_id}")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return None
+            logger.debug(f"Sending file download request for {cache_id}")
+
+            # Send event and wait for the response
+            result = await self.request(message, timeout=20)
+            if result is None:
+                logger.warning(f"File download timed out for {cache_id}")
+                return None
+
+            if result.get("success"):
+                logger.info(f"File downloaded successfully: {cache_id}")
+
+                # Save to file if path provided
+                if save_path and result.get("file_data"):
+                    file_bytes = base64.b64decode(result["file_data"])
+                    with open(save_path, "wb") as f:
+                        f.write(file_bytes)
+                    logger.info(f"File saved to: {save_path}")
+                    # Remove file_data from result to save memory
+                    result["saved_to"] = save_path
+                    del result["file_data"]
+
+                return result
+            else:
+                logger.error(
+                    f"File download failed: {result.get('error', 'Unknown error')}"
+                )
+                return None
 
         except Exception as e:
             logger.error(f"Error downloading file: {e}")
@@ -682,40 +612,23 @@ class SharedCacheAdapter(BaseModAdapter):
                 },
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "upload",
-                "filename": filename,
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent file upload request for {filename}")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(100):  # 100 * 0.2 = 20 seconds
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        cache_id = result.get("cache_id")
-                        logger.info(f"File uploaded successfully: {cache_id}")
-                        return result
-                    else:
-                        logger.error(
-                            f"File upload failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return None
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning(f"File upload timed out for {filename}")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return None
+            logger.debug(f"Sending file upload request for {filename}")
+
+            # Send event and wait for the response
+            result = await self.request(message, timeout=20)
+            if result is None:
+                logger.warning(f"File upload timed out for {filename}")
+                return None
+
+            if result.get("success"):
+                cache_id = result.get("cache_id")
+                logger.info(f"File uploaded successfully: {cache_id}")
+                return result
+            else:
+                logger.error(
+                    f"File upload failed: {result.get('error', 'Unknown error')}"
+                )
+                return None
 
         except Exception as e:
             logger.error(f"Error uploading file: {e}")
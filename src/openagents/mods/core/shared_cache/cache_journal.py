@@ -0,0 +1,111 @@
+"""
+Append-only journal for the shared cache mod.
+
+Cache entries are persisted as a snapshot (``cache_data.json``) plus a JSON Lines
+journal of the changes made since the snapshot was written. Each created,
+updated or removed entry is appended to the journal once instead of rewriting
+the whole index; compaction writes a fresh snapshot and truncates the journal.
+Loading reads the snapshot and replays the journal on top of it.
+
+Records are applied idempotently, so a crash between replacing the snapshot and
+truncating the journal, or a torn last line, loses nothing but the torn record.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE_NAME = "cache_data.json"
+JOURNAL_FILE_NAME = "cache_data.log.jsonl"
+
+# Journal record operations
+PUT = "put"
+DELETE = "delete"
+
+
+class CacheJournal:
+    """Snapshot plus append-only journal of serialized cache entries."""
+
+    def __init__(self, storage_path: Path):
+        """Initialize the journal.
+
+        Args:
+            storage_path: Directory holding the snapshot and journal files
+        """
+        self.storage_path = storage_path
+        self.snapshot_file = storage_path / SNAPSHOT_FILE_NAME
+        self.journal_file = storage_path / JOURNAL_FILE_NAME
+        self.records_since_compaction = 0
+        self._handle: Optional[TextIO] = None
+
+    def put(self, cache_id: str, entry_data: Dict[str, Any]) -> None:
+        """Record a created or updated cache entry."""
+        self._append({"op": PUT, "id": cache_id, "entry": entry_data})
+
+    def delete(self, cache_id: str) -> None:
+        """Record a removed cache entry."""
+        self._append({"op": DELETE, "id": cache_id})
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if self._handle is None:
+            self._handle = open(self.journal_file, "a", encoding="utf-8")
+        self._handle.write(json.dumps(record) + "\n")
+        self._handle.flush()
+        self.records_since_compaction += 1
+
+    def compact(self, cache_data: Dict[str, Any]) -> None:
+        """Replace the snapshot with the given entries and truncate the journal.
+
+        Args:
+            cache_data: Serialized cache_id -> entry mapping of the whole cache
+        """
+        temp_file = self.snapshot_file.with_name(self.snapshot_file.name + ".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(cache_data, f)
+        os.replace(temp_file, self.snapshot_file)
+
+        self.close()
+        with open(self.journal_file, "w", encoding="utf-8"):
+            pass
+        self.records_since_compaction = 0
+
+    def replay(self) -> Dict[str, Any]:
+        """Read the snapshot and apply the journaled changes.
+
+        Returns:
+            Dict[str, Any]: Serialized cache_id -> entry mapping
+        """
+        cache_data: Dict[str, Any] = {}
+        if self.snapshot_file.exists():
+            with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                cache_data = json.load(f)
+
+        applied = 0
+        if self.journal_file.exists():
+            with open(self.journal_file, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                        if record["op"] == PUT:
+                            cache_data[record["id"]] = record["entry"]
+                        elif record["op"] == DELETE:
+                            cache_data.pop(record["id"], None)
+                        applied += 1
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning(
+                            f"Skipping unreadable record on line {line_number} of {self.journal_file}: {e}"
+                        )
+        self.records_since_compaction = applied
+        return cache_data
+
+    def close(self) -> None:
+        """Close the journal file handle, if open."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
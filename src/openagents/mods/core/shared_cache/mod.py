@@ -3,20 +3,38 @@ Network-level shared cache mod for OpenAgents.
 
 This mod provides a shared caching system with agent group-based access control.
 Supports both string values and binary file storage.
+
+Entries can expire after a TTL and the cache can be bounded by entry count and
+total size, evicting the least recently used entries. Changes are persisted
+through an append-only journal (see cache_journal).
+
+Configuration options:
+- default_ttl: Seconds after which entries created without a ttl expire (default: never)
+- max_entries: Maximum number of entries kept (default: unbounded)
+- max_bytes: Maximum total size of values and files in bytes (default: unbounded)
+- sweep_interval: Seconds between background sweeps of expired entries (default: 60)
+- journal_compaction_records: Minimum journal records after which a snapshot is written;
+  the threshold grows with the number of entries (default: 1000)
+- notification_coalesce_window: Seconds during which further update notifications for
+  an entry are folded into one sent at the end of the window (default: 0, disabled)
 """
 
+import asyncio
+import heapq
 import logging
-import json
 import uuid
 import time
 import base64
 import os
-from typing import Dict, Any, List, Optional, Set
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 
 from openagents.core.base_mod import BaseMod, mod_event_handler
+from openagents.core.notification_coalescer import NotificationCoalescer
 from openagents.models.event import Event
 from openagents.models.event_response import EventResponse
+from .cache_journal import CacheJournal
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +57,8 @@ class CacheEntry:
         is_file: bool = False,
         filename: Optional[str] = None,
         file_size: Optional[int] = None,
+        expires_at: Optional[int] = None,
+        version: int = 1,
     ):
         self.cache_id = cache_id
         self.value = value  # For files, this is the relative path to the file
@@ -50,6 +70,19 @@ class CacheEntry:
         self.is_file = is_file
         self.filename = filename  # Original filename for file entries
         self.file_size = file_size  # File size in bytes
+        self.expires_at = expires_at  # Expiry timestamp, None if the entry never expires
+        self.version = version  # Incremented on every update
+
+    @property
+    def size(self) -> int:
+        """Size of the entry's value or file in bytes."""
+        if self.is_file:
+            return self.file_size or 0
+        return len(self.value.encode("utf-8"))
+
+    def is_expired(self, now: float) -> bool:
+        """Check whether the entry has expired at the given time."""
+        return self.expires_at is not None and self.expires_at <= now
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert cache entry to dictionary."""
@@ -62,10 +95,13 @@ class CacheEntry:
             "created_at": self.created_at,
             "updated_at": self.updated_at,
             "is_file": self.is_file,
+            "version": self.version,
         }
         if self.is_file:
             data["filename"] = self.filename
             data["file_size"] = self.file_size
+        if self.expires_at is not None:
+            data["expires_at"] = self.expires_at
         return data
 
     @classmethod
@@ -82,6 +118,8 @@ class CacheEntry:
             is_file=data.get("is_file", False),
             filename=data.get("filename"),
             file_size=data.get("file_size"),
+            expires_at=data.get("expires_at"),
+            version=data.get("version", 1),
         )
 
 
@@ -96,10 +134,31 @@ class SharedCacheMod(BaseMod):
         """Initialize the shared cache mod."""
         super().__init__(mod_name=mod_name)
 
-        # Cache storage
-        self.cache_entries: Dict[str, CacheEntry] = {}
+        # Cache storage, ordered from least to most recently used
+        self.cache_entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self.storage_path: Optional[Path] = None
         self.files_path: Optional[Path] = None
+        self.incoming_path: Optional[Path] = None
+        self.journal: Optional[CacheJournal] = None
+
+        # Total size of the cached values and files in bytes
+        self.total_bytes = 0
+
+        # (expires_at, cache_id) of entries with a TTL; stale items are skipped
+        self._expiry_heap: List[Tuple[int, str]] = []
+        self._sweeper_task: Optional[asyncio.Task] = None
+
+        # Multicasts notifications and coalesces update bursts per entry
+        self._notifications = NotificationCoalescer(self)
+        # Pending deletion notifications of entries expired during lookups
+        self._expiry_notification_tasks: Set[asyncio.Task] = set()
+
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
 
         logger.info("Initializing Shared Cache mod")
 
@@ -121,6 +180,13 @@ class SharedCacheMod(BaseMod):
         self.files_path = self.storage_path / "files"
         self.files_path.mkdir(exist_ok=True)
 
+        # Create incoming directory for blobs streamed in by the transports,
+        # dropping blobs left behind by uploads that never completed
+        self.incoming_path = self.storage_path / "incoming"
+        self.incoming_path.mkdir(exist_ok=True)
+        for stale_blob in self.incoming_path.iterdir():
+            stale_blob.unlink()
+
         logger.info(f"Using cache storage at {self.storage_path}")
         logger.info(f"Using files storage at {self.files_path}")
 
@@ -128,37 +194,211 @@ class SharedCacheMod(BaseMod):
 
     def _load_cache_entries(self):
         """Load cache entries from storage."""
+        self.journal = CacheJournal(self.storage_path)
         try:
-            cache_file = self.storage_path / "cache_data.json"
-
-            if cache_file.exists():
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-                    for cache_id, entry_data in data.items():
-                        self.cache_entries[cache_id] = CacheEntry.from_dict(entry_data)
+            data = self.journal.replay()
+            entries = sorted(
+                (CacheEntry.from_dict(entry_data) for entry_data in data.values()),
+                key=lambda entry: entry.updated_at,
+            )
+            for entry in entries:
+                self._index_entry(entry)
+            if entries:
                 logger.info(f"Loaded {len(self.cache_entries)} cache entries from storage")
             else:
                 logger.debug("No existing cache data found in storage")
         except Exception as e:
             logger.error(f"Failed to load cache entries: {e}")
-            self.cache_entries = {}
+            self.cache_entries = OrderedDict()
+            self.total_bytes = 0
+            self._expiry_heap = []
+
+        self._expire_entries()
+        if self.journal.records_since_compaction:
+            self._save_cache_entries()
 
     def _save_cache_entries(self):
-        """Save cache entries to storage."""
+        """Write a snapshot of all cache entries and truncate the journal."""
         try:
-            cache_file = self.storage_path / "cache_data.json"
-
             data = {
                 cache_id: entry.to_dict()
                 for cache_id, entry in self.cache_entries.items()
             }
-
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self.journal.compact(data)
             logger.info(f"Saved {len(self.cache_entries)} cache entries to storage")
         except Exception as e:
             logger.error(f"Failed to save cache entries: {e}")
 
+    def _journal_compaction_records(self) -> int:
+        # Scale with the cache so rewriting the snapshot stays O(1) amortized per change
+        return max(
+            self.config.get("journal_compaction_records", 1000), len(self.cache_entries)
+        )
+
+    def _index_entry(self, cache_entry: CacheEntry) -> None:
+        """Add or replace an entry in memory as the most recently used one."""
+        previous = self.cache_entries.pop(cache_entry.cache_id, None)
+        if previous is not None:
+            self.total_bytes -= previous.size
+        self.cache_entries[cache_entry.cache_id] = cache_entry
+        self.total_bytes += cache_entry.size
+        if cache_entry.expires_at is not None:
+            heapq.heappush(self._expiry_heap, (cache_entry.expires_at, cache_entry.cache_id))
+
+    def _store_entry(self, cache_entry: CacheEntry) -> None:
+        """Add or replace a cache entry and journal the change."""
+        self._index_entry(cache_entry)
+        self.journal.put(cache_entry.cache_id, cache_entry.to_dict())
+        if self.journal.records_since_compaction >= self._journal_compaction_records():
+            self._save_cache_entries()
+        if cache_entry.expires_at is not None:
+            self._ensure_sweeper()
+
+    def _remove_entry(self, cache_id: str) -> Optional[CacheEntry]:
+        """Remove a cache entry, and its file if any, and journal the change."""
+        cache_entry = self.cache_entries.pop(cache_id, None)
+        if cache_entry is None:
+            return None
+        self.total_bytes -= cache_entry.size
+        if cache_entry.is_file:
+            try:
+                (self.storage_path / cache_entry.value).unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(f"Failed to remove file of cache entry {cache_id}: {e}")
+        self.journal.delete(cache_id)
+        if self.journal.records_since_compaction >= self._journal_compaction_records():
+            self._save_cache_entries()
+        return cache_entry
+
+    def _get_live_entry(self, cache_id: str) -> Optional[CacheEntry]:
+        """Get an entry, removing it instead if it has expired."""
+        cache_entry = self.cache_entries.get(cache_id)
+        if cache_entry is not None and cache_entry.is_expired(time.time()):
+            self._remove_entry(cache_id)
+            self.stats["expirations"] += 1
+            self._notify_expired([cache_entry])
+            return None
+        return cache_entry
+
+    def _expiry_for(self, payload: Dict[str, Any], now: int) -> Optional[int]:
+        """Get the expiry timestamp for an entry from the request's ttl or the default TTL.
+
+        Raises:
+            ValueError: If the ttl is not a positive number
+        """
+        ttl = payload.get("ttl")
+        if ttl is None:
+            ttl = self.config.get("default_ttl")
+            if ttl is None:
+                return None
+        if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0:
+            raise ValueError("ttl must be a positive number of seconds")
+        return now + int(ttl)
+
+    def _exceeds_budget(self, size: int) -> bool:
+        """Check whether a single entry of the given size can never fit in the cache."""
+        max_bytes = self.config.get("max_bytes")
+        return max_bytes is not None and size > max_bytes
+
+    def _expire_entries(self) -> int:
+        """Remove all expired entries.
+
+        Returns:
+            int: Number of entries removed
+        """
+        now = time.time()
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, cache_id = heapq.heappop(self._expiry_heap)
+            cache_entry = self.cache_entries.get(cache_id)
+            # Skip items left behind by removed entries or changed TTLs
+            if cache_entry is None or cache_entry.expires_at != expires_at:
+                continue
+            self._remove_entry(cache_id)
+            expired.append(cache_entry)
+        self.stats["expirations"] += len(expired)
+        if expired:
+            self._notify_expired(expired)
+
+        # Drop stale items once they outnumber the live ones
+        if len(self._expiry_heap) > 2 * len(self.cache_entries) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, cache_id)
+                for cache_id, entry in self.cache_entries.items()
+                if entry.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+        return len(expired)
+
+    def _evict_entries(self, keep_id: str) -> List[CacheEntry]:
+        """Evict least recently used entries until the cache is within its budget.
+
+        Args:
+            keep_id: ID of the entry just stored, which is never evicted
+
+        Returns:
+            List[CacheEntry]: The evicted entries
+        """
+        self._expire_entries()
+        max_entries = self.config.get("max_entries")
+        max_bytes = self.config.get("max_bytes")
+        evicted = []
+        while (max_entries is not None and len(self.cache_entries) > max_entries) or (
+            max_bytes is not None and self.total_bytes > max_bytes
+        ):
+            cache_id = next(iter(self.cache_entries))
+            if cache_id == keep_id:
+                break
+            evicted.append(self._remove_entry(cache_id))
+        self.stats["evictions"] += len(evicted)
+        return evicted
+
+    async def _notify_evicted(self, evicted: List[CacheEntry], reason: str = "Evicted") -> None:
+        for cache_entry in evicted:
+            logger.info(f"{reason} cache entry {cache_entry.cache_id}")
+            await self._send_notification("shared_cache.notification.deleted", cache_entry)
+
+    def _notify_expired(self, expired: List[CacheEntry]) -> None:
+        """Notify the deletion of expired entries like that of evicted ones.
+
+        Entries expire during synchronous lookups, so pending update notifications
+        are dropped right away and the deletions are sent from a task. Without a
+        running loop (while loading the cache) there is nobody to notify.
+        """
+        for cache_entry in expired:
+            self._notifications.discard(cache_entry.cache_id)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._notify_evicted(expired, reason="Expired"))
+        self._expiry_notification_tasks.add(task)
+        task.add_done_callback(self._expiry_notification_tasks.discard)
+
+    def _ensure_sweeper(self) -> None:
+        """Start the background sweeper of expired entries if it is not running."""
+        if self._sweeper_task is not None and not self._sweeper_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Expired entries are still removed when they are read
+            return
+        self._sweeper_task = loop.create_task(self._sweep_expired_entries())
+
+    async def _sweep_expired_entries(self) -> None:
+        """Periodically remove expired entries while any entry has a TTL."""
+        while self._expiry_heap:
+            await asyncio.sleep(self.config.get("sweep_interval", 60))
+            try:
+                expired = self._expire_entries()
+                if expired:
+                    logger.debug(f"Removed {expired} expired cache entries")
+            except Exception as e:
+                logger.error(f"Error sweeping expired cache entries: {e}")
+
     def initialize(self) -> bool:
         """Initialize the mod.
 
@@ -173,11 +413,23 @@ class SharedCacheMod(BaseMod):
         Returns:
             bool: True if shutdown was successful, False otherwise
         """
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            self._sweeper_task = None
+        self._notifications.close()
+        for task in self._expiry_notification_tasks:
+            task.cancel()
+        self._expiry_notification_tasks.clear()
+
         # Save cache entries to storage
-        self._save_cache_entries()
+        if self.journal is not None:
+            self._save_cache_entries()
+            self.journal.close()
 
         # Clear all state
         self.cache_entries.clear()
+        self.total_bytes = 0
+        self._expiry_heap = []
 
         return True
 
@@ -207,45 +459,29 @@ class SharedCacheMod(BaseMod):
     ):
         """Send notification to agents with access to the cache entry.
 
+        Update notifications are coalesced per cache entry (see NotificationCoalescer);
+        a deletion drops the pending update notification.
+
         Args:
             event_name: Name of the notification event
-            cache_entry: The cache entry that was modified
+            cache_entry: The cache entry entry that was modified
             exclude_agent: Optional agent ID to exclude from notifications
         """
-        # Determine which agents should be notified
-        notify_agents = set()
-
-        if cache_entry.allowed_agent_groups:
-            # Notify only agents in allowed groups
-            for agent_id, group in self.network.topology.agent_group_membership.items():
-                if group in cache_entry.allowed_agent_groups:
-                    notify_agents.add(agent_id)
-        else:
-            # Notify all registered agents
-            notify_agents = set(self.network.topology.agent_registry.keys())
-
-        # Exclude the agent who triggered the notification
-        if exclude_agent:
-            notify_agents.discard(exclude_agent)
-
-        # Send notifications
-        for agent_id in notify_agents:
-            notification = Event(
-                event_name=event_name,
-                source_id=self.network.network_id,
-                destination_id=agent_id,
-                payload={
-                    "cache_id": cache_entry.cache_id,
-                    "mime_type": cache_entry.mime_type,
-                    "created_by": cache_entry.created_by,
-                    "allowed_agent_groups": cache_entry.allowed_agent_groups,
-                },
-            )
-            try:
-                await self.network.process_event(notification)
-                logger.debug(f"Sent {event_name} notification to {agent_id}")
-            except Exception as e:
-                logger.error(f"Failed to send notification to {agent_id}: {e}")
+        if event_name == "shared_cache.notification.deleted":
+            self._notifications.discard(cache_entry.cache_id)
+        await self._notifications.notify(
+            event_name,
+            cache_entry.cache_id,
+            {
+                "cache_id": cache_entry.cache_id,
+                "mime_type": cache_entry.mime_type,
+                "created_by": cache_entry.created_by,
+                "allowed_agent_groups": cache_entry.allowed_agent_groups,
+            },
+            cache_entry.allowed_agent_groups,
+            exclude_agent,
+            coalesce=event_name == "shared_cache.notification.updated",
+        )
 
     @mod_event_handler("shared_cache.create")
     async def _handle_cache_create(self, event: Event) -> Optional[EventResponse]:
@@ -262,17 +498,22 @@ class SharedCacheMod(BaseMod):
 
             # Validate required fields
             value = payload.get("value")
+            if value is not None and not isinstance(value, str):
+                # Ensure value is a string
+                value = str(value)
+
             if value is None:
                 response_data = {"success": False, "error": "value is required"}
+            elif self._exceeds_budget(len(value.encode("utf-8"))):
+                response_data = {
+                    "success": False,
+                    "error": "Cache entry exceeds the cache size budget",
+                }
             else:
                 # Extract optional fields
                 mime_type = payload.get("mime_type", "text/plain")
                 allowed_agent_groups = payload.get("allowed_agent_groups", [])
 
-                # Ensure value is a string
-                if not isinstance(value, str):
-                    value = str(value)
-
                 # Create cache entry
                 cache_id = str(uuid.uuid4())
                 current_time = int(time.time())
@@ -285,10 +526,11 @@ class SharedCacheMod(BaseMod):
                     created_by=event.source_id,
                     created_at=current_time,
                     updated_at=current_time,
+                    expires_at=self._expiry_for(payload, current_time),
                 )
 
-                self.cache_entries[cache_id] = cache_entry
-                self._save_cache_entries()
+                self._store_entry(cache_entry)
+                evicted = self._evict_entries(cache_id)
 
                 logger.info(
                     f"Created cache entry {cache_id} by {event.source_id} "
@@ -299,6 +541,7 @@ class SharedCacheMod(BaseMod):
                 await self._send_notification(
                     "shared_cache.notification.created", cache_entry, exclude_agent=event.source_id
                 )
+                await self._notify_evicted(evicted)
 
                 response_data = {"success": True, "cache_id": cache_id}
 
@@ -320,6 +563,9 @@ class SharedCacheMod(BaseMod):
     async def _handle_cache_get(self, event: Event) -> Optional[EventResponse]:
         """Handle cache retrieval request.
 
+        If the payload's if_version matches the entry's version, the response
+        only confirms the entry is unchanged (not_modified) instead of carrying it.
+
         Args:
             event: The cache get event
 
@@ -331,12 +577,15 @@ class SharedCacheMod(BaseMod):
 
             # Validate required fields
             cache_id = payload.get("cache_id")
+            cache_entry = self._get_live_entry(cache_id) if cache_id else None
             if not cache_id:
                 response_data = {"success": False, "error": "cache_id is required"}
-            elif cache_id not in self.cache_entries:
+            elif cache_entry is None:
+                self.stats["misses"] += 1
                 response_data = {"success": False, "error": "Cache entry not found"}
             else:
-                cache_entry = self.cache_entries[cache_id]
+                self.stats["hits"] += 1
+                self.cache_entries.move_to_end(cache_id)
 
                 # Check access permissions
                 if not self._check_agent_access(event.source_id, cache_entry.allowed_agent_groups):
@@ -347,6 +596,14 @@ class SharedCacheMod(BaseMod):
                         "success": False,
                         "error": "Agent does not have permission to access this cache entry",
                     }
+                elif payload.get("if_version") == cache_entry.version:
+                    response_data = {
+                        "success": True,
+                        "cache_id": cache_id,
+                        "version": cache_entry.version,
+                        "expires_at": cache_entry.expires_at,
+                        "not_modified": True,
+                    }
                 else:
                     logger.debug(f"Retrieved cache entry {cache_id} for {event.source_id}")
                     response_data = cache_entry.to_dict()
@@ -383,15 +640,19 @@ class SharedCacheMod(BaseMod):
             cache_id = payload.get("cache_id")
             value = payload.get("value")
 
+            cache_entry = self._get_live_entry(cache_id) if cache_id else None
             if not cache_id:
                 response_data = {"success": False, "error": "cache_id is required"}
             elif value is None:
                 response_data = {"success": False, "error": "value is required"}
-            elif cache_id not in self.cache_entries:
+            elif cache_entry is None:
                 response_data = {"success": False, "error": "Cache entry not found"}
+            elif self._exceeds_budget(len(str(value).encode("utf-8"))):
+                response_data = {
+                    "success": False,
+                    "error": "Cache entry exceeds the cache size budget",
+                }
             else:
-                cache_entry = self.cache_entries[cache_id]
-
                 # Check access permissions
                 if not self._check_agent_access(event.source_id, cache_entry.allowed_agent_groups):
                     logger.warning(
@@ -406,10 +667,18 @@ class SharedCacheMod(BaseMod):
                     if not isinstance(value, str):
                         value = str(value)
 
-                    cache_entry.value = value
-                    cache_entry.updated_at = int(time.time())
+                    current_time = int(time.time())
+                    if "ttl" in payload:
+                        cache_entry.expires_at = self._expiry_for(payload, current_time)
 
-                    self._save_cache_entries()
+                    # Replace the entry so the size and expiry indexes follow the change
+                    self.cache_entries.pop(cache_id)
+                    self.total_bytes -= cache_entry.size
+                    cache_entry.value = value
+                    cache_entry.updated_at = current_time
+                    cache_entry.version += 1
+                    self._store_entry(cache_entry)
+                    evicted = self._evict_entries(cache_id)
 
                     logger.info(f"Updated cache entry {cache_id} by {event.source_id}")
 
@@ -417,6 +686,7 @@ class SharedCacheMod(BaseMod):
                     await self._send_notification(
                         "shared_cache.notification.updated", cache_entry, exclude_agent=event.source_id
                     )
+                    await self._notify_evicted(evicted)
 
                     response_data = {"success": True, "cache_id": cache_id}
 
@@ -449,13 +719,13 @@ class SharedCacheMod(BaseMod):
 
             # Validate required fields
             cache_id = payload.get("cache_id")
+            cache_entry = self._get_live_entry(cache_id) if cache_id else None
 
             if not cache_id:
                 response_data = {"success": False, "error": "cache_id is required"}
-            elif cache_id not in self.cache_entries:
+            elif cache_entry is None:
                 response_data = {"success": False, "error": "Cache entry not found"}
             else:
-                cache_entry = self.cache_entries[cache_id]
 
                 # Check access permissions
                 if not self._check_agent_access(event.source_id, cache_entry.allowed_agent_groups):
@@ -468,8 +738,7 @@ class SharedCacheMod(BaseMod):
                     }
                 else:
                     # Delete cache entry
-                    del self.cache_entries[cache_id]
-                    self._save_cache_entries()
+                    self._remove_entry(cache_id)
 
                     logger.info(f"Deleted cache entry {cache_id} by {event.source_id}")
 
@@ -498,22 +767,37 @@ class SharedCacheMod(BaseMod):
     async def _handle_file_upload(self, event: Event) -> Optional[EventResponse]:
         """Handle file upload request.
 
+        The file content is either carried base64-encoded in file_data, or was
+        streamed to disk by a transport and is referenced by blob_id (see
+        create_blob_path).
+
         Args:
-            event: The file upload event containing base64-encoded file data
+            event: The file upload event containing the file data or blob reference
 
         Returns:
             EventResponse: Response with cache_id if successful
         """
+        blob_path = None
         try:
             payload = event.payload or {}
 
             # Validate required fields
             file_data = payload.get("file_data")  # Base64-encoded file content
+            blob_id = payload.get("blob_id")  # Blob streamed to the incoming directory
             filename = payload.get("filename")
             mime_type = payload.get("mime_type", "application/octet-stream")
             allowed_agent_groups = payload.get("allowed_agent_groups", [])
 
-            if not file_data:
+            if blob_id:
+                blob_path = self.incoming_path / os.path.basename(blob_id)
+                if not blob_path.is_file():
+                    blob_path = None
+                    return EventResponse(
+                        success=False,
+                        message="Blob not found",
+                        data={"success": False, "error": "Blob not found"},
+                    )
+            elif not file_data:
                 return EventResponse(
                     success=False,
                     message="file_data is required",
@@ -527,19 +811,30 @@ class SharedCacheMod(BaseMod):
                     data={"success": False, "error": "filename is required"},
                 )
 
-            # Decode base64 data with strict validation
-            try:
-                file_bytes = base64.b64decode(file_data, validate=True)
-            except Exception as decode_error:
-                logger.error(f"Failed to decode base64 file data: {decode_error}")
+            file_bytes = None
+            if blob_path is not None:
+                file_size = blob_path.stat().st_size
+            else:
+                # Decode base64 data with strict validation
+                try:
+                    file_bytes = base64.b64decode(file_data, validate=True)
+                except Exception as decode_error:
+                    logger.error(f"Failed to decode base64 file data: {decode_error}")
+                    return EventResponse(
+                        success=False,
+                        message="Invalid base64 file data",
+                        data={"success": False, "error": "Invalid base64 file data"},
+                    )
+                file_size = len(file_bytes)
+
+            if self._exceeds_budget(file_size):
                 return EventResponse(
                     success=False,
-                    message="Invalid base64 file data",
-                    data={"success": False, "error": "Invalid base64 file data"},
+                    message="File exceeds the cache size budget",
+                    data={"success": False, "error": "File exceeds the cache size budget"},
                 )
 
             # Check file size
-            file_size = len(file_bytes)
             if file_size > MAX_FILE_SIZE:
                 return EventResponse(
                     success=False,
@@ -547,18 +842,24 @@ class SharedCacheMod(BaseMod):
                     data={"success": False, "error": f"File size exceeds maximum allowed ({MAX_FILE_SIZE} bytes)"},
                 )
 
+            current_time = int(time.time())
+            expires_at = self._expiry_for(payload, current_time)
+
             # Generate cache ID and file path
             cache_id = str(uuid.uuid4())
             # Sanitize filename to prevent path traversal
             safe_filename = os.path.basename(filename)
             file_path = self.files_path / f"{cache_id}_{safe_filename}"
 
-            # Write file to storage
-            with open(file_path, "wb") as f:
-                f.write(file_bytes)
+            # Write file to storage, moving streamed blobs into place
+            if blob_path is not None:
+                os.replace(blob_path, file_path)
+                blob_path = None
+            else:
+                with open(file_path, "wb") as f:
+                    f.write(file_bytes)
 
             # Create cache entry
-            current_time = int(time.time())
             cache_entry = CacheEntry(
                 cache_id=cache_id,
                 value=str(file_path.relative_to(self.storage_path)),  # Store relative path
@@ -570,10 +871,11 @@ class SharedCacheMod(BaseMod):
                 is_file=True,
                 filename=safe_filename,
                 file_size=file_size,
+                expires_at=expires_at,
             )
 
-            self.cache_entries[cache_id] = cache_entry
-            self._save_cache_entries()
+            self._store_entry(cache_entry)
+            evicted = self._evict_entries(cache_id)
 
             logger.info(
                 f"Uploaded file {safe_filename} ({file_size} bytes) as cache {cache_id} "
@@ -584,6 +886,7 @@ class SharedCacheMod(BaseMod):
             await self._send_notification(
                 "shared_cache.notification.created", cache_entry, exclude_agent=event.source_id
             )
+            await self._notify_evicted(evicted)
 
             return EventResponse(
                 success=True,
@@ -604,11 +907,19 @@ class SharedCacheMod(BaseMod):
                 message=f"Error uploading file: {str(e)}",
                 data={"success": False, "error": str(e)},
             )
+        finally:
+            # Rejected blobs are not kept around
+            if blob_path is not None:
+                blob_path.unlink(missing_ok=True)
 
     @mod_event_handler("shared_cache.file.download")
     async def _handle_file_download(self, event: Event) -> Optional[EventResponse]:
         """Handle file download request.
 
+        The base64-encoded file data is left out when the payload sets
+        include_data to False, so a transport can check access through this
+        handler and then stream the file from get_file_path.
+
         Args:
             event: The file download event
 
@@ -628,14 +939,17 @@ class SharedCacheMod(BaseMod):
                     data={"success": False, "error": "cache_id is required"},
                 )
 
-            if cache_id not in self.cache_entries:
+            cache_entry = self._get_live_entry(cache_id)
+            if cache_entry is None:
+                self.stats["misses"] += 1
                 return EventResponse(
                     success=False,
                     message="Cache entry not found",
                     data={"success": False, "error": "Cache entry not found"},
                 )
 
-            cache_entry = self.cache_entries[cache_id]
+            self.stats["hits"] += 1
+            self.cache_entries.move_to_end(cache_id)
 
             # Check if it's a file entry
             if not cache_entry.is_file:
@@ -666,25 +980,25 @@ class SharedCacheMod(BaseMod):
                     data={"success": False, "error": "File not found on disk"},
                 )
 
-            with open(file_path, "rb") as f:
-                file_bytes = f.read()
+            response_data = {
+                "success": True,
+                "cache_id": cache_id,
+                "filename": cache_entry.filename,
+                "file_size": cache_entry.file_size,
+                "mime_type": cache_entry.mime_type,
+            }
 
-            # Encode to base64
-            file_data = base64.b64encode(file_bytes).decode("utf-8")
+            if payload.get("include_data", True):
+                with open(file_path, "rb") as f:
+                    # Encode to base64
+                    response_data["file_data"] = base64.b64encode(f.read()).decode("utf-8")
 
             logger.debug(f"Downloaded file {cache_id} for {event.source_id}")
 
             return EventResponse(
                 success=True,
                 message="File downloaded successfully",
-                data={
-                    "success": True,
-                    "cache_id": cache_id,
-                    "filename": cache_entry.filename,
-                    "file_size": cache_entry.file_size,
-                    "mime_type": cache_entry.mime_type,
-                    "file_data": file_data,
-                },
+                data=response_data,
             )
 
         except Exception as e:
@@ -695,6 +1009,17 @@ class SharedCacheMod(BaseMod):
                 data={"success": False, "error": str(e)},
             )
 
+    def create_blob_path(self) -> Path:
+        """Get a new path in the incoming directory for a transport to stream a file to.
+
+        The file is then uploaded by sending a shared_cache.file.upload event with
+        the name of the path as blob_id, which moves it into the files storage.
+
+        Returns:
+            Path: Path of the new blob
+        """
+        return self.incoming_path / uuid.uuid4().hex
+
     def get_file_path(self, cache_id: str) -> Optional[Path]:
         """Get the file path for a cache entry (for HTTP direct download).
 
@@ -704,11 +1029,8 @@ class SharedCacheMod(BaseMod):
         Returns:
             Optional[Path]: File path if exists and is a file entry, None otherwise
         """
-        if cache_id not in self.cache_entries:
-            return None
-
-        cache_entry = self.cache_entries[cache_id]
-        if not cache_entry.is_file:
+        cache_entry = self._get_live_entry(cache_id)
+        if cache_entry is None or not cache_entry.is_file:
             return None
 
         file_path = self.storage_path / cache_entry.value
@@ -726,7 +1048,7 @@ class SharedCacheMod(BaseMod):
         Returns:
             Optional[CacheEntry]: Cache entry if found, None otherwise
         """
-        return self.cache_entries.get(cache_id)
+        return self._get_live_entry(cache_id)
 
     def get_state(self) -> Dict[str, Any]:
         """Get the current state of the shared cache mod.
@@ -736,5 +1058,9 @@ class SharedCacheMod(BaseMod):
         """
         return {
             "cache_count": len(self.cache_entries),
+            "total_bytes": self.total_bytes,
+            "max_entries": self.config.get("max_entries"),
+            "max_bytes": self.config.get("max_bytes"),
+            **self.stats,
             "storage_path": str(self.storage_path) if self.storage_path else None,
         }
@@ -12,7 +12,7 @@ This standalone mod enables document management with:
 import logging
 import uuid
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 
 from openagents.config.globals import BROADCAST_AGENT_ID
@@ -1015,7 +1015,7 @@ class DocumentsNetworkMod(BaseMod):
         """Send document-related notifications to agents with permission.
 
         Documents with access_permissions:
-        - Send individual notifications to agents with access
+        - Multicast one notification to the creator and agents with access
         Documents without access_permissions (public):
         - Broadcast to all agents
 
@@ -1056,39 +1056,31 @@ class DocumentsNetworkMod(BaseMod):
             await self.send_event(notification)
             logger.info(f"Document notification (public): {event_name} for document {document.document_id}")
         else:
-            # Document has access restrictions - only notify agents with permissions
-            notified_agents = set()
+            # Document has access restrictions - only notify the creator and agents
+            # with explicit permissions
+            notified_agents = {document.creator_agent_id}
+            notified_agents.update(document.access_permissions.keys())
+            notified_agents.discard(source_id)
 
-            # Notify creator
-            if document.creator_agent_id != source_id:
+            if notified_agents:
                 notification = Event(
                     event_name=event_name,
-                    destination_id=document.creator_agent_id,
+                    destination_id=self._multicast_destination(notified_agents),
                     source_id=source_id,
                     payload=base_payload,
                 )
-                await self.send_event(notification)
-                notified_agents.add(document.creator_agent_id)
-
-            # Notify agents with explicit permissions
-            for agent_id in document.access_permissions.keys():
-                if agent_id == source_id:
-                    continue
-
-                notification = Event(
-                    event_name=event_name,
-                    destination_id=agent_id,
-                    source_id=source_id,
-                    payload=base_payload,
-                )
-                await self.send_event(notification)
-                notified_agents.add(agent_id)
+                await self.send_event(notification, recipient_ids=notified_agents)
 
             logger.info(
                 f"Document notification (restricted): {event_name} for document {document.document_id} "
                 f"sent to {len(notified_agents)} agents"
             )
 
+    @staticmethod
+    def _multicast_destination(recipients: Set[str]) -> Optional[str]:
+        """Get the destination of a notification multicast to the given agents."""
+        return next(iter(recipients)) if len(recipients) == 1 else None
+
     async def _broadcast_to_document_users(
         self,
         document_id: str,
@@ -1111,17 +1103,18 @@ class DocumentsNetworkMod(BaseMod):
         document = self.documents[document_id]
 
         # Broadcast to all active users except the excluded agent
-        for agent_id in document.active_users:
-            if exclude_agent_id and agent_id == exclude_agent_id:
-                continue
+        recipients = set(document.active_users)
+        if exclude_agent_id:
+            recipients.discard(exclude_agent_id)
 
+        if recipients:
             notification = Event(
                 event_name=event_name,
-                destination_id=agent_id,
+                destination_id=self._multicast_destination(recipients),
                 source_id="mod:openagents.mods.workspace.documents",
                 payload=payload,
             )
-            await self.send_event(notification)
+            await self.send_event(notification, recipient_ids=recipients)
 
         logger.info(
             f"Broadcasted {event_name} to {len(document.active_users)} active users "
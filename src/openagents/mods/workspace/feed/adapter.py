@@ -40,6 +40,7 @@ class FeedAgentAdapter(BaseModAdapter):
         self.feed_handlers: Dict[str, FeedHandler] = {}
         self.pending_requests: Dict[str, Dict[str, Any]] = {}
         self.last_poll_timestamp: float = 0.0
+        self.last_poll_post_id: Optional[str] = None
 
     def initialize(self) -> bool:
         """Initialize the adapter.
@@ -171,6 +172,7 @@ class FeedAgentAdapter(BaseModAdapter):
         tags: Optional[List[str]] = None,
         author_id: Optional[str] = None,
         since_date: Optional[float] = None,
+        after_post_id: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """List posts with filters and pagination.
 
@@ -181,6 +183,7 @@ class FeedAgentAdapter(BaseModAdapter):
             tags: Filter by tags (all must match)
             author_id: Filter by author ID
             since_date: Filter posts created after this timestamp
+            after_post_id: Cursor; list posts after this one (next_cursor of a previous page)
 
         Returns:
             Optional[Dict[str, Any]]: Posts data if successful, None if failed
@@ -193,6 +196,7 @@ class FeedAgentAdapter(BaseModAdapter):
             tags=tags,
             author_id=author_id,
             since_date=since_date,
+            after_post_id=after_post_id,
         )
 
     async def search_posts(
@@ -232,7 +236,7 @@ class FeedAgentAdapter(BaseModAdapter):
     ) -> Optional[Dict[str, Any]]:
         """Get posts created since a specific timestamp (for polling).
 
-        If since_timestamp is not provided, uses the last poll timestamp.
+        If since_timestamp is not provided, continues after the last polled post.
 
         Args:
             since_timestamp: Unix timestamp to get posts after
@@ -242,19 +246,23 @@ class FeedAgentAdapter(BaseModAdapter):
         Returns:
             Optional[Dict[str, Any]]: Recent posts data if successful, None if failed
         """
+        after_post_id = None
         if since_timestamp is None:
             since_timestamp = self.last_poll_timestamp
+            after_post_id = self.last_poll_post_id
 
         result = await self._query_feed(
             "recent_posts",
             since_timestamp=since_timestamp,
             limit=limit,
             tags=tags,
+            after_post_id=after_post_id,
         )
 
-        # Update last poll timestamp if successful
+        # Update last poll position if successful
         if result and "latest_timestamp" in result:
             self.last_poll_timestamp = result["latest_timestamp"]
+            self.last_poll_post_id = result.get("latest_post_id")
 
         return result
 
@@ -462,6 +470,10 @@ class FeedAgentAdapter(BaseModAdapter):
                         "type": "number",
                         "description": "Filter posts created after this Unix timestamp",
                     },
+                    "after_post_id": {
+                        "type": "string",
+                        "description": "Cursor: list posts after this post (next_cursor of the previous page)",
+                    },
                 },
                 "required": [],
             },
@@ -7,13 +7,20 @@ This standalone mod enables information publishing functionality with:
 - Full-text search and filtering
 - Tag-based organization
 - Quick retrieval of recent posts
+
+Author, tag and creation time indexes of all posts are kept in memory, built from
+an append-only post summaries file, so listing a page only loads the posts on that
+page. Loaded posts are kept in an LRU cache. Post titles, content and tags are kept in a persisted full-text search index.
 """
 
 import logging
 import json
+import os
 import time
 import uuid
-from typing import Dict, Any, List, Optional, Set
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, defaultdict
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
 
@@ -21,9 +28,18 @@ from openagents.config.globals import BROADCAST_AGENT_ID
 from openagents.core.base_mod import BaseMod, mod_event_handler
 from openagents.models.event import Event
 from openagents.models.event_response import EventResponse
+from openagents.utils.search_index import SearchIndex
 
 logger = logging.getLogger(__name__)
 
+# Indexed post fields and their search weights
+POST_SEARCH_FIELDS = {"title": 2.0, "tags": 1.5, "content": 1.0}
+
+POST_SUMMARIES_FILE = "post_summaries.jsonl"
+
+# Maximum number of loaded posts kept in memory
+POST_CACHE_SIZE = 1024
+
 @dataclass
 class Attachment:
     """Represents a file attachment for a feed post."""
@@ -95,6 +111,48 @@ class FeedPost:
         )
 
 
+@dataclass
+class PostSummary:
+    """Listing metadata of a post, kept in memory for every post."""
+
+    post_id: str
+    author_id: str
+    created_at: float
+    tags: List[str] = field(default_factory=list)  # Lowercased
+    allowed_groups: List[str] = field(default_factory=list)
+
+    @property
+    def sort_key(self) -> Tuple[float, str]:
+        """Get the key ordering posts by creation time."""
+        return (self.created_at, self.post_id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert summary to dictionary representation."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PostSummary":
+        """Create summary from dictionary."""
+        return cls(
+            post_id=data["post_id"],
+            author_id=data["author_id"],
+            created_at=data["created_at"],
+            tags=data.get("tags", []),
+            allowed_groups=data.get("allowed_groups", []),
+        )
+
+    @classmethod
+    def from_post(cls, post: FeedPost) -> "PostSummary":
+        """Create summary of a post."""
+        return cls(
+            post_id=post.post_id,
+            author_id=post.author_id,
+            created_at=post.created_at,
+            tags=[tag.lower() for tag in post.tags],
+            allowed_groups=list(post.allowed_groups),
+        )
+
+
 class FeedNetworkMod(BaseMod):
     """Network-level feed mod implementation.
 
@@ -116,6 +174,9 @@ class FeedNetworkMod(BaseMod):
         # Track active agents
         self.active_agents: Set[str] = set()
 
+        # Post indexes, post cache and search index, loaded from storage on first use
+        self._reset_post_index()
+
         logger.info(f"Initialized Feed Network Mod: {self.mod_name}")
 
     def _get_agent_groups(self, agent_id: str) -> List[str]:
@@ -136,12 +197,14 @@ class FeedNetworkMod(BaseMod):
             return [agent_group]
         return []
 
-    def _can_agent_view_post(self, agent_id: str, post: FeedPost) -> bool:
+    def _can_agent_view_post(
+        self, agent_id: str, post: Union[FeedPost, PostSummary]
+    ) -> bool:
         """Check if an agent can view a post based on allowed_groups.
 
         Args:
             agent_id: ID of the agent
-            post: The post to check
+            post: The post, or its summary, to check
 
         Returns:
             bool: True if agent can view the post, False otherwise
@@ -164,9 +227,7 @@ class FeedNetworkMod(BaseMod):
     def posts(self) -> Dict[str, FeedPost]:
         """Get all posts (loaded from storage)."""
         posts = {}
-        metadata = self._get_posts_metadata()
-        # Load all posts from storage
-        for post_id in metadata["posts"].keys():
+        for post_id in self.post_summaries:
             post = self._load_post(post_id)
             if post:
                 posts[post_id] = post
@@ -174,12 +235,198 @@ class FeedNetworkMod(BaseMod):
 
     @property
     def post_order_recent(self) -> List[str]:
-        """Get recent post order (loaded from storage)."""
-        metadata = self._get_posts_metadata()
-        return metadata.get("post_order_recent", [])
+        """Get post IDs, newest first."""
+        self._ensure_post_index()
+        return [post_id for _, post_id in reversed(self._time_index)]
+
+    @property
+    def post_summaries(self) -> Dict[str, PostSummary]:
+        """Get the listing metadata of all posts, keyed by post ID."""
+        self._ensure_post_index()
+        return self._summaries
+
+    def _reset_post_index(self):
+        """Drop the in-memory post indexes so they are reloaded from storage on next use."""
+        self._summaries: Optional[Dict[str, PostSummary]] = None
+        # Sorted (created_at, post_id) keys, overall and per author and tag
+        self._time_index: List[Tuple[float, str]] = []
+        self._author_index: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+        self._tag_index: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+        self._post_cache: "OrderedDict[str, FeedPost]" = OrderedDict()
+        self._search_index: Optional[SearchIndex] = None
+
+    def _ensure_post_index(self):
+        """Load the post indexes if they have not been loaded yet."""
+        if self._summaries is None:
+            self._load_post_index()
+
+    def _load_post_index(self):
+        """Load post summaries and build the author, tag and time indexes.
+
+        Summaries are read from an append-only file; only posts missing from it,
+        such as posts written before it existed, are read from storage.
+        """
+        summaries: Dict[str, PostSummary] = {}
+        post_ids: Set[str] = set()
+        try:
+            storage_path = self.get_storage_path()
+            summaries_file = storage_path / POST_SUMMARIES_FILE
+            if summaries_file.exists():
+                with open(summaries_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            summary = PostSummary.from_dict(json.loads(line))
+                        except (ValueError, KeyError, TypeError):
+                            # Torn record from an interrupted write
+                            continue
+                        summaries[summary.post_id] = summary
+
+            posts_dir = storage_path / "posts"
+            if posts_dir.exists():
+                post_ids = {post_file.stem for post_file in posts_dir.glob("*.json")}
+        except Exception as e:
+            logger.error(f"Failed to load post summaries: {e}")
+
+        self._summaries = {}
+        self._time_index = []
+        self._author_index = defaultdict(list)
+        self._tag_index = defaultdict(list)
+
+        stale_ids = set(summaries) - post_ids
+        ordered = sorted(
+            (s for s in summaries.values() if s.post_id not in stale_ids),
+            key=lambda s: s.sort_key,
+        )
+        for summary in ordered:
+            self._index_summary(summary)
+
+        missing_ids = post_ids - set(summaries)
+        for post_id in missing_ids:
+            post = self._load_post(post_id)
+            if post:
+                self._index_summary(PostSummary.from_post(post))
+
+        if stale_ids or missing_ids:
+            self._write_post_summaries()
+        logger.info(f"Loaded {len(self._summaries)} feed post summaries")
+
+    def _index_summary(self, summary: PostSummary):
+        """Add a post summary to the author, tag and time indexes."""
+        previous = self._summaries.get(summary.post_id)
+        if previous is not None:
+            self._unindex_summary(previous)
+
+        key = summary.sort_key
+        self._summaries[summary.post_id] = summary
+        insort(self._time_index, key)
+        insort(self._author_index[summary.author_id], key)
+        for tag in set(summary.tags):
+            insort(self._tag_index[tag], key)
+
+    def _unindex_summary(self, summary: PostSummary):
+        """Remove a post summary from the author, tag and time indexes."""
+        key = summary.sort_key
+        del self._summaries[summary.post_id]
+        for keys in (
+            self._time_index,
+            self._author_index[summary.author_id],
+            *(self._tag_index[tag] for tag in set(summary.tags)),
+        ):
+            position = bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                del keys[position]
+
+    def _iter_post_summaries(
+        self,
+        newest_first: bool = True,
+        author_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        since: Optional[float] = None,
+        after_post_id: Optional[str] = None,
+    ) -> Iterator[PostSummary]:
+        """Iterate over post summaries in creation order using the indexes.
+
+        Args:
+            newest_first: Iterate from the newest post instead of the oldest
+            author_id: Only posts by this author
+            tags: Only posts having all of these tags
+            since: Only posts created at or after this Unix timestamp
+            after_post_id: Cursor; only posts following this post in iteration order
+
+        Yields:
+            PostSummary: Matching post summaries; permissions are not checked
+        """
+        self._ensure_post_index()
+        tag_set = {tag.lower() for tag in tags or []}
+
+        # Walk the most selective index
+        keys = self._time_index
+        if author_id:
+            keys = self._author_index.get(author_id, [])
+        for tag in tag_set:
+            tag_keys = self._tag_index.get(tag, [])
+            if len(tag_keys) < len(keys):
+                keys = tag_keys
+
+        low, high = 0, len(keys)
+        if since is not None:
+            low = bisect_left(keys, (since, ""))
+        cursor = self._summaries.get(after_post_id) if after_post_id else None
+        if cursor is not None:
+            if newest_first:
+                high = bisect_left(keys, cursor.sort_key)
+            else:
+                low = max(low, bisect_right(keys, cursor.sort_key))
+
+        positions = range(high - 1, low - 1, -1) if newest_first else range(low, high)
+        for position in positions:
+            summary = self._summaries[keys[position][1]]
+            if author_id and summary.author_id != author_id:
+                continue
+            if tag_set and not tag_set.issubset(summary.tags):
+                continue
+            yield summary
+
+    def _write_post_summaries(self):
+        """Rewrite the post summaries file from memory."""
+        try:
+            storage_path = self.get_storage_path()
+            storage_path.mkdir(parents=True, exist_ok=True)
+            summaries_file = storage_path / POST_SUMMARIES_FILE
+            temp_file = summaries_file.with_name(summaries_file.name + ".tmp")
+
+            with open(temp_file, "w", encoding="utf-8") as f:
+                for _, post_id in self._time_index:
+                    f.write(json.dumps(self._summaries[post_id].to_dict()) + "\n")
+            os.replace(temp_file, summaries_file)
+
+        except Exception as e:
+            logger.error(f"Failed to save post summaries: {e}")
+
+    def _append_post_summary(self, summary: PostSummary):
+        """Append a post summary to the post summaries file."""
+        try:
+            storage_path = self.get_storage_path()
+            with open(storage_path / POST_SUMMARIES_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps(summary.to_dict()) + "\n")
+
+        except Exception as e:
+            logger.error(f"Failed to save summary of post {summary.post_id}: {e}")
+
+    def _cache_post(self, post: FeedPost):
+        """Keep a loaded post in the LRU post cache."""
+        self._post_cache[post.post_id] = post
+        self._post_cache.move_to_end(post.post_id)
+        while len(self._post_cache) > POST_CACHE_SIZE:
+            self._post_cache.popitem(last=False)
 
     def _load_post(self, post_id: str) -> Optional[FeedPost]:
-        """Load a specific post from storage."""
+        """Load a specific post from the post cache or storage."""
+        post = self._post_cache.get(post_id)
+        if post is not None:
+            self._post_cache.move_to_end(post_id)
+            return post
+
         try:
             storage_path = self.get_storage_path()
             posts_dir = storage_path / "posts"
@@ -191,59 +438,45 @@ class FeedNetworkMod(BaseMod):
             with open(post_file, "r", encoding="utf-8") as f:
                 post_dict = json.load(f)
 
-            return FeedPost.from_dict(post_dict)
+            post = FeedPost.from_dict(post_dict)
+            self._cache_post(post)
+            return post
 
         except Exception as e:
             logger.error(f"Failed to load post {post_id}: {e}")
             return None
 
-    def _get_posts_metadata(self) -> Dict[str, Any]:
-        """Get post metadata (for listing) without loading full posts."""
-        try:
+    @property
+    def search_index(self) -> SearchIndex:
+        """Get the post search index, loading it from storage on first use."""
+        if self._search_index is None:
             storage_path = self.get_storage_path()
-
-            # Load basic post info from individual files
-            posts_data = {}
-            posts_dir = storage_path / "posts"
-            if posts_dir.exists():
-                for post_file in posts_dir.glob("*.json"):
-                    try:
-                        post_id = post_file.stem  # filename without extension
-                        with open(post_file, "r", encoding="utf-8") as f:
-                            post_dict = json.load(f)
-                        # Extract only metadata, not full content
-                        posts_data[post_id] = {
-                            "post_id": post_dict["post_id"],
-                            "title": post_dict["title"],
-                            "author_id": post_dict["author_id"],
-                            "created_at": post_dict["created_at"],
-                            "tags": post_dict.get("tags", []),
-                            "allowed_groups": post_dict.get("allowed_groups", []),
-                        }
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to load metadata for post file {post_file}: {e}"
-                        )
-                        continue
-
-            # Load ordering metadata
-            metadata = {}
-            metadata_file = storage_path / "metadata.json"
-            if metadata_file.exists():
-                with open(metadata_file, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
-
-            return {
-                "posts": posts_data,
-                "post_order_recent": metadata.get("post_order_recent", []),
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to load posts metadata: {e}")
-            return {"posts": {}, "post_order_recent": []}
+            search_index = SearchIndex(POST_SEARCH_FIELDS, storage_dir=storage_path)
+            search_index.load()
+
+            # Index posts written while the index was not being maintained
+            missing = search_index.reconcile(self.post_summaries)
+            self._search_index = search_index
+            for post_id in missing:
+                post = self._load_post(post_id)
+                if post:
+                    self._index_post(post)
+            if missing:
+                search_index.save()
+        return self._search_index
+
+    def _index_post(self, post: FeedPost):
+        """Add a post to the search index."""
+        self.search_index.add(
+            post.post_id,
+            {"title": post.title, "content": post.content, "tags": post.tags},
+            allowed_groups=post.allowed_groups,
+            owner_id=post.author_id,
+            timestamp=post.created_at,
+        )
 
     def _save_post(self, post: FeedPost):
-        """Save a single post to its own file."""
+        """Save a single post to its own file and add it to the post and search indexes."""
         try:
             storage_path = self.get_storage_path()
             posts_dir = storage_path / "posts"
@@ -255,27 +488,16 @@ class FeedNetworkMod(BaseMod):
             with open(post_file, "w", encoding="utf-8") as f:
                 json.dump(post.to_dict(), f, indent=2, default=str)
 
+            # Loading the indexes for the first time picks up the new file
+            summary = PostSummary.from_post(post)
+            if self.post_summaries.get(post.post_id) != summary:
+                self._index_summary(summary)
+                self._append_post_summary(summary)
+            self._cache_post(post)
+            self._index_post(post)
         except Exception as e:
             logger.error(f"Failed to save post {post.post_id}: {e}")
 
-    def _save_metadata(self, post_order_recent: List[str]):
-        """Save post ordering metadata."""
-        try:
-            storage_path = self.get_storage_path()
-            storage_path.mkdir(parents=True, exist_ok=True)
-            metadata_file = storage_path / "metadata.json"
-
-            metadata = {
-                "post_order_recent": post_order_recent,
-                "last_saved": time.time(),
-            }
-
-            with open(metadata_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, default=str)
-
-        except Exception as e:
-            logger.error(f"Failed to save metadata: {e}")
-
     def _save_attachment(self, post_id: str, file_id: str, content: bytes):
         """Save an attachment file."""
         try:
@@ -307,8 +529,15 @@ class FeedNetworkMod(BaseMod):
             logger.error(f"Failed to load attachment {file_id}: {e}")
             return None
 
+    def bind_network(self, network) -> bool:
+        """Register this mod with a network, reloading the post indexes from its workspace."""
+        result = super().bind_network(network)
+        # Storage may have moved to the network's workspace
+        self._reset_post_index()
+        return result
+
     def initialize(self) -> bool:
-        """Initialize the mod without loading all data into memory.
+        """Initialize the mod, loading the post indexes but not the posts.
 
         Returns:
             bool: True if initialization was successful, False otherwise
@@ -319,7 +548,11 @@ class FeedNetworkMod(BaseMod):
             (storage_path / "posts").mkdir(parents=True, exist_ok=True)
             (storage_path / "attachments").mkdir(parents=True, exist_ok=True)
 
-            logger.info("Feed mod initialization complete (storage-first mode)")
+            # Only post summaries are loaded; posts are read when requested
+            self._reset_post_index()
+            self._load_post_index()
+
+            logger.info("Feed mod initialization complete")
             return True
         except Exception as e:
             logger.error(f"Feed mod initialization failed: {e}")
@@ -334,6 +567,7 @@ class FeedNetworkMod(BaseMod):
         try:
             # Clear state (data is already in storage)
             self.active_agents.clear()
+            self._reset_post_index()
 
             logger.info("Feed mod shutdown complete")
             return True
@@ -427,21 +661,9 @@ class FeedNetworkMod(BaseMod):
             attachments=attachments,
         )
 
-        # Save the new post to storage
+        # Save the new post to storage; this also indexes it
         self._save_post(post)
 
-        # Update post ordering metadata
-        metadata = self._get_posts_metadata()
-        post_order_recent = metadata["post_order_recent"]
-
-        # Add to front for recency
-        if post_id in post_order_recent:
-            post_order_recent.remove(post_id)
-        post_order_recent.insert(0, post_id)
-
-        # Save metadata
-        self._save_metadata(post_order_recent)
-
         logger.info(f"Created post {post_id}: '{title}' by {author_id}")
 
         # Send notification event
@@ -479,49 +701,41 @@ class FeedNetworkMod(BaseMod):
         sort_by = payload.get("sort_by", "recent")
         author_id = payload.get("author_id")
         tags = payload.get("tags", [])
-        since_date = payload.get("since_date")  # Unix timestamp
+        since_date = payload.get("since", payload.get("since_date"))  # Unix timestamp
+        after_post_id = payload.get("after_post_id")  # Cursor from a previous page
         requester_id = event.source_id
 
-        # Get ordered post list
-        ordered_posts = self.post_order_recent
-
-        # Filter posts by permission and criteria
-        viewable_posts = []
-        for post_id in ordered_posts:
-            post = self._load_post(post_id)
-            if not post:
-                continue
-
-            # Check view permission
-            if not self._can_agent_view_post(requester_id, post):
-                continue
-
-            # Filter by author
-            if author_id and post.author_id != author_id:
-                continue
-
-            # Filter by tags (all specified tags must match)
-            if tags:
-                if not all(tag.lower() in [t.lower() for t in post.tags] for tag in tags):
-                    continue
+        # An unknown cursor would silently restart the listing from the first page
+        self._ensure_post_index()
+        if after_post_id and after_post_id not in self._summaries:
+            return EventResponse(
+                success=False, message=f"Unknown after_post_id cursor: {after_post_id}"
+            )
 
-            # Filter by date
-            if since_date and post.created_at < since_date:
+        # Filter by author, tags and date through the in-memory indexes; only
+        # the posts on the requested page are loaded
+        page = []
+        total_count = 0
+        for summary in self._iter_post_summaries(
+            newest_first=sort_by != "oldest",
+            author_id=author_id,
+            tags=tags,
+            since=since_date or None,
+            after_post_id=after_post_id,
+        ):
+            if not self._can_agent_view_post(requester_id, summary):
                 continue
+            if offset <= total_count < offset + limit:
+                page.append(summary.post_id)
+            total_count += 1
 
-            viewable_posts.append(post)
-
-        # Sort posts
-        if sort_by == "oldest":
-            viewable_posts.sort(key=lambda p: p.created_at)
-        else:  # recent (default)
-            viewable_posts.sort(key=lambda p: p.created_at, reverse=True)
-
-        # Apply pagination
-        total_count = len(viewable_posts)
-        paginated_posts = viewable_posts[offset : offset + limit]
+        posts_data = []
+        for post_id in page:
+            post = self._load_post(post_id)
+            if post:
+                posts_data.append(post.to_dict())
 
-        posts_data = [post.to_dict() for post in paginated_posts]
+        has_more = offset + limit < total_count
 
         return EventResponse(
             success=True,
@@ -531,7 +745,8 @@ class FeedNetworkMod(BaseMod):
                 "total_count": total_count,
                 "offset": offset,
                 "limit": limit,
-                "has_more": offset + limit < total_count,
+                "has_more": has_more,
+                "next_cursor": page[-1] if has_more and page else None,
                 "sort_by": sort_by,
             },
         )
@@ -560,58 +775,34 @@ class FeedNetworkMod(BaseMod):
         if not query:
             return EventResponse(success=False, message="Search query cannot be empty")
 
-        # Search in titles and content with relevance scoring
-        matching_posts = []
-        for post in self.posts.values():
-            # Check view permission
-            if not self._can_agent_view_post(requester_id, post):
-                continue
-
-            # Filter by author
-            if author_id and post.author_id != author_id:
-                continue
-
-            # Filter by tags
-            if tags:
-                if not all(tag.lower() in [t.lower() for t in post.tags] for tag in tags):
-                    continue
-
-            # Calculate relevance score
-            score = 0
-            title_lower = post.title.lower()
-            content_lower = post.content.lower()
-
-            # Title match has higher weight
-            if query in title_lower:
-                score += 10
-                # Exact title match gets bonus
-                if title_lower == query:
-                    score += 5
-                # Title starts with query gets bonus
-                elif title_lower.startswith(query):
-                    score += 3
-
-            # Content match
-            if query in content_lower:
-                score += 5
-                # Count occurrences for additional scoring
-                score += min(content_lower.count(query), 5)
-
-            # Tag match
-            if any(query in tag.lower() for tag in post.tags):
-                score += 3
-
-            if score > 0:
-                matching_posts.append((post, score))
-
-        # Sort by relevance score (descending), then by recency
-        matching_posts.sort(key=lambda x: (x[1], x[0].created_at), reverse=True)
-
-        # Apply pagination
-        total_count = len(matching_posts)
-        paginated_posts = matching_posts[offset : offset + limit]
+        # Filter on the in-memory post summaries; only the posts on the page are loaded
+        summaries = self.post_summaries
+        tag_set = {tag.lower() for tag in tags or []}
+
+        def matches_filters(post_id: str) -> bool:
+            summary = summaries.get(post_id)
+            if summary is None:
+                return False
+            if author_id and summary.author_id != author_id:
+                return False
+            return tag_set.issubset(summary.tags)
+
+        # Rank viewable posts by relevance (title, then tags, then content),
+        # newer posts first on ties
+        post_ids, total_count = self.search_index.search(
+            query,
+            offset=offset,
+            limit=limit,
+            groups=self._get_agent_groups(requester_id),
+            agent_id=requester_id,
+            accept=matches_filters if author_id or tags else None,
+        )
 
-        posts_data = [post.to_dict() for post, _ in paginated_posts]
+        posts_data = []
+        for post_id in post_ids:
+            post = self._load_post(post_id)
+            if post:
+                posts_data.append(post.to_dict())
 
         return EventResponse(
             success=True,
@@ -643,6 +834,7 @@ class FeedNetworkMod(BaseMod):
         since_timestamp = payload.get("since_timestamp", 0)
         limit = int(payload.get("limit", 100))
         tags = payload.get("tags", [])
+        after_post_id = payload.get("after_post_id")  # Last post of the previous poll
         requester_id = event.source_id
 
         # Validate timestamp
@@ -651,37 +843,36 @@ class FeedNetworkMod(BaseMod):
                 success=False, message="since_timestamp must be a number"
             )
 
-        # Get posts newer than timestamp
-        recent_posts = []
-        for post in self.posts.values():
-            # Check view permission
-            if not self._can_agent_view_post(requester_id, post):
-                continue
+        # Fall back to the timestamp if the cursor post is unknown (e.g. deleted)
+        self._ensure_post_index()
+        if after_post_id and after_post_id not in self._summaries:
+            after_post_id = None
 
-            # Only include posts newer than timestamp
-            if post.created_at <= since_timestamp:
+        # Get posts newer than timestamp (or after the cursor post), oldest first
+        page = []
+        total_count = 0
+        for summary in self._iter_post_summaries(
+            newest_first=False,
+            tags=tags,
+            since=None if after_post_id else since_timestamp,
+            after_post_id=after_post_id,
+        ):
+            if not after_post_id and summary.created_at <= since_timestamp:
                 continue
+            if not self._can_agent_view_post(requester_id, summary):
+                continue
+            if total_count < limit:
+                page.append(summary)
+            total_count += 1
 
-            # Filter by tags
-            if tags:
-                if not all(tag.lower() in [t.lower() for t in post.tags] for tag in tags):
-                    continue
-
-            recent_posts.append(post)
-
-        # Sort by creation time (oldest first for chronological order)
-        recent_posts.sort(key=lambda p: p.created_at)
-
-        # Apply limit
-        total_count = len(recent_posts)
-        limited_posts = recent_posts[:limit]
-
-        posts_data = [post.to_dict() for post in limited_posts]
+        posts_data = []
+        for summary in page:
+            post = self._load_post(summary.post_id)
+            if post:
+                posts_data.append(post.to_dict())
 
-        # Determine latest timestamp for next poll
-        latest_timestamp = (
-            max(p.created_at for p in limited_posts) if limited_posts else since_timestamp
-        )
+        # Determine latest timestamp and post for next poll
+        latest_timestamp = page[-1].created_at if page else since_timestamp
 
         return EventResponse(
             success=True,
@@ -693,6 +884,7 @@ class FeedNetworkMod(BaseMod):
                 "has_more": total_count > limit,
                 "since_timestamp": since_timestamp,
                 "latest_timestamp": latest_timestamp,
+                "latest_post_id": page[-1].post_id if page else after_post_id,
             },
         )
 
@@ -7,13 +7,18 @@ This standalone mod enables Reddit-like forum functionality with:
 - Nested comment threading (up to 5 levels)
 - Voting system for topics and comments
 - Search and browsing capabilities
+
+Topics, votes and topic orderings are loaded from storage once and kept in memory;
+every change is written through to storage, so reads never touch the disk. Topic
+titles and content are kept in a persisted full-text search index.
 """
 
 import logging
 import json
 import time
 import uuid
-from typing import Dict, Any, List, Optional, Set
+from bisect import bisect_left, insort
+from typing import Dict, Any, List, Optional, Set, Tuple
 from collections import defaultdict
 from pathlib import Path
 
@@ -21,6 +26,7 @@ from openagents.config.globals import BROADCAST_AGENT_ID
 from openagents.core.base_mod import BaseMod, mod_event_handler
 from openagents.models.event import Event
 from openagents.models.event_response import EventResponse
+from openagents.utils.search_index import SearchIndex
 from .forum_messages import (
     ForumTopicMessage,
     ForumCommentMessage,
@@ -30,6 +36,9 @@ from .forum_messages import (
 
 logger = logging.getLogger(__name__)
 
+# Indexed topic fields and their search weights
+TOPIC_SEARCH_FIELDS = {"title": 2.0, "content": 1.0}
+
 
 class ForumTopic:
     """Represents a forum topic."""
@@ -167,6 +176,17 @@ class ForumNetworkMod(BaseMod):
         # Initialize forum state
         self.active_agents: Set[str] = set()
 
+        # In-memory forum store, loaded from storage on first use
+        self._topics: Optional[Dict[str, ForumTopic]] = None
+        self._user_votes: Dict[str, Dict[str, str]] = defaultdict(dict)
+        self._topic_order_recent: List[str] = []
+        # Sorted (-vote_score, sequence, topic_id) entries; sequence breaks ties by age
+        self._popular_index: List[Tuple[int, int, str]] = []
+        self._popular_keys: Dict[str, Tuple[int, int, str]] = {}
+        self._next_popular_sequence = 0
+        self._comment_topics: Dict[str, str] = {}  # comment_id -> topic_id
+        self._search_index: Optional[SearchIndex] = None
+
         logger.info(f"Initialized Forum Network Mod: {self.mod_name}")
 
     def _get_agent_groups(self, agent_id: str) -> List[str]:
@@ -209,44 +229,162 @@ class ForumNetworkMod(BaseMod):
 
     @property
     def topics(self) -> Dict[str, ForumTopic]:
-        """Get all topics (loaded from storage)."""
-        topics = {}
-        metadata = self._get_topics_metadata()
-        # Load all topics from storage
-        for topic_id in metadata["topics"].keys():
-            topic = self._load_topic(topic_id)
-            if topic:
-                topics[topic_id] = topic
-        return topics
+        """Get all topics."""
+        self._ensure_loaded()
+        return self._topics
 
     @property
     def user_votes(self) -> Dict[str, Dict[str, str]]:
-        """Get all user votes (loaded from storage)."""
+        """Get all user votes."""
+        self._ensure_loaded()
+        return self._user_votes
+
+    @property
+    def topic_order_recent(self) -> List[str]:
+        """Get recent topic order."""
+        self._ensure_loaded()
+        return self._topic_order_recent
+
+    @property
+    def topic_order_popular(self) -> List[str]:
+        """Get popular topic order (highest vote score first)."""
+        self._ensure_loaded()
+        return [entry[2] for entry in self._popular_index]
+
+    def _ensure_loaded(self):
+        """Load the forum from storage if it has not been loaded yet."""
+        if self._topics is None:
+            self._load_forum()
+
+    def _load_forum(self):
+        """Load all topics, votes and topic orderings from storage."""
+        topics = {}
+        user_votes = defaultdict(dict)
+        metadata = {}
         try:
             storage_path = self.get_storage_path()
-            votes_file = storage_path / "votes.json"
 
+            topics_dir = storage_path / "topics"
+            if topics_dir.exists():
+                for topic_file in topics_dir.glob("*.json"):
+                    topic = self._load_topic(topic_file.stem)
+                    if topic:
+                        topics[topic.topic_id] = topic
+
+            votes_file = storage_path / "votes.json"
             if votes_file.exists():
                 with open(votes_file, "r") as f:
-                    votes_data = json.load(f)
-                return defaultdict(dict, votes_data)
-            else:
-                return defaultdict(dict)
+                    user_votes.update(json.load(f))
+
+            metadata_file = storage_path / "metadata.json"
+            if metadata_file.exists():
+                with open(metadata_file, "r") as f:
+                    metadata = json.load(f)
         except Exception as e:
-            logger.error(f"Failed to load user votes: {e}")
-            return defaultdict(dict)
+            logger.error(f"Failed to load forum from storage: {e}")
+
+        self._topics = topics
+        self._user_votes = user_votes
+        self._comment_topics = {}
+        for topic in topics.values():
+            self._index_topic_comments(topic)
+
+        # Topics missing from the stored orderings are listed after the others
+        recent = [
+            tid for tid in dict.fromkeys(metadata.get("topic_order_recent", []))
+            if tid in topics
+        ]
+        listed = set(recent)
+        recent.extend(
+            sorted(
+                (tid for tid in topics if tid not in listed),
+                key=lambda tid: topics[tid].timestamp,
+                reverse=True,
+            )
+        )
+        self._topic_order_recent = recent
+        self._rebuild_popular_index(metadata.get("topic_order_popular", []))
+        self._load_search_index()
 
-    @property
-    def topic_order_recent(self) -> List[str]:
-        """Get recent topic order (loaded from storage)."""
-        metadata = self._get_topics_metadata()
-        return metadata.get("topic_order_recent", [])
+        logger.info(f"Loaded {len(topics)} forum topics from storage")
 
-    @property
-    def topic_order_popular(self) -> List[str]:
-        """Get popular topic order (loaded from storage)."""
-        metadata = self._get_topics_metadata()
-        return metadata.get("topic_order_popular", [])
+    def _load_search_index(self):
+        """Load the persisted search index and bring it in line with the loaded topics."""
+        self._search_index = SearchIndex(
+            TOPIC_SEARCH_FIELDS, storage_dir=self.get_storage_path()
+        )
+        self._search_index.load()
+        missing = self._search_index.reconcile(self._topics)
+        for topic_id in missing:
+            self._index_topic_text(self._topics[topic_id])
+        if missing:
+            self._search_index.save()
+
+    def _index_topic_text(self, topic: ForumTopic):
+        """Add or update a topic in the search index."""
+        self._search_index.add(
+            topic.topic_id,
+            {"title": topic.title, "content": topic.content},
+            allowed_groups=topic.allowed_groups,
+            timestamp=topic.timestamp,
+        )
+
+    def _rebuild_popular_index(self, popular_order: List[str]):
+        """Rebuild the popularity index, breaking vote score ties by the given order."""
+        self._popular_index = []
+        self._popular_keys = {}
+        self._next_popular_sequence = 0
+        ordered = [tid for tid in dict.fromkeys(popular_order) if tid in self._topics]
+        listed = set(ordered)
+        ordered.extend(
+            sorted(
+                (tid for tid in self._topics if tid not in listed),
+                key=lambda tid: self._topics[tid].timestamp,
+            )
+        )
+        for topic_id in ordered:
+            self._index_topic_popularity(self._topics[topic_id])
+
+    def _index_topic_popularity(self, topic: ForumTopic):
+        """Insert or reposition a topic in the popularity index."""
+        old_key = self._popular_keys.get(topic.topic_id)
+        if old_key is not None:
+            if old_key[0] == -topic.get_vote_score():
+                return
+            self._unindex_topic_popularity(topic.topic_id)
+            sequence = old_key[1]
+        else:
+            sequence = self._next_popular_sequence
+            self._next_popular_sequence += 1
+        key = (-topic.get_vote_score(), sequence, topic.topic_id)
+        self._popular_keys[topic.topic_id] = key
+        insort(self._popular_index, key)
+
+    def _unindex_topic_popularity(self, topic_id: str):
+        """Remove a topic from the popularity index."""
+        key = self._popular_keys.pop(topic_id, None)
+        if key is not None:
+            position = bisect_left(self._popular_index, key)
+            if (
+                position < len(self._popular_index)
+                and self._popular_index[position] == key
+            ):
+                del self._popular_index[position]
+
+    def _index_topic_comments(self, topic: ForumTopic):
+        """Map all comments of a topic to the topic."""
+        for comment_id in topic.comments:
+            self._comment_topics[comment_id] = topic.topic_id
+
+    def _find_comment_topic(self, comment_id: str) -> Optional[ForumTopic]:
+        """Get the topic containing a comment."""
+        topic_id = self._comment_topics.get(comment_id)
+        if topic_id is None:
+            return None
+        topic = self.topics.get(topic_id)
+        if topic is None or comment_id not in topic.comments:
+            return None
+        return topic
 
     def _load_topic(self, topic_id: str) -> Optional[ForumTopic]:
         """Get a specific topic from storage."""
@@ -304,75 +442,35 @@ class ForumNetworkMod(BaseMod):
             return None
 
     def _get_topics_metadata(self) -> Dict[str, Any]:
-        """Get topic metadata (for listing) without loading full topics."""
-        try:
-            storage_path = self.get_storage_path()
-
-            # Load basic topic info from individual files
-            topics_data = {}
-            topics_dir = storage_path / "topics"
-            if topics_dir.exists():
-                for topic_file in topics_dir.glob("*.json"):
-                    try:
-                        topic_id = topic_file.stem  # filename without extension
-                        with open(topic_file, "r") as f:
-                            topic_dict = json.load(f)
-                        # Extract only metadata, not full content/comments
-                        topics_data[topic_id] = {
-                            "topic_id": topic_dict["topic_id"],
-                            "title": topic_dict["title"],
-                            "owner_id": topic_dict["owner_id"],
-                            "timestamp": topic_dict["timestamp"],
-                            "upvotes": topic_dict.get("upvotes", 0),
-                            "downvotes": topic_dict.get("downvotes", 0),
-                            "comment_count": topic_dict.get("comment_count", 0),
-                            "last_activity": topic_dict.get(
-                                "last_activity", topic_dict["timestamp"]
-                            ),
-                        }
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to load metadata for topic file {topic_file}: {e}"
-                        )
-                        continue
-
-            # Load ordering metadata
-            metadata = {}
-            metadata_file = storage_path / "metadata.json"
-            if metadata_file.exists():
-                with open(metadata_file, "r") as f:
-                    metadata = json.load(f)
-
-            return {
-                "topics": topics_data,
-                "topic_order_recent": metadata.get("topic_order_recent", []),
-                "topic_order_popular": metadata.get("topic_order_popular", []),
+        """Get topic metadata (for listing) without the full topics."""
+        topics_data = {}
+        for topic_id, topic in self.topics.items():
+            topics_data[topic_id] = {
+                "topic_id": topic.topic_id,
+                "title": topic.title,
+                "owner_id": topic.owner_id,
+                "timestamp": topic.timestamp,
+                "upvotes": topic.upvotes,
+                "downvotes": topic.downvotes,
+                "comment_count": topic.comment_count,
+                "last_activity": topic.last_activity,
             }
-
-        except Exception as e:
-            logger.error(f"Failed to load topics metadata: {e}")
-            return {"topics": {}, "topic_order_recent": [], "topic_order_popular": []}
+        return {
+            "topics": topics_data,
+            "topic_order_recent": list(self.topic_order_recent),
+            "topic_order_popular": self.topic_order_popular,
+        }
 
     def _get_user_votes(self, agent_id: str) -> Dict[str, str]:
-        """Get votes for a specific user from storage."""
-        try:
-            storage_path = self.get_storage_path()
-            votes_file = storage_path / "votes.json"
-
-            if not votes_file.exists():
-                return {}
-
-            with open(votes_file, "r") as f:
-                all_votes = json.load(f)
-
-            return all_votes.get(agent_id, {})
-
-        except Exception as e:
-            logger.error(f"Failed to load votes for user {agent_id}: {e}")
-            return {}
+        """Get a copy of the votes of a specific user."""
+        return dict(self.user_votes.get(agent_id, {}))
 
     def _save_topic(self, topic: ForumTopic):
-        """Save a single topic to its own file."""
+        """Store a single topic and write it to its own file."""
+        self.topics[topic.topic_id] = topic
+        self._index_topic_comments(topic)
+        self._index_topic_popularity(topic)
+        self._index_topic_text(topic)
         try:
             storage_path = self.get_storage_path()
             topics_dir = storage_path / "topics"
@@ -392,46 +490,60 @@ class ForumNetworkMod(BaseMod):
             with open(topic_file, "w") as f:
                 json.dump(topic_dict, f, indent=2, default=str)
 
-            # Topic saved to individual file
-
         except Exception as e:
             logger.error(f"Failed to save topic {topic.topic_id}: {e}")
 
+    def _delete_topic_file(self, topic_id: str):
+        """Remove a topic's file from storage."""
+        self._search_index.remove(topic_id)
+        try:
+            topic_file = self.get_storage_path() / "topics" / f"{topic_id}.json"
+            if topic_file.exists():
+                topic_file.unlink()
+        except Exception as e:
+            logger.error(f"Failed to delete topic file {topic_id}: {e}")
+
     def _save_user_votes(self, agent_id: str, votes: Dict[str, str]):
-        """Save votes for a specific user."""
+        """Store votes for a specific user and write all votes to storage."""
+        self.user_votes[agent_id] = votes
+        self._persist_votes()
+
+    def _persist_votes(self):
+        """Write all user votes to storage, omitting users without votes."""
         try:
             storage_path = self.get_storage_path()
             storage_path.mkdir(parents=True, exist_ok=True)
             votes_file = storage_path / "votes.json"
 
-            # Load existing votes
-            all_votes = {}
-            if votes_file.exists():
-                with open(votes_file, "r") as f:
-                    all_votes = json.load(f)
-
-            # Update this user's votes
-            all_votes[agent_id] = votes
-
-            # Save back to file
+            all_votes = {
+                agent_id: votes for agent_id, votes in self.user_votes.items() if votes
+            }
             with open(votes_file, "w") as f:
                 json.dump(all_votes, f, indent=2)
 
         except Exception as e:
-            logger.error(f"Failed to save votes for user {agent_id}: {e}")
+            logger.error(f"Failed to save user votes: {e}")
 
     def _save_metadata(
         self, topic_order_recent: List[str], topic_order_popular: List[str]
     ):
-        """Save topic ordering metadata."""
+        """Store topic orderings and write them to storage."""
+        self._ensure_loaded()
+        self._topic_order_recent = list(topic_order_recent)
+        if list(topic_order_popular) != self.topic_order_popular:
+            self._rebuild_popular_index(topic_order_popular)
+        self._persist_metadata()
+
+    def _persist_metadata(self):
+        """Write topic ordering metadata to storage."""
         try:
             storage_path = self.get_storage_path()
             storage_path.mkdir(parents=True, exist_ok=True)
             metadata_file = storage_path / "metadata.json"
 
             metadata = {
-                "topic_order_recent": topic_order_recent,
-                "topic_order_popular": topic_order_popular,
+                "topic_order_recent": self.topic_order_recent,
+                "topic_order_popular": self.topic_order_popular,
                 "last_saved": time.time(),
             }
 
@@ -442,22 +554,26 @@ class ForumNetworkMod(BaseMod):
             logger.error(f"Failed to save metadata: {e}")
 
     def _get_topic_vote_score(self, topic_id: str) -> int:
-        """Get vote score for a topic from storage."""
-        metadata = self._get_topics_metadata()
-        topic_info = metadata["topics"].get(topic_id, {})
-        upvotes = topic_info.get("upvotes", 0)
-        downvotes = topic_info.get("downvotes", 0)
-        return upvotes - downvotes
+        """Get vote score for a topic."""
+        topic = self.topics.get(topic_id)
+        return topic.get_vote_score() if topic else 0
+
+    def bind_network(self, network) -> bool:
+        """Register this mod with a network, reloading the forum from its workspace."""
+        result = super().bind_network(network)
+        # Storage may have moved to the network's workspace
+        self._topics = None
+        return result
 
     def initialize(self) -> bool:
-        """Initialize the mod without loading all data into memory.
+        """Initialize the mod, loading the forum from storage into memory.
 
         Returns:
             bool: True if initialization was successful, False otherwise
         """
         try:
-            # No need to load all data - storage-first approach
-            logger.info("Forum mod initialization complete (storage-first mode)")
+            self._load_forum()
+            logger.info("Forum mod initialization complete")
             return True
         except Exception as e:
             logger.error(f"Forum mod initialization failed: {e}")
@@ -472,6 +588,7 @@ class ForumNetworkMod(BaseMod):
         try:
             # Clear state (data is already in storage)
             self.active_agents.clear()
+            self._topics = None
 
             logger.info("Forum mod shutdown complete")
             return True
@@ -479,8 +596,6 @@ class ForumNetworkMod(BaseMod):
             logger.error(f"Forum mod shutdown failed: {e}")
             return False
 
-    # Old memory-based methods removed - now using storage-first approach
-
     async def handle_register_agent(
         self, agent_id: str, metadata: Optional[Dict[str, Any]] = None
     ) -> Optional[EventResponse]:
@@ -493,9 +608,6 @@ class ForumNetworkMod(BaseMod):
         """Handle agent unregistration."""
         if agent_id in self.active_agents:
             self.active_agents.remove(agent_id)
-        # Clean up user votes
-        if agent_id in self.user_votes:
-            del self.user_votes[agent_id]
         logger.info(f"Unregistered agent {agent_id} from forum mod")
         return None
 
@@ -553,31 +665,14 @@ class ForumNetworkMod(BaseMod):
             allowed_groups=allowed_groups,
         )
 
-        # Save the new topic to storage
+        # Save the new topic to storage (this also ranks it in the popular order)
         self._save_topic(topic)
 
-        # Update topic ordering metadata
-        metadata = self._get_topics_metadata()
-        topic_order_recent = metadata["topic_order_recent"]
-        topic_order_popular = metadata["topic_order_popular"]
-
         # Add to front for recency
-        if topic_id in topic_order_recent:
-            topic_order_recent.remove(topic_id)
-        topic_order_recent.insert(0, topic_id)
-
-        # Update popular order
-        if topic_id not in topic_order_popular:
-            topic_order_popular.append(topic_id)
-        # Sort by vote score (will be 0 for new topics)
-        topic_order_popular.sort(
-            key=lambda tid: self._get_topic_vote_score(tid), reverse=True
-        )
+        self.topic_order_recent.insert(0, topic_id)
 
         # Save metadata
-        self._save_metadata(topic_order_recent, topic_order_popular)
-
-        # Topic data now stored in storage
+        self._persist_metadata()
 
         logger.info(f"Created topic {topic_id}: '{title}' by {owner_id}")
 
@@ -601,11 +696,10 @@ class ForumNetworkMod(BaseMod):
         editor_id = event.source_id
 
         # Validate input
-        if not topic_id or topic_id not in self.topics:
+        topic = self.topics.get(topic_id) if topic_id else None
+        if not topic:
             return EventResponse(success=False, message="Topic not found")
 
-        topic = self.topics[topic_id]
-
         # Check ownership
         if topic.owner_id != editor_id:
             return EventResponse(
@@ -624,12 +718,6 @@ class ForumNetworkMod(BaseMod):
         # Save the updated topic to storage
         self._save_topic(topic)
 
-        # Update metadata (ordering might have changed due to activity update)
-        metadata = self._get_topics_metadata()
-        self._save_metadata(
-            metadata["topic_order_recent"], metadata["topic_order_popular"]
-        )
-
         # Send notification event
         await self._send_topic_notification(
             "forum.topic.edited", topic, event.source_id
@@ -646,55 +734,36 @@ class ForumNetworkMod(BaseMod):
         deleter_id = event.source_id
 
         # Validate input
-        if not topic_id or topic_id not in self.topics:
+        topic = self.topics.get(topic_id) if topic_id else None
+        if not topic:
             return EventResponse(success=False, message="Topic not found")
 
-        topic = self.topics[topic_id]
-
         # Check ownership
         if topic.owner_id != deleter_id:
             return EventResponse(
                 success=False, message="Only the topic owner can delete this topic"
             )
 
-        # Remove topic file
-        storage_path = self.get_storage_path()
-        topics_dir = storage_path / "topics"
-        topic_file = topics_dir / f"{topic_id}.json"
-        if topic_file.exists():
-            topic_file.unlink()
+        # Remove the topic and its file
+        del self.topics[topic_id]
+        self._delete_topic_file(topic_id)
 
-        # Update metadata - remove from ordering
-        metadata = self._get_topics_metadata()
-        topic_order_recent = metadata["topic_order_recent"]
-        topic_order_popular = metadata["topic_order_popular"]
-
-        if topic_id in topic_order_recent:
-            topic_order_recent.remove(topic_id)
-        if topic_id in topic_order_popular:
-            topic_order_popular.remove(topic_id)
+        # Remove from ordering
+        if topic_id in self.topic_order_recent:
+            self.topic_order_recent.remove(topic_id)
+        self._unindex_topic_popularity(topic_id)
+        for comment_id in topic.comments:
+            self._comment_topics.pop(comment_id, None)
 
         # Clean up votes for this topic and its comments
-        all_user_votes = self.user_votes
-        updated_votes = {}
-        for agent_id, agent_votes in all_user_votes.items():
-            # Remove votes for the topic and its comments
-            filtered_votes = {}
-            for vote_target_id, vote_type in agent_votes.items():
-                # Keep vote if it's not for this topic or its comments
-                if vote_target_id != topic_id and vote_target_id not in topic.comments:
-                    filtered_votes[vote_target_id] = vote_type
-            if filtered_votes:  # Only save if user has remaining votes
-                updated_votes[agent_id] = filtered_votes
-
-        # Save updated votes
-        storage_path.mkdir(parents=True, exist_ok=True)
-        votes_file = storage_path / "votes.json"
-        with open(votes_file, "w") as f:
-            json.dump(updated_votes, f, indent=2)
+        for agent_votes in self.user_votes.values():
+            for vote_target_id in list(agent_votes):
+                if vote_target_id == topic_id or vote_target_id in topic.comments:
+                    del agent_votes[vote_target_id]
 
-        # Save updated metadata
-        self._save_metadata(topic_order_recent, topic_order_popular)
+        # Save updated votes and metadata
+        self._persist_votes()
+        self._persist_metadata()
 
         logger.info(f"Deleted topic {topic_id} by {deleter_id}")
 
@@ -754,7 +823,7 @@ class ForumNetworkMod(BaseMod):
                 success=False, message="Comment content cannot be empty"
             )
 
-        topic = self._load_topic(topic_id)
+        topic = self.topics.get(topic_id)
         if not topic:
             return EventResponse(success=False, message="Topic not found")
 
@@ -788,12 +857,6 @@ class ForumNetworkMod(BaseMod):
         # Save the updated topic with new comment
         self._save_topic(topic)
 
-        # Update metadata for activity ordering
-        metadata = self._get_topics_metadata()
-        self._save_metadata(
-            metadata["topic_order_recent"], metadata["topic_order_popular"]
-        )
-
         # Send notifications
         await self._send_comment_notification(
             "forum.comment.posted", comment, topic, event.source_id
@@ -815,7 +878,7 @@ class ForumNetworkMod(BaseMod):
         if not topic_id:
             return EventResponse(success=False, message="Topic ID required")
 
-        topic = self._load_topic(topic_id)
+        topic = self.topics.get(topic_id)
         if not topic:
             return EventResponse(success=False, message="Topic not found")
 
@@ -873,12 +936,6 @@ class ForumNetworkMod(BaseMod):
         # Save the updated topic with new reply
         self._save_topic(topic)
 
-        # Update metadata for activity ordering
-        metadata = self._get_topics_metadata()
-        self._save_metadata(
-            metadata["topic_order_recent"], metadata["topic_order_popular"]
-        )
-
         # Send notifications
         await self._send_comment_notification(
             "forum.comment.replied", comment, topic, event.source_id
@@ -900,7 +957,7 @@ class ForumNetworkMod(BaseMod):
         if not topic_id:
             return EventResponse(success=False, message="Topic ID required")
 
-        topic = self._load_topic(topic_id)
+        topic = self.topics.get(topic_id)
         if not topic:
             return EventResponse(success=False, message="Topic not found")
 
@@ -949,7 +1006,7 @@ class ForumNetworkMod(BaseMod):
         if not topic_id:
             return EventResponse(success=False, message="Topic ID required")
 
-        topic = self._load_topic(topic_id)
+        topic = self.topics.get(topic_id)
         if not topic:
             return EventResponse(success=False, message="Topic not found")
 
@@ -993,6 +1050,7 @@ class ForumNetworkMod(BaseMod):
 
                 # Remove the comment
                 del topic.comments[cid]
+                self._comment_topics.pop(cid, None)
                 topic.comment_count -= 1
 
         remove_comment_tree(comment_id)
@@ -1001,17 +1059,8 @@ class ForumNetworkMod(BaseMod):
         # Save the updated topic after comment deletion
         self._save_topic(topic)
 
-        # Clean up votes (already done in remove_comment_tree but save updated votes)
-        updated_votes = {}
-        for agent_id, agent_votes in self.user_votes.items():
-            if agent_votes:  # Only include agents that still have votes
-                updated_votes[agent_id] = agent_votes
-
-        storage_path = self.get_storage_path()
-        storage_path.mkdir(parents=True, exist_ok=True)
-        votes_file = storage_path / "votes.json"
-        with open(votes_file, "w") as f:
-            json.dump(updated_votes, f, indent=2)
+        # Save votes cleaned up in remove_comment_tree
+        self._persist_votes()
 
         logger.info(f"Deleted comment {comment_id} by {deleter_id}")
 
@@ -1074,7 +1123,7 @@ class ForumNetworkMod(BaseMod):
         target_obj = None
         containing_topic = None  # Track which topic contains a comment
         if target_type == "topic":
-            target_obj = self._load_topic(target_id)
+            target_obj = self.topics.get(target_id)
             if not target_obj:
                 return EventResponse(success=False, message="Topic not found")
             # Check if agent can view the topic
@@ -1085,15 +1134,9 @@ class ForumNetworkMod(BaseMod):
                     data={"error_code": "PERMISSION_DENIED_NOT_IN_ALLOWED_GROUPS"},
                 )
         else:  # comment
-            # Find comment in any topic - need to search through all topics
-            for topic_id in self._get_topics_metadata()["topics"].keys():
-                topic = self._load_topic(topic_id)
-                if topic and target_id in topic.comments:
-                    target_obj = topic.comments[target_id]
-                    containing_topic = (
-                        topic  # Save reference to the topic containing this comment
-                    )
-                    break
+            containing_topic = self._find_comment_topic(target_id)
+            if containing_topic:
+                target_obj = containing_topic.comments[target_id]
 
             if not target_obj:
                 return EventResponse(success=False, message="Comment not found")
@@ -1106,7 +1149,7 @@ class ForumNetworkMod(BaseMod):
                     data={"error_code": "PERMISSION_DENIED_NOT_IN_ALLOWED_GROUPS"},
                 )
 
-        # Check if user already voted on this target - get fresh vote data each time
+        # Check if user already voted on this target
         user_vote_data = self._get_user_votes(voter_id)
         existing_vote = user_vote_data.get(target_id)
         if existing_vote:
@@ -1135,29 +1178,15 @@ class ForumNetworkMod(BaseMod):
         if target_type == "topic":
             self._save_topic(target_obj)
         else:
-            # For comments, we need to save the topic that contains the comment
-            # Use the containing_topic that we already found during comment lookup
-            if containing_topic:
-                self._save_topic(containing_topic)
-            else:
-                logger.error(
-                    f"Could not find topic containing comment {target_id} for vote save"
-                )
+            # For comments, save the topic that contains the comment
+            self._save_topic(containing_topic)
 
         # Save updated user votes
         self._save_user_votes(voter_id, user_vote_data)
 
         # Update metadata if it's a topic vote (affects popular ordering)
         if target_type == "topic":
-            metadata = self._get_topics_metadata()
-            # Re-sort popular order based on new vote scores
-            topic_order_popular = sorted(
-                metadata["topics"].keys(),
-                key=lambda tid: metadata["topics"][tid].get("upvotes", 0)
-                - metadata["topics"][tid].get("downvotes", 0),
-                reverse=True,
-            )
-            self._save_metadata(metadata["topic_order_recent"], topic_order_popular)
+            self._persist_metadata()
 
         logger.info(f"Cast {vote_type} on {target_type} {target_id} by {voter_id}")
 
@@ -1197,7 +1226,7 @@ class ForumNetworkMod(BaseMod):
         target_id = payload.get("target_id")
         voter_id = event.source_id
 
-        # Check if user has voted on this target - get fresh vote data each time
+        # Check if user has voted on this target
         user_vote_data = self._get_user_votes(voter_id)
         existing_vote = user_vote_data.get(target_id)
         if not existing_vote:
@@ -1207,17 +1236,15 @@ class ForumNetworkMod(BaseMod):
 
         # Find target
         target_obj = None
+        containing_topic = None
         if target_type == "topic":
-            target_obj = self._load_topic(target_id)
+            target_obj = containing_topic = self.topics.get(target_id)
             if not target_obj:
                 return EventResponse(success=False, message="Topic not found")
         else:  # comment
-            # Find comment in any topic - need to search through all topics
-            for topic_id in self._get_topics_metadata()["topics"].keys():
-                topic = self._load_topic(topic_id)
-                if topic and target_id in topic.comments:
-                    target_obj = topic.comments[target_id]
-                    break
+            containing_topic = self._find_comment_topic(target_id)
+            if containing_topic:
+                target_obj = containing_topic.comments[target_id]
 
             if not target_obj:
                 return EventResponse(success=False, message="Comment not found")
@@ -1230,20 +1257,13 @@ class ForumNetworkMod(BaseMod):
 
         del user_vote_data[target_id]
 
-        # Save updated user votes
+        # Save the updated vote counts and user votes
+        self._save_topic(containing_topic)
         self._save_user_votes(voter_id, user_vote_data)
 
         # Update metadata if it's a topic vote (affects popular ordering)
         if target_type == "topic":
-            metadata = self._get_topics_metadata()
-            # Re-sort popular order based on new vote scores
-            topic_order_popular = sorted(
-                metadata["topics"].keys(),
-                key=lambda tid: metadata["topics"][tid].get("upvotes", 0)
-                - metadata["topics"][tid].get("downvotes", 0),
-                reverse=True,
-            )
-            self._save_metadata(metadata["topic_order_recent"], topic_order_popular)
+            self._persist_metadata()
 
         logger.info(
             f"Removed {existing_vote} on {target_type} {target_id} by {voter_id}"
@@ -1309,35 +1329,15 @@ class ForumNetworkMod(BaseMod):
         requester_id = event.source_id
 
         # Get ordered topic list
-        if sort_by == "popular":
+        if sort_by in ("popular", "votes"):
+            # The popular order is maintained sorted by vote score
             ordered_topics = self.topic_order_popular
-        elif sort_by == "votes":
-            # Sort by vote score
-            ordered_topics = sorted(
-                self.topics.keys(),
-                key=lambda tid: self.topics[tid].get_vote_score(),
-                reverse=True,
-            )
         else:  # recent
             ordered_topics = self.topic_order_recent
 
-        # Filter topics by permission
-        viewable_topics = []
-        for topic_id in ordered_topics:
-            if topic_id in self.topics:
-                topic = self.topics[topic_id]
-                if self._can_agent_view_topic(requester_id, topic):
-                    viewable_topics.append(topic_id)
-
-        # Apply pagination on filtered topics
-        total_count = len(viewable_topics)
-        paginated_topics = viewable_topics[offset : offset + limit]
-
-        # Build response
-        topics_data = []
-        for topic_id in paginated_topics:
-            if topic_id in self.topics:
-                topics_data.append(self.topics[topic_id].to_dict())
+        topics_data, total_count = self._get_viewable_topics_page(
+            ordered_topics, requester_id, offset, limit
+        )
 
         return EventResponse(
             success=True,
@@ -1352,6 +1352,33 @@ class ForumNetworkMod(BaseMod):
             },
         )
 
+    def _get_viewable_topics_page(
+        self, ordered_topics: List[str], requester_id: str, offset: int, limit: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of the topics an agent can view, in the given order.
+
+        Args:
+            ordered_topics: Topic IDs in listing order
+            requester_id: ID of the agent listing the topics
+            offset: Number of viewable topics to skip
+            limit: Maximum number of topics to return
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The page of topic dicts and the total
+                number of viewable topics
+        """
+        topics = self.topics
+        topics_data = []
+        total_count = 0
+        for topic_id in ordered_topics:
+            topic = topics.get(topic_id)
+            if topic is None or not self._can_agent_view_topic(requester_id, topic):
+                continue
+            if offset <= total_count < offset + limit:
+                topics_data.append(topic.to_dict())
+            total_count += 1
+        return topics_data, total_count
+
     async def _search_topics(self, event: Event) -> EventResponse:
         """Search topics by keywords."""
         payload = event.payload
@@ -1363,30 +1390,15 @@ class ForumNetworkMod(BaseMod):
         if not search_query:
             return EventResponse(success=False, message="Search query cannot be empty")
 
-        # Search in titles and content (only viewable topics)
-        matching_topics = []
-        for topic in self.topics.values():
-            if self._can_agent_view_topic(requester_id, topic):
-                if (
-                    search_query in topic.title.lower()
-                    or search_query in topic.content.lower()
-                ):
-                    matching_topics.append(topic)
-
-        # Sort by relevance (title matches first, then by recency)
-        def relevance_score(topic):
-            title_match = 2 if search_query in topic.title.lower() else 0
-            return (
-                title_match + topic.timestamp / 1000000
-            )  # Add timestamp for tie-breaking
-
-        matching_topics.sort(key=relevance_score, reverse=True)
-
-        # Apply pagination
-        total_count = len(matching_topics)
-        paginated_topics = matching_topics[offset : offset + limit]
-
-        topics_data = [topic.to_dict() for topic in paginated_topics]
+        # Rank viewable topics by relevance, title matches weighing more
+        topics = self.topics
+        topic_ids, total_count = self._search_index.search(
+            search_query,
+            offset=offset,
+            limit=limit,
+            groups=self._get_agent_groups(requester_id),
+        )
+        topics_data = [topics[topic_id].to_dict() for topic_id in topic_ids]
 
         return EventResponse(
             success=True,
@@ -1407,11 +1419,10 @@ class ForumNetworkMod(BaseMod):
         topic_id = payload.get("topic_id")
         requester_id = event.source_id
 
-        if not topic_id or topic_id not in self.topics:
+        topic = self.topics.get(topic_id) if topic_id else None
+        if not topic:
             return EventResponse(success=False, message="Topic not found")
 
-        topic = self.topics[topic_id]
-
         # Check if agent can view the topic
         if not self._can_agent_view_topic(requester_id, topic):
             return EventResponse(
@@ -1434,24 +1445,9 @@ class ForumNetworkMod(BaseMod):
         requester_id = event.source_id
 
         # Use popular ordering
-        ordered_topics = self.topic_order_popular
-
-        # Filter topics by permission
-        viewable_topics = []
-        for topic_id in ordered_topics:
-            if topic_id in self.topics:
-                topic = self.topics[topic_id]
-                if self._can_agent_view_topic(requester_id, topic):
-                    viewable_topics.append(topic_id)
-
-        # Apply pagination on filtered topics
-        total_count = len(viewable_topics)
-        paginated_topics = viewable_topics[offset : offset + limit]
-
-        topics_data = []
-        for topic_id in paginated_topics:
-            if topic_id in self.topics:
-                topics_data.append(self.topics[topic_id].to_dict())
+        topics_data, total_count = self._get_viewable_topics_page(
+            self.topic_order_popular, requester_id, offset, limit
+        )
 
         return EventResponse(
             success=True,
@@ -1473,24 +1469,9 @@ class ForumNetworkMod(BaseMod):
         requester_id = event.source_id
 
         # Use recent ordering
-        ordered_topics = self.topic_order_recent
-
-        # Filter topics by permission
-        viewable_topics = []
-        for topic_id in ordered_topics:
-            if topic_id in self.topics:
-                topic = self.topics[topic_id]
-                if self._can_agent_view_topic(requester_id, topic):
-                    viewable_topics.append(topic_id)
-
-        # Apply pagination on filtered topics
-        total_count = len(viewable_topics)
-        paginated_topics = viewable_topics[offset : offset + limit]
-
-        topics_data = []
-        for topic_id in paginated_topics:
-            if topic_id in self.topics:
-                topics_data.append(self.topics[topic_id].to_dict())
+        topics_data, total_count = self._get_viewable_topics_page(
+            self.topic_order_recent, requester_id, offset, limit
+        )
 
         return EventResponse(
             success=True,
@@ -1580,24 +1561,13 @@ class ForumNetworkMod(BaseMod):
 
     def _update_topic_activity(self, topic_id: str):
         """Update topic activity ordering in metadata."""
-        metadata = self._get_topics_metadata()
-        topic_order_recent = metadata["topic_order_recent"]
-        topic_order_popular = metadata["topic_order_popular"]
-
         # Move to front of recent list
-        if topic_id in topic_order_recent:
-            topic_order_recent.remove(topic_id)
-        topic_order_recent.insert(0, topic_id)
-
-        # Update popular ordering based on current vote scores
-        topic_order_popular = sorted(
-            metadata["topics"].keys(),
-            key=lambda tid: self._get_topic_popularity_score(metadata["topics"][tid]),
-            reverse=True,
-        )
+        if topic_id in self.topic_order_recent:
+            self.topic_order_recent.remove(topic_id)
+        self.topic_order_recent.insert(0, topic_id)
 
         # Save updated metadata
-        self._save_metadata(topic_order_recent, topic_order_popular)
+        self._persist_metadata()
 
     def _get_topic_popularity_score(self, topic_metadata: Dict[str, Any]) -> float:
         """Calculate popularity score for a topic based on metadata."""
@@ -64,9 +64,6 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
         self.pending_file_operations: Dict[str, Dict[str, Any]] = (
             {}
         )  # request_id -> operation metadata
-        self.completed_file_operations: Dict[str, Dict[str, Any]] = (
-            {}
-        )  # request_id -> operation results
         self.pending_channel_requests: Dict[str, Dict[str, Any]] = (
             {}
         )  # request_id -> request metadata
@@ -477,50 +474,27 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
                 visibility=EventVisibility.MOD_ONLY,
             )
 
-            # Store pending operation
-            self.pending_file_operations[message.event_id] = {
-                "action": "upload",
-                "filename": file_path.name,
-                "timestamp": message.timestamp,
-            }
-
             # Use send_event for gRPC or send_mod_message for websocket
             if hasattr(self.connector, "send_mod_message"):
-                await self.connector.send_mod_message(message)
+                send = self.connector.send_mod_message
             else:
-                await self.agent_client.send_event(message)
-            logger.debug(f"Initiated file upload for {file_path.name}")
+                send = self.agent_client.send_event
+            logger.debug(f"Initiating file upload for {file_path.name}")
 
-            # Wait for response with timeout
-            try:
-                import asyncio
-
-                # Wait up to 10 seconds for the upload response
-                for _ in range(50):  # 50 * 0.2 = 10 seconds
-                    if message.event_id in self.completed_file_operations:
-                        result = self.completed_file_operations.pop(message.event_id)
-                        if result.get("success"):
-                            file_uuid = result.get("file_uuid")
-                            logger.info(
-                                f"File upload completed: {file_path.name} -> {file_uuid}"
-                            )
-                            return file_uuid
-                        else:
-                            logger.error(
-                                f"File upload failed: {result.get('error', 'Unknown error')}"
-                            )
-                            return None
-
-                    await asyncio.sleep(0.2)
-
-                # Timeout - clean up and return None
+            # Send request and wait for the upload response
+            result = await self.request(message, timeout=10, send=send)
+            if result is None:
                 logger.warning(f"File upload timed out for {file_path.name}")
-                if message.event_id in self.pending_file_operations:
-                    del self.pending_file_operations[message.event_id]
                 return None
 
-            except Exception as e:
-                logger.error(f"Error waiting for upload response: {e}")
+            if result.get("success"):
+                file_uuid = result.get("file_uuid") or result.get("file_id")
+                logger.info(f"File upload completed: {file_path.name} -> {file_uuid}")
+                return file_uuid
+            else:
+                logger.error(
+                    f"File upload failed: {result.get('error', 'Unknown error')}"
+                )
                 return None
 
         except Exception as e:
@@ -740,53 +714,39 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             payload=channel_info_msg.model_dump(),
         )
 
-        # Store pending request
-        self.pending_channel_requests[message.event_id] = {
-            "action": "list_channels",
-            "timestamp": message.timestamp,
-        }
-
-        await self.agent_client.send_event(message)
-        logger.debug("Requested channels list")
+        logger.debug("Requesting channels list")
 
-        # Wait for response with timeout
-        try:
-            import asyncio
-
-            for _ in range(25):  # 25 * 0.2 = 5 seconds
-                if self.available_channels:
-                    logger.debug(
-                        f"Received {len(self.available_channels)} channels from network"
-                    )
-                    return self.available_channels
-                await asyncio.sleep(0.2)
+        # Send request and wait for the response
+        result = await self.request(message, timeout=5, send=self.agent_client.send_event)
+        if result is not None and result.get("success"):
+            self.available_channels = result.get("channels", [])
+            logger.debug(
+                f"Received {len(self.available_channels)} channels from network"
+            )
+            return self.available_channels
 
-            # Timeout - return default channels
-            logger.warning("Channel list request timed out, returning defaults")
-            default_channels = [
-                {
-                    "name": "general",
-                    "description": "General discussion",
-                    "agents": [],
-                    "message_count": 0,
-                },
-                {
-                    "name": "development",
-                    "description": "Development topics",
-                    "agents": [],
-                    "message_count": 0,
-                },
-                {
-                    "name": "support",
-                    "description": "Support and help",
-                    "agents": [],
-                    "message_count": 0,
-                },
-            ]
-            return default_channels
-        except Exception as e:
-            logger.error(f"Error waiting for channels response: {e}")
-            return []
+        # Timeout or error - return default channels
+        logger.warning("Channel list request failed, returning defaults")
+        return [
+            {
+                "name": "general",
+                "description": "General discussion",
+                "agents": [],
+                "message_count": 0,
+            },
+            {
+                "name": "development",
+                "description": "Development topics",
+                "agents": [],
+                "message_count": 0,
+            },
+            {
+                "name": "support",
+                "description": "Support and help",
+                "agents": [],
+                "message_count": 0,
+            },
+        ]
 
     async def react_to_message(
         self, target_message_id: str, reaction_type: str, action: str = "add"
@@ -891,14 +851,6 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             filename = message.payload.get("filename")
             logger.info(f"File uploaded successfully: {filename} -> {file_id}")
 
-            # Store completion result for upload_file method
-            if request_id:
-                self.completed_file_operations[request_id] = {
-                    "success": True,
-                    "file_uuid": file_id,
-                    "filename": filename,
-                }
-
             # Call file handlers
             for handler in self.file_handlers.values():
                 try:
@@ -909,13 +861,6 @@ class ThreadMessagingAgentAdapter(BaseModAdapter):
             error = message.payload.get("error", "Unknown error")
             logger.error(f"File upload failed: {error}")
 
-            # Store completion result for upload_file method
-            if request_id:
-                self.completed_file_operations[request_id] = {
-                    "success": False,
-                    "error": error,
-                }
-
             # Call file handlers with error
             for handler in self.file_handlers.values():
                 try:
@@ -0,0 +1,231 @@
+"""
+Indexed message history for the thread messaging mod.
+
+Retrieving one channel's or one conversation's messages used to scan the whole
+message history. MessageHistory keeps, next to the message_id -> Event mapping,
+time-ordered lists of the message IDs of each channel and each direct message pair.
+The lists are updated on every insertion and removal, so retrieving a page costs
+O(log n + limit) regardless of how many other messages are held in memory.
+"""
+
+import logging
+from bisect import bisect_left, insort
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from openagents.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+# Channel key of channel events that name no channel; they match every channel
+ANY_CHANNEL = object()
+
+# Message types stored in a channel
+_CHANNEL_REPLY_TYPES = ("reply", "reply_message")
+
+
+def get_channel_key(message: Any) -> Any:
+    """Get the channel a message is listed under.
+
+    Args:
+        message: A message from the history
+
+    Returns:
+        The channel name, ANY_CHANNEL, or None if the message is not a channel message
+    """
+    if not isinstance(message, Event):
+        return None
+    payload = message.payload
+    if payload and "channel" in payload:
+        message_type = payload.get("message_type", "")
+        if isinstance(message_type, str) and (
+            "channel" in message_type or message_type in _CHANNEL_REPLY_TYPES
+        ):
+            return payload["channel"]
+        return None
+    if message.event_name and "channel" in message.event_name:
+        destination_id = message.destination_id
+        if destination_id and destination_id.startswith("channel:"):
+            return destination_id.split(":", 1)[1]
+        return ANY_CHANNEL
+    return None
+
+
+def get_conversation_key(message: Any) -> Optional[FrozenSet[str]]:
+    """Get the pair of agents of a direct message.
+
+    Args:
+        message: A message from the history
+
+    Returns:
+        The sender and target agent IDs, or None if the message is not a direct message
+    """
+    if not isinstance(message, Event):
+        return None
+    payload = message.payload
+    if (
+        payload
+        and "target_agent_id" in payload
+        and message.destination_id
+        and message.destination_id.startswith("agent:")
+    ):
+        try:
+            return frozenset((message.source_id, payload["target_agent_id"]))
+        except TypeError:
+            return None
+    return None
+
+
+class MessageHistory(dict):
+    """
+    message_id -> Event mapping with per-channel and per-conversation indexes.
+
+    Entries of an index are ``(timestamp, order, message_id)`` tuples kept sorted,
+    where ``order`` preserves insertion order among messages with equal timestamps
+    (it is negated in channel indexes, which are read newest first). Any insertion
+    or removal through the dict interface updates the indexes, so callers like the
+    storage helper can keep treating the history as a plain dict.
+    """
+
+    def __init__(self, messages: Optional[Dict[str, Event]] = None):
+        super().__init__()
+        self._next_order = 0
+        self._orders: Dict[str, int] = {}
+        # message_id -> (index, key, entry) of each index list the message is in
+        self._entries: Dict[str, List[Tuple[Dict[Any, List[tuple]], Any, tuple]]] = {}
+        self._channels: Dict[Any, List[tuple]] = {}
+        self._conversations: Dict[FrozenSet[str], List[tuple]] = {}
+        if messages:
+            self.update(messages)
+
+    def __setitem__(self, message_id: str, message: Event) -> None:
+        if message_id in self:
+            # Replacing a message keeps its position in the dict
+            self._unindex(message_id)
+            order = self._orders[message_id]
+        else:
+            order = self._next_order
+            self._next_order += 1
+            self._orders[message_id] = order
+        super().__setitem__(message_id, message)
+        self._index(message_id, message, order)
+
+    def __delitem__(self, message_id: str) -> None:
+        super().__delitem__(message_id)
+        self._unindex(message_id)
+        del self._orders[message_id]
+
+    def pop(self, message_id: str, *default: Any) -> Any:
+        if message_id not in self:
+            return super().pop(message_id, *default)
+        message = self[message_id]
+        del self[message_id]
+        return message
+
+    def popitem(self) -> Tuple[str, Event]:
+        message_id, message = super().popitem()
+        self._unindex(message_id)
+        del self._orders[message_id]
+        return message_id, message
+
+    def setdefault(self, message_id: str, default: Any = None) -> Any:
+        if message_id not in self:
+            self[message_id] = default
+        return self[message_id]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for message_id, message in dict(*args, **kwargs).items():
+            self[message_id] = message
+
+    def clear(self) -> None:
+        super().clear()
+        self._orders.clear()
+        self._entries.clear()
+        self._channels.clear()
+        self._conversations.clear()
+
+    def copy(self) -> Dict[str, Event]:
+        return dict(self)
+
+    def channel_page(self, channel: str, offset: int, limit: int) -> Tuple[List[str], int]:
+        """Get a page of a channel's message IDs, newest first.
+
+        Args:
+            channel: The channel name
+            offset: Number of newest messages to skip
+            limit: Maximum number of message IDs to return
+
+        Returns:
+            Tuple[List[str], int]: The page of message IDs and the channel's total count
+        """
+        entries = self._channels.get(channel, [])
+        wildcards = self._channels.get(ANY_CHANNEL)
+        if wildcards:
+            entries = sorted(entries + wildcards)
+        total = len(entries)
+        end = total - max(offset, 0)
+        if end <= 0 or limit <= 0:
+            return [], total
+        page = entries[max(end - limit, 0) : end]
+        return [entry[2] for entry in reversed(page)], total
+
+    def conversation_page(
+        self, agent_id: str, other_agent_id: str, offset: int, limit: int
+    ) -> Tuple[List[str], int]:
+        """Get a page of the direct message IDs between two agents, oldest first.
+
+        Args:
+            agent_id: One agent of the conversation
+            other_agent_id: The other agent of the conversation
+            offset: Number of oldest messages to skip
+            limit: Maximum number of message IDs to return
+
+        Returns:
+            Tuple[List[str], int]: The page of message IDs and the conversation's total count
+        """
+        entries = self._conversations.get(frozenset((agent_id, other_agent_id)), [])
+        start = max(offset, 0)
+        page = entries[start : start + max(limit, 0)]
+        return [entry[2] for entry in page], len(entries)
+
+    def _index(self, message_id: str, message: Event, order: int) -> None:
+        timestamp = getattr(message, "timestamp", 0) or 0
+        listed = []
+
+        channel = get_channel_key(message)
+        if channel is not None:
+            try:
+                listed.append(
+                    self._insert(self._channels, channel, (timestamp, -order, message_id))
+                )
+            except TypeError:
+                # Unhashable channel value; such a message can never be requested
+                pass
+
+        conversation = get_conversation_key(message)
+        if conversation is not None:
+            listed.append(
+                self._insert(self._conversations, conversation, (timestamp, order, message_id))
+            )
+
+        if listed:
+            self._entries[message_id] = listed
+
+    def _insert(
+        self, index: Dict[Any, List[tuple]], key: Any, entry: tuple
+    ) -> Tuple[Dict[Any, List[tuple]], Any, tuple]:
+        entries = index.setdefault(key, [])
+        if not entries or entries[-1] < entry:
+            # Messages usually arrive in timestamp order
+            entries.append(entry)
+        else:
+            insort(entries, entry)
+        return index, key, entry
+
+    def _unindex(self, message_id: str) -> None:
+        for index, key, entry in self._entries.pop(message_id, ()):
+            entries = index[key]
+            position = bisect_left(entries, entry)
+            if position < len(entries) and entries[position] == entry:
+                del entries[position]
+            if not entries:
+                del index[key]
@@ -0,0 +1,124 @@
+"""
+Append-only message log for the thread messaging mod.
+
+The message history is persisted as a snapshot (``message_history.json``) plus a
+JSON Lines log of the changes made since the snapshot was written. Each stored or
+updated message is appended to the log once instead of rewriting the whole
+history; compaction writes a fresh snapshot and truncates the log. Loading reads
+the snapshot and replays the log on top of it.
+
+Records are applied idempotently, so a crash between replacing the snapshot and
+truncating the log, or a torn last line, loses nothing but the torn record.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE_NAME = "message_history.json"
+LOG_FILE_NAME = "message_history.log.jsonl"
+
+# Log record operations
+PUT = "put"
+DELETE = "delete"
+
+
+class MessageLog:
+    """Snapshot plus append-only change log of serialized messages.
+
+    The log is not thread-safe; the storage helper calls it from a single writer.
+    """
+
+    def __init__(self, storage_path: Path):
+        """Initialize the log.
+
+        Args:
+            storage_path: Directory holding the snapshot and log files
+        """
+        self.storage_path = storage_path
+        self.snapshot_file = storage_path / SNAPSHOT_FILE_NAME
+        self.log_file = storage_path / LOG_FILE_NAME
+        self.records_since_compaction = 0
+        self._handle: Optional[TextIO] = None
+
+    def append(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append change records to the log.
+
+        Args:
+            records: Records built with put_record or delete_record
+        """
+        lines = [json.dumps(record, default=str) + "\n" for record in records]
+        if not lines:
+            return
+        if self._handle is None:
+            self._handle = open(self.log_file, "a", encoding="utf-8")
+        self._handle.write("".join(lines))
+        self._handle.flush()
+        self.records_since_compaction += len(lines)
+
+    def compact(self, history_data: Dict[str, Any]) -> None:
+        """Replace the snapshot with the given history and truncate the log.
+
+        Args:
+            history_data: Serialized message_id -> message mapping of the whole history
+        """
+        temp_file = self.snapshot_file.with_name(self.snapshot_file.name + ".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(history_data, f, default=str)
+        os.replace(temp_file, self.snapshot_file)
+
+        self.close()
+        with open(self.log_file, "w", encoding="utf-8"):
+            pass
+        self.records_since_compaction = 0
+
+    def replay(self) -> Dict[str, Any]:
+        """Read the snapshot and apply the logged changes.
+
+        Returns:
+            Dict[str, Any]: Serialized message_id -> message mapping
+        """
+        history_data: Dict[str, Any] = {}
+        if self.snapshot_file.exists():
+            with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                history_data = json.load(f)
+
+        applied = 0
+        if self.log_file.exists():
+            with open(self.log_file, "r", encoding="utf-8") as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                        if record["op"] == PUT:
+                            history_data[record["id"]] = record["message"]
+                        elif record["op"] == DELETE:
+                            history_data.pop(record["id"], None)
+                        applied += 1
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning(
+                            f"Skipping unreadable record on line {line_number} of {self.log_file}: {e}"
+                        )
+        self.records_since_compaction = applied
+        return history_data
+
+    def close(self) -> None:
+        """Close the log file handle, if open."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    @staticmethod
+    def put_record(message_id: str, message_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a record storing or replacing a message."""
+        return {"op": PUT, "id": message_id, "message": message_data}
+
+    @staticmethod
+    def delete_record(message_id: str) -> Dict[str, Any]:
+        """Build a record removing a message."""
+        return {"op": DELETE, "id": message_id}
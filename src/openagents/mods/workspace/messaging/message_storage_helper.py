@@ -3,21 +3,33 @@ Message Storage Helper for Messaging Mod
 
 This helper class extracts the storage complexity from the messaging mod, providing:
 - Memory management with configurable limits
+- Append-only logging of message changes with periodic compaction
 - Periodic dumps to prevent data loss
 - Daily archiving of old messages
 - Automatic cleanup of expired archives
 - Comprehensive error handling and logging
+
+When called from a running event loop, file writes are handed to a single writer
+thread so they never block the loop; the writer applies them in submission order.
+Logged messages are serialized on the calling thread. Compaction serializes the
+whole history on the writer thread from a snapshot of the messages; a message
+changed in place meanwhile (such as by a reaction) is logged again after the
+compaction, so replaying the log restores its latest state.
 """
 
+import asyncio
 import logging
 import json
 import gzip
+import shutil
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
 from pathlib import Path
 
 from openagents.models.event import Event
+from .message_log import LOG_FILE_NAME, MessageLog
 
 logger = logging.getLogger(__name__)
 
@@ -32,12 +44,16 @@ class MessageStorageConfig:
         dump_interval_minutes: int = 10,
         hot_storage_days: int = 7,
         archive_retention_days: int = 180,
+        log_compaction_records: int = 1000,
     ):
         self.max_memory_messages = max_memory_messages
         self.memory_cleanup_interval = memory_cleanup_minutes * 60  # Convert to seconds
         self.dump_interval = dump_interval_minutes * 60
         self.hot_storage_days = hot_storage_days
         self.archive_retention_days = archive_retention_days
+        # Minimum number of logged changes after which the log is compacted into a
+        # snapshot; the threshold grows with the number of messages
+        self.log_compaction_records = log_compaction_records
 
         # Timing state
         self.last_dump_time = time.time()
@@ -58,6 +74,10 @@ class MessageStorageHelper:
         """
         self.get_storage_path = storage_path_provider
         self.config = config
+        self._log: Optional[MessageLog] = None
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._last_write: Optional[Future] = None
+        self._records_since_compaction = 0
 
     def should_perform_dump(self) -> bool:
         """Check if periodic dump should be performed."""
@@ -74,33 +94,71 @@ class MessageStorageHelper:
         now = time.time()
         return now - self.config.last_archive_cleanup_time > (24 * 3600)  # Daily
 
+    def should_compact_log(self, message_count: int = 0) -> bool:
+        """Check if the message log has grown enough to be compacted.
+
+        The threshold scales with the history, so rewriting the snapshot costs O(1)
+        amortized per logged change.
+
+        Args:
+            message_count: Number of messages in the history
+        """
+        return self._records_since_compaction >= max(
+            self.config.log_compaction_records, message_count
+        )
+
+    def log_messages(self, messages: Iterable[Event]):
+        """
+        Append new or changed messages to the message log.
+
+        Args:
+            messages: Messages that were added to or modified in the history
+        """
+        records = []
+        for event in messages:
+            try:
+                records.append(
+                    MessageLog.put_record(event.event_id, self._serialize_event(event))
+                )
+            except Exception as e:
+                logger.warning(f"Failed to serialize message {event.event_id}: {e}")
+        self._records_since_compaction += len(records)
+        self._submit("Appending to message log", self._append_records, records)
+
+    def log_deletions(self, message_ids: Iterable[str]):
+        """
+        Record the removal of messages from the history in the message log.
+
+        Args:
+            message_ids: IDs of the removed messages
+        """
+        records = [MessageLog.delete_record(message_id) for message_id in message_ids]
+        self._records_since_compaction += len(records)
+        self._submit("Appending to message log", self._append_records, records)
+
     def periodic_dump(self, message_history: Dict[str, Event]):
         """
         Dump current in-memory data periodically to prevent data loss.
 
+        Compacts the message log into the main storage file and copies that file to a
+        timestamped backup.
+
         Args:
             message_history: Current message history dictionary
         """
         try:
-            storage_path = self.get_storage_path()
-
             # Create timestamped dump for safety
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-            # Save main message history (existing logic from mod)
+            # Save main message history
             self.save_message_history(message_history)
 
             # Also create a backup dump with timestamp
-            backup_file = storage_path / f"message_dump_{timestamp}.json"
-            history_data = self._serialize_message_history(message_history)
-
-            with open(backup_file, "w") as f:
-                json.dump(history_data, f, indent=2, default=str)
-
-            logger.info(f"Periodic dump completed: {len(history_data)} messages dumped")
+            self._submit("Periodic dump", self._write_backup_dump, timestamp)
 
-            # Cleanup old backup dumps (keep only last 24 hours)
-            self.cleanup_old_dumps()
+            logger.info(
+                f"Periodic dump scheduled: {len(message_history)} messages dumped"
+            )
 
             # Update timing
             self.config.last_dump_time = time.time()
@@ -110,28 +168,23 @@ class MessageStorageHelper:
 
     def save_message_history(self, message_history: Dict[str, Event]):
         """
-        Save message history to the main storage file.
+        Save message history to the main storage file and truncate the message log.
 
         Args:
             message_history: Current message history dictionary
         """
         try:
-            storage_path = self.get_storage_path()
-            history_file = storage_path / "message_history.json"
-
-            # Serialize message history
-            history_data = self._serialize_message_history(message_history)
-
-            # Write to file
-            with open(history_file, "w") as f:
-                json.dump(history_data, f, indent=2, default=str)
+            # Only the message list is copied here; serializing happens on the writer
+            messages = list(message_history.items())
+            self._records_since_compaction = 0
+            self._submit("Saving message history", self._compact_log, messages)
 
         except Exception as e:
             logger.error(f"Failed to save message history: {e}")
 
     def load_message_history(self) -> Dict[str, Event]:
         """
-        Load message history from storage.
+        Load message history from storage, replaying the message log.
 
         Returns:
             Dictionary of message_id -> Event objects
@@ -139,23 +192,20 @@ class MessageStorageHelper:
         message_history = {}
 
         try:
-            storage_path = self.get_storage_path()
-            history_file = storage_path / "message_history.json"
-
-            if history_file.exists():
-                with open(history_file, "r") as f:
-                    history_data = json.load(f)
-
-                # Reconstruct Event objects
-                for message_id, message_data in history_data.items():
-                    try:
-                        event = Event(**message_data)
-                        message_history[message_id] = event
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to deserialize message {message_id}: {e}"
-                        )
+            self.flush()
+            message_log = self._get_log()
+            history_data = message_log.replay()
+            self._records_since_compaction = message_log.records_since_compaction
+
+            # Reconstruct Event objects
+            for message_id, message_data in history_data.items():
+                try:
+                    event = Event(**message_data)
+                    message_history[message_id] = event
+                except Exception as e:
+                    logger.warning(f"Failed to deserialize message {message_id}: {e}")
 
+            if history_data:
                 logger.info(f"Loaded {len(message_history)} messages from storage")
 
         except Exception as e:
@@ -163,6 +213,23 @@ class MessageStorageHelper:
 
         return message_history
 
+    def flush(self):
+        """Wait until all pending writes have been applied."""
+        last_write = self._last_write
+        if last_write is not None:
+            last_write.result()
+            self._last_write = None
+
+    def close(self):
+        """Apply pending writes and release the log file and writer thread."""
+        self.flush()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+
     def cleanup_old_memory(
         self,
         message_history: Dict[str, Event],
@@ -217,6 +284,8 @@ class MessageStorageHelper:
                             ):
                                 del threads[thread_id]
 
+                self.log_deletions(removed_ids)
+
                 logger.info(
                     f"Cleaned up {len(old_message_ids)} old messages from memory"
                 )
@@ -265,6 +334,7 @@ class MessageStorageHelper:
                 if msg_id in message_history:
                     del message_history[msg_id]
                     removed_ids.append(msg_id)
+            self.log_deletions(removed_ids)
 
             logger.info(
                 f"Emergency cleanup: removed {excess_count} excess messages from memory"
@@ -281,15 +351,14 @@ class MessageStorageHelper:
         """
         Archive specific messages to daily files before removing from memory.
 
+        Each call writes new archive segments (``YYYY-MM-DD.json.gz``, then
+        ``YYYY-MM-DD.N.json.gz``) instead of rewriting the day's existing archive.
+
         Args:
             message_ids: List of message IDs to archive
             message_history: Current message history dictionary
         """
         try:
-            storage_path = self.get_storage_path()
-            archives_dir = storage_path / "daily_archives"
-            archives_dir.mkdir(exist_ok=True)
-
             # Group messages by date
             messages_by_date = {}
             for msg_id in message_ids:
@@ -312,37 +381,19 @@ class MessageStorageHelper:
                         f"Failed to serialize message {msg_id} for archiving: {e}"
                     )
 
-            # Save/append to daily archive files
-            for date_str, daily_messages in messages_by_date.items():
-                archive_file = archives_dir / f"{date_str}.json.gz"
-
-                existing_messages = {}
-                if archive_file.exists():
-                    # Load existing messages for this date
-                    try:
-                        with gzip.open(archive_file, "rt") as f:
-                            existing_messages = json.load(f)
-                    except Exception as e:
-                        logger.warning(
-                            f"Could not load existing archive {archive_file}: {e}"
-                        )
-
-                # Merge with new messages
-                existing_messages.update(daily_messages)
-
-                # Save back to compressed file
-                with gzip.open(archive_file, "wt") as f:
-                    json.dump(existing_messages, f, indent=2, default=str)
-
-                logger.info(
-                    f"Archived {len(daily_messages)} messages to {date_str}.json.gz"
-                )
+            if messages_by_date:
+                self._submit("Archiving", self._write_archives, messages_by_date)
 
         except Exception as e:
             logger.error(f"Archiving failed: {e}")
 
     def cleanup_expired_archives(self):
         """Remove archived files older than retention policy."""
+        self._submit("Archive cleanup", self._delete_expired_archives)
+        # Update timing
+        self.config.last_archive_cleanup_time = time.time()
+
+    def _delete_expired_archives(self):
         try:
             storage_path = self.get_storage_path()
             archives_dir = storage_path / "daily_archives"
@@ -358,10 +409,8 @@ class MessageStorageHelper:
             deleted_count = 0
             for archive_file in archives_dir.glob("*.json.gz"):
                 try:
-                    # Extract date from filename (YYYY-MM-DD.json.gz)
-                    date_str = archive_file.stem  # Remove .gz extension
-                    if date_str.endswith(".json"):
-                        date_str = date_str[:-5]  # Remove .json extension
+                    # Extract date from filename (YYYY-MM-DD[.N].json.gz)
+                    date_str = archive_file.name.split(".", 1)[0]
 
                     archive_date = datetime.fromisoformat(date_str).date()
 
@@ -377,9 +426,6 @@ class MessageStorageHelper:
             if deleted_count > 0:
                 logger.info(f"Cleaned up {deleted_count} expired archive files")
 
-            # Update timing
-            self.config.last_archive_cleanup_time = time.time()
-
         except Exception as e:
             logger.error(f"Archive cleanup failed: {e}")
 
@@ -396,12 +442,73 @@ class MessageStorageHelper:
         except Exception as e:
             logger.warning(f"Failed to cleanup old dumps: {e}")
 
+    def _submit(self, description: str, job: Callable, *args: Any):
+        """Run a storage job on the writer thread, or inline outside an event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            self._run_job(description, job, *args)
+            return
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="message-storage"
+            )
+        self._last_write = self._writer.submit(self._run_job, description, job, *args)
+
+    def _run_job(self, description: str, job: Callable, *args: Any):
+        try:
+            job(*args)
+        except Exception as e:
+            logger.error(f"{description} failed: {e}")
+
+    def _get_log(self) -> MessageLog:
+        storage_path = self.get_storage_path()
+        if self._log is None or self._log.storage_path != storage_path:
+            if self._log is not None:
+                self._log.close()
+            self._log = MessageLog(storage_path)
+        return self._log
+
+    def _append_records(self, records: List[Dict[str, Any]]):
+        self._get_log().append(records)
+
+    def _compact_log(self, messages: List[Tuple[str, Event]]):
+        self._get_log().compact(self._serialize_message_history(messages))
+
+    def _write_backup_dump(self, timestamp: str):
+        storage_path = self.get_storage_path()
+        backup_file = storage_path / f"message_dump_{timestamp}.json"
+        shutil.copyfile(self._get_log().snapshot_file, backup_file)
+
+        # Cleanup old backup dumps (keep only last 24 hours)
+        self.cleanup_old_dumps()
+
+    def _write_archives(self, messages_by_date: Dict[str, Dict[str, Any]]):
+        archives_dir = self.get_storage_path() / "daily_archives"
+        archives_dir.mkdir(exist_ok=True)
+
+        for date_str, daily_messages in messages_by_date.items():
+            archive_file = archives_dir / f"{date_str}.json.gz"
+            segment = 0
+            while archive_file.exists():
+                segment += 1
+                archive_file = archives_dir / f"{date_str}.{segment}.json.gz"
+
+            # Write to a temporary name so readers never see a partial archive
+            temp_file = archives_dir / f".{archive_file.name}.tmp"
+            with gzip.open(temp_file, "wt") as f:
+                json.dump(daily_messages, f, default=str)
+            temp_file.replace(archive_file)
+
+            logger.info(f"Archived {len(daily_messages)} messages to {archive_file.name}")
+
     def _serialize_message_history(
-        self, message_history: Dict[str, Event]
+        self, messages: Iterable[Tuple[str, Event]]
     ) -> Dict[str, Any]:
-        """Serialize message history to JSON-compatible format."""
+        """Serialize (message_id, event) pairs to JSON-compatible format."""
         history_data = {}
-        for message_id, event in message_history.items():
+        for message_id, event in messages:
             try:
                 history_data[message_id] = self._serialize_event(event)
             except Exception as e:
@@ -434,6 +541,8 @@ class MessageStorageHelper:
                 "storage_path": str(storage_path),
                 "main_file_exists": (storage_path / "message_history.json").exists(),
                 "main_file_size_mb": 0,
+                "log_file_size_mb": 0,
+                "log_records_since_compaction": self._records_since_compaction,
                 "daily_archives_count": 0,
                 "daily_archives_size_mb": 0,
                 "dump_files_count": 0,
@@ -445,6 +554,11 @@ class MessageStorageHelper:
             if main_file.exists():
                 stats["main_file_size_mb"] = main_file.stat().st_size / (1024 * 1024)
 
+            # Log file stats
+            log_file = storage_path / LOG_FILE_NAME
+            if log_file.exists():
+                stats["log_file_size_mb"] = log_file.stat().st_size / (1024 * 1024)
+
             # Archive stats
             archives_dir = storage_path / "daily_archives"
             if archives_dir.exists():
@@ -23,6 +23,7 @@ from pathlib import Path
 from openagents.core.base_mod import BaseMod, mod_event_handler
 from openagents.models.event import Event
 from openagents.models.event_response import EventResponse
+from .message_index import MessageHistory
 from .message_storage_helper import MessageStorageHelper, MessageStorageConfig
 from .thread_messages import (
     ChannelMessage,
@@ -130,6 +131,7 @@ class ThreadMessagingNetworkMod(BaseMod):
             dump_interval_minutes=self.config.get("dump_interval_minutes", 10),
             hot_storage_days=self.config.get("hot_storage_days", 7),
             archive_retention_days=self.config.get("archive_retention_days", 180),
+            log_compaction_records=self.config.get("log_compaction_records", 1000),
         )
         self.storage_helper = MessageStorageHelper(
             self.get_storage_path, storage_config
@@ -139,7 +141,7 @@ class ThreadMessagingNetworkMod(BaseMod):
 
         # Initialize mod state
         self.active_agents: Set[str] = set()
-        self.message_history: Dict[str, Event] = {}  # message_id -> message
+        self.message_history = MessageHistory()  # message_id -> message
         self.threads: Dict[str, MessageThread] = {}  # thread_id -> MessageThread
         self.message_to_thread: Dict[str, str] = {}  # message_id -> thread_id
         self.max_history_size = 1000  # Default limit for backward compatibility
@@ -160,10 +162,6 @@ class ThreadMessagingNetworkMod(BaseMod):
         # File storage will be set up after workspace binding
         self.file_storage_path: Optional[Path] = None
 
-        # Enhanced periodic persistence tracking
-        self._message_count_since_save = 0
-        self._save_interval = 50  # Save every 50 messages
-
         logger.info(f"Initializing Thread Messaging network mod")
 
     def _get_request_id(self, message) -> str:
@@ -311,7 +309,9 @@ class ThreadMessagingNetworkMod(BaseMod):
 
     def _load_message_history(self):
         """Load message history from storage using helper."""
-        self.message_history = self.storage_helper.load_message_history()
+        self.message_history = MessageHistory(
+            self.storage_helper.load_message_history()
+        )
 
     def _save_message_history(self):
         """Save message history to storage using helper."""
@@ -336,6 +336,11 @@ class ThreadMessagingNetworkMod(BaseMod):
         Returns:
             bool: True if shutdown was successful, False otherwise
         """
+        # Save data to storage before clearing it
+        self._save_file_metadata()
+        self._save_message_history()
+        self.storage_helper.close()
+
         # Clear all state
         self.active_agents.clear()
         self.message_history.clear()
@@ -349,10 +354,6 @@ class ThreadMessagingNetworkMod(BaseMod):
 
         self.channels.clear()
 
-        # Save data to storage
-        self._save_file_metadata()
-        self._save_message_history()
-
         return True
 
     async def handle_register_agent(
@@ -646,26 +647,45 @@ class ThreadMessagingNetworkMod(BaseMod):
         current_reactions = self._get_reactions_for_message(target_message_id)
         total_reactions = len(current_reactions.get(reaction_type, []))
 
-        for agent_id in notify_agents:
-            notification = Event(
-                event_name="thread.reaction.notification",  # Standard reaction notification event
-                source_id=reacting_agent,
-                destination_id=agent_id,
-                payload={
-                    "target_message_id": target_message_id,
-                    "reaction_type": reaction_type,
-                    "reacting_agent": reacting_agent,
-                    "action": action,
-                    "total_reactions": total_reactions,
-                },
+        notification = Event(
+            event_name="thread.reaction.notification",  # Standard reaction notification event
+            source_id=reacting_agent,
+            destination_id=self._notification_destination(
+                notify_agents, target_message.payload.get("channel") if target_message.payload else None
+            ),
+            payload={
+                "target_message_id": target_message_id,
+                "reaction_type": reaction_type,
+                "reacting_agent": reacting_agent,
+                "action": action,
+                "total_reactions": total_reactions,
+            },
+        )
+        try:
+            await self.network.process_event(notification, recipient_ids=notify_agents)
+            logger.debug(
+                f"Sent reaction notification to {notify_agents}: {action} {reaction_type}"
             )
-            try:
-                await self.network.process_event(notification)
-                logger.debug(
-                    f"Sent reaction notification to {agent_id}: {action} {reaction_type}"
-                )
-            except Exception as e:
-                logger.error(f"Failed to send reaction notification to {agent_id}: {e}")
+        except Exception as e:
+            logger.error(f"Failed to send reaction notification to {notify_agents}: {e}")
+
+    def _notification_destination(
+        self, notify_agents: Set[str], channel: Optional[str] = None
+    ) -> Optional[str]:
+        """Get the destination of a notification multicast to a set of agents.
+
+        Args:
+            notify_agents: The agents receiving the notification
+            channel: The channel the notification is about, if any
+
+        Returns:
+            Optional[str]: The channel, the single recipient, or None
+        """
+        if channel:
+            return f"channel:{channel}"
+        if len(notify_agents) == 1:
+            return next(iter(notify_agents))
+        return None
 
     def _create_reaction_response(
         self,
@@ -1176,47 +1196,36 @@ class ThreadMessagingNetworkMod(BaseMod):
             f"Broadcasting channel message to {len(notify_agents)} agents in {channel}: {notify_agents}"
         )
 
-        # Create a mod message to notify other agents about the new channel message
-        for agent_id in notify_agents:
-            logger.info(
-                f"🔧 THREAD MESSAGING: Creating notification for agent: {agent_id}"
-            )
-
-            # Extract payload from original message and add notification metadata
-            original_payload = message.payload or {}
-            notification_payload = original_payload.copy()
-            notification_payload["channel"] = channel
-            notification_payload["original_event_id"] = message.event_id  # Store original for reference
+        # Extract payload from original message and add notification metadata
+        original_payload = message.payload or {}
+        notification_payload = original_payload.copy()
+        notification_payload["channel"] = channel
+        notification_payload["original_event_id"] = message.event_id  # Store original for reference
+
+        # A single notification is processed once and fanned out to all members at the
+        # queue level. Don't reuse event_id from the original message, so the
+        # notification is not deduplicated by the event gateway.
+        notification = Event(
+            event_name="thread.channel_message.notification",
+            source_id=message.source_id,  # Keep original sender
+            timestamp=message.timestamp,  # Keep original timestamp
+            payload=notification_payload,
+            direction="inbound",
+            destination_id=f"channel:{channel}",
+        )
 
-            # Note: Don't reuse event_id from original message - each notification needs
-            # a unique event_id to avoid being deduplicated by event gateway
-            notification = Event(
-                event_name="thread.channel_message.notification",
-                source_id=message.source_id,  # Keep original sender
-                timestamp=message.timestamp,  # Keep original timestamp
-                payload=notification_payload,
-                direction="inbound",
-                destination_id=agent_id,
-            )
+        try:
+            await self.network.process_event(notification, recipient_ids=notify_agents)
             logger.info(
-                f"🔧 THREAD MESSAGING: Notification target_id will be: {notification.destination_id}"
+                f"✅ THREAD MESSAGING: Sent channel message notification to {len(notify_agents)} agents"
             )
-            logger.info(
-                f"🔧 THREAD MESSAGING: Notification content: {notification.content}"
+        except Exception as e:
+            logger.error(
+                f"❌ THREAD MESSAGING: Failed to send channel message notification to {notify_agents}: {e}"
             )
+            import traceback
 
-            try:
-                await self.network.process_event(notification)
-                logger.info(
-                    f"✅ THREAD MESSAGING: Sent channel message notification to agent {agent_id}"
-                )
-            except Exception as e:
-                logger.error(
-                    f"❌ THREAD MESSAGING: Failed to send channel message notification to {agent_id}: {e}"
-                )
-                import traceback
-
-                traceback.print_exc()
+            traceback.print_exc()
 
     async def _process_direct_message(self, message: Event) -> None:
         """Process a direct message.
@@ -1314,42 +1323,41 @@ class ThreadMessagingNetworkMod(BaseMod):
                 f"🔧 THREAD MESSAGING: Sending reply notifications to {len(notify_agents)} agents: {notify_agents}"
             )
 
-            # Send notifications to each interested agent
-            for agent_id in notify_agents:
+            if not notify_agents:
+                return
+
+            # Create notification with flat payload structure
+            original_payload = reply_message.payload or {}
+            notification_payload = original_payload.copy()
+            notification_payload["original_message_id"] = original_message.event_id
+            notification_payload["original_sender"] = original_message.source_id
+            notification_payload["reply_event_id"] = reply_message.event_id  # Store original for reference
+
+            # A single notification is fanned out to all interested agents. Don't reuse
+            # event_id from the reply message, so it is not deduplicated by the event gateway.
+            notification = Event(
+                event_name="thread.reply.notification",
+                source_id=reply_message.source_id,  # Keep original reply sender
+                timestamp=reply_message.timestamp,  # Keep original timestamp
+                payload=notification_payload,
+                direction="inbound",
+                destination_id=self._notification_destination(
+                    notify_agents, original_payload.get("channel")
+                ),
+            )
+
+            try:
+                await self.network.process_event(notification, recipient_ids=notify_agents)
                 logger.info(
-                    f"🔧 THREAD MESSAGING: Creating reply notification for agent: {agent_id}"
+                    f"✅ THREAD MESSAGING: Sent reply notification to {len(notify_agents)} agents"
                 )
-
-                # Create notification with flat payload structure
-                original_payload = reply_message.payload or {}
-                notification_payload = original_payload.copy()
-                notification_payload["original_message_id"] = original_message.event_id
-                notification_payload["original_sender"] = original_message.source_id
-                notification_payload["reply_event_id"] = reply_message.event_id  # Store original for reference
-
-                # Note: Don't reuse event_id from reply message - each notification needs
-                # a unique event_id to avoid being deduplicated by event gateway
-                notification = Event(
-                    event_name="thread.reply.notification",
-                    source_id=reply_message.source_id,  # Keep original reply sender
-                    timestamp=reply_message.timestamp,  # Keep original timestamp
-                    payload=notification_payload,
-                    direction="inbound",
-                    destination_id=agent_id,
+            except Exception as e:
+                logger.error(
+                    f"❌ THREAD MESSAGING: Failed to send reply notification to {notify_agents}: {e}"
                 )
+                import traceback
 
-                try:
-                    await self.network.process_event(notification)
-                    logger.info(
-                        f"✅ THREAD MESSAGING: Sent reply notification to agent {agent_id}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"❌ THREAD MESSAGING: Failed to send reply notification to {agent_id}: {e}"
-                    )
-                    import traceback
-
-                    traceback.print_exc()
+                traceback.print_exc()
 
         except Exception as e:
             logger.error(
@@ -1626,137 +1634,14 @@ class ThreadMessagingNetworkMod(BaseMod):
                 "request_id": self._get_request_id(message),
             }
 
-        # Find channel messages
-        channel_messages = []
-        for msg_id, msg in self.message_history.items():
-            # Check if this is a channel message for the requested channel
-            # Handle both Event objects and ChannelMessage objects for backward compatibility
-            is_channel_message = False
-            msg_channel = None
-
-            if isinstance(msg, Event):
-                # For Event objects, check the payload for channel information
-                if msg.payload and "channel" in msg.payload:
-                    msg_channel = msg.payload["channel"]
-                    # Also check if it's a channel message type
-                    message_type = msg.payload.get("message_type", "")
-                    is_channel_message = msg_channel == channel and (
-                        "channel" in message_type
-                        or message_type == "channel_message"
-                        or message_type == "reply"
-                        or message_type == "reply_message"
-                    )
-                elif msg.event_name and "channel" in msg.event_name:
-                    # Check for channel-related events
-                    is_channel_message = True
-                    # Try to extract channel from destination_id if available
-                    if msg.destination_id and msg.destination_id.startswith("channel:"):
-                        msg_channel = msg.destination_id.split(":", 1)[1]
-                    else:
-                        msg_channel = channel  # Assume it's the requested channel
-
-            else:
-                # For backward compatibility with ChannelMessage objects
-                from .thread_messages import ChannelMessage
-
-                if isinstance(msg, ChannelMessage) and msg.channel == channel:
-                    is_channel_message = True
-                    msg_channel = msg.channel
-
-            if is_channel_message and msg_channel == channel:
-                # Extract message data based on the type of object
-                if isinstance(msg, Event):
-                    # For Event objects, convert to the expected message format
-                    # Extract content (text and files) from payload
-                    content_data = self._extract_content_from_event(msg)
-
-                    msg_data = {
-                        "message_id": msg.event_id,
-                        "sender_id": msg.source_id,
-                        "timestamp": msg.timestamp,
-                        "content": content_data,
-                        "channel": msg_channel,
-                        "message_type": (
-                            msg.payload.get("message_type", "channel_message")
-                            if msg.payload
-                            else "channel_message"
-                        ),
-                        "reply_to_id": (
-                            msg.payload.get("reply_to_id") if msg.payload else None
-                        ),
-                        "thread_level": (
-                            msg.payload.get("thread_level", 1) if msg.payload else 1
-                        ),
-                        "quoted_message_id": (
-                            msg.payload.get("quoted_message_id")
-                            if msg.payload
-                            else None
-                        ),
-                        "quoted_text": (
-                            msg.payload.get("quoted_text") if msg.payload else None
-                        ),
-                    }
-                else:
-                    # For ChannelMessage objects, use the existing model_dump
-                    msg_data = msg.model_dump()
-
-                msg_data["thread_info"] = None
-
-                # Add thread information if this message is part of a thread
-                if include_threads and msg_id in self.message_to_thread:
-                    thread_id = self.message_to_thread[msg_id]
-                    thread = self.threads[thread_id]
-                    msg_data["thread_info"] = {
-                        "thread_id": thread_id,
-                        "is_root": (msg_id == thread.root_message_id),
-                        "thread_structure": (
-                            thread.get_thread_structure() if include_threads else None
-                        ),
-                    }
-
-                # Add reactions to the message
-                msg_reactions = msg.payload.get("reactions", {}) if msg.payload else {}
-                msg_data["reactions"] = {
-                    reaction_type: len(agents)
-                    for reaction_type, agents in msg_reactions.items()
-                    if agents  # Only include reactions with at least one agent
-                }
-
-                channel_messages.append(msg_data)
-
-            # Also include replies if they're in this channel
-            elif (
-                include_threads
-                and isinstance(msg, ReplyMessage)
-                and msg.channel == channel
-            ):
-                msg_data = msg.model_dump()
-                msg_data["thread_info"] = None
-
-                if msg_id in self.message_to_thread:
-                    thread_id = self.message_to_thread[msg_id]
-                    msg_data["thread_info"] = {
-                        "thread_id": thread_id,
-                        "is_root": False,
-                        "thread_level": msg.thread_level,
-                    }
-
-                # Add reactions to the reply message
-                msg_reactions = msg.payload.get("reactions", {}) if msg.payload else {}
-                msg_data["reactions"] = {
-                    reaction_type: len(agents)
-                    for reaction_type, agents in msg_reactions.items()
-                    if agents  # Only include reactions with at least one agent
-                }
-
-                channel_messages.append(msg_data)
-
-        # Sort by timestamp (newest first - reverse chronological order)
-        channel_messages.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
-
-        # Apply pagination
-        total_count = len(channel_messages)
-        paginated_messages = channel_messages[offset : offset + limit]
+        # Look up the requested page in the channel index
+        page_ids, total_count = self.message_history.channel_page(channel, offset, limit)
+        paginated_messages = [
+            self._format_channel_message(
+                msg_id, self.message_history[msg_id], channel, include_threads
+            )
+            for msg_id in page_ids
+        ]
 
         logger.debug(
             f"Retrieved {len(paginated_messages)} channel messages for {channel}"
@@ -1795,102 +1680,17 @@ class ThreadMessagingNetworkMod(BaseMod):
                 "request_id": self._get_request_id(message),
             }
 
-        # Find direct messages between the two agents
-        direct_messages = []
+        # Look up the requested page in the conversation index
         logger.debug(
             f"Direct message retrieval: Looking for messages between {agent_id} and {target_agent_id}"
         )
-        logger.debug(f"Total messages in history: {len(self.message_history)}")
-
-        for msg_id, msg in self.message_history.items():
-            # Check if this is a direct message between the agents
-            # Direct messages have target_agent_id in payload and destination_id like "agent:X"
-            is_direct_message = (
-                msg.payload
-                and "target_agent_id" in msg.payload
-                and msg.destination_id
-                and msg.destination_id.startswith("agent:")
-            )
-
-            if is_direct_message:
-                payload_target = msg.payload["target_agent_id"]
-                # Check if this message is between the requesting agents
-                is_direct_msg_between_agents = (
-                    msg.source_id == agent_id and payload_target == target_agent_id
-                ) or (msg.source_id == target_agent_id and payload_target == agent_id)
-                if is_direct_msg_between_agents:
-                    logger.debug(
-                        f"Found direct message: {msg_id} from {msg.source_id} to {payload_target}"
-                    )
-            else:
-                is_direct_msg_between_agents = False
-
-            if is_direct_msg_between_agents:
-                msg_data = msg.model_dump()
-                msg_data["thread_info"] = None
-
-                # Add thread information if this message is part of a thread
-                if include_threads and msg_id in self.message_to_thread:
-                    thread_id = self.message_to_thread[msg_id]
-                    thread = self.threads[thread_id]
-                    msg_data["thread_info"] = {
-                        "thread_id": thread_id,
-                        "is_root": (msg_id == thread.root_message_id),
-                        "thread_structure": (
-                            thread.get_thread_structure() if include_threads else None
-                        ),
-                    }
-
-                # Add reactions to the direct message
-                msg_reactions = msg.payload.get("reactions", {}) if msg.payload else {}
-                msg_data["reactions"] = {
-                    reaction_type: len(agents)
-                    for reaction_type, agents in msg_reactions.items()
-                    if agents  # Only include reactions with at least one agent
-                }
-
-                direct_messages.append(msg_data)
-
-            # Also include replies if they're between these agents
-            elif (
-                include_threads and isinstance(msg, ReplyMessage) and msg.destination_id
-            ):
-                is_reply_between_agents = (
-                    msg.source_id == agent_id and msg.destination_id == target_agent_id
-                ) or (
-                    msg.source_id == target_agent_id and msg.destination_id == agent_id
-                )
-
-                if is_reply_between_agents:
-                    msg_data = msg.model_dump()
-                    msg_data["thread_info"] = None
-
-                    if msg_id in self.message_to_thread:
-                        thread_id = self.message_to_thread[msg_id]
-                        msg_data["thread_info"] = {
-                            "thread_id": thread_id,
-                            "is_root": False,
-                            "thread_level": msg.thread_level,
-                        }
-
-                    # Add reactions to the reply message
-                    msg_reactions = (
-                        msg.payload.get("reactions", {}) if msg.payload else {}
-                    )
-                    msg_data["reactions"] = {
-                        reaction_type: len(agents)
-                        for reaction_type, agents in msg_reactions.items()
-                        if agents  # Only include reactions with at least one agent
-                    }
-
-                    direct_messages.append(msg_data)
-
-        # Sort by timestamp (oldest first - chronological order)
-        direct_messages.sort(key=lambda x: x.get("timestamp", 0), reverse=False)
-
-        # Apply pagination
-        total_count = len(direct_messages)
-        paginated_messages = direct_messages[offset : offset + limit]
+        page_ids, total_count = self.message_history.conversation_page(
+            agent_id, target_agent_id, offset, limit
+        )
+        paginated_messages = [
+            self._format_direct_message(msg_id, self.message_history[msg_id], include_threads)
+            for msg_id in page_ids
+        ]
 
         logger.debug(
             f"Retrieved {len(paginated_messages)} direct messages with {target_agent_id}"
@@ -1907,6 +1707,85 @@ class ThreadMessagingNetworkMod(BaseMod):
             "request_id": self._get_request_id(message),
         }
 
+    def _format_channel_message(
+        self, msg_id: str, msg: Event, channel: str, include_threads: bool
+    ) -> Dict[str, Any]:
+        """Build the retrieval data of a channel message.
+
+        Args:
+            msg_id: ID of the message
+            msg: The message
+            channel: The channel the message was retrieved from
+            include_threads: Whether to include thread information
+
+        Returns:
+            Dict[str, Any]: The message data
+        """
+        # Extract content (text and files) from payload
+        content_data = self._extract_content_from_event(msg)
+
+        msg_data = {
+            "message_id": msg.event_id,
+            "sender_id": msg.source_id,
+            "timestamp": msg.timestamp,
+            "content": content_data,
+            "channel": channel,
+            "message_type": (
+                msg.payload.get("message_type", "channel_message")
+                if msg.payload
+                else "channel_message"
+            ),
+            "reply_to_id": (msg.payload.get("reply_to_id") if msg.payload else None),
+            "thread_level": (msg.payload.get("thread_level", 1) if msg.payload else 1),
+            "quoted_message_id": (
+                msg.payload.get("quoted_message_id") if msg.payload else None
+            ),
+            "quoted_text": (msg.payload.get("quoted_text") if msg.payload else None),
+        }
+        self._add_thread_and_reactions(msg_id, msg, msg_data, include_threads)
+        return msg_data
+
+    def _format_direct_message(
+        self, msg_id: str, msg: Event, include_threads: bool
+    ) -> Dict[str, Any]:
+        """Build the retrieval data of a direct message.
+
+        Args:
+            msg_id: ID of the message
+            msg: The message
+            include_threads: Whether to include thread information
+
+        Returns:
+            Dict[str, Any]: The message data
+        """
+        msg_data = msg.model_dump()
+        self._add_thread_and_reactions(msg_id, msg, msg_data, include_threads)
+        return msg_data
+
+    def _add_thread_and_reactions(
+        self, msg_id: str, msg: Event, msg_data: Dict[str, Any], include_threads: bool
+    ) -> None:
+        """Add thread information and reaction counts to retrieved message data."""
+        msg_data["thread_info"] = None
+
+        # Add thread information if this message is part of a thread
+        if include_threads and msg_id in self.message_to_thread:
+            thread_id = self.message_to_thread[msg_id]
+            thread = self.threads[thread_id]
+            msg_data["thread_info"] = {
+                "thread_id": thread_id,
+                "is_root": (msg_id == thread.root_message_id),
+                "thread_structure": thread.get_thread_structure(),
+            }
+
+        # Add reactions to the message
+        msg_reactions = msg.payload.get("reactions", {}) if msg.payload else {}
+        msg_data["reactions"] = {
+            reaction_type: len(agents)
+            for reaction_type, agents in msg_reactions.items()
+            if agents  # Only include reactions with at least one agent
+        }
+
     async def _process_add_reaction(self, message: Event) -> Dict[str, Any]:
         """Process adding a reaction to a message."""
         target_message_id = ReactionMessage.get_target_message_id(message)
@@ -1933,6 +1812,7 @@ class ThreadMessagingNetworkMod(BaseMod):
         if agent_id not in target_message.payload["reactions"][reaction_type]:
             # Add reaction directly to the target message payload
             target_message.payload["reactions"][reaction_type].append(agent_id)
+            self.storage_helper.log_messages([target_message])
             success = True
             logger.debug(
                 f"{agent_id} added {reaction_type} reaction to message {target_message_id}"
@@ -1988,6 +1868,8 @@ class ThreadMessagingNetworkMod(BaseMod):
             if not target_message.payload["reactions"]:
                 del target_message.payload["reactions"]
 
+            self.storage_helper.log_messages([target_message])
+
             # Send notification to relevant agents
             await self._send_reaction_notification(
                 target_message_id, reaction_type, agent_id, "removed"
@@ -2040,6 +1922,8 @@ class ThreadMessagingNetworkMod(BaseMod):
             if not target_message.payload["reactions"]:
                 del target_message.payload["reactions"]
 
+            self.storage_helper.log_messages([target_message])
+
             # Send notification to relevant agents
             await self._send_reaction_notification(
                 target_message_id, reaction_type, agent_id, "removed"
@@ -2047,6 +1931,7 @@ class ThreadMessagingNetworkMod(BaseMod):
         else:
             # Add reaction
             target_message.payload["reactions"][reaction_type].append(agent_id)
+            self.storage_helper.log_messages([target_message])
             action_taken = "add"
             logger.debug(
                 f"{agent_id} toggled (added) {reaction_type} reaction to message {target_message_id}"
@@ -2087,6 +1972,7 @@ class ThreadMessagingNetworkMod(BaseMod):
             message: The message to add
         """
         self.message_history[message.event_id] = message
+        self.storage_helper.log_messages([message])
 
         # Check if we need periodic dump using helper
         if self.storage_helper.should_perform_dump():
@@ -2110,11 +1996,9 @@ class ThreadMessagingNetworkMod(BaseMod):
             if msg_id in self.message_to_thread:
                 del self.message_to_thread[msg_id]
 
-        # Periodic persistence to storage (keep existing logic for compatibility)
-        self._message_count_since_save += 1
-        if self._message_count_since_save >= self._save_interval:
+        # Compact the message log into a snapshot once it has grown large enough
+        if self.storage_helper.should_compact_log(len(self.message_history)):
             self._save_message_history()
-            self._message_count_since_save = 0
 
     def _periodic_dump(self):
         """Dump current in-memory data periodically to prevent data loss. [DEPRECATED - use storage helper]"""
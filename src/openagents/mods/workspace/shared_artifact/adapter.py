@@ -26,10 +26,6 @@ class SharedArtifactAdapter(BaseModAdapter):
         """Initialize the shared artifact adapter for an agent."""
         super().__init__(mod_name="shared_artifact")
 
-        # Track pending requests
-        self.pending_requests: Dict[str, Dict[str, Any]] = {}
-        self.completed_requests: Dict[str, Dict[str, Any]] = {}
-
         logger.info(f"Initializing Shared Artifact adapter for agent")
 
     def initialize(self) -> bool:
@@ -47,10 +43,6 @@ class SharedArtifactAdapter(BaseModAdapter):
         Returns:
             bool: True if shutdown was successful, False otherwise
         """
-        # Clear all state
-        self.pending_requests.clear()
-        self.completed_requests.clear()
-
         return True
 
     async def process_incoming_mod_message(self, message: Event) -> None:
@@ -64,17 +56,7 @@ class SharedArtifactAdapter(BaseModAdapter):
         # Handle different event types based on event name
         event_name = message.event_name
 
-        if event_name == "shared_artifact.create.response":
-            await self._handle_artifact_create_response(message)
-        elif event_name == "shared_artifact.get.response":
-            await self._handle_artifact_get_response(message)
-        elif event_name == "shared_artifact.update.response":
-            await self._handle_artifact_update_response(message)
-        elif event_name == "shared_artifact.delete.response":
-            await self._handle_artifact_delete_response(message)
-        elif event_name == "shared_artifact.list.response":
-            await self._handle_artifact_list_response(message)
-        elif event_name == "shared_artifact.notification.created":
+        if event_name == "shared_artifact.notification.created":
             await self._handle_artifact_created_notification(message)
         elif event_name == "shared_artifact.notification.updated":
             await self._handle_artifact_updated_notification(message)
@@ -122,39 +104,23 @@ class SharedArtifactAdapter(BaseModAdapter):
                 },
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "create",
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent artifact creation request")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(50):  # 50 * 0.2 = 10 seconds
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        artifact_id = result.get("artifact_id")
-                        logger.info(f"Artifact created: {artifact_id}")
-                        return artifact_id
-                    else:
-                        logger.error(
-                            f"Artifact creation failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return None
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning("Artifact creation timed out")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return None
+            logger.debug(f"Sending artifact creation request")
+
+            # Send event and wait for the response
+            result = await self.request(message, timeout=10)
+            if result is None:
+                logger.warning("Artifact creation timed out")
+                return None
+
+            if result.get("success"):
+                artifact_id = result.get("artifact_id")
+                logger.info(f"Artifact created: {artifact_id}")
+                return artifact_id
+            else:
+                logger.error(
+                    f"Artifact creation failed: {result.get('error', 'Unknown error')}"
+                )
+                return None
 
         except Exception as e:
             logger.error(f"Error creating artifact: {e}")
@@ -183,39 +149,22 @@ class SharedArtifactAdapter(BaseModAdapter):
                 payload={"artifact_id": artifact_id},
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "get",
-                "artifact_id": artifact_id,
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent artifact get request for {artifact_id}")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(50):  # 50 * 0.2 = 10 seconds
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        logger.info(f"Artifact retrieved: {artifact_id}")
-                        return result
-                    else:
-                        logger.error(
-                            f"Artifact retrieval failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return None
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning(f"Artifact retrieval timed out for {artifact_id}")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return None
+            logger.debug(f"Sending artifact get request for {artifact_id}")
+
+            # Send event and wait for the response
+            result = await self.request(message, timeout=10)
+            if result is None:
+                logger.warning(f"Artifact retrieval timed out for {artifact_id}")
+                return None
+
+            if result.get("success"):
+                logger.info(f"Artifact retrieved: {artifact_id}")
+                return result
+            else:
+                logger.error(
+                    f"Artifact retrieval failed: {result.get('error', 'Unknown error')}"
+                )
+                return None
 
         except Exception as e:
             logger.error(f"Error retrieving artifact: {e}")
@@ -247,39 +196,22 @@ class SharedArtifactAdapter(BaseModAdapter):
                 payload={"artifact_id": artifact_id, "content": content},
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "update",
-                "artifact_id": artifact_id,
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent artifact update request for {artifact_id}")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(50):  # 50 * 0.2 = 10 seconds
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        logger.info(f"Artifact updated: {artifact_id}")
-                        return True
-                    else:
-                        logger.error(
-                            f"Artifact update failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return False
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning(f"Artifact update timed out for {artifact_id}")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return False
+            logger.debug(f"Sending artifact update request for {artifact_id}")
+
+            # Send event and wait for the response
+            result = await self.request(message, timeout=10)
+            if result is None:
+                logger.warning(f"Artifact update timed out for {artifact_id}")
+                return False
+
+            if result.get("success"):
+                logger.info(f"Artifact updated: {artifact_id}")
+                return True
+            else:
+                logger.error(
+                    f"Artifact update failed: {result.get('error', 'Unknown error')}"
+                )
+                return False
 
         except Exception as e:
             logger.error(f"Error updating artifact: {e}")
@@ -310,39 +242,22 @@ class SharedArtifactAdapter(BaseModAdapter):
                 payload={"artifact_id": artifact_id},
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "delete",
-                "artifact_id": artifact_id,
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent artifact delete request for {artifact_id}")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(50):  # 50 * 0.2 = 10 seconds
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        logger.info(f"Artifact deleted: {artifact_id}")
-                        return True
-                    else:
-                        logger.error(
-                            f"Artifact deletion failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return False
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning(f"Artifact deletion timed out for {artifact_id}")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return False
+            logger.debug(f"Sending artifact delete request for {artifact_id}")
+
+            # Send event and wait for the response
+            result = await self.request(message, timeout=10)
+            if result is None:
+                logger.warning(f"Artifact deletion timed out for {artifact_id}")
+                return False
+
+            if result.get("success"):
+                logger.info(f"Artifact deleted: {artifact_id}")
+                return True
+            else:
+                logger.error(
+                    f"Artifact deletion failed: {result.get('error', 'Unknown error')}"
+                )
+                return False
 
         except Exception as e:
             logger.error(f"Error deleting artifact: {e}")
@@ -375,99 +290,28 @@ class SharedArtifactAdapter(BaseModAdapter):
                 payload=payload,
             )
 
-            # Store pending request
-            self.pending_requests[message.event_id] = {
-                "action": "list",
-                "timestamp": message.timestamp,
-            }
-
-            # Send event
-            await self.connector.send_event(message)
-            logger.debug(f"Sent artifact list request")
-
-            # Wait for response
-            import asyncio
-
-            for _ in range(50):  # 50 * 0.2 = 10 seconds
-                if message.event_id in self.completed_requests:
-                    result = self.completed_requests.pop(message.event_id)
-                    if result.get("success"):
-                        artifacts = result.get("artifacts", [])
-                        logger.info(f"Listed {len(artifacts)} artifacts")
-                        return artifacts
-                    else:
-                        logger.error(
-                            f"Artifact listing failed: {result.get('error', 'Unknown error')}"
-                        )
-                        return None
-
-                await asyncio.sleep(0.2)
-
-            # Timeout
-            logger.warning("Artifact listing timed out")
-            if message.event_id in self.pending_requests:
-                del self.pending_requests[message.event_id]
-            return None
+            logger.debug(f"Sending artifact list request")
+
+            # Send event and wait for the response
+            result = await self.request(message, timeout=10)
+            if result is None:
+                logger.warning("Artifact listing timed out")
+                return None
+
+            if result.get("success"):
+                artifacts = result.get("artifacts", [])
+                logger.info(f"Listed {len(artifacts)} artifacts")
+                return artifacts
+            else:
+                logger.error(
+                    f"Artifact listing failed: {result.get('error', 'Unknown error')}"
+                )
+                return None
 
         except Exception as e:
             logger.error(f"Error listing artifacts: {e}")
             return None
 
-    async def _handle_artifact_create_response(self, message: Event) -> None:
-        """Handle artifact create response.
-
-        Args:
-            message: The response message
-        """
-        request_id = message.response_to
-        if request_id and request_id in self.pending_requests:
-            self.completed_requests[request_id] = message.payload or {}
-            del self.pending_requests[request_id]
-
-    async def _handle_artifact_get_response(self, message: Event) -> None:
-        """Handle artifact get response.
-
-        Args:
-            message: The response message
-        """
-        request_id = message.response_to
-        if request_id and request_id in self.pending_requests:
-            self.completed_requests[request_id] = message.payload or {}
-            del self.pending_requests[request_id]
-
-    async def _handle_artifact_update_response(self, message: Event) -> None:
-        """Handle artifact update response.
-
-        Args:
-            message: The response message
-        """
-        request_id = message.response_to
-        if request_id and request_id in self.pending_requests:
-            self.completed_requests[request_id] = message.payload or {}
-            del self.pending_requests[request_id]
-
-    async def _handle_artifact_delete_response(self, message: Event) -> None:
-        """Handle artifact delete response.
-
-        Args:
-            message: The response message
-        """
-        request_id = message.response_to
-        if request_id and request_id in self.pending_requests:
-            self.completed_requests[request_id] = message.payload or {}
-            del self.pending_requests[request_id]
-
-    async def _handle_artifact_list_response(self, message: Event) -> None:
-        """Handle artifact list response.
-
-        Args:
-            message: The response message
-        """
-        request_id = message.response_to
-        if request_id and request_id in self.pending_requests:
-            self.completed_requests[request_id] = message.payload or {}
-            del self.pending_requests[request_id]
-
     async def _handle_artifact_created_notification(self, message: Event) -> None:
         """Handle artifact created notification.
 
@@ -3,6 +3,10 @@ Network-level shared artifact mod for OpenAgents.
 
 This mod provides a shared artifact storage system with agent group-based access control.
 Artifacts are stored as files in the workspace, supporting both text and binary content.
+
+Configuration options:
+- notification_coalesce_window: Seconds during which further update notifications for
+  an artifact are folded into one sent at the end of the window (default: 0, disabled)
 """
 
 import logging
@@ -14,6 +18,7 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from openagents.core.base_mod import BaseMod, mod_event_handler
+from openagents.core.notification_coalescer import NotificationCoalescer
 from openagents.models.event import Event
 from openagents.models.event_response import EventResponse
 
@@ -94,6 +99,9 @@ class SharedArtifactMod(BaseMod):
         self.storage_path: Optional[Path] = None
         self.artifacts_dir: Optional[Path] = None
 
+        # Multicasts notifications and coalesces update bursts per entry
+        self._notifications = NotificationCoalescer(self)
+
         logger.info("Initializing Shared Artifact mod")
 
     def bind_network(self, network):
@@ -226,6 +234,8 @@ class SharedArtifactMod(BaseMod):
         Returns:
             bool: True if shutdown was successful, False otherwise
         """
+        self._notifications.close()
+
         # Save artifact metadata to storage
         self._save_artifact_entries()
 
@@ -260,46 +270,30 @@ class SharedArtifactMod(BaseMod):
     ):
         """Send notification to agents with access to the artifact.
 
+        Update notifications are coalesced per artifact (see NotificationCoalescer);
+        a deletion drops the pending update notification.
+
         Args:
             event_name: Name of the notification event
             artifact_entry: The artifact entry that was modified
             exclude_agent: Optional agent ID to exclude from notifications
         """
-        # Determine which agents should be notified
-        notify_agents = set()
-
-        if artifact_entry.allowed_agent_groups:
-            # Notify only agents in allowed groups
-            for agent_id, group in self.network.topology.agent_group_membership.items():
-                if group in artifact_entry.allowed_agent_groups:
-                    notify_agents.add(agent_id)
-        else:
-            # Notify all registered agents
-            notify_agents = set(self.network.topology.agent_registry.keys())
-
-        # Exclude the agent who triggered the notification
-        if exclude_agent:
-            notify_agents.discard(exclude_agent)
-
-        # Send notifications
-        for agent_id in notify_agents:
-            notification = Event(
-                event_name=event_name,
-                source_id=self.network.network_id,
-                destination_id=agent_id,
-                payload={
-                    "artifact_id": artifact_entry.artifact_id,
-                    "name": artifact_entry.name,
-                    "mime_type": artifact_entry.mime_type,
-                    "created_by": artifact_entry.created_by,
-                    "allowed_agent_groups": artifact_entry.allowed_agent_groups,
-                },
-            )
-            try:
-                await self.network.process_event(notification)
-                logger.debug(f"Sent {event_name} notification to {agent_id}")
-            except Exception as e:
-                logger.error(f"Failed to send notification to {agent_id}: {e}")
+        if event_name == "shared_artifact.notification.deleted":
+            self._notifications.discard(artifact_entry.artifact_id)
+        await self._notifications.notify(
+            event_name,
+            artifact_entry.artifact_id,
+            {
+                "artifact_id": artifact_entry.artifact_id,
+                "name": artifact_entry.name,
+                "mime_type": artifact_entry.mime_type,
+                "created_by": artifact_entry.created_by,
+                "allowed_agent_groups": artifact_entry.allowed_agent_groups,
+            },
+            artifact_entry.allowed_agent_groups,
+            exclude_agent,
+            coalesce=event_name == "shared_artifact.notification.updated",
+        )
 
     @mod_event_handler("shared_artifact.create")
     async def _handle_artifact_create(self, event: Event) -> Optional[EventResponse]:
@@ -384,6 +378,10 @@ class SharedArtifactMod(BaseMod):
     async def _handle_artifact_get(self, event: Event) -> Optional[EventResponse]:
         """Handle artifact retrieval request.
 
+        The content is left out when the payload sets include_content to False,
+        so a transport can check access through this handler and then stream the
+        file from get_file_path.
+
         Args:
             event: The artifact get event
 
@@ -412,13 +410,14 @@ class SharedArtifactMod(BaseMod):
                         "error": "Agent does not have permission to access this artifact",
                     }
                 else:
-                    # Read artifact file content
-                    file_path = Path(artifact_entry.file_path)
-                    content = self._read_artifact_file(file_path, artifact_entry.mime_type)
-
                     logger.debug(f"Retrieved artifact {artifact_id} for {event.source_id}")
                     response_data = artifact_entry.to_dict()
-                    response_data["content"] = content
+                    if payload.get("include_content", True):
+                        # Read artifact file content
+                        file_path = Path(artifact_entry.file_path)
+                        response_data["content"] = self._read_artifact_file(
+                            file_path, artifact_entry.mime_type
+                        )
                     response_data["success"] = True
 
             return EventResponse(
@@ -624,6 +623,24 @@ class SharedArtifactMod(BaseMod):
                 data={"error": str(e)},
             )
 
+    def get_file_path(self, artifact_id: str) -> Optional[Path]:
+        """Get the file path for an artifact (for HTTP direct download).
+
+        Args:
+            artifact_id: ID of the artifact
+
+        Returns:
+            Optional[Path]: File path if the artifact exists, None otherwise
+        """
+        if artifact_id not in self.artifact_entries:
+            return None
+
+        file_path = Path(self.artifact_entries[artifact_id].file_path)
+        if not file_path.exists():
+            return None
+
+        return file_path
+
     def get_state(self) -> Dict[str, Any]:
         """Get the current state of the shared artifact mod.
 
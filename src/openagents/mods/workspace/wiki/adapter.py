@@ -50,12 +50,6 @@ class WikiAgentAdapter(BaseModAdapter):
 
         # Initialize adapter state
         self.wiki_handlers: Dict[str, WikiHandler] = {}
-        self.pending_requests: Dict[str, Dict[str, Any]] = (
-            {}
-        )  # request_id -> request metadata
-        self.completed_requests: Dict[str, Dict[str, Any]] = (
-            {}
-        )  # request_id -> response data
 
     def initialize(self) -> bool:
         """Initialize the wiki adapter.
@@ -86,27 +80,7 @@ class WikiAgentAdapter(BaseModAdapter):
         # Handle different event types based on event name
         event_name = message.event_name
 
-        if event_name == "wiki.page.create_response":
-            await self._handle_page_create_response(message)
-        elif event_name == "wiki.page.edit_response":
-            await self._handle_page_edit_response(message)
-        elif event_name == "wiki.page.get_response":
-            await self._handle_page_get_response(message)
-        elif event_name == "wiki.pages.search_response":
-            await self._handle_pages_search_response(message)
-        elif event_name == "wiki.pages.list_response":
-            await self._handle_pages_list_response(message)
-        elif event_name == "wiki.page.proposal.create_response":
-            await self._handle_proposal_create_response(message)
-        elif event_name == "wiki.proposals.list_response":
-            await self._handle_proposals_list_response(message)
-        elif event_name == "wiki.proposal.resolve_response":
-            await self._handle_proposal_resolve_response(message)
-        elif event_name == "wiki.page.history_response":
-            await self._handle_page_history_response(message)
-        elif event_name == "wiki.page.revert_response":
-            await self._handle_page_revert_response(message)
-        elif event_name == "wiki.page.notification":
+        if event_name == "wiki.page.notification":
             await self._handle_page_notification(message)
         elif event_name == "wiki.proposal.notification":
             await self._handle_proposal_notification(message)
@@ -151,18 +125,10 @@ class WikiAgentAdapter(BaseModAdapter):
             visibility=EventVisibility.MOD_ONLY,
         )
 
-        # Store pending request
-        self.pending_requests[message.event_id] = {
-            "action": "create_page",
-            "page_path": page_path,
-            "timestamp": message.timestamp,
-        }
+        logger.debug(f"Sending create wiki page request for {page_path}")
 
-        await self.connector.send_event(message)
-        logger.debug(f"Sent create wiki page request for {page_path}")
-
-        # Wait for response
-        return await self._wait_for_response(message.event_id, "page_path")
+        # Send request and wait for response
+        return await self._send_request(message, "page_path")
 
     async def edit_wiki_page(self, page_path: str, content: str) -> bool:
         """Edit an existing wiki page (owner only).
@@ -196,18 +162,10 @@ class WikiAgentAdapter(BaseModAdapter):
             visibility=EventVisibility.MOD_ONLY,
         )
 
-        # Store pending request
-        self.pending_requests[message.event_id] = {
-            "action": "edit_page",
-            "page_path": page_path,
-            "timestamp": message.timestamp,
-        }
-
-        await self.connector.send_event(message)
-        logger.debug(f"Sent edit wiki page request for {page_path}")
+        logger.debug(f"Sending edit wiki page request for {page_path}")
 
-        # Wait for response
-        result = await self._wait_for_response(message.event_id, "success")
+        # Send request and wait for response
+        result = await self._send_request(message, "success")
         return result if result is not None else False
 
     async def get_wiki_page(
@@ -244,18 +202,10 @@ class WikiAgentAdapter(BaseModAdapter):
             visibility=EventVisibility.MOD_ONLY,
         )
 
-        # Store pending request
-        self.pending_requests[message.event_id] = {
-            "action": "get_page",
-            "page_path": page_path,
-            "timestamp": message.timestamp,
-        }
+        logger.debug(f"Sending get wiki page request for {page_path}")
 
-        await self.connector.send_event(message)
-        logger.debug(f"Sent get wiki page request for {page_path}")
-
-        # Wait for response
-        return await self._wait_for_response(message.event_id, "page_data")
+        # Send request and wait for response
+        return await self._send_request(message, "page_data")
 
     async def search_wiki_pages(
         self, query: str, limit: int = 10
@@ -291,18 +241,10 @@ class WikiAgentAdapter(BaseModAdapter):
             visibility=EventVisibility.MOD_ONLY,
         )
 
-        # Store pending request
-        self.pending_requests[message.event_id] = {
-            "action": "search_pages",
-            "query": query,
-            "timestamp": message.timestamp,
-        }
-
-        await self.connector.send_event(message)
-        logger.debug(f"Sent search wiki pages request for query: {query}")
+        logger.debug(f"Sending search wiki pages request for query: {query}")
 
-        # Wait for response
-        result = await self._wait_for_response(message.event_id, "pages")
+        # Send request and wait for response
+        result = await self._send_request(message, "pages")
         return result if result is not None else []
 
     async def list_wiki_pages(
@@ -339,18 +281,10 @@ class WikiAgentAdapter(BaseModAdapter):
             visibility=EventVisibility.MOD_ONLY,
         )
 
-        # Store pending request
-        self.pending_requests[message.event_id] = {
-            "action": "list_pages",
-            "category": category,
-            "timestamp": message.timestamp,
-        }
+        logger.debug(f"Sending list wiki pages request")
 
-        await self.connector.send_event(message)
-        logger.debug(f"Sent list wiki pages request")
-
-        # Wait for response
-        result = await self._wait_for_response(message.event_id, "pages")
+        # Send request and wait for response
+        result = await self._send_request(message, "pages")
         return result if result is not None else []
 
     async def propose_wiki_page_edit(
@@ -391,18 +325,10 @@ class WikiAgentAdapter(BaseModAdapter):
             visibility=EventVisibility.MOD_ONLY,
         )
 
-        # Store pending request
-        self.pending_requests[message.event_id] = {
-            "action": "create_proposal",
-            "page_path": page_path,
-            "timestamp": message.timestamp,
-        }
-
-        await self.connector.send_event(message)
-        logger.debug(f"Sent propose wiki page edit request for {page_path}")
+        logger.debug(f"Sending propose wiki page edit request for {page_path}")
 
-        # Wait for response
-        return await self._wait_for_response(message.event_id, "proposal_id")
+        # Send request and wait for response
+        return await self._send_request(message, "proposal_id")
 
     async def list_wiki_edit_proposals(
         self, page_path: Optional[str] = None, status: str = "pending"
@@ -438,18 +364,10 @@ class WikiAgentAdapter(BaseModAdapter):
             visibility=EventVisibility.MOD_ONLY,
         )
 
-        # Store pending request
-        self.pending_requests[message.event_id] = {
-            "action": "list_proposals",
-            "page_path": page_path,
-            "timestamp": message.timestamp,
-        }
-
-        await self.connector.send_event(message)
-        logger.debug(f"Sent list wiki edit proposals request")
+        logger.debug(f"Sending list wiki edit proposals request")
 
-        # Wait for response
-        result = await self._wait_for_response(message.event_id, "proposals")
+        # Send request and wait for response
+        result = await self._send_request(message, "proposals")
         return result if result is not None else []
 
     async def resolve_wiki_edit_proposal(
@@ -494,18 +412,10 @@ class WikiAgentAdapter(BaseModAdapter):
             visibility=EventVisibility.MOD_ONLY,
         )
 
-        # Store pending request
-        self.pending_requests[message.event_id] = {
-            "action": "resolve_proposal",
-            "proposal_id": proposal_id,
-            "timestamp": message.timestamp,
-        }
+        logger.debug(f"Sending resolve wiki edit proposal request for {proposal_id}")
 
-        await self.connector.send_event(message)
-        logger.debug(f"Sent resolve wiki edit proposal request for {proposal_id}")
-
-        # Wait for response
-        result = await self._wait_for_response(message.event_id, "success")
+        # Send request and wait for response
+        result = await self._send_request(message, "success")
         return result if result is not None else False
 
     async def get_wiki_page_history(
@@ -542,18 +452,10 @@ class WikiAgentAdapter(BaseModAdapter):
             visibility=EventVisibility.MOD_ONLY,
         )
 
-        # Store pending request
-        self.pending_requests[message.event_id] = {
-            "action": "get_history",
-            "page_path": page_path,
-            "timestamp": message.timestamp,
-        }
-
-        await self.connector.send_event(message)
-        logger.debug(f"Sent get wiki page history request for {page_path}")
+        logger.debug(f"Sending get wiki page history request for {page_path}")
 
-        # Wait for response
-        result = await self._wait_for_response(message.event_id, "versions")
+        # Send request and wait for response
+        result = await self._send_request(message, "versions")
         return result if result is not None else []
 
     async def revert_wiki_page_version(
@@ -590,20 +492,12 @@ class WikiAgentAdapter(BaseModAdapter):
             visibility=EventVisibility.MOD_ONLY,
         )
 
-        # Store pending request
-        self.pending_requests[message.event_id] = {
-            "action": "revert_page",
-            "page_path": page_path,
-            "timestamp": message.timestamp,
-        }
-
-        await self.connector.send_event(message)
         logger.debug(
-            f"Sent revert wiki page request for {page_path} to version {target_version}"
+            f"Sending revert wiki page request for {page_path} to version {target_version}"
         )
 
-        # Wait for response
-        result = await self._wait_for_response(message.event_id, "success")
+        # Send request and wait for response
+        result = await self._send_request(message, "success")
         return result if result is not None else False
 
     def register_wiki_handler(self, handler_id: str, handler: WikiHandler) -> None:
@@ -626,99 +520,28 @@ class WikiAgentAdapter(BaseModAdapter):
             del self.wiki_handlers[handler_id]
             logger.debug(f"Unregistered wiki handler {handler_id}")
 
-    async def _wait_for_response(
-        self, request_id: str, response_key: str, timeout: int = 10
+    async def _send_request(
+        self, message: Event, response_key: str, timeout: float = 10
     ):
-        """Wait for a response to a request.
+        """Send a request and wait for its response.
 
         Args:
-            request_id: ID of the request
+            message: The request event
             response_key: Key to extract from response data
             timeout: Timeout in seconds
 
         Returns:
             Response data or None if timeout/error
         """
-        import asyncio
-
-        # Wait up to timeout seconds for the response
-        for _ in range(timeout * 5):  # 5 checks per second
-            if request_id in self.completed_requests:
-                result = self.completed_requests.pop(request_id)
-                if result.get("success"):
-                    return result.get(response_key)
-                else:
-                    logger.error(
-                        f"Request failed: {result.get('error', 'Unknown error')}"
-                    )
-                    return None
-
-            await asyncio.sleep(0.2)
-
-        # Timeout - clean up and return None
-        logger.warning(f"Request timed out: {request_id}")
-        if request_id in self.pending_requests:
-            del self.pending_requests[request_id]
+        result = await self.request(message, timeout=timeout)
+        if result is None:
+            logger.warning(f"Request timed out: {message.event_id}")
+            return None
+        if result.get("success"):
+            return result.get(response_key)
+        logger.error(f"Request failed: {result.get('error', 'Unknown error')}")
         return None
 
-    async def _handle_page_create_response(self, message: Event) -> None:
-        """Handle page create response."""
-        await self._handle_generic_response(message, "create_page")
-
-    async def _handle_page_edit_response(self, message: Event) -> None:
-        """Handle page edit response."""
-        await self._handle_generic_response(message, "edit_page")
-
-    async def _handle_page_get_response(self, message: Event) -> None:
-        """Handle page get response."""
-        await self._handle_generic_response(message, "get_page")
-
-    async def _handle_pages_search_response(self, message: Event) -> None:
-        """Handle pages search response."""
-        await self._handle_generic_response(message, "search_pages")
-
-    async def _handle_pages_list_response(self, message: Event) -> None:
-        """Handle pages list response."""
-        await self._handle_generic_response(message, "list_pages")
-
-    async def _handle_proposal_create_response(self, message: Event) -> None:
-        """Handle proposal create response."""
-        await self._handle_generic_response(message, "create_proposal")
-
-    async def _handle_proposals_list_response(self, message: Event) -> None:
-        """Handle proposals list response."""
-        await self._handle_generic_response(message, "list_proposals")
-
-    async def _handle_proposal_resolve_response(self, message: Event) -> None:
-        """Handle proposal resolve response."""
-        await self._handle_generic_response(message, "resolve_proposal")
-
-    async def _handle_page_history_response(self, message: Event) -> None:
-        """Handle page history response."""
-        await self._handle_generic_response(message, "get_history")
-
-    async def _handle_page_revert_response(self, message: Event) -> None:
-        """Handle page revert response."""
-        await self._handle_generic_response(message, "revert_page")
-
-    async def _handle_generic_response(self, message: Event, action: str) -> None:
-        """Handle a generic response message."""
-        request_id = message.payload.get("request_id")
-
-        if request_id and request_id in self.pending_requests:
-            # Store completion result
-            self.completed_requests[request_id] = message.payload
-
-            # Clean up pending request
-            del self.pending_requests[request_id]
-
-            # Call registered handlers
-            for handler in self.wiki_handlers.values():
-                try:
-                    handler(message.payload, message.source_id)
-                except Exception as e:
-                    logger.error(f"Error in wiki handler: {e}")
-
     async def _handle_page_notification(self, message: Event) -> None:
         """Handle page notification from the network."""
         logger.info(f"Received wiki page notification")
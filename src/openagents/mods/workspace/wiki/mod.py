@@ -6,8 +6,15 @@ This standalone mod enables collaborative wiki functionality with:
 - Proposal-based collaborative editing
 - Version control and history tracking
 - Page search and discovery
+
+Pages, version histories and proposals are cached in memory once read. An
+append-only page manifest holds the summaries used for listing and search results,
+so startup and listing never parse page bodies; version histories are read per page
+on first use.
+Page titles, content and tags are kept in a persisted full-text search index.
 """
 
+import heapq
 import logging
 import json
 import os
@@ -20,6 +27,7 @@ from openagents.core.base_mod import BaseMod, mod_event_handler
 from openagents.models.messages import Event, EventNames
 from openagents.models.event import Event
 from openagents.models.event_response import EventResponse
+from openagents.utils.search_index import SearchIndex
 from .wiki_messages import (
     WikiPageCreateMessage,
     WikiPageEditMessage,
@@ -38,6 +46,25 @@ from .wiki_messages import (
 
 logger = logging.getLogger(__name__)
 
+# Indexed page fields and their search weights
+PAGE_SEARCH_FIELDS = {"title": 2.0, "tags": 1.5, "content": 1.0}
+
+PAGE_MANIFEST_FILE = "page_manifest.jsonl"
+
+# Minimum number of appended manifest records before the manifest is compacted; the
+# threshold grows with the number of pages
+MANIFEST_COMPACTION_RECORDS = 1000
+
+# Length of the content preview kept in the page manifest
+CONTENT_PREVIEW_LENGTH = 200
+
+
+def _copy_model(model):
+    """Copy a cached model so callers cannot change the cache."""
+    if hasattr(model, "model_copy"):
+        return model.model_copy(deep=True)
+    return model.copy(deep=True)
+
 
 class WikiNetworkMod(BaseMod):
     """Network-level wiki mod implementation.
@@ -57,134 +84,212 @@ class WikiNetworkMod(BaseMod):
         # Initialize mod state
         self.active_agents: Set[str] = set()
 
+        # Cached wiki data and search index, loaded from storage on first use
+        self._reset_cache()
+
         logger.info(f"Initializing Wiki network mod")
 
+    @property
+    def manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Get the page summaries, keyed by page path."""
+        if self._manifest is None:
+            self._load_manifest()
+        return self._manifest
+
     @property
     def pages(self) -> Dict[str, WikiPage]:
-        """Get all pages (loaded from storage)."""
-        # TODO: either add cache or implement get_pages method
+        """Get all pages, reading pages that are not cached yet from storage."""
         pages = {}
-        try:
-            storage_path = self.get_storage_path()
-            pages_dir = storage_path / "pages"
-            if pages_dir.exists():
-                for page_file in pages_dir.glob("*.json"):
-                    try:
-                        page_path = page_file.stem.replace(
-                            "_SLASH_", "/"
-                        )  # Decode path from filename
-                        with open(page_file, "r") as f:
-                            page_dict = json.load(f)
-
-                        page = WikiPage(
-                            page_path=page_dict["page_path"],
-                            title=page_dict["title"],
-                            content=page_dict["content"],
-                            created_by=page_dict["created_by"],
-                            created_timestamp=page_dict["created_timestamp"],
-                            current_version=page_dict.get("current_version", 1),
-                        )
-                        pages[page_path] = page
-                    except Exception as e:
-                        logger.error(f"Failed to load page from file {page_file}: {e}")
-                        continue
-        except Exception as e:
-            logger.error(f"Failed to load wiki pages: {e}")
+        for page_path in self.manifest:
+            page = self.get_page(page_path)
+            if page is not None:
+                pages[page_path] = page
         return pages
 
     @property
     def page_versions(self) -> Dict[str, List[WikiPageVersion]]:
-        """Get all page versions (loaded from storage)."""
-        page_versions = {}
+        """Get all page versions, reading histories that are not cached yet from storage."""
+        page_paths = set(self._version_cache)
         try:
-            storage_path = self.get_storage_path()
-            versions_dir = storage_path / "versions"
+            versions_dir = self.get_storage_path() / "versions"
             if versions_dir.exists():
-                for version_file in versions_dir.glob("*.json"):
-                    try:
-                        page_path = version_file.stem.replace(
-                            "_SLASH_", "/"
-                        )  # Decode path from filename
-                        with open(version_file, "r") as f:
-                            versions_list = json.load(f)
-
-                        versions = []
-                        for version_dict in versions_list:
-                            version = WikiPageVersion(
-                                version_id=version_dict["version_id"],
-                                page_path=version_dict["page_path"],
-                                version_number=version_dict["version_number"],
-                                content=version_dict["content"],
-                                edited_by=version_dict["edited_by"],
-                                edit_timestamp=version_dict["edit_timestamp"],
-                                edit_type=version_dict.get("edit_type", "direct"),
-                                parent_version=version_dict.get("parent_version"),
-                            )
-                            versions.append(version)
-                        page_versions[page_path] = versions
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to load versions from file {version_file}: {e}"
-                        )
-                        continue
+                page_paths.update(
+                    self._decode_page_path_from_filename(version_file.stem)
+                    for version_file in versions_dir.glob("*.json")
+                )
         except Exception as e:
-            logger.error(f"Failed to load page versions: {e}")
-        return page_versions
+            logger.error(f"Failed to list page versions: {e}")
+        return {page_path: self.get_page_versions(page_path) for page_path in page_paths}
 
     @property
     def proposals(self) -> Dict[str, WikiEditProposal]:
-        """Get all proposals (loaded from storage)."""
+        """Get all proposals."""
+        if self._proposals is None:
+            self._load_proposals()
+        return dict(self._proposals)
+
+    @property
+    def page_proposals(self) -> Dict[str, List[str]]:
+        """Get page-proposal mappings (loaded from metadata on first use)."""
+        if self._page_proposals is None:
+            self._page_proposals = {}
+            try:
+                metadata_file = self.get_storage_path() / "metadata.json"
+                if metadata_file.exists():
+                    with open(metadata_file, "r") as f:
+                        metadata = json.load(f)
+                    self._page_proposals = metadata.get("page_proposals", {})
+            except Exception as e:
+                logger.error(f"Failed to load page proposals metadata: {e}")
+        return {
+            page_path: list(proposal_ids)
+            for page_path, proposal_ids in self._page_proposals.items()
+        }
+
+    def _reset_cache(self):
+        """Drop all cached wiki data so it is reloaded from storage on next use."""
+        self._manifest: Optional[Dict[str, Dict[str, Any]]] = None
+        # Records appended to the page manifest since it was last compacted
+        self._manifest_records = 0
+        self._page_cache: Dict[str, WikiPage] = {}
+        self._version_cache: Dict[str, List[WikiPageVersion]] = {}
+        self._proposals: Optional[Dict[str, WikiEditProposal]] = None
+        self._page_proposals: Optional[Dict[str, List[str]]] = None
+        self._search_index: Optional[SearchIndex] = None
+
+    def _load_manifest(self):
+        """Load the page manifest and bring it in line with the stored page files.
+
+        The manifest holds one summary record per line; the last record of a page
+        wins. Only pages missing from the manifest, such as pages written before the
+        manifest existed, are read from storage.
+        """
+        manifest: Dict[str, Dict[str, Any]] = {}
+        page_paths: Set[str] = set()
+        records = 0
+        try:
+            storage_path = self.get_storage_path()
+            manifest_file = storage_path / PAGE_MANIFEST_FILE
+            if manifest_file.exists():
+                with open(manifest_file, "r") as f:
+                    for line in f:
+                        try:
+                            summary = json.loads(line)
+                            manifest[summary["page_path"]] = summary
+                        except (ValueError, KeyError, TypeError):
+                            # Torn record from an interrupted write
+                            continue
+                        records += 1
+
+            pages_dir = storage_path / "pages"
+            if pages_dir.exists():
+                page_paths = {
+                    self._decode_page_path_from_filename(page_file.stem)
+                    for page_file in pages_dir.glob("*.json")
+                }
+        except Exception as e:
+            logger.error(f"Failed to load wiki page manifest: {e}")
+
+        stale_paths = set(manifest) - page_paths
+        for page_path in stale_paths:
+            del manifest[page_path]
+        self._manifest = manifest
+        # Records beyond one per page were appended since the last compaction
+        self._manifest_records = max(records - len(manifest), 0)
+
+        missing_paths = page_paths - set(manifest)
+        for page_path in missing_paths:
+            page = self._read_page(page_path)
+            if page is not None:
+                self._page_cache[page_path] = page
+                self.get_page_versions(page_path)
+                manifest[page_path] = self._summarize_page(page)
+
+        if stale_paths or missing_paths or self._should_compact_manifest():
+            self._write_manifest()
+        logger.info(f"Loaded wiki page manifest with {len(manifest)} pages")
+
+    def _load_proposals(self):
+        """Load all proposals from storage."""
         proposals = {}
         try:
             storage_path = self.get_storage_path()
             proposals_dir = storage_path / "proposals"
             if proposals_dir.exists():
                 for proposal_file in proposals_dir.glob("*.json"):
-                    try:
-                        proposal_id = proposal_file.stem  # filename without extension
-                        with open(proposal_file, "r") as f:
-                            proposal_dict = json.load(f)
-
-                        proposal = WikiEditProposal(
-                            proposal_id=proposal_dict["proposal_id"],
-                            page_path=proposal_dict["page_path"],
-                            proposed_content=proposal_dict["proposed_content"],
-                            rationale=proposal_dict.get("rationale", ""),
-                            proposed_by=proposal_dict["proposed_by"],
-                            created_timestamp=proposal_dict["created_timestamp"],
-                            status=proposal_dict.get("status", "pending"),
-                            resolved_by=proposal_dict.get("resolved_by"),
-                            resolved_timestamp=proposal_dict.get("resolved_timestamp"),
-                            resolution_comments=proposal_dict.get(
-                                "resolution_comments"
-                            ),
-                        )
-                        proposals[proposal_id] = proposal
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to load proposal from file {proposal_file}: {e}"
-                        )
-                        continue
+                    proposal = self._read_proposal(proposal_file.stem)
+                    if proposal is not None:
+                        proposals[proposal.proposal_id] = proposal
         except Exception as e:
             logger.error(f"Failed to load proposals: {e}")
-        return proposals
+        self._proposals = proposals
+
+    def _summarize_page(self, page: WikiPage) -> Dict[str, Any]:
+        """Build the manifest entry of a page."""
+        versions = self._version_cache.get(page.page_path)
+        if versions is not None:
+            version_count = len(versions)
+        else:
+            version_count = (
+                self._manifest.get(page.page_path, {}).get("version_count", 0)
+                if self._manifest
+                else 0
+            )
+        return {
+            "page_path": page.page_path,
+            "title": page.title,
+            "category": page.category,
+            "created_by": page.created_by,
+            "created_timestamp": page.created_timestamp,
+            "current_version": page.current_version,
+            "tags": list(page.tags),
+            "content_preview": page.content[:CONTENT_PREVIEW_LENGTH],
+            "content_length": len(page.content),
+            "version_count": version_count,
+        }
 
-    @property
-    def page_proposals(self) -> Dict[str, List[str]]:
-        """Get page-proposal mappings (loaded from metadata)."""
+    def _should_compact_manifest(self) -> bool:
+        """Check if enough records were appended to the manifest to compact it.
+
+        The threshold scales with the number of pages, so rewriting the manifest
+        costs O(1) amortized per appended record.
+        """
+        return self._manifest_records >= max(
+            MANIFEST_COMPACTION_RECORDS, len(self._manifest)
+        )
+
+    def _write_manifest(self):
+        """Rewrite the page manifest from memory, one record per page."""
         try:
             storage_path = self.get_storage_path()
-            metadata_file = storage_path / "metadata.json"
+            storage_path.mkdir(parents=True, exist_ok=True)
+            manifest_file = storage_path / PAGE_MANIFEST_FILE
+            temp_file = manifest_file.with_name(manifest_file.name + ".tmp")
+
+            with open(temp_file, "w") as f:
+                for summary in self._manifest.values():
+                    f.write(json.dumps(summary, default=str) + "\n")
+            os.replace(temp_file, manifest_file)
+            self._manifest_records = 0
 
-            if metadata_file.exists():
-                with open(metadata_file, "r") as f:
-                    metadata = json.load(f)
-                return metadata.get("page_proposals", {})
-            else:
-                return {}
         except Exception as e:
-            logger.error(f"Failed to load page proposals metadata: {e}")
-            return {}
+            logger.error(f"Failed to save wiki page manifest: {e}")
+
+    def _update_manifest(self, summary: Dict[str, Any]):
+        """Record a page summary in memory and append it to the manifest."""
+        self.manifest[summary["page_path"]] = summary
+        try:
+            storage_path = self.get_storage_path()
+            storage_path.mkdir(parents=True, exist_ok=True)
+            with open(storage_path / PAGE_MANIFEST_FILE, "a") as f:
+                f.write(json.dumps(summary, default=str) + "\n")
+            self._manifest_records += 1
+        except Exception as e:
+            logger.error(f"Failed to save summary of page {summary['page_path']}: {e}")
+            return
+
+        if self._should_compact_manifest():
+            self._write_manifest()
 
     def initialize(self) -> bool:
         """Initialize the mod and load persistent data.
@@ -193,11 +298,14 @@ class WikiNetworkMod(BaseMod):
             bool: True if initialization was successful, False otherwise
         """
         try:
-            # No need to load all data - storage-first approach
+            # Only page summaries are loaded; page bodies are read on first use
+            self._reset_cache()
+            self._load_manifest()
+
             # Initialize default wiki threads
             self._initialize_wiki_threads()
 
-            logger.info("Wiki mod initialization complete (storage-first mode)")
+            logger.info("Wiki mod initialization complete")
             return True
         except Exception as e:
             logger.error(f"Wiki mod initialization failed: {e}")
@@ -212,6 +320,7 @@ class WikiNetworkMod(BaseMod):
         try:
             # Clear state (data is already in storage)
             self.active_agents.clear()
+            self._reset_cache()
 
             logger.info("Wiki mod shutdown complete")
             return True
@@ -222,6 +331,8 @@ class WikiNetworkMod(BaseMod):
     def bind_network(self, network):
         """Bind the mod to a network and initialize threads."""
         super().bind_network(network)
+        # Storage may have moved to the network's workspace
+        self._reset_cache()
         # Initialize wiki threads after network is available
         self._initialize_wiki_threads()
 
@@ -237,10 +348,37 @@ class WikiNetworkMod(BaseMod):
             self.network.event_gateway.create_channel(thread_name)
             logger.debug(f"Created wiki thread: {thread_name}")
 
-    # Old _load_wiki_data method removed - now using storage-first approach with properties
-
     def get_page(self, page_path: str) -> Optional[WikiPage]:
-        """Get a single page by path (loads only that page from storage)."""
+        """Get a copy of a single page by path, reading it from storage on first access."""
+        page = self._page_cache.get(page_path)
+        if page is None:
+            if page_path not in self.manifest:
+                return None
+            page = self._read_page(page_path)
+            if page is None:
+                return None
+            self._page_cache[page_path] = page
+        return _copy_model(page)
+
+    def get_page_versions(self, page_path: str) -> List[WikiPageVersion]:
+        """Get versions for a specific page, reading its history from storage on first access."""
+        versions = self._version_cache.get(page_path)
+        if versions is None:
+            versions = self._read_page_versions(page_path)
+            if versions is None:
+                return []
+            self._version_cache[page_path] = versions
+        return list(versions)
+
+    def get_proposal(self, proposal_id: str) -> Optional[WikiEditProposal]:
+        """Get a copy of a specific proposal by ID."""
+        if self._proposals is None:
+            self._load_proposals()
+        proposal = self._proposals.get(proposal_id)
+        return _copy_model(proposal) if proposal is not None else None
+
+    def _read_page(self, page_path: str) -> Optional[WikiPage]:
+        """Read a single page from storage."""
         try:
             storage_path = self.get_storage_path()
             pages_dir = storage_path / "pages"
@@ -269,8 +407,12 @@ class WikiNetworkMod(BaseMod):
             logger.error(f"Failed to load page {page_path}: {e}")
             return None
 
-    def get_page_versions(self, page_path: str) -> List[WikiPageVersion]:
-        """Get versions for a specific page (loads only that page's versions from storage)."""
+    def _read_page_versions(self, page_path: str) -> Optional[List[WikiPageVersion]]:
+        """Read the versions of a specific page from storage.
+
+        Returns:
+            Optional[List[WikiPageVersion]]: The versions, or None if they could not be read
+        """
         try:
             storage_path = self.get_storage_path()
             versions_dir = storage_path / "versions"
@@ -299,10 +441,10 @@ class WikiNetworkMod(BaseMod):
             return versions
         except Exception as e:
             logger.error(f"Failed to load versions for page {page_path}: {e}")
-            return []
+            return None
 
-    def get_proposal(self, proposal_id: str) -> Optional[WikiEditProposal]:
-        """Get a specific proposal by ID (loads only that proposal from storage)."""
+    def _read_proposal(self, proposal_id: str) -> Optional[WikiEditProposal]:
+        """Read a specific proposal from storage."""
         try:
             storage_path = self.get_storage_path()
             proposals_dir = storage_path / "proposals"
@@ -334,8 +476,39 @@ class WikiNetworkMod(BaseMod):
         """Encode page path to be safe for filename."""
         return page_path.replace("/", "_SLASH_")
 
+    def _decode_page_path_from_filename(self, filename: str) -> str:
+        """Decode page path from a filename stem."""
+        return filename.replace("_SLASH_", "/")
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Get the page search index, loading it from storage on first use."""
+        if self._search_index is None:
+            storage_path = self.get_storage_path()
+            search_index = SearchIndex(PAGE_SEARCH_FIELDS, storage_dir=storage_path)
+            search_index.load()
+
+            # Index pages written while the index was not being maintained
+            missing = search_index.reconcile(self.manifest)
+            self._search_index = search_index
+            for page_path in missing:
+                page = self.get_page(page_path)
+                if page:
+                    self._index_page(page)
+            if missing:
+                search_index.save()
+        return self._search_index
+
+    def _index_page(self, page: WikiPage):
+        """Add or update a page in the search index."""
+        self.search_index.add(
+            page.page_path,
+            {"title": page.title, "content": page.content, "tags": page.tags},
+            timestamp=page.created_timestamp,
+        )
+
     def _save_page(self, page: WikiPage):
-        """Save a single page to its own file."""
+        """Save a single page to its own file and update the cache, manifest and search index."""
         try:
             storage_path = self.get_storage_path()
             pages_dir = storage_path / "pages"
@@ -351,6 +524,9 @@ class WikiNetworkMod(BaseMod):
             with open(page_file, "w") as f:
                 json.dump(page_data, f, indent=2, default=str)
 
+            self._page_cache[page.page_path] = _copy_model(page)
+            self._update_manifest(self._summarize_page(page))
+            self._index_page(page)
         except Exception as e:
             logger.error(f"Failed to save page {page.page_path}: {e}")
 
@@ -376,6 +552,10 @@ class WikiNetworkMod(BaseMod):
             with open(version_file, "w") as f:
                 json.dump(versions_data, f, indent=2, default=str)
 
+            self._version_cache[page_path] = list(versions)
+            summary = self.manifest.get(page_path)
+            if summary is not None:
+                self._update_manifest(dict(summary, version_count=len(versions)))
         except Exception as e:
             logger.error(f"Failed to save versions for page {page_path}: {e}")
 
@@ -397,6 +577,9 @@ class WikiNetworkMod(BaseMod):
             with open(proposal_file, "w") as f:
                 json.dump(proposal_data, f, indent=2, default=str)
 
+            if self._proposals is None:
+                self._load_proposals()
+            self._proposals[proposal.proposal_id] = _copy_model(proposal)
         except Exception as e:
             logger.error(f"Failed to save proposal {proposal.proposal_id}: {e}")
 
@@ -411,6 +594,11 @@ class WikiNetworkMod(BaseMod):
             with open(metadata_file, "w") as f:
                 json.dump(metadata, f, indent=2, default=str)
 
+            self._page_proposals = {
+                page_path: list(proposal_ids)
+                for page_path, proposal_ids in page_proposals.items()
+            }
+
         except Exception as e:
             logger.error(f"Failed to save wiki metadata: {e}")
 
@@ -741,39 +929,30 @@ class WikiNetworkMod(BaseMod):
             content["source_id"] = event.source_id  # Add source_id from Event
             message = WikiPageSearchMessage(**content)
 
-            # Simple search implementation
-            query_lower = message.query.lower()
+            # Rank pages by relevance; summaries come from the page manifest
+            page_paths, _ = self.search_index.search(message.query, limit=message.limit)
             matching_pages = []
 
-            for page in self.pages.values():
-                # Search in title and content
-                if (
-                    query_lower in page.title.lower()
-                    or query_lower in page.content.lower()
-                    or any(query_lower in tag.lower() for tag in page.tags)
-                ):
-
+            for page_path in page_paths:
+                summary = self.manifest.get(page_path)
+                if summary:
                     page_summary = {
-                        "page_path": page.page_path,
-                        "title": page.title,
-                        "category": page.category,
-                        "created_by": page.created_by,
-                        "created_timestamp": page.created_timestamp,
-                        "current_version": page.current_version,
-                        "tags": page.tags,
+                        "page_path": summary["page_path"],
+                        "title": summary["title"],
+                        "category": summary["category"],
+                        "created_by": summary["created_by"],
+                        "created_timestamp": summary["created_timestamp"],
+                        "current_version": summary["current_version"],
+                        "tags": summary["tags"],
                         # Include snippet of content
                         "content_snippet": (
-                            page.content[:200] + "..."
-                            if len(page.content) > 200
-                            else page.content
+                            summary["content_preview"] + "..."
+                            if summary["content_length"] > CONTENT_PREVIEW_LENGTH
+                            else summary["content_preview"]
                         ),
                     }
                     matching_pages.append(page_summary)
 
-            # Sort by creation timestamp (newest first) and limit results
-            matching_pages.sort(key=lambda x: x["created_timestamp"], reverse=True)
-            matching_pages = matching_pages[: message.limit]
-
             return EventResponse(
                 success=True,
                 message=f"Found {len(matching_pages)} matching pages",
@@ -804,30 +983,34 @@ class WikiNetworkMod(BaseMod):
             content["source_id"] = event.source_id  # Add source_id from Event
             message = WikiPageListMessage(**content)
 
-            # Filter pages by category if specified
-            pages_list = []
-            for page in self.pages.values():
-                if message.category is None or page.category == message.category:
-                    page_summary = {
-                        "page_path": page.page_path,
-                        "title": page.title,
-                        "category": page.category,
-                        "creator_id": page.created_by,  # Use creator_id to match frontend expectation
-                        "created_by": page.created_by,
-                        "created_timestamp": page.created_timestamp,
-                        "current_version": page.current_version,
-                        "version": page.current_version,  # Add version field for frontend
-                        "last_modified": page.created_timestamp,  # Use created_timestamp as fallback for last_modified
-                        "tags": page.tags,
-                        "wiki_content": (
-                            page.content[:200] if page.content else ""
-                        ),  # Add content preview (use 'content' field)
-                    }
-                    pages_list.append(page_summary)
+            # Filter pages by category if specified, newest first
+            summaries = heapq.nlargest(
+                message.limit,
+                (
+                    summary
+                    for summary in self.manifest.values()
+                    if message.category is None
+                    or summary["category"] == message.category
+                ),
+                key=lambda summary: summary["created_timestamp"],
+            )
 
-            # Sort by creation timestamp (newest first) and limit results
-            pages_list.sort(key=lambda x: x["created_timestamp"], reverse=True)
-            pages_list = pages_list[: message.limit]
+            pages_list = []
+            for summary in summaries:
+                page_summary = {
+                    "page_path": summary["page_path"],
+                    "title": summary["title"],
+                    "category": summary["category"],
+                    "creator_id": summary["created_by"],  # Use creator_id to match frontend expectation
+                    "created_by": summary["created_by"],
+                    "created_timestamp": summary["created_timestamp"],
+                    "current_version": summary["current_version"],
+                    "version": summary["current_version"],  # Add version field for frontend
+                    "last_modified": summary["created_timestamp"],  # Use created_timestamp as fallback for last_modified
+                    "tags": summary["tags"],
+                    "wiki_content": summary["content_preview"],  # Content preview
+                }
+                pages_list.append(page_summary)
 
             return EventResponse(
                 success=True,
@@ -1259,11 +1442,10 @@ class WikiNetworkMod(BaseMod):
             page.content = target_version.content
             page.current_version = new_version_number
 
-            # Store version
+            # Store page and version
             versions.append(revert_version)
-
-            # Save data after page revert
-            # Data now stored in storage
+            self._save_page(page)
+            self._save_page_versions(message.page_path, versions)
 
             # Send notification
             await self._send_page_edit_notification(page, revert_version)
@@ -1418,13 +1600,13 @@ class WikiNetworkMod(BaseMod):
         """
         return {
             "active_agents": len(self.active_agents),
-            "total_pages": len(self.pages),
+            "total_pages": len(self.manifest),
             "total_versions": sum(
-                len(versions) for versions in self.page_versions.values()
+                summary.get("version_count", 0) for summary in self.manifest.values()
             ),
             "pending_proposals": len(
                 [p for p in self.proposals.values() if p.status == "pending"]
             ),
             "total_proposals": len(self.proposals),
-            "pages": list(self.pages.keys()),
+            "pages": list(self.manifest.keys()),
         }
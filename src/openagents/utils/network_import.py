@@ -297,6 +297,7 @@ class NetworkImporter:
                             for mod_name, mod_instance in mods.items():
                                 mod_instance.bind_network(network)
                                 network.mods[mod_name] = mod_instance
+                            network.event_gateway.mod_event_processor.invalidate_dispatch_table()
 
                         # Reinitialize
                         if hasattr(network, 'initialize') and callable(getattr(network, 'initialize')):
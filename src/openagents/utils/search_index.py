@@ -0,0 +1,414 @@
+"""
+Incremental full-text search index for OpenAgents workspace mods.
+
+Mods that offer search (forum, wiki, feed) keep a SearchIndex up to date as
+documents are created, edited and deleted instead of scanning every document for
+each query. The index maps tokens to postings, ranks matches with BM25 over
+weighted fields, matches query terms as token prefixes, and filters documents by
+group permissions while collecting candidates.
+
+The index is persisted in the mod's storage directory as a snapshot plus an
+append-only change log, so a restart only replays the log instead of re-reading
+and re-tokenizing every document.
+"""
+
+import heapq
+import json
+import logging
+import math
+import os
+import re
+from bisect import bisect_left, insort
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Maximum number of prefix expansions of a query term scored with full BM25; documents
+# matched only through further expansions still match, scored by term rarity alone
+MAX_SCORED_PREFIX_EXPANSIONS = 64
+
+# Weight of terms matched only as a prefix, relative to exact term matches
+PREFIX_MATCH_WEIGHT = 0.5
+
+INDEX_FORMAT_VERSION = 1
+
+
+def tokenize(text: Any) -> List[str]:
+    """Split text, or a list of texts, into lowercase word tokens."""
+    if not text:
+        return []
+    if isinstance(text, (list, tuple, set)):
+        tokens = []
+        for item in text:
+            tokens.extend(tokenize(item))
+        return tokens
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+class SearchIndex:
+    """
+    Inverted index of documents with weighted text fields.
+
+    Each document is stored as its weighted term frequencies (a term in a field with
+    weight 2.0 counts twice), its weighted length, the groups allowed to see it,
+    an optional owner who can always see it, and a timestamp used to break score ties
+    in favour of newer documents.
+    """
+
+    def __init__(
+        self,
+        field_weights: Dict[str, float],
+        storage_dir: Optional[Path] = None,
+        name: str = "search_index",
+        k1: float = 1.2,
+        b: float = 0.75,
+        compaction_records: int = 1000,
+    ):
+        """Initialize the index.
+
+        Args:
+            field_weights: Indexed field names and their weights
+            storage_dir: Directory to persist the index in, None to keep it in memory
+            name: Base name of the index files
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+            compaction_records: Minimum logged changes before the log is compacted
+        """
+        self.field_weights = dict(field_weights)
+        self.k1 = k1
+        self.b = b
+        self.compaction_records = compaction_records
+        self.snapshot_file = storage_dir / f"{name}.json" if storage_dir else None
+        self.log_file = storage_dir / f"{name}.log.jsonl" if storage_dir else None
+
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._sorted_terms: List[str] = []
+        self._total_length = 0.0
+        # Only held in memory; lets unchanged documents skip re-indexing
+        self._signatures: Dict[str, int] = {}
+        self._logged_records = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._documents
+
+    def document_ids(self) -> Set[str]:
+        """Get the IDs of all indexed documents."""
+        return set(self._documents)
+
+    def add(
+        self,
+        doc_id: str,
+        fields: Dict[str, Any],
+        allowed_groups: Optional[Iterable[str]] = None,
+        owner_id: Optional[str] = None,
+        timestamp: float = 0.0,
+    ) -> None:
+        """Index a document, replacing any previous version of it.
+
+        Args:
+            doc_id: ID of the document
+            fields: Field name -> text (or list of texts); unweighted fields are ignored
+            allowed_groups: Groups allowed to see the document, empty or None for everyone
+            owner_id: Agent that can always see the document
+            timestamp: Document time, newer documents win score ties
+        """
+        groups = sorted(set(allowed_groups)) if allowed_groups else []
+        signature = hash(
+            (
+                tuple(repr(fields.get(field)) for field in self.field_weights),
+                tuple(groups),
+                owner_id,
+                timestamp,
+            )
+        )
+        if self._signatures.get(doc_id) == signature and doc_id in self._documents:
+            return
+
+        terms: Dict[str, float] = {}
+        for field, weight in self.field_weights.items():
+            for token in tokenize(fields.get(field)):
+                terms[token] = terms.get(token, 0.0) + weight
+        document = {
+            "terms": terms,
+            "length": sum(terms.values()),
+            "groups": groups,
+            "owner": owner_id,
+            "timestamp": timestamp,
+        }
+
+        self._remove_document(doc_id)
+        self._insert_document(doc_id, document)
+        self._signatures[doc_id] = signature
+        self._log({"op": "add", "id": doc_id, "doc": document})
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document from the index."""
+        if doc_id not in self._documents:
+            return
+        self._remove_document(doc_id)
+        self._signatures.pop(doc_id, None)
+        self._log({"op": "remove", "id": doc_id})
+
+    def search(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: int = 50,
+        groups: Optional[Iterable[str]] = None,
+        agent_id: Optional[str] = None,
+        accept: Optional[Callable[[str], bool]] = None,
+    ) -> Tuple[List[str], int]:
+        """Find the documents matching every term of a query, best match first.
+
+        Query terms match indexed terms exactly or as a prefix.
+
+        Args:
+            query: The search query
+            offset: Number of best matches to skip
+            limit: Maximum number of document IDs to return
+            groups: Groups of the searching agent, for permission filtering
+            agent_id: The searching agent, who can see documents it owns
+            accept: Additional filter on document IDs
+
+        Returns:
+            Tuple[List[str], int]: The page of document IDs and the total number of matches
+        """
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        if not query_terms or not self._documents:
+            return [], 0
+
+        # Score contributions of each query term, rarest term first
+        term_scores = [self._score_term(term) for term in query_terms]
+        term_scores.sort(key=len)
+
+        agent_groups = frozenset(groups or ())
+        scores: Dict[str, float] = {}
+        for doc_id, score in term_scores[0].items():
+            if not self._is_visible(doc_id, agent_groups, agent_id):
+                continue
+            for other in term_scores[1:]:
+                other_score = other.get(doc_id)
+                if other_score is None:
+                    break
+                score += other_score
+            else:
+                if accept is None or accept(doc_id):
+                    scores[doc_id] = score
+
+        total = len(scores)
+        if offset >= total or limit <= 0:
+            return [], total
+        best = heapq.nlargest(
+            offset + limit,
+            scores,
+            key=lambda doc_id: (scores[doc_id], self._documents[doc_id]["timestamp"]),
+        )
+        return best[offset:], total
+
+    def reconcile(self, doc_ids: Iterable[str]) -> Set[str]:
+        """Drop indexed documents that no longer exist.
+
+        Args:
+            doc_ids: IDs of all existing documents
+
+        Returns:
+            Set[str]: IDs of existing documents missing from the index, to be added
+        """
+        existing = set(doc_ids)
+        for doc_id in set(self._documents) - existing:
+            self.remove(doc_id)
+        return existing - set(self._documents)
+
+    def load(self) -> bool:
+        """Load the persisted index, replaying its change log.
+
+        Returns:
+            bool: False if no usable index was found
+        """
+        if self.snapshot_file is None:
+            return False
+        documents: Dict[str, Dict[str, Any]] = {}
+        try:
+            if self.snapshot_file.exists():
+                with open(self.snapshot_file, "r", encoding="utf-8") as f:
+                    snapshot = json.load(f)
+                if (
+                    snapshot.get("version") != INDEX_FORMAT_VERSION
+                    or snapshot.get("field_weights") != self.field_weights
+                ):
+                    logger.info(f"Discarding outdated search index {self.snapshot_file}")
+                    return False
+                documents = snapshot.get("documents", {})
+            elif not (self.log_file and self.log_file.exists()):
+                return False
+
+            if self.log_file.exists():
+                with open(self.log_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                            if record["op"] == "add":
+                                documents[record["id"]] = record["doc"]
+                            elif record["op"] == "remove":
+                                documents.pop(record["id"], None)
+                            self._logged_records += 1
+                        except (ValueError, KeyError, TypeError):
+                            # Torn record from an interrupted write
+                            continue
+        except Exception as e:
+            logger.error(f"Failed to load search index {self.snapshot_file}: {e}")
+            return False
+
+        for doc_id, document in documents.items():
+            self._insert_document(doc_id, document)
+        logger.debug(f"Loaded search index with {len(documents)} documents")
+        return True
+
+    def save(self) -> None:
+        """Write a snapshot of the index and truncate its change log."""
+        if self.snapshot_file is None:
+            return
+        try:
+            self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.snapshot_file.with_name(self.snapshot_file.name + ".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "version": INDEX_FORMAT_VERSION,
+                        "field_weights": self.field_weights,
+                        "documents": self._documents,
+                    },
+                    f,
+                )
+            os.replace(temp_file, self.snapshot_file)
+            with open(self.log_file, "w", encoding="utf-8"):
+                pass
+            self._logged_records = 0
+        except Exception as e:
+            logger.error(f"Failed to save search index {self.snapshot_file}: {e}")
+
+    def _log(self, record: Dict[str, Any]) -> None:
+        if self.log_file is None:
+            return
+        try:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+            self._logged_records += 1
+        except Exception as e:
+            logger.error(f"Failed to log search index change: {e}")
+            return
+        if self._logged_records >= max(self.compaction_records, len(self._documents)):
+            self.save()
+
+    def _insert_document(self, doc_id: str, document: Dict[str, Any]) -> None:
+        self._documents[doc_id] = document
+        self._total_length += document["length"]
+        for term, frequency in document["terms"].items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                insort(self._sorted_terms, term)
+            postings[doc_id] = frequency
+
+    def _remove_document(self, doc_id: str) -> None:
+        document = self._documents.pop(doc_id, None)
+        if document is None:
+            return
+        self._total_length -= document["length"]
+        for term in document["terms"]:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                position = bisect_left(self._sorted_terms, term)
+                if (
+                    position < len(self._sorted_terms)
+                    and self._sorted_terms[position] == term
+                ):
+                    del self._sorted_terms[position]
+
+    def _expand_term(self, term: str) -> List[Tuple[str, float]]:
+        """Get the indexed terms a query term matches, with their match weights."""
+        matches = []
+        if term in self._postings:
+            matches.append((term, 1.0))
+        position = bisect_left(self._sorted_terms, term)
+        while (
+            position < len(self._sorted_terms)
+            and self._sorted_terms[position].startswith(term)
+        ):
+            if self._sorted_terms[position] != term:
+                matches.append((self._sorted_terms[position], PREFIX_MATCH_WEIGHT))
+            position += 1
+        return matches
+
+    def _score_term(self, term: str) -> Dict[str, float]:
+        """Get the BM25 score of a query term for every document matching it.
+
+        Every expansion of the term contributes its matching documents; only the
+        first MAX_SCORED_PREFIX_EXPANSIONS prefix expansions are scored with full
+        BM25, the others by their match weight and IDF.
+        """
+        document_count = len(self._documents)
+        average_length = self._total_length / document_count or 1.0
+        scores: Dict[str, float] = {}
+        for index, (indexed_term, match_weight) in enumerate(self._expand_term(term)):
+            postings = self._postings[indexed_term]
+            document_frequency = len(postings)
+            idf = math.log(
+                1
+                + (document_count - document_frequency + 0.5)
+                / (document_frequency + 0.5)
+            )
+            if index > MAX_SCORED_PREFIX_EXPANSIONS:
+                score = match_weight * idf
+                for doc_id in postings:
+                    if score > scores.get(doc_id, 0.0):
+                        scores[doc_id] = score
+                continue
+            for doc_id, frequency in postings.items():
+                length = self._documents[doc_id]["length"]
+                score = (
+                    match_weight
+                    * idf
+                    * frequency
+                    * (self.k1 + 1)
+                    / (
+                        frequency
+                        + self.k1 * (1 - self.b + self.b * length / average_length)
+                    )
+                )
+                # A document matching several expansions counts its best one
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+        return scores
+
+    def _is_visible(
+        self, doc_id: str, agent_groups: FrozenSet[str], agent_id: Optional[str]
+    ) -> bool:
+        document = self._documents[doc_id]
+        if not document["groups"]:
+            return True
+        if agent_id is not None and document["owner"] == agent_id:
+            return True
+        return not agent_groups.isdisjoint(document["groups"])
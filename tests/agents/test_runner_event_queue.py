@@ -0,0 +1,217 @@
+"""
+Test cases for the event-driven AgentRunner loop.
+
+Tests that the runner processes events from the client's pending queue in
+timestamp order, wakes up as soon as an event arrives instead of waiting for
+the polling interval, and hands EventContext per-thread views that contain the
+events up to the one being processed, remembering only a bounded window of
+processed event IDs. With concurrent processing, it also tests that dequeueing
+stops while the worker backlogs are full.
+"""
+
+import asyncio
+
+import pytest
+
+from openagents.agents import runner as runner_module
+from openagents.agents.runner import AgentRunner
+from openagents.models.event import Event
+from openagents.models.event_context import EventContext
+
+
+class RecordingAgent(AgentRunner):
+    def __init__(self, **kwargs):
+        super().__init__(agent_id="agent-1", **kwargs)
+        self.contexts = []
+        self.reacted = asyncio.Event()
+
+    async def react(self, context: EventContext):
+        self.contexts.append(
+            (
+                context.incoming_event.event_id,
+                {
+                    thread_id: [e.event_id for e in thread.events]
+                    for thread_id, thread in context.event_threads.items()
+                },
+            )
+        )
+        self.reacted.set()
+
+
+def _event(event_id: str, timestamp: int, source_id: str = "user", name="chat.message"):
+    return Event(
+        event_id=event_id,
+        event_name=name,
+        source_id=source_id,
+        timestamp=timestamp,
+        thread_name="thread:" + name.rsplit(".", 1)[0],
+    )
+
+
+async def _run_until(agent: RecordingAgent, count: int):
+    agent._running = True
+    task = asyncio.create_task(agent._async_loop())
+    try:
+        while len(agent.contexts) < count:
+            agent.reacted.clear()
+            await asyncio.wait_for(agent.reacted.wait(), 1)
+    finally:
+        agent._running = False
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_events_are_processed_in_timestamp_order():
+    agent = RecordingAgent()
+    client = agent.client
+    client._add_event_to_thread(_event("late", 30))
+    client._add_event_to_thread(_event("early", 10))
+    client._record_outgoing_event(_event("reply", 20, source_id="agent-1"))
+    client._add_event_to_thread(_event("ping", 15, name="system.ping"))
+
+    await _run_until(agent, 2)
+
+    assert agent.contexts == [
+        ("early", {"thread:chat": ["early"]}),
+        ("late", {"thread:chat": ["early", "reply", "late"]}),
+    ]
+    assert agent.client._event_queues == []
+
+
+@pytest.mark.asyncio
+async def test_new_events_wake_up_the_loop():
+    agent = RecordingAgent(interval=60)
+    agent.client._add_event_to_thread(_event("first", 1))
+
+    async def deliver():
+        await asyncio.sleep(0.05)
+        agent.client._add_event_to_thread(_event("second", 2))
+        # Duplicates are not queued again
+        agent.client._add_event_to_thread(_event("second", 2))
+
+    delivery = asyncio.create_task(deliver())
+    await _run_until(agent, 2)
+    await delivery
+
+    assert [event_id for event_id, _ in agent.contexts] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_processed_event_ids_are_bounded(monkeypatch):
+    monkeypatch.setattr(runner_module, "PROCESSED_EVENT_WINDOW_SIZE", 2)
+    agent = RecordingAgent()
+    for i in range(4):
+        agent.client._add_event_to_thread(_event(f"chat-{i}", i))
+
+    await _run_until(agent, 4)
+
+    assert [event_id for event_id, _ in agent.contexts] == [
+        f"chat-{i}" for i in range(4)
+    ]
+    assert len(agent._processed_message_ids) == 2
+
+
+class GatedAgent(AgentRunner):
+    def __init__(self, **kwargs):
+        super().__init__(agent_id="agent-1", **kwargs)
+        self.started = []
+        self.finished = []
+        self.gates = {}
+        self.own_threads = {}
+
+    async def react(self, context: EventContext):
+        event_id = context.incoming_event.event_id
+        self.started.append(event_id)
+        self.own_threads[event_id] = [
+            e.event_id for e in context.event_threads[context.incoming_thread_id].events
+        ]
+        gate = self.gates.setdefault(event_id, asyncio.Event())
+        await gate.wait()
+        self.finished.append(event_id)
+
+
+async def _wait_for(condition):
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_threads_are_processed_concurrently_and_in_order():
+    agent = GatedAgent(max_concurrency=2)
+    client = agent.client
+    client._add_event_to_thread(_event("chat-1", 1))
+    client._add_event_to_thread(_event("chat-2", 2))
+    client._add_event_to_thread(_event("forum-1", 3, name="forum.topic"))
+    client._add_event_to_thread(_event("wiki-1", 4, name="wiki.page"))
+
+    agent._running = True
+    task = asyncio.create_task(agent._async_loop())
+    try:
+        # Two threads react in parallel; the second chat event waits for the first
+        # and the third thread waits for a free slot
+        await _wait_for(lambda: agent.started == ["chat-1", "forum-1"])
+        await asyncio.sleep(0.05)
+        assert agent.started == ["chat-1", "forum-1"]
+
+        agent.gates["forum-1"].set()
+        await _wait_for(lambda: "wiki-1" in agent.started)
+        assert "chat-2" not in agent.started
+
+        agent.gates["chat-1"].set()
+        await _wait_for(lambda: "chat-2" in agent.started)
+        agent.gates["chat-2"].set()
+        agent.gates["wiki-1"].set()
+        await _wait_for(lambda: len(agent.finished) == 4)
+        assert agent.finished.index("chat-1") < agent.finished.index("chat-2")
+
+        # Each reaction sees its own thread up to the incoming event
+        assert agent.own_threads["chat-1"] == ["chat-1"]
+        assert agent.own_threads["chat-2"] == ["chat-1", "chat-2"]
+    finally:
+        agent._running = False
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_backlog_is_bounded(monkeypatch):
+    monkeypatch.setattr(runner_module, "PENDING_EVENTS_PER_WORKER", 2)
+    agent = GatedAgent(max_concurrency=2)
+    for i in range(10):
+        agent.client._add_event_to_thread(_event(f"chat-{i}", i))
+
+    agent._running = True
+    task = asyncio.create_task(agent._async_loop())
+    try:
+        # The blocked thread holds four slots and the loop waits with the fifth
+        # event; the rest stay in the client queue
+        await _wait_for(lambda: agent.started == ["chat-0"])
+        await asyncio.sleep(0.05)
+        assert len(agent._processed_message_ids) == 5
+
+        for i in range(10):
+            agent.gates.setdefault(f"chat-{i}", asyncio.Event()).set()
+        await _wait_for(lambda: len(agent.finished) == 10)
+        assert agent.finished == [f"chat-{i}" for i in range(10)]
+        assert agent.own_threads["chat-9"] == [f"chat-{i}" for i in range(10)]
+    finally:
+        agent._running = False
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_sender_rate_limit_spaces_reactions():
+    agent = RecordingAgent(sender_rate_limit=20)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for i in range(3):
+        agent.client._add_event_to_thread(_event(f"m{i}", i))
+
+    await _run_until(agent, 3)
+
+    assert loop.time() - start >= 0.1
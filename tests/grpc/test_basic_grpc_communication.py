@@ -761,5 +761,46 @@ async def test_bidirectional_grpc_communication(grpc_client_a, grpc_client_b):
     print(f"   Client B received {len(b_received_from_a)} messages from A")
 
 
+@pytest.mark.asyncio
+async def test_grpc_stream_push_delivery(grpc_client_a, grpc_client_b):
+    """Test that events are pushed to gRPC clients over the StreamEvents RPC."""
+
+    print("🔍 Testing gRPC StreamEvents push delivery...")
+
+    # Client B should have switched from polling to the event stream
+    assert grpc_client_b.connector.poll_interval == 0.0
+
+    received = []
+    delivered = asyncio.Event()
+
+    async def message_handler(event):
+        if event.payload and event.payload.get("test_id") == "grpc_stream_push_test":
+            received.append(event)
+            delivered.set()
+
+    grpc_client_b.register_event_handler(message_handler, ["test.message"])
+
+    test_event = Event(
+        event_name="test.message",
+        source_id="client-a",
+        destination_id="client-b",
+        payload={"test_id": "grpc_stream_push_test", "count": 3},
+    )
+
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    assert await grpc_client_a.send_event(test_event)
+    await asyncio.wait_for(delivered.wait(), timeout=5.0)
+    elapsed = loop.time() - start
+
+    print(f"📥 Event delivered in {elapsed * 1000:.1f} ms")
+    # Well under the old fixed 1 second polling interval
+    assert elapsed < 0.5
+    # Pushed events keep integer payload values
+    assert received[0].payload["count"] == 3
+
+    print("✅ gRPC StreamEvents push delivery test PASSED")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s", "--tb=short"])
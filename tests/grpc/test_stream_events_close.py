@@ -0,0 +1,135 @@
+"""
+Test cases for closing gRPC event streams.
+
+Tests that a StreamEvents call whose client closed its side of the stream stops
+right away instead of keeping a poll parked on the agent's queue, that events
+polled but not handed to the client are put back on the queue, and that the
+gRPC connector reopens a dropped stream.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openagents.config.globals import SYSTEM_EVENT_POLL_MESSAGES
+from openagents.core.connectors import base as connector_base
+from openagents.core.connectors.grpc_connector import GRPCNetworkConnector
+from openagents.core.agent_event_queue import AgentEventQueue
+from openagents.core.event_envelope import EventEnvelope
+from openagents.core.event_gateway import EventGateway
+from openagents.core.transports.grpc import OpenAgentsGRPCServicer
+from openagents.models.event import Event
+from openagents.models.event_response import EventResponse
+from openagents.proto import agent_service_pb2
+
+
+@pytest.mark.asyncio
+async def test_closed_client_releases_parked_poll():
+    parked = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def call_event_handler(event: Event):
+        if not event.payload.get("wait_timeout"):
+            return EventResponse(success=True, message="", data={"messages": []})
+        parked.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    transport = MagicMock()
+    transport.call_event_handler = call_event_handler
+    servicer = OpenAgentsGRPCServicer(transport)
+    client_closed = asyncio.Event()
+
+    async def requests():
+        yield agent_service_pb2.Event(
+            event_name=SYSTEM_EVENT_POLL_MESSAGES, source_id="agent-1", secret="s"
+        )
+        await client_closed.wait()
+
+    stream = servicer.StreamEvents(requests(), AsyncMock())
+    consumer = asyncio.create_task(stream.__anext__())
+    await asyncio.wait_for(parked.wait(), 1)
+
+    client_closed.set()
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(consumer, 1)
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_undelivered_stream_events_are_requeued():
+    messages = [
+        Event(event_name="test.message", source_id="a", payload={"index": index}).to_dict()
+        for index in range(3)
+    ]
+
+    async def call_event_handler(event: Event):
+        return EventResponse(success=True, message="", data={"messages": messages})
+
+    transport = MagicMock()
+    transport.call_event_handler = call_event_handler
+    servicer = OpenAgentsGRPCServicer(transport)
+
+    async def requests():
+        yield agent_service_pb2.Event(
+            event_name=SYSTEM_EVENT_POLL_MESSAGES, source_id="agent-1", secret="s"
+        )
+        await asyncio.sleep(60)
+
+    # The client goes away while the second event is being written
+    stream = servicer.StreamEvents(requests(), AsyncMock())
+    await stream.__anext__()
+    await stream.__anext__()
+    await stream.aclose()
+
+    agent_id, requeued = transport.requeue_messages.call_args.args
+    assert agent_id == "agent-1"
+    assert [message["payload"]["index"] for message in requeued] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_poll_requeues_its_event():
+    network = MagicMock()
+    release_heartbeat = asyncio.Event()
+
+    async def record_heartbeat(agent_id: str):
+        if network.topology.record_heartbeat.await_count > 1:
+            await release_heartbeat.wait()
+
+    network.topology.record_heartbeat = AsyncMock(side_effect=record_heartbeat)
+    gateway = EventGateway(network)
+    queue = AgentEventQueue()
+    gateway.agent_event_queues["agent-1"] = queue
+
+    poll = asyncio.create_task(gateway.poll_envelopes("agent-1", wait_timeout=5))
+    await asyncio.sleep(0)
+    queue.put_nowait(EventEnvelope(Event(event_name="test.message", source_id="a")))
+    await asyncio.sleep(0.01)
+    poll.cancel()
+    await asyncio.gather(poll, return_exceptions=True)
+
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_connector_reopens_event_stream(monkeypatch):
+    monkeypatch.setattr(connector_base, "STREAM_RECONNECT_DELAY", 0.01)
+    connector = GRPCNetworkConnector("localhost", 50051, "agent-1")
+    connector.is_connected = True
+
+    attempts = []
+
+    async def receive_event_stream():
+        attempts.append(len(attempts))
+        if len(attempts) == 3:
+            # The server turns out to have no event stream
+            connector.use_event_stream = False
+        return len(attempts) == 2
+
+    connector._receive_event_stream = receive_event_stream
+    await asyncio.wait_for(connector._listen_event_stream(), 1)
+    assert attempts == [0, 1, 2]
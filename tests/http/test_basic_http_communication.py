@@ -823,3 +823,77 @@ async def test_bidirectional_http_communication(http_client_a, http_client_b):
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s", "--tb=short"])
+
+
+@pytest.mark.asyncio
+async def test_http_push_delivery_latency(http_client_a, http_client_b):
+    """Test that events reach an idle HTTP client without waiting for a poll interval."""
+
+    print("🔍 Testing HTTP push delivery latency...")
+
+    # Client B should be receiving over the event stream or long polling
+    assert http_client_b.connector.poll_interval == 0.0
+
+    received = asyncio.Event()
+
+    async def message_handler(event):
+        if event.payload and event.payload.get("test_id") == "http_push_latency_test":
+            received.set()
+
+    http_client_b.register_event_handler(message_handler, ["test.message"])
+
+    test_event = Event(
+        event_name="test.message",
+        source_id="http-client-a",
+        destination_id="http-client-b",
+        payload={"test_id": "http_push_latency_test"},
+    )
+
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    assert await http_client_a.send_event(test_event)
+    await asyncio.wait_for(received.wait(), timeout=5.0)
+    elapsed = loop.time() - start
+
+    print(f"📥 Event delivered in {elapsed * 1000:.1f} ms")
+    # Well under the old fixed 1 second polling interval
+    assert elapsed < 0.5
+
+    print("✅ HTTP push delivery latency test PASSED")
+
+
+@pytest.mark.asyncio
+async def test_http_batch_send_events(http_client_a, http_client_b):
+    """Test that a batch of events is submitted in one request and delivered in order."""
+
+    print("🔍 Testing HTTP batch event submission...")
+
+    received = []
+    all_received = asyncio.Event()
+
+    async def message_handler(event):
+        if event.payload and event.payload.get("test_id") == "http_batch_test":
+            received.append(event.payload["index"])
+            if len(received) == 5:
+                all_received.set()
+
+    http_client_b.register_event_handler(message_handler, ["test.message"])
+
+    events = [
+        Event(
+            event_name="test.message",
+            source_id="http-client-a",
+            destination_id="http-client-b",
+            payload={"test_id": "http_batch_test", "index": index},
+        )
+        for index in range(5)
+    ]
+    responses = await http_client_a.send_events(events)
+    assert len(responses) == 5
+    assert all(response.success for response in responses)
+    assert http_client_a.connector.batch_supported
+
+    await asyncio.wait_for(all_received.wait(), timeout=10.0)
+    assert received == [0, 1, 2, 3, 4]
+
+    print("✅ HTTP batch event submission test PASSED")
@@ -0,0 +1,155 @@
+"""
+Test cases for streaming shared cache and artifact files over HTTP.
+
+Tests that uploads are streamed to a blob that the upload event only refers
+to, that downloads are served from disk with Range support, that access is
+still checked by the mods, and that rejected uploads leave no blobs behind.
+"""
+
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from openagents.core.transports.http import (
+    SHARED_ARTIFACT_MOD,
+    SHARED_CACHE_MOD,
+    HttpTransport,
+)
+from openagents.mods.core.shared_cache.mod import SharedCacheMod
+from openagents.mods.workspace.shared_artifact.mod import SharedArtifactMod
+
+
+def _bind(mod, workspace: Path):
+    network = MagicMock()
+    network.network_id = "test-network"
+    network.process_event = AsyncMock()
+    network.topology.agent_registry = {}
+    network.topology.agent_group_membership = {"writer": "editors"}
+    mod._network = network
+    mod.get_storage_path = lambda: workspace
+    return mod
+
+
+@pytest.fixture
+async def http_setup():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        workspace = Path(temp_dir)
+        cache_mod = _bind(SharedCacheMod(), workspace)
+        cache_mod._setup_cache_storage()
+        artifact_mod = _bind(SharedArtifactMod(), workspace)
+        artifact_mod._setup_artifact_storage()
+
+        events = []
+
+        async def handle_event(event):
+            events.append(event)
+            mod = cache_mod if event.relevant_mod == SHARED_CACHE_MOD else artifact_mod
+            return await mod.process_event(event)
+
+        transport = HttpTransport()
+        transport.network_instance = SimpleNamespace(
+            mods={SHARED_CACHE_MOD: cache_mod, SHARED_ARTIFACT_MOD: artifact_mod}
+        )
+        transport.register_event_handler(handle_event)
+
+        client = TestClient(TestServer(transport.app))
+        await client.start_server()
+        try:
+            yield client, cache_mod, artifact_mod, events
+        finally:
+            await client.close()
+
+
+def _form(content: bytes, **fields) -> aiohttp.FormData:
+    form = aiohttp.FormData()
+    for name, value in fields.items():
+        form.add_field(name, value)
+    form.add_field(
+        "file", content, filename="data.bin", content_type="application/octet-stream"
+    )
+    return form
+
+
+@pytest.mark.asyncio
+async def test_upload_streams_blob_and_download_supports_ranges(http_setup):
+    client, cache_mod, _, events = http_setup
+    content = bytes(range(256)) * 4096
+
+    response = await client.post(
+        "/api/cache/upload", data=_form(content, agent_id="writer")
+    )
+    result = await response.json()
+    assert result["success"], result
+    assert result["file_size"] == len(content)
+
+    # The upload event refers to the blob instead of carrying the file
+    payload = events[-1].payload
+    assert "file_data" not in payload and payload["blob_id"]
+    assert list(cache_mod.incoming_path.iterdir()) == []
+
+    cache_id = result["cache_id"]
+    response = await client.get(f"/api/cache/download/{cache_id}?agent_id=reader")
+    assert response.status == 200
+    assert await response.read() == content
+    assert "data.bin" in response.headers["Content-Disposition"]
+    assert "file_data" not in (await cache_mod.process_event(events[-1])).data
+
+    response = await client.get(
+        f"/api/cache/download/{cache_id}?agent_id=reader",
+        headers={"Range": "bytes=100-199"},
+    )
+    assert response.status == 206
+    assert await response.read() == content[100:200]
+
+
+@pytest.mark.asyncio
+async def test_rejected_uploads_leave_no_blobs(http_setup):
+    client, cache_mod, _, _ = http_setup
+
+    response = await client.post("/api/cache/upload", data=_form(b"no agent"))
+    assert response.status == 400
+
+    response = await client.post(
+        "/api/cache/upload",
+        data=_form(b"x", agent_id="writer", allowed_agent_groups="editors"),
+    )
+    cache_id = (await response.json())["cache_id"]
+
+    assert list(cache_mod.incoming_path.iterdir()) == []
+
+    # Group restricted entries are still checked by the mod
+    response = await client.get(f"/api/cache/download/{cache_id}?agent_id=reader")
+    assert response.status == 403
+
+    # A second file part is rejected instead of replacing the first blob
+    form = _form(b"first", agent_id="writer")
+    form.add_field("file", b"second", filename="other.bin")
+    response = await client.post("/api/cache/upload", data=form)
+    assert response.status == 400
+    assert list(cache_mod.incoming_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_artifact_download_is_served_from_disk(http_setup):
+    client, _, artifact_mod, events = http_setup
+    created = await artifact_mod._handle_artifact_create(
+        SimpleNamespace(
+            payload={"content": "hello artifacts", "name": "notes.txt"},
+            source_id="writer",
+        )
+    )
+    artifact_id = created.data["artifact_id"]
+
+    response = await client.get(
+        f"/api/artifacts/download/{artifact_id}?agent_id=reader",
+        headers={"Range": "bytes=6-"},
+    )
+    assert response.status == 206
+    assert await response.read() == b"artifacts"
+    assert response.headers["Content-Type"].startswith("text/plain")
+    assert events[-1].payload["include_content"] is False
@@ -0,0 +1,135 @@
+"""
+Test cases for recovering from dropped HTTP event streams.
+
+Tests that events the server could not write to a closed or failing stream
+are put back on the agent's queue, that the HTTP connector reopens the event
+stream with backoff instead of staying on polling, and that it parses events
+packed into or split across chunks.
+"""
+
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openagents.core.connectors import base as connector_base
+from openagents.core.connectors.http_connector import HTTPNetworkConnector
+from openagents.core.transports.http import HttpTransport
+from openagents.models.event import Event
+
+
+def _messages(count: int):
+    return [
+        Event(
+            event_name="test.message", source_id="sender", payload={"index": index}
+        ).to_dict()
+        for index in range(count)
+    ]
+
+
+def _requeued(gateway: MagicMock):
+    return [
+        [envelope.event.payload["index"] for envelope in call.args[1]]
+        for call in gateway.requeue_envelopes.call_args_list
+    ]
+
+
+@pytest.fixture
+def transport():
+    transport = HttpTransport()
+    transport.network_instance = SimpleNamespace(event_gateway=MagicMock())
+    return transport
+
+
+def _request(closing: bool = False):
+    return SimpleNamespace(transport=SimpleNamespace(is_closing=lambda: closing))
+
+
+@pytest.mark.asyncio
+async def test_unwritten_events_are_requeued(transport):
+    gateway = transport.network_instance.event_gateway
+    stream = MagicMock()
+    stream.write = AsyncMock()
+
+    assert await transport._write_stream_events(_request(), stream, "agent-1", _messages(2))
+    assert stream.write.await_count == 2
+    assert not gateway.requeue_envelopes.called
+
+    # A closed connection gets no writes and keeps the events queued
+    assert not await transport._write_stream_events(
+        _request(closing=True), stream, "agent-1", _messages(2)
+    )
+    assert _requeued(gateway) == [[0, 1]]
+
+    # A failing write keeps the event it failed on and the ones after it
+    stream.write = AsyncMock(side_effect=[None, ConnectionResetError()])
+    with pytest.raises(ConnectionResetError):
+        await transport._write_stream_events(_request(), stream, "agent-1", _messages(3))
+    assert _requeued(gateway)[-1] == [1, 2]
+    assert gateway.requeue_envelopes.call_args.args[0] == "agent-1"
+
+
+@pytest.mark.asyncio
+async def test_connector_reopens_event_stream(monkeypatch):
+    monkeypatch.setattr(connector_base, "STREAM_RECONNECT_DELAY", 0.01)
+    connector = HTTPNetworkConnector("localhost", 8700, "agent-1")
+    connector.is_connected = True
+
+    attempts = []
+
+    async def receive_event_stream():
+        attempts.append(len(attempts))
+        if len(attempts) == 3:
+            connector.is_connected = False
+        return len(attempts) == 2
+
+    connector._receive_event_stream = receive_event_stream
+    await connector._listen_event_stream()
+    assert attempts == [0, 1, 2]
+
+    # A server without the stream endpoint is not asked again
+    connector.is_connected = True
+
+    async def no_stream_endpoint():
+        attempts.append(len(attempts))
+        connector.use_event_stream = False
+        return False
+
+    connector._receive_event_stream = no_stream_endpoint
+    await connector._listen_event_stream()
+    assert attempts == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_connector_parses_stream_chunks():
+    connector = HTTPNetworkConnector("localhost", 8700, "agent-1")
+    connector.is_connected = True
+    body = b": keep-alive\n\n" + b"".join(
+        f"data: {json.dumps(message)}\r\n\r\n".encode("utf-8")
+        for message in _messages(200)
+    )
+    # One large burst, then the rest split mid-line
+    chunks = [body[:-100], body[-100:-40], body[-40:]]
+
+    async def iter_any():
+        for chunk in chunks:
+            yield chunk
+
+    response = SimpleNamespace(status=200, content=SimpleNamespace(iter_any=iter_any))
+
+    @asynccontextmanager
+    async def get(*args, **kwargs):
+        yield response
+
+    connector.session = SimpleNamespace(get=get)
+    connector.aiohttp = MagicMock()
+    received = []
+
+    async def consume_message(event):
+        received.append(event.payload["index"])
+
+    connector.consume_message = consume_message
+    assert await connector._receive_event_stream()
+    assert received == list(range(200))
@@ -0,0 +1,68 @@
+"""Tests for Event routing info parsing.
+
+Tests that parse_source and parse_destination results are cached per event
+and re-parsed when the IDs change.
+"""
+
+from openagents.models.event import Event, EventDestination, EventSource
+from openagents.models.network_role import NetworkRole
+
+
+class TestEventRouting:
+    """Tests for cached Event.parse_source / Event.parse_destination."""
+
+    def test_parse_results(self):
+        """Test parsed roles and IDs."""
+        event = Event(
+            event_name="agent.message.sent",
+            source_id="mod:openagents.mods.workspace.messaging",
+            destination_id="channel:general",
+        )
+        assert event.parse_source() == EventSource(
+            NetworkRole.MOD, "openagents.mods.workspace.messaging"
+        )
+        assert event.parse_destination() == EventDestination(
+            NetworkRole.CHANNEL, "general"
+        )
+
+    def test_parse_is_cached(self):
+        """Test that repeated calls reuse the parsed result."""
+        event = Event(
+            event_name="agent.message.sent",
+            source_id="agent-a",
+            destination_id="agent:agent-b",
+        )
+        assert event.parse_source() is event.parse_source()
+        assert event.parse_destination() is event.parse_destination()
+
+    def test_parse_invalidated_on_change(self):
+        """Test that changing an ID re-parses it."""
+        event = Event(
+            event_name="agent.message.sent",
+            source_id="agent-a",
+            destination_id="agent:agent-b",
+        )
+        event.parse_source()
+        event.parse_destination()
+
+        event.source_id = "system"
+        event.destination_id = "agent:broadcast"
+
+        assert event.parse_source() == EventSource(NetworkRole.SYSTEM, "system")
+        assert event.parse_destination() == EventDestination(
+            NetworkRole.AGENT, "broadcast"
+        )
+
+    def test_copy_keeps_independent_cache(self):
+        """Test that a copied event re-parses its own changed IDs."""
+        event = Event(
+            event_name="agent.message.sent",
+            source_id="agent-a",
+            destination_id="agent:agent-b",
+        )
+        event.parse_destination()
+        copied = event.model_copy()
+        copied.destination_id = "channel:general"
+
+        assert copied.parse_destination().role == NetworkRole.CHANNEL
+        assert event.parse_destination().role == NetworkRole.AGENT
@@ -0,0 +1,84 @@
+"""
+Test cases for EventThread indexing and client-side event retention.
+
+Tests that threads keep events ordered by timestamp and deduplicated by ID,
+that trimming evicts the oldest events, and that AgentClient enforces its
+per-thread, global and age limits on the cached events.
+"""
+
+import time
+
+from openagents.core.client import AgentClient
+from openagents.models.event import Event
+from openagents.models.event_thread import EventThread
+
+
+def _event(event_id: str, timestamp: int, name: str = "chat.message") -> Event:
+    return Event(
+        event_id=event_id, event_name=name, source_id="user", timestamp=timestamp
+    )
+
+
+def test_thread_orders_and_deduplicates():
+    thread = EventThread(events=[_event("b", 20), _event("a", 10)])
+
+    assert thread.add_event(_event("d", 40))
+    assert thread.add_event(_event("c", 30))
+    assert not thread.add_event(_event("a", 10))
+
+    assert [e.event_id for e in thread.get_events()] == ["a", "b", "c", "d"]
+    assert thread.has_event("c")
+
+    # Direct changes to the list are picked up by the index
+    thread.events.append(_event("e", 5))
+    assert not thread.add_event(_event("e", 5))
+    assert [e.event_id for e in thread.events] == ["e", "a", "b", "c", "d"]
+
+
+def test_thread_trim_and_remove():
+    thread = EventThread()
+    for i in range(5):
+        thread.add_event(_event(f"e{i}", i))
+
+    assert [e.event_id for e in thread.trim(max_events=3)] == ["e0", "e1"]
+    assert [e.event_id for e in thread.trim(min_timestamp=3)] == ["e2"]
+    assert thread.remove_event("e4", 4).event_id == "e4"
+    assert thread.remove_event("e4") is None
+    assert [e.event_id for e in thread.events] == ["e3"]
+    assert not thread.has_event("e0")
+
+
+def test_client_per_thread_and_global_limits():
+    client = AgentClient(agent_id="agent-1", max_events_per_thread=3, max_cached_events=3)
+    for i in range(5):
+        event = _event(f"chat-{i}", i)
+        event.thread_name = "thread:chat"
+        client._event_id_map[event.event_id] = event
+        client._add_event_to_thread(event)
+
+    chat = client.get_event_threads()["thread:chat"]
+    assert [e.event_id for e in chat.events] == ["chat-2", "chat-3", "chat-4"]
+    assert client.get_cached_event("chat-0") is None
+
+    for i in range(2):
+        client._record_outgoing_event(_event(f"forum-{i}", 10 + i, name="forum.topic"))
+
+    # The oldest events across all threads are evicted first
+    assert [e.event_id for e in chat.events] == ["chat-4"]
+    assert [e.event_id for e in client.get_event_threads()["thread:forum"].events] == [
+        "forum-0",
+        "forum-1",
+    ]
+    assert client._event_count == 3
+
+
+def test_client_age_limit_drops_empty_threads():
+    client = AgentClient(agent_id="agent-1", max_event_age=60)
+    now = int(time.time())
+    client._record_outgoing_event(_event("old", now - 120, name="wiki.page"))
+    client._record_outgoing_event(_event("new", now))
+
+    threads = client.get_event_threads()
+    assert "thread:wiki" not in threads
+    assert [e.event_id for e in threads["thread:chat"].events] == ["new"]
+    assert client.get_cached_event("old") is None
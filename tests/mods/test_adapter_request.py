@@ -0,0 +1,87 @@
+"""
+Test cases for request/response correlation in mod adapters.
+
+Tests that an adapter request resolves as soon as the correlated response
+event arrives, that data returned directly with the EventResponse is used
+without waiting, and that timed out or cancelled requests are cleaned up.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from openagents.core.client import AgentClient
+from openagents.models.event import Event
+from openagents.models.event_response import EventResponse
+from openagents.mods.core.shared_cache.adapter import SharedCacheAdapter
+
+
+@pytest.fixture
+def adapter():
+    client = AgentClient(agent_id="agent-1")
+    connector = AsyncMock()
+    connector.send_event.return_value = EventResponse(success=True)
+
+    adapter = SharedCacheAdapter()
+    adapter.bind_agent("agent-1")
+    adapter.bind_connector(connector)
+    adapter.bind_client(client)
+    return adapter
+
+
+async def _pending_request_id(client: AgentClient) -> str:
+    for _ in range(100):
+        if client._response_futures:
+            return next(iter(client._response_futures))
+        await asyncio.sleep(0.01)
+    raise AssertionError("request not sent")
+
+
+@pytest.mark.asyncio
+async def test_response_event_resolves_request(adapter):
+    client = adapter.agent_client
+    task = asyncio.create_task(adapter.create_cache("value"))
+    request_id = await _pending_request_id(client)
+
+    await client._handle_event(
+        Event(
+            event_name="shared_cache.create.response",
+            source_id="mod:openagents.mods.core.shared_cache",
+            destination_id="agent-1",
+            response_to=request_id,
+            payload={"success": True, "cache_id": "cache-1"},
+        )
+    )
+
+    assert await asyncio.wait_for(task, 1) == "cache-1"
+    assert client._response_futures == {}
+
+
+@pytest.mark.asyncio
+async def test_direct_response_data_is_used(adapter):
+    adapter.connector.send_event.return_value = EventResponse(
+        success=False, message="Cache entry not found"
+    )
+
+    assert await adapter.get_cache("missing") is None
+    assert await adapter.request(
+        Event(event_name="shared_cache.get", source_id="agent-1")
+    ) == {"success": False, "error": "Cache entry not found"}
+    assert adapter.agent_client._response_futures == {}
+
+
+@pytest.mark.asyncio
+async def test_timed_out_and_cancelled_requests_are_cleaned_up(adapter):
+    client = adapter.agent_client
+    event = Event(event_name="shared_cache.get", source_id="agent-1")
+
+    assert await adapter.request(event, timeout=0.05) is None
+    assert client._response_futures == {}
+
+    task = asyncio.create_task(adapter.request(event, timeout=10))
+    await _pending_request_id(client)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert client._response_futures == {}
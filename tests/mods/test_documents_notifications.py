@@ -0,0 +1,62 @@
+"""
+Test cases for document notifications.
+
+Tests that notifications for restricted documents and document broadcasts are
+sent as a single event multicast to the agents concerned.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openagents.mods.workspace.documents.mod import Document, DocumentsNetworkMod
+
+
+@pytest.fixture
+def mod():
+    mod = DocumentsNetworkMod()
+    mod._network = MagicMock()
+    mod._network.process_event = AsyncMock()
+    return mod
+
+
+@pytest.mark.asyncio
+async def test_restricted_document_notification_is_multicast(mod):
+    document = Document("doc-1", "Plan", creator_agent_id="alice")
+    document.access_permissions = {"alice": "admin", "bob": "write", "carol": "read"}
+
+    await mod._send_document_notification("document.updated", document, "bob")
+
+    mod.network.process_event.assert_awaited_once()
+    event = mod.network.process_event.await_args.args[0]
+    assert event.event_name == "document.updated"
+    assert event.destination_id is None
+    assert mod.network.process_event.await_args.kwargs["recipient_ids"] == {
+        "alice",
+        "carol",
+    }
+
+
+@pytest.mark.asyncio
+async def test_document_broadcast_is_multicast_to_active_users(mod):
+    document = Document("doc-1", "Plan", creator_agent_id="alice")
+    document.active_users = ["alice", "bob", "carol"]
+    mod.documents["doc-1"] = document
+
+    await mod._broadcast_to_document_users(
+        "doc-1", "document.cursor_moved", {"line": 3}, exclude_agent_id="alice"
+    )
+
+    mod.network.process_event.assert_awaited_once()
+    assert mod.network.process_event.await_args.kwargs["recipient_ids"] == {
+        "bob",
+        "carol",
+    }
+
+    # Nobody else is viewing the document
+    mod.network.process_event.reset_mock()
+    document.active_users = ["alice"]
+    await mod._broadcast_to_document_users(
+        "doc-1", "document.cursor_moved", {"line": 4}, exclude_agent_id="alice"
+    )
+    mod.network.process_event.assert_not_awaited()
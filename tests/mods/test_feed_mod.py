@@ -143,12 +143,11 @@ class TestFeedPersistence:
 
         # Save the post
         feed_mod._save_post(post)
-        feed_mod._save_metadata(["test_post_1"])
 
         # Verify files were created
         expected_files = [
             temp_workspace / "posts" / "test_post_1.json",
-            temp_workspace / "metadata.json",
+            temp_workspace / "post_summaries.jsonl",
         ]
 
         for file_path in expected_files:
@@ -165,7 +164,7 @@ class TestFeedPersistence:
         assert "test" in loaded_post.tags
         assert "important" in loaded_post.tags
 
-        # Verify metadata was restored
+        # Verify the post order was restored from the post summaries
         assert feed_mod.post_order_recent == ["test_post_1"]
 
         print("Feed persistence cycle test passed!")
@@ -301,8 +300,6 @@ class TestFeedSearch:
         for post in posts:
             mod._save_post(post)
 
-        mod._save_metadata(["post-3", "post-2", "post-1"])
-
         return mod
 
     @pytest.mark.asyncio
@@ -388,7 +385,6 @@ class TestFeedAccessControl:
 
         mod._save_post(public_post)
         mod._save_post(restricted_post)
-        mod._save_metadata(["restricted-post", "public-post"])
 
         return mod
 
@@ -464,7 +460,6 @@ class TestFeedPagination:
 
         # Create 10 test posts
         base_time = time.time()
-        post_ids = []
 
         for i in range(10):
             post = FeedPost(
@@ -476,9 +471,6 @@ class TestFeedPagination:
                 tags=[f"tag-{i % 3}"],
             )
             mod._save_post(post)
-            post_ids.append(post.post_id)
-
-        mod._save_metadata(post_ids)
 
         return mod
 
@@ -585,7 +577,6 @@ class TestFeedRecentPosts:
 
         mod._save_post(old_post)
         mod._save_post(recent_post)
-        mod._save_metadata(["recent-post", "old-post"])
 
         return mod, now
 
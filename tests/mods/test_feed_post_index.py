@@ -0,0 +1,181 @@
+"""
+Test cases for the feed mod's in-memory post indexes.
+
+Tests that listing and searching filter through the in-memory indexes and only
+load the posts on the requested page, that cursor pagination walks the feed
+without gaps or repeats, that unknown cursors do not restart the feed, and that
+the post summaries file is rebuilt from the post files when missing.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from openagents.mods.workspace.feed.mod import (
+    POST_SUMMARIES_FILE,
+    FeedNetworkMod,
+    FeedPost,
+)
+from openagents.models.event import Event
+
+
+@pytest.fixture
+def temp_workspace():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def _feed_mod(workspace: Path) -> FeedNetworkMod:
+    mod = FeedNetworkMod()
+    mod.get_storage_path = lambda: workspace
+    mod.initialize()
+    return mod
+
+
+@pytest.fixture
+def feed_dir(temp_workspace):
+    mod = _feed_mod(temp_workspace)
+    for i in range(20):
+        mod._save_post(
+            FeedPost(
+                post_id=f"post-{i:02d}",
+                title=f"Post {i}",
+                content=f"Content {i}",
+                author_id="agent-1" if i % 2 == 0 else "agent-2",
+                created_at=1000.0 + i,
+                tags=["Even"] if i % 2 == 0 else ["odd"],
+            )
+        )
+    return temp_workspace
+
+
+async def _list(mod: FeedNetworkMod, **payload):
+    response = await mod._list_posts(
+        Event(event_name="feed.posts.list", source_id="reader", payload=payload)
+    )
+    assert response.success
+    return response.data
+
+
+@pytest.mark.asyncio
+async def test_listing_loads_only_the_page(feed_dir):
+    mod = _feed_mod(feed_dir)
+    mod._load_post = MagicMock(wraps=mod._load_post)
+
+    data = await _list(mod, limit=5, author_id="agent-1", tags=["even"])
+
+    assert [p["post_id"] for p in data["posts"]] == [
+        "post-18",
+        "post-16",
+        "post-14",
+        "post-12",
+        "post-10",
+    ]
+    assert data["total_count"] == 10
+    assert mod._load_post.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_filtered_search_loads_only_the_page(feed_dir):
+    mod = _feed_mod(feed_dir)
+    mod._load_post = MagicMock(wraps=mod._load_post)
+
+    response = await mod._search_posts(
+        Event(
+            event_name="feed.posts.search",
+            source_id="reader",
+            payload={"query": "content", "author_id": "agent-1", "tags": ["EVEN"], "limit": 3},
+        )
+    )
+
+    assert response.data["total_count"] == 10
+    assert len(response.data["posts"]) == 3
+    assert mod._load_post.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination(feed_dir):
+    mod = _feed_mod(feed_dir)
+
+    for sort_by in ("recent", "oldest"):
+        seen = []
+        cursor = None
+        while True:
+            data = await _list(mod, limit=6, sort_by=sort_by, after_post_id=cursor)
+            seen.extend(p["post_id"] for p in data["posts"])
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+        expected = sorted(f"post-{i:02d}" for i in range(20))
+        assert seen == (expected if sort_by == "oldest" else expected[::-1])
+
+
+@pytest.mark.asyncio
+async def test_recent_posts_cursor_handles_equal_timestamps(temp_workspace):
+    mod = _feed_mod(temp_workspace)
+    for post_id in ("a", "b", "c"):
+        mod._save_post(
+            FeedPost(
+                post_id=post_id,
+                title=post_id,
+                content=post_id,
+                author_id="agent-1",
+                created_at=2000.0,
+            )
+        )
+
+    polled = []
+    after_post_id = None
+    for _ in range(3):
+        response = await mod._get_recent_posts(
+            Event(
+                event_name="feed.posts.recent",
+                source_id="reader",
+                payload={"since_timestamp": 0, "limit": 1, "after_post_id": after_post_id},
+            )
+        )
+        polled.extend(p["post_id"] for p in response.data["posts"])
+        after_post_id = response.data["latest_post_id"]
+
+    assert polled == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_cursor_does_not_restart_the_feed(feed_dir):
+    mod = _feed_mod(feed_dir)
+
+    # Polling falls back to the timestamp
+    response = await mod._get_recent_posts(
+        Event(
+            event_name="feed.posts.recent",
+            source_id="reader",
+            payload={"since_timestamp": 1016, "after_post_id": "gone"},
+        )
+    )
+    assert [p["post_id"] for p in response.data["posts"]] == [
+        "post-17",
+        "post-18",
+        "post-19",
+    ]
+    assert response.data["latest_post_id"] == "post-19"
+
+    # Listing rejects the cursor
+    response = await mod._list_posts(
+        Event(
+            event_name="feed.posts.list",
+            source_id="reader",
+            payload={"after_post_id": "gone"},
+        )
+    )
+    assert not response.success
+
+
+def test_missing_summaries_are_rebuilt(feed_dir):
+    (feed_dir / POST_SUMMARIES_FILE).unlink()
+
+    mod = _feed_mod(feed_dir)
+    assert len(mod.post_summaries) == 20
+    assert mod.post_order_recent[0] == "post-19"
+    assert (feed_dir / POST_SUMMARIES_FILE).exists()
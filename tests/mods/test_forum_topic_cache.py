@@ -0,0 +1,133 @@
+"""
+Test cases for the forum mod's in-memory topic store.
+
+Tests that topics, votes and orderings are served from memory after loading,
+that changes are written through to storage, and that a new mod instance
+restores the same state.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openagents.mods.workspace.forum.mod import ForumNetworkMod
+from openagents.models.event import Event
+
+
+@pytest.fixture
+def temp_workspace():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def _forum_mod(workspace: Path) -> ForumNetworkMod:
+    mod = ForumNetworkMod()
+    mod.get_storage_path = lambda: workspace
+    mod.send_event = AsyncMock()
+    mod.initialize()
+    return mod
+
+
+async def _create_topic(mod: ForumNetworkMod, title: str) -> str:
+    response = await mod._handle_topic_operations(
+        Event(
+            event_name="forum.topic.create",
+            source_id="alice",
+            payload={"action": "create", "title": title, "content": f"About {title}"},
+        )
+    )
+    assert response.success
+    return response.data["topic_id"]
+
+
+async def _vote(mod: ForumNetworkMod, voter_id: str, target_type: str, target_id: str):
+    response = await mod._handle_voting(
+        Event(
+            event_name="forum.vote.cast",
+            source_id=voter_id,
+            payload={
+                "action": "cast",
+                "target_type": target_type,
+                "target_id": target_id,
+                "vote_type": "upvote",
+            },
+        )
+    )
+    assert response.success
+    return response
+
+
+async def _list_topics(mod: ForumNetworkMod, sort_by: str):
+    response = await mod._handle_queries(
+        Event(
+            event_name="forum.topics.list",
+            source_id="bob",
+            payload={"query_type": "list_topics", "sort_by": sort_by, "limit": 2},
+        )
+    )
+    assert response.success
+    return response.data
+
+
+@pytest.mark.asyncio
+async def test_queries_and_votes_do_not_read_storage(temp_workspace):
+    mod = _forum_mod(temp_workspace)
+    first = await _create_topic(mod, "first")
+    second = await _create_topic(mod, "second")
+    third = await _create_topic(mod, "third")
+
+    mod._load_topic = MagicMock(side_effect=AssertionError("topic read from storage"))
+
+    await _vote(mod, "bob", "topic", second)
+
+    recent = await _list_topics(mod, "recent")
+    assert [t["topic_id"] for t in recent["topics"]] == [third, second]
+    assert recent["total_count"] == 3
+    assert recent["has_more"]
+
+    popular = await _list_topics(mod, "popular")
+    assert [t["topic_id"] for t in popular["topics"]] == [second, first]
+    assert mod.topic_order_popular == [second, first, third]
+
+
+@pytest.mark.asyncio
+async def test_changes_are_written_through(temp_workspace):
+    mod = _forum_mod(temp_workspace)
+    first = await _create_topic(mod, "first")
+    second = await _create_topic(mod, "second")
+    await _vote(mod, "bob", "topic", second)
+
+    comment = await mod._handle_comment_operations(
+        Event(
+            event_name="forum.comment.post",
+            source_id="bob",
+            payload={"action": "post", "topic_id": first, "content": "Nice"},
+        )
+    )
+    comment_id = comment.data["comment_id"]
+    await _vote(mod, "carol", "comment", comment_id)
+
+    reloaded = _forum_mod(temp_workspace)
+    assert reloaded.topic_order_recent == [second, first]
+    assert reloaded.topic_order_popular == [second, first]
+    assert reloaded.user_votes["bob"] == {second: "upvote"}
+    assert reloaded.topics[first].comments[comment_id].upvotes == 1
+
+    # Deleting a topic drops it from the orderings and removes votes on its comments
+    response = await reloaded._handle_topic_operations(
+        Event(
+            event_name="forum.topic.delete",
+            source_id="alice",
+            payload={"action": "delete", "topic_id": first},
+        )
+    )
+    assert response.success
+    assert "carol" not in reloaded.user_votes or not reloaded.user_votes["carol"]
+
+    reloaded = _forum_mod(temp_workspace)
+    assert list(reloaded.topics) == [second]
+    assert reloaded.topic_order_recent == [second]
+    assert reloaded.topic_order_popular == [second]
+    assert "carol" not in reloaded.user_votes
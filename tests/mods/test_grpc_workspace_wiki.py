@@ -26,6 +26,7 @@ from openagents.core.client import AgentClient
 from openagents.core.network import create_network
 from openagents.launchers.network_launcher import load_network_config
 from openagents.models.event import Event
+from openagents.models.event_response import EventResponse
 from openagents.mods.workspace.wiki import WikiAgentAdapter, WikiNetworkMod
 
 
@@ -668,30 +669,17 @@ class TestWikiAgentAdapter:
     async def test_create_wiki_page_call(self):
         """Test calling create_wiki_page method."""
         # Mock successful response
-        self.adapter.completed_requests["test_event"] = {
-            "success": True,
-            "page_path": "test/page",
-        }
-
-        # Mock the event ID generation to return predictable value
-        import uuid
-
-        original_uuid4 = uuid.uuid4
-        uuid.uuid4 = lambda: type(
-            "MockUUID", (), {"__str__": lambda self: "test_event"}
-        )()
-
-        try:
-            # Call the method
-            result = await self.adapter.create_wiki_page(
-                "test/page", "Test Page", "# Test\n\nContent"
-            )
+        self.mock_connector.send_event.return_value = EventResponse(
+            success=True, data={"page_path": "test/page"}
+        )
+
+        # Call the method
+        result = await self.adapter.create_wiki_page(
+            "test/page", "Test Page", "# Test\n\nContent"
+        )
 
-            # Verify connector was called
-            assert self.mock_connector.send_event.called
+        # Verify connector was called
+        assert self.mock_connector.send_event.called
 
-            # Verify result
-            assert result == "test/page"
-        finally:
-            # Restore original uuid4
-            uuid.uuid4 = original_uuid4
+        # Verify result
+        assert result == "test/page"
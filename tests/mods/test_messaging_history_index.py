@@ -0,0 +1,169 @@
+"""
+Test cases for the indexed message history of the messaging mod.
+
+Verifies that paginated channel and direct message retrieval through the indexes
+returns the same messages, in the same order, as a scan of the whole history.
+"""
+
+import random
+
+import pytest
+
+from openagents.mods.workspace.messaging.message_index import MessageHistory
+from openagents.mods.workspace.messaging.mod import ThreadMessagingNetworkMod
+from openagents.models.event import Event
+
+
+def _scan_channel(history, channel):
+    """Reference implementation: scan the history for a channel's messages."""
+    found = []
+    for msg_id, msg in history.items():
+        payload = msg.payload
+        if payload and "channel" in payload:
+            message_type = payload.get("message_type", "")
+            matches = payload["channel"] == channel and (
+                "channel" in message_type
+                or message_type in ("reply", "reply_message")
+            )
+        elif msg.event_name and "channel" in msg.event_name:
+            destination = msg.destination_id
+            if destination and destination.startswith("channel:"):
+                matches = destination.split(":", 1)[1] == channel
+            else:
+                matches = True
+        else:
+            matches = False
+        if matches:
+            found.append((msg.timestamp, msg_id))
+    found.sort(key=lambda item: item[0], reverse=True)
+    return [msg_id for _, msg_id in found]
+
+
+def _scan_conversation(history, agent_id, other_agent_id):
+    """Reference implementation: scan the history for direct messages between two agents."""
+    found = []
+    for msg_id, msg in history.items():
+        payload = msg.payload
+        if (
+            payload
+            and "target_agent_id" in payload
+            and msg.destination_id
+            and msg.destination_id.startswith("agent:")
+        ):
+            target = payload["target_agent_id"]
+            if (msg.source_id, target) in (
+                (agent_id, other_agent_id),
+                (other_agent_id, agent_id),
+            ):
+                found.append((msg.timestamp, msg_id))
+    found.sort(key=lambda item: item[0])
+    return [msg_id for _, msg_id in found]
+
+
+def _random_message(rng, index):
+    agents = ["alice", "bob", "carol"]
+    source = rng.choice(agents)
+    timestamp = 1000 + rng.randint(0, 30)  # Plenty of equal timestamps
+    kind = rng.random()
+    if kind < 0.45:
+        channel = rng.choice(["general", "dev"])
+        message_type = rng.choice(["channel_message", "reply_message", "other"])
+        return Event(
+            event_name="thread.channel_message.post",
+            source_id=source,
+            destination_id=f"channel:{channel}",
+            payload={"channel": channel, "message_type": message_type, "index": index},
+            timestamp=timestamp,
+        )
+    if kind < 0.9:
+        target = rng.choice(agents)
+        return Event(
+            event_name="thread.direct_message.send",
+            source_id=source,
+            destination_id=f"agent:{target}",
+            payload={"target_agent_id": target, "index": index},
+            timestamp=timestamp,
+        )
+    return Event(
+        event_name="thread.file.upload",
+        source_id=source,
+        payload={"index": index},
+        timestamp=timestamp,
+    )
+
+
+def test_index_matches_scan_through_updates():
+    rng = random.Random(7)
+    history = MessageHistory()
+    for index in range(400):
+        message = _random_message(rng, index)
+        history[message.event_id] = message
+        if index % 5 == 0:
+            del history[rng.choice(list(history.keys()))]
+
+    for channel in ["general", "dev", "missing"]:
+        expected = _scan_channel(history, channel)
+        for offset, limit in [(0, 10), (7, 25), (0, 1000), (len(expected), 5)]:
+            page, total = history.channel_page(channel, offset, limit)
+            assert total == len(expected)
+            assert page == expected[offset : offset + limit]
+
+    for agent_id, other_agent_id in [("alice", "bob"), ("bob", "alice"), ("carol", "carol")]:
+        expected = _scan_conversation(history, agent_id, other_agent_id)
+        for offset, limit in [(0, 10), (3, 20), (0, 1000)]:
+            page, total = history.conversation_page(agent_id, other_agent_id, offset, limit)
+            assert total == len(expected)
+            assert page == expected[offset : offset + limit]
+
+
+def test_channel_event_without_channel_matches_every_channel():
+    history = MessageHistory()
+    targeted = Event(
+        event_name="thread.channel_message.post",
+        source_id="alice",
+        destination_id="channel:general",
+        payload={"channel": "general", "message_type": "channel_message"},
+        timestamp=1,
+    )
+    untargeted = Event(event_name="thread.channel_message.notify", source_id="bob", timestamp=2)
+    history[targeted.event_id] = targeted
+    history[untargeted.event_id] = untargeted
+
+    assert history.channel_page("general", 0, 10) == ([untargeted.event_id, targeted.event_id], 2)
+    assert history.channel_page("dev", 0, 10) == ([untargeted.event_id], 1)
+
+    history.clear()
+    assert history.channel_page("general", 0, 10) == ([], 0)
+
+
+def test_mod_retrieval_uses_index():
+    mod = ThreadMessagingNetworkMod()
+    mod.channels["general"] = {"name": "general"}
+    for index in range(5):
+        message = Event(
+            event_name="thread.channel_message.post",
+            source_id="alice",
+            destination_id="channel:general",
+            payload={
+                "channel": "general",
+                "message_type": "channel_message",
+                "content": {"text": f"message {index}"},
+            },
+            timestamp=1000 + index,
+        )
+        mod.message_history[message.event_id] = message
+
+    request = Event(
+        event_name="thread.channel_messages.retrieve",
+        source_id="bob",
+        payload={"channel": "general", "limit": 2, "offset": 1},
+    )
+    response = mod._handle_channel_messages_retrieval(request)
+
+    assert response["success"]
+    assert response["total_count"] == 5
+    assert response["has_more"]
+    assert [msg["content"]["text"] for msg in response["messages"]] == [
+        "message 3",
+        "message 2",
+    ]
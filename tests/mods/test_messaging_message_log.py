@@ -0,0 +1,145 @@
+"""
+Test cases for the messaging mod's append-only message log.
+
+Tests that message history is persisted as a snapshot plus a replayed change
+log, that compaction truncates the log, and that archiving writes new daily
+segments without rewriting existing ones.
+"""
+
+import gzip
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from openagents.mods.workspace.messaging.message_log import (
+    LOG_FILE_NAME,
+    SNAPSHOT_FILE_NAME,
+)
+from openagents.mods.workspace.messaging.message_storage_helper import (
+    MessageStorageConfig,
+    MessageStorageHelper,
+)
+from openagents.models.event import Event
+
+
+@pytest.fixture
+def temp_workspace():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def _helper(workspace: Path, **config) -> MessageStorageHelper:
+    return MessageStorageHelper(lambda: workspace, MessageStorageConfig(**config))
+
+
+def _message(index: int, timestamp: int = None) -> Event:
+    return Event(
+        event_name="thread.channel_message",
+        source_id="agent_a",
+        destination_id="channel:general",
+        payload={"text": f"Message {index}", "channel": "general"},
+        timestamp=timestamp or int(time.time()),
+    )
+
+
+def test_log_replays_puts_and_deletes(temp_workspace):
+    helper = _helper(temp_workspace)
+    messages = [_message(i) for i in range(3)]
+    helper.log_messages(messages)
+
+    messages[0].payload["reactions"] = {"like": ["agent_b"]}
+    helper.log_messages([messages[0]])
+    helper.log_deletions([messages[1].event_id])
+    helper.close()
+
+    assert not (temp_workspace / SNAPSHOT_FILE_NAME).exists()
+    with open(temp_workspace / LOG_FILE_NAME) as f:
+        assert len(f.readlines()) == 5
+
+    history = _helper(temp_workspace).load_message_history()
+    assert set(history) == {messages[0].event_id, messages[2].event_id}
+    assert history[messages[0].event_id].payload["reactions"] == {"like": ["agent_b"]}
+
+
+def test_compaction_writes_snapshot_and_truncates_log(temp_workspace):
+    helper = _helper(temp_workspace, log_compaction_records=2)
+    messages = {message.event_id: message for message in (_message(0), _message(1))}
+    helper.log_messages(messages.values())
+    assert helper.should_compact_log(len(messages))
+    # The threshold grows with the history
+    assert not helper.should_compact_log(3)
+
+    helper.save_message_history(messages)
+    assert not helper.should_compact_log()
+    assert (temp_workspace / LOG_FILE_NAME).stat().st_size == 0
+
+    extra = _message(2)
+    helper.log_messages([extra])
+    helper.close()
+
+    history = _helper(temp_workspace).load_message_history()
+    assert set(history) == set(messages) | {extra.event_id}
+
+
+def test_replay_skips_torn_record(temp_workspace):
+    helper = _helper(temp_workspace)
+    message = _message(0)
+    helper.log_messages([message])
+    helper.close()
+
+    with open(temp_workspace / LOG_FILE_NAME, "a") as f:
+        f.write('{"op": "put", "id": "torn", "mess')
+
+    history = _helper(temp_workspace).load_message_history()
+    assert list(history) == [message.event_id]
+
+
+def test_archiving_appends_daily_segments(temp_workspace):
+    helper = _helper(temp_workspace)
+    timestamp = int(time.time()) - 3 * 24 * 3600
+    first, second = _message(0, timestamp), _message(1, timestamp)
+    history = {first.event_id: first, second.event_id: second}
+
+    helper.archive_messages_by_date([first.event_id], history)
+    archive_dir = temp_workspace / "daily_archives"
+    (first_segment,) = archive_dir.glob("*.json.gz")
+    first_mtime = first_segment.stat().st_mtime_ns
+
+    helper.archive_messages_by_date([second.event_id], history)
+    segments = sorted(archive_dir.glob("*.json.gz"))
+    assert len(segments) == 2
+    assert first_segment.stat().st_mtime_ns == first_mtime
+
+    archived = {}
+    for segment in segments:
+        with gzip.open(segment, "rt") as f:
+            archived.update(json.load(f))
+    assert set(archived) == set(history)
+
+
+def test_expired_archive_segments_are_removed(temp_workspace):
+    archive_dir = temp_workspace / "daily_archives"
+    archive_dir.mkdir()
+    for name in ("2020-01-01.json.gz", "2020-01-01.1.json.gz"):
+        with gzip.open(archive_dir / name, "wt") as f:
+            json.dump({}, f)
+
+    _helper(temp_workspace, archive_retention_days=7).cleanup_expired_archives()
+    assert list(archive_dir.glob("*.json.gz")) == []
+
+
+@pytest.mark.asyncio
+async def test_writes_run_off_the_event_loop(temp_workspace):
+    helper = _helper(temp_workspace)
+    message = _message(0)
+    helper.log_messages([message])
+    helper.flush()
+
+    assert helper._writer is not None
+    assert (temp_workspace / LOG_FILE_NAME).stat().st_size > 0
+    helper.close()
+
+    assert list(_helper(temp_workspace).load_message_history()) == [message.event_id]
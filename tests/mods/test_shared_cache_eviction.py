@@ -0,0 +1,215 @@
+"""
+Test cases for shared cache expiry, eviction and journaled persistence.
+
+Tests that entries expire lazily on read and through the sweeper, that agents
+are notified of expired and evicted entries, that the entry and byte budgets
+evict the least recently used entries, that changes
+are appended to the journal and replayed on restart, and that statistics are
+reported through get_state.
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openagents.mods.core.shared_cache.cache_journal import JOURNAL_FILE_NAME
+from openagents.mods.core.shared_cache.mod import SharedCacheMod
+from openagents.models.event import Event
+
+
+@pytest.fixture
+def temp_workspace():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def _cache_mod(workspace: Path, **config) -> SharedCacheMod:
+    mod = SharedCacheMod()
+    network = MagicMock()
+    network.network_id = "test-network"
+    network.process_event = AsyncMock()
+    network.topology.agent_registry = {"agent-1": None, "agent-2": None}
+    network.topology.agent_group_membership = {}
+    mod._network = network
+    mod.get_storage_path = lambda: workspace
+    mod.update_config(config)
+    mod._setup_cache_storage()
+    return mod
+
+
+async def _create(mod: SharedCacheMod, value: str, **payload) -> str:
+    response = await mod._handle_cache_create(
+        Event(
+            event_name="shared_cache.create",
+            source_id="agent-1",
+            payload={"value": value, **payload},
+        )
+    )
+    assert response.success, response.message
+    return response.data["cache_id"]
+
+
+async def _get(mod: SharedCacheMod, cache_id: str):
+    return await mod._handle_cache_get(
+        Event(
+            event_name="shared_cache.get",
+            source_id="agent-1",
+            payload={"cache_id": cache_id},
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_on_read_and_by_sweeper(temp_workspace):
+    mod = _cache_mod(temp_workspace, sweep_interval=0.05)
+    lazy_id = await _create(mod, "lazy", ttl=60)
+    swept_id = await _create(mod, "swept", ttl=60)
+    kept_id = await _create(mod, "kept")
+
+    # Move the clock past the TTL by backdating the expiry
+    mod.cache_entries[lazy_id].expires_at = int(time.time()) - 1
+    assert not (await _get(mod, lazy_id)).success
+
+    mod.cache_entries[swept_id].expires_at = int(time.time()) - 1
+    mod._expiry_heap = [(int(time.time()) - 1, swept_id)]
+    await asyncio.sleep(0.2)
+
+    assert list(mod.cache_entries) == [kept_id]
+    assert mod.get_state()["expirations"] == 2
+
+    # Agents are told about expired entries
+    notified = [
+        (call.args[0].event_name, call.args[0].payload["cache_id"])
+        for call in mod.network.process_event.call_args_list
+    ]
+    assert ("shared_cache.notification.deleted", lazy_id) in notified
+    assert ("shared_cache.notification.deleted", swept_id) in notified
+    mod.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_expiry_drops_pending_update_notification(temp_workspace):
+    mod = _cache_mod(temp_workspace, notification_coalesce_window=0.05)
+    cache_id = await _create(mod, "v0", ttl=60)
+    for value in ("v1", "v2"):
+        response = await mod._handle_cache_update(
+            Event(
+                event_name="shared_cache.update",
+                source_id="agent-1",
+                payload={"cache_id": cache_id, "value": value},
+            )
+        )
+        assert response.success
+
+    mod.cache_entries[cache_id].expires_at = int(time.time()) - 1
+    assert not (await _get(mod, cache_id)).success
+    await asyncio.sleep(0.1)
+
+    assert [
+        call.args[0].event_name for call in mod.network.process_event.call_args_list
+    ] == [
+        "shared_cache.notification.created",
+        "shared_cache.notification.updated",
+        "shared_cache.notification.deleted",
+    ]
+    mod.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_budgets_evict_least_recently_used(temp_workspace):
+    mod = _cache_mod(temp_workspace, max_entries=3, max_bytes=10)
+    first = await _create(mod, "aaa")
+    second = await _create(mod, "bbb")
+    third = await _create(mod, "ccc")
+
+    # Reading the first entry makes the second one the least recently used
+    assert (await _get(mod, first)).success
+    fourth = await _create(mod, "ddd")
+    assert list(mod.cache_entries) == [third, first, fourth]
+
+    # The byte budget evicts until the new entry fits
+    fifth = await _create(mod, "eeeeeee")
+    assert list(mod.cache_entries) == [fourth, fifth]
+    assert mod.total_bytes == 10
+
+    response = await mod._handle_cache_create(
+        Event(event_name="shared_cache.create", source_id="agent-1", payload={"value": "x" * 11})
+    )
+    assert not response.success
+
+    assert not (await _get(mod, second)).success
+    state = mod.get_state()
+    assert (state["hits"], state["misses"], state["evictions"]) == (1, 1, 3)
+
+    # Agents are told about evicted entries
+    notified = [
+        (call.args[0].event_name, call.kwargs["recipient_ids"])
+        for call in mod.network.process_event.call_args_list
+    ]
+    assert notified.count(
+        ("shared_cache.notification.deleted", {"agent-1", "agent-2"})
+    ) == 3
+    mod.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_changes_are_journaled_and_replayed(temp_workspace):
+    mod = _cache_mod(temp_workspace)
+    kept_id = await _create(mod, "kept", ttl=3600)
+    deleted_id = await _create(mod, "deleted")
+    await mod._handle_cache_update(
+        Event(
+            event_name="shared_cache.update",
+            source_id="agent-1",
+            payload={"cache_id": kept_id, "value": "updated"},
+        )
+    )
+    await mod._handle_cache_delete(
+        Event(
+            event_name="shared_cache.delete",
+            source_id="agent-1",
+            payload={"cache_id": deleted_id},
+        )
+    )
+
+    journal = temp_workspace / "shared_cache" / JOURNAL_FILE_NAME
+    assert len(journal.read_text().splitlines()) == 4
+    assert not (temp_workspace / "shared_cache" / "cache_data.json").exists()
+
+    # A restart without a clean shutdown replays the journal
+    restarted = _cache_mod(temp_workspace)
+    assert list(restarted.cache_entries) == [kept_id]
+    assert restarted.cache_entries[kept_id].value == "updated"
+    assert restarted.cache_entries[kept_id].expires_at is not None
+    assert journal.read_text() == ""
+    restarted.shutdown()
+    mod.journal.close()
+
+
+@pytest.mark.asyncio
+async def test_journal_is_compacted(temp_workspace):
+    mod = _cache_mod(temp_workspace, journal_compaction_records=3)
+    for i in range(4):
+        await _create(mod, f"value-{i}")
+
+    journal = temp_workspace / "shared_cache" / JOURNAL_FILE_NAME
+    assert len(journal.read_text().splitlines()) == 1
+    assert mod.get_state()["cache_count"] == 4
+
+    # The threshold grows to the number of entries, keeping snapshot rewrites amortized
+    cache_id = next(iter(mod.cache_entries))
+    for i in range(3):
+        response = await mod._handle_cache_update(
+            Event(
+                event_name="shared_cache.update",
+                source_id="agent-1",
+                payload={"cache_id": cache_id, "value": f"updated-{i}"},
+            )
+        )
+        assert response.success
+        assert len(journal.read_text().splitlines()) == (2 + i) % 4
+    mod.shutdown()
@@ -0,0 +1,136 @@
+"""
+Test cases for the shared cache adapter's local read-through cache.
+
+Tests that repeated reads are served locally, that notifications and the
+agent's own writes invalidate local entries, that entries are revalidated by
+version after a reconnect, and that the local cache stays within its size.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openagents.models.event import Event
+from openagents.mods.core.shared_cache.adapter import SharedCacheAdapter
+from openagents.mods.core.shared_cache.mod import SharedCacheMod
+
+
+@pytest.fixture
+def cache_mod():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        mod = SharedCacheMod()
+        network = MagicMock()
+        network.network_id = "test-network"
+        network.process_event = AsyncMock()
+        network.topology.agent_registry = {"agent-1": None, "agent-2": None}
+        network.topology.agent_group_membership = {}
+        mod._network = network
+        mod.get_storage_path = lambda: Path(temp_dir)
+        mod._setup_cache_storage()
+        yield mod
+        mod.shutdown()
+
+
+def _adapter(cache_mod: SharedCacheMod, agent_id: str, **config) -> SharedCacheAdapter:
+    handlers = {
+        "shared_cache.create": cache_mod._handle_cache_create,
+        "shared_cache.get": cache_mod._handle_cache_get,
+        "shared_cache.update": cache_mod._handle_cache_update,
+        "shared_cache.delete": cache_mod._handle_cache_delete,
+    }
+
+    async def send_event(event: Event):
+        return await handlers[event.event_name](event)
+
+    connector = AsyncMock()
+    connector.send_event.side_effect = send_event
+
+    adapter = SharedCacheAdapter(mod_config=config)
+    adapter.bind_agent(agent_id)
+    adapter.bind_connector(connector)
+    return adapter
+
+
+def _sent_payloads(adapter: SharedCacheAdapter):
+    return [
+        call.args[0].payload
+        for call in adapter.connector.send_event.call_args_list
+        if call.args[0].event_name == "shared_cache.get"
+    ]
+
+
+def _notification(cache_mod: SharedCacheMod, agent_id: str, event_name: str) -> Event:
+    for call in reversed(cache_mod.network.process_event.call_args_list):
+        event = call.args[0]
+        if event.event_name == event_name and agent_id in call.kwargs["recipient_ids"]:
+            return event
+    raise AssertionError(f"no {event_name} notification for {agent_id}")
+
+
+@pytest.mark.asyncio
+async def test_reads_are_served_locally_until_notified(cache_mod):
+    writer = _adapter(cache_mod, "agent-1")
+    reader = _adapter(cache_mod, "agent-2", local_cache_size=10)
+    cache_id = await writer.create_cache("v1")
+
+    assert (await reader.get_cache(cache_id))["value"] == "v1"
+    assert (await reader.get_cache(cache_id))["value"] == "v1"
+    assert len(_sent_payloads(reader)) == 1
+    assert reader.local_stats["hits"] == 1
+
+    # The update notification drops the local copy
+    assert await writer.update_cache(cache_id, "v2")
+    await reader.process_incoming_event(
+        _notification(cache_mod, "agent-2", "shared_cache.notification.updated")
+    )
+    entry = await reader.get_cache(cache_id)
+    assert (entry["value"], entry["version"]) == ("v2", 2)
+    assert len(_sent_payloads(reader)) == 2
+
+    # The agent's own writes drop the local copy without a notification
+    assert await reader.delete_cache(cache_id)
+    assert await reader.get_cache(cache_id) is None
+    assert cache_id not in reader.local_cache
+
+
+@pytest.mark.asyncio
+async def test_entries_are_revalidated_after_reconnect(cache_mod):
+    writer = _adapter(cache_mod, "agent-1")
+    reader = _adapter(cache_mod, "agent-2", local_cache_size=10)
+    cache_id = await writer.create_cache("v1")
+    await reader.get_cache(cache_id)
+
+    # Unchanged entries are confirmed without resending the value
+    reader.on_disconnect()
+    reader.on_connect()
+    assert (await reader.get_cache(cache_id))["value"] == "v1"
+    assert _sent_payloads(reader)[-1] == {"cache_id": cache_id, "if_version": 1}
+    assert reader.local_stats["revalidations"] == 1
+    assert (await reader.get_cache(cache_id))["value"] == "v1"
+    assert len(_sent_payloads(reader)) == 2
+
+    # An update missed while disconnected is picked up on revalidation
+    reader.on_disconnect()
+    assert await writer.update_cache(cache_id, "v2")
+    reader.on_connect()
+    assert (await reader.get_cache(cache_id))["value"] == "v2"
+    assert reader.local_stats["revalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_local_cache_is_bounded_and_opt_in(cache_mod):
+    writer = _adapter(cache_mod, "agent-1")
+    reader = _adapter(cache_mod, "agent-2", local_cache_size=2)
+    cache_ids = [await writer.create_cache(f"value-{i}") for i in range(3)]
+    for cache_id in cache_ids:
+        await reader.get_cache(cache_id)
+
+    assert list(reader.local_cache) == cache_ids[1:]
+
+    uncached = _adapter(cache_mod, "agent-2")
+    await uncached.get_cache(cache_ids[0])
+    await uncached.get_cache(cache_ids[0])
+    assert len(_sent_payloads(uncached)) == 2
+    assert not uncached.local_cache
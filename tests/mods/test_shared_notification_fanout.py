@@ -0,0 +1,165 @@
+"""
+Test cases for shared cache and shared artifact notification fan-out.
+
+Tests that the topology keeps a group members index in sync with agent group
+membership, that notifications are multicast once to the members of the
+allowed groups, and that rapid updates of the same entry are coalesced.
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openagents.core.topology import CentralizedTopology
+from openagents.models.event import Event
+from openagents.models.network_config import AgentGroupConfig, NetworkConfig
+from openagents.mods.core.shared_cache.mod import SharedCacheMod
+from openagents.mods.workspace.shared_artifact.mod import SharedArtifactMod
+
+
+@pytest.fixture
+def topology():
+    config = NetworkConfig(
+        name="FanoutTestNetwork",
+        default_agent_group="guests",
+        agent_groups={
+            "editors": AgentGroupConfig(password_hash="editors_hash"),
+            "viewers": AgentGroupConfig(password_hash="viewers_hash"),
+        },
+    )
+    topology = CentralizedTopology("test-node", config)
+    for agent_id, group in [
+        ("editor-1", "editors"),
+        ("editor-2", "editors"),
+        ("viewer-1", "viewers"),
+        ("guest-1", "guests"),
+    ]:
+        topology._assign_agent_to_group(agent_id, {}, group, f"{group}_hash")
+        topology.agent_registry[agent_id] = MagicMock()
+    return topology
+
+
+@pytest.fixture
+def temp_workspace():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def _bind(mod, topology, workspace: Path, **config):
+    network = MagicMock()
+    network.network_id = "test-network"
+    network.process_event = AsyncMock()
+    network.topology = topology
+    mod._network = network
+    mod.get_storage_path = lambda: workspace
+    mod.update_config(config)
+    return mod
+
+
+def _notifications(mod):
+    return [
+        (call.args[0].event_name, call.kwargs["recipient_ids"])
+        for call in mod.network.process_event.call_args_list
+    ]
+
+
+def test_group_members_index_follows_membership(topology):
+    assert topology.get_group_members("editors") == {"editor-1", "editor-2"}
+
+    topology._assign_agent_to_group("editor-2", {}, "viewers", "viewers_hash")
+    assert topology.get_group_members("editors") == {"editor-1"}
+    assert topology.get_group_members("viewers") == {"viewer-1", "editor-2"}
+
+    asyncio.run(topology.cleanup_agent("editor-1"))
+    assert topology.get_group_members("editors") == set()
+    assert "editors" not in topology.agent_group_members
+
+
+@pytest.mark.asyncio
+async def test_notifications_are_multicast_to_allowed_groups(topology, temp_workspace):
+    cache_mod = _bind(SharedCacheMod(), topology, temp_workspace)
+    cache_mod._setup_cache_storage()
+    await cache_mod._handle_cache_create(
+        Event(
+            event_name="shared_cache.create",
+            source_id="editor-1",
+            payload={"value": "v1", "allowed_agent_groups": ["editors", "viewers"]},
+        )
+    )
+    await cache_mod._handle_cache_create(
+        Event(event_name="shared_cache.create", source_id="editor-1", payload={"value": "v2"})
+    )
+    assert _notifications(cache_mod) == [
+        ("shared_cache.notification.created", {"editor-2", "viewer-1"}),
+        ("shared_cache.notification.created", {"editor-2", "viewer-1", "guest-1"}),
+    ]
+    cache_mod.shutdown()
+
+    artifact_mod = _bind(SharedArtifactMod(), topology, temp_workspace)
+    artifact_mod._setup_artifact_storage()
+    await artifact_mod._handle_artifact_create(
+        Event(
+            event_name="shared_artifact.create",
+            source_id="viewer-1",
+            payload={"content": "report", "allowed_agent_groups": ["editors"]},
+        )
+    )
+    assert _notifications(artifact_mod) == [
+        ("shared_artifact.notification.created", {"editor-1", "editor-2"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rapid_updates_are_coalesced(topology, temp_workspace):
+    mod = _bind(
+        SharedCacheMod(), topology, temp_workspace, notification_coalesce_window=0.05
+    )
+    mod._setup_cache_storage()
+    response = await mod._handle_cache_create(
+        Event(
+            event_name="shared_cache.create",
+            source_id="editor-1",
+            payload={"value": "v0", "allowed_agent_groups": ["editors"]},
+        )
+    )
+    cache_id = response.data["cache_id"]
+
+    async def update(agent_id: str, value: str):
+        await mod._handle_cache_update(
+            Event(
+                event_name="shared_cache.update",
+                source_id=agent_id,
+                payload={"cache_id": cache_id, "value": value},
+            )
+        )
+
+    # The first update is sent right away, the next ones once the window closes
+    for i in range(3):
+        await update("editor-1", f"v{i + 1}")
+    await update("editor-2", "v4")
+    assert len(_notifications(mod)) == 2
+    await asyncio.sleep(0.1)
+    assert _notifications(mod)[1:] == [
+        ("shared_cache.notification.updated", {"editor-2"}),
+        ("shared_cache.notification.updated", {"editor-1", "editor-2"}),
+    ]
+
+    # A deletion drops the pending update notification
+    await update("editor-1", "v5")
+    await update("editor-1", "v6")
+    await mod._handle_cache_delete(
+        Event(
+            event_name="shared_cache.delete",
+            source_id="editor-1",
+            payload={"cache_id": cache_id},
+        )
+    )
+    await asyncio.sleep(0.1)
+    assert [name for name, _ in _notifications(mod)[3:]] == [
+        "shared_cache.notification.updated",
+        "shared_cache.notification.deleted",
+    ]
+    mod.shutdown()
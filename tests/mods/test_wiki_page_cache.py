@@ -0,0 +1,153 @@
+"""
+Test cases for the wiki mod's cached page store.
+
+Tests that pages are served from memory once read, that listing and search use
+the page manifest instead of page bodies, that version histories are read per
+page on first use, that the manifest is appended to and compacted, and that a
+manifest missing from storage is rebuilt.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openagents.mods.workspace.wiki import mod as wiki_mod
+from openagents.mods.workspace.wiki.mod import PAGE_MANIFEST_FILE, WikiNetworkMod
+from openagents.models.event import Event
+
+
+@pytest.fixture
+def temp_workspace():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def _wiki_mod(workspace: Path) -> WikiNetworkMod:
+    mod = WikiNetworkMod()
+    mod.get_storage_path = lambda: workspace
+    mod._network = MagicMock()
+    mod._network.process_event = AsyncMock()
+    mod.initialize()
+    return mod
+
+
+async def _create_page(mod: WikiNetworkMod, page_path: str, content: str):
+    response = await mod._handle_wiki_page_create(
+        Event(
+            event_name="wiki.page.create",
+            source_id="alice",
+            payload={
+                "page_path": page_path,
+                "title": page_path.title(),
+                "wiki_content": content,
+                "category": "guides",
+            },
+        )
+    )
+    assert response.success
+
+
+async def _list_pages(mod: WikiNetworkMod):
+    response = await mod._handle_wiki_pages_list(
+        Event(event_name="wiki.pages.list", source_id="bob", payload={})
+    )
+    assert response.success
+    return response.data["pages"]
+
+
+@pytest.mark.asyncio
+async def test_reads_are_served_from_memory(temp_workspace):
+    mod = _wiki_mod(temp_workspace)
+    await _create_page(mod, "setup", "How to set things up")
+    await _create_page(mod, "deploy", "x" * 500)
+
+    mod._read_page = MagicMock(side_effect=AssertionError("page read from storage"))
+    mod._read_page_versions = MagicMock(
+        side_effect=AssertionError("versions read from storage")
+    )
+
+    assert mod.get_page("setup").content == "How to set things up"
+    assert {page["page_path"] for page in await _list_pages(mod)} == {"setup", "deploy"}
+    assert len(mod.get_page_versions("deploy")) == 1
+
+    response = await mod._handle_wiki_pages_search(
+        Event(event_name="wiki.pages.search", source_id="bob", payload={"query": "deploy"})
+    )
+    (result,) = response.data["pages"]
+    assert result["content_snippet"] == "x" * 200 + "..."
+
+    # Changing a returned page does not change the cache
+    mod.get_page("setup").content = "changed"
+    assert mod.get_page("setup").content == "How to set things up"
+
+
+@pytest.mark.asyncio
+async def test_startup_reads_only_the_manifest(temp_workspace):
+    mod = _wiki_mod(temp_workspace)
+    await _create_page(mod, "setup", "How to set things up")
+    await mod._handle_wiki_page_edit(
+        Event(
+            event_name="wiki.page.edit",
+            source_id="alice",
+            payload={"page_path": "setup", "wiki_content": "Updated steps"},
+        )
+    )
+
+    reloaded = WikiNetworkMod()
+    reloaded.get_storage_path = lambda: temp_workspace
+    reloaded._read_page = MagicMock(side_effect=AssertionError("page read on startup"))
+    assert reloaded.initialize()
+
+    (page,) = await _list_pages(reloaded)
+    assert page["wiki_content"] == "Updated steps"
+    assert page["current_version"] == 2
+    assert reloaded.get_state()["total_versions"] == 2
+    assert reloaded._version_cache == {}
+
+    del reloaded._read_page
+    assert reloaded.get_page("setup").content == "Updated steps"
+    assert [v.version_number for v in reloaded.get_page_versions("setup")] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_missing_manifest_is_rebuilt(temp_workspace):
+    mod = _wiki_mod(temp_workspace)
+    await _create_page(mod, "guides/setup", "How to set things up")
+    (temp_workspace / PAGE_MANIFEST_FILE).unlink()
+
+    reloaded = _wiki_mod(temp_workspace)
+    assert list(reloaded.manifest) == ["guides/setup"]
+    assert reloaded.manifest["guides/setup"]["version_count"] == 1
+    assert (temp_workspace / PAGE_MANIFEST_FILE).exists()
+
+
+@pytest.mark.asyncio
+async def test_manifest_is_appended_and_compacted(temp_workspace, monkeypatch):
+    monkeypatch.setattr(wiki_mod, "MANIFEST_COMPACTION_RECORDS", 4)
+    manifest_file = temp_workspace / PAGE_MANIFEST_FILE
+    mod = _wiki_mod(temp_workspace)
+    await _create_page(mod, "setup", "How to set things up")
+    await _create_page(mod, "deploy", "How to deploy")
+    line_counts = [len(manifest_file.read_text().splitlines())]
+
+    for index in range(3):
+        await mod._handle_wiki_page_edit(
+            Event(
+                event_name="wiki.page.edit",
+                source_id="alice",
+                payload={"page_path": "setup", "wiki_content": f"Step {index}"},
+            )
+        )
+        line_counts.append(len(manifest_file.read_text().splitlines()))
+
+    # Edits append records until the manifest is rewritten with one line per page
+    assert line_counts[1] > line_counts[0]
+    assert min(line_counts[1:]) == 2
+    assert max(line_counts) < 2 + wiki_mod.MANIFEST_COMPACTION_RECORDS
+
+    reloaded = _wiki_mod(temp_workspace)
+    assert reloaded.manifest["setup"]["current_version"] == 4
+    assert reloaded.manifest["setup"]["version_count"] == 4
+    assert reloaded.manifest["setup"]["content_preview"] == "Step 2"
@@ -0,0 +1,133 @@
+"""
+Test cases for bounded per-agent event queues.
+
+This module verifies the overflow policies of AgentEventQueue and that the event
+gateway reports overflows to senders and in its stats.
+"""
+
+import asyncio
+
+import pytest
+
+from openagents.core.agent_event_queue import (
+    AgentEventQueue,
+    COALESCED,
+    DROPPED_NEWEST,
+    DROPPED_OLDEST,
+    QUEUED,
+    REJECTED,
+)
+from openagents.core.event_envelope import EventEnvelope
+from openagents.models.event import Event
+from openagents.models.network_config import QueueOverflowPolicy
+
+
+def _event(index: int, coalesce_key: str = None) -> EventEnvelope:
+    metadata = {"coalesce_key": coalesce_key} if coalesce_key else {}
+    return EventEnvelope(
+        Event(
+            event_name="test.message",
+            source_id="sender",
+            payload={"index": index},
+            metadata=metadata,
+        )
+    )
+
+
+def _drain(queue: AgentEventQueue):
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait().event.payload["index"])
+    return events
+
+
+@pytest.mark.parametrize(
+    "policy, outcome, expected",
+    [
+        (QueueOverflowPolicy.DROP_OLDEST, DROPPED_OLDEST, [1, 2, 3]),
+        (QueueOverflowPolicy.DROP_NEWEST, DROPPED_NEWEST, [0, 1, 2]),
+        (QueueOverflowPolicy.REJECT, REJECTED, [0, 1, 2]),
+        # Without a coalesce key, coalescing falls back to dropping the oldest event
+        (QueueOverflowPolicy.COALESCE, DROPPED_OLDEST, [1, 2, 3]),
+    ],
+)
+def test_overflow_policies(policy, outcome, expected):
+    """A full queue stays at max_size and applies its overflow policy."""
+    queue = AgentEventQueue(max_size=3, overflow_policy=policy)
+    for index in range(3):
+        assert queue.offer(_event(index)) == QUEUED
+
+    assert queue.offer(_event(3)) == outcome
+    assert queue.qsize() == 3
+    assert queue.overflow_counts[outcome] == 1
+    assert _drain(queue) == expected
+
+
+def test_coalesce_replaces_event_with_same_key():
+    """The newest queued event with the same coalesce key is replaced in place."""
+    queue = AgentEventQueue(max_size=3, overflow_policy=QueueOverflowPolicy.COALESCE)
+    queue.offer(_event(0, "status"))
+    queue.offer(_event(1, "other"))
+    queue.offer(_event(2))
+
+    assert queue.offer(_event(3, "status")) == COALESCED
+    assert _drain(queue) == [3, 1, 2]
+
+
+def test_unbounded_queue_never_overflows():
+    queue = AgentEventQueue(max_size=0)
+    for index in range(100):
+        assert queue.offer(_event(index)) == QUEUED
+    assert queue.qsize() == 100
+
+
+@pytest.mark.asyncio
+async def test_requeue_puts_events_back_in_front():
+    """Undelivered events go back ahead of newer ones and wake a waiting poller."""
+    queue = AgentEventQueue(max_size=2)
+    taken = [_event(0), _event(1)]
+    queue.offer(_event(2))
+    queue.offer(_event(3))
+
+    queue.requeue(taken)
+    assert _drain(queue) == [0, 1, 2, 3]
+
+    waiter = asyncio.ensure_future(queue.get())
+    await asyncio.sleep(0)
+    queue.requeue([_event(4)])
+    assert (await asyncio.wait_for(waiter, 1)).event.payload["index"] == 4
+
+
+@pytest.mark.asyncio
+async def test_gateway_rejects_and_reports_overflow():
+    """Rejected deliveries fail the sender's event and are counted in get_stats()."""
+    from openagents.core.network import AgentNetwork
+    from openagents.models.network_config import NetworkConfig
+
+    network = AgentNetwork(
+        NetworkConfig(
+            name="AgentEventQueueNetwork",
+            agent_queue_max_size=2,
+            agent_queue_overflow_policy=QueueOverflowPolicy.REJECT,
+        ),
+        workspace_path=None,
+    )
+    gateway = network.event_gateway
+    gateway.register_agent("receiver")
+
+    for index in range(2):
+        assert await gateway.deliver_event(
+            Event(event_name="test.message", source_id="sender", destination_id="agent:receiver")
+        ) == []
+
+    rejected = await gateway.deliver_event(
+        Event(event_name="test.message", source_id="sender", destination_id="agent:broadcast")
+    )
+    assert rejected == ["receiver"]
+
+    stats = gateway.get_stats()
+    assert stats["queued_events"] == 2
+    assert stats["queue_overflows"] == {REJECTED: 1}
+    assert stats["agent_queue_overflows"] == {"receiver": {REJECTED: 1}}
+
+    assert len(await gateway.poll_events("receiver")) == 2
@@ -0,0 +1,55 @@
+"""
+Test cases for the processed event dedup window.
+
+This module verifies that EventDedupWindow suppresses duplicates and evicts the
+oldest event IDs by count and by age.
+"""
+
+from openagents.core.dedup_window import EventDedupWindow
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_duplicates_are_detected_and_counted():
+    window = EventDedupWindow(max_size=10)
+
+    assert window.check_and_add("event-1") is False
+    assert window.check_and_add("event-2") is False
+    assert window.check_and_add("event-1") is True
+
+    assert len(window) == 2
+    assert window.hits == 1
+    assert window.total_added == 2
+
+
+def test_count_bound_evicts_oldest_first():
+    window = EventDedupWindow(max_size=3)
+    for index in range(5):
+        window.check_and_add(f"event-{index}")
+
+    assert len(window) == 3
+    assert "event-0" not in window
+    assert "event-1" not in window
+    assert all(f"event-{index}" in window for index in range(2, 5))
+    assert window.evictions == 2
+
+
+def test_ttl_evicts_expired_ids():
+    clock = FakeClock()
+    window = EventDedupWindow(max_size=100, ttl=10.0, clock=clock)
+
+    window.check_and_add("old")
+    clock.now = 5.0
+    window.check_and_add("recent")
+    clock.now = 12.0
+
+    # "old" has expired and is accepted again; "recent" is still a duplicate
+    assert window.check_and_add("old") is False
+    assert window.check_and_add("recent") is True
+    assert window.get_stats()["hits"] == 1
@@ -0,0 +1,74 @@
+"""
+Test cases for shared event delivery envelopes.
+
+This module verifies that a fanned-out event is serialized once, that every
+recipient receives the same envelope and cached encodings, and that response
+bodies splice in the cached event JSON.
+"""
+
+import json
+
+import pytest
+
+from openagents.core.event_envelope import (
+    EventEnvelope,
+    SerializedEvent,
+    encode_json,
+    encode_json_object,
+)
+from openagents.models.event import Event
+
+
+def test_envelope_serializes_once():
+    envelope = EventEnvelope(
+        Event(event_name="test.message", source_id="sender", payload={"count": 3})
+    )
+
+    serialized = envelope.to_dict()
+    assert isinstance(serialized, SerializedEvent)
+    assert envelope.to_dict() is serialized
+    assert serialized.to_json() is serialized.to_json()
+    assert json.loads(encode_json(serialized))["payload"] == {"count": 3}
+
+
+def test_encode_json_plain_dict():
+    assert json.loads(encode_json({"a": 1})) == {"a": 1}
+
+
+def test_encode_json_object_splices_cached_events():
+    serialized = EventEnvelope(
+        Event(event_name="test.message", source_id="sender", payload={"count": 3})
+    ).to_dict()
+    serialized.to_json = lambda: '{"cached": true}'
+
+    body = encode_json_object({"success": True, "messages": [serialized, {"a": 1}]})
+    assert json.loads(body) == {
+        "success": True,
+        "messages": [{"cached": True}, {"a": 1}],
+    }
+    assert json.loads(encode_json_object({"messages": []})) == {"messages": []}
+    assert json.loads(encode_json_object({})) == {}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_shares_one_envelope():
+    """All recipients of a broadcast poll the same serialized event."""
+    from openagents.core.network import AgentNetwork
+    from openagents.models.network_config import NetworkConfig
+
+    network = AgentNetwork(NetworkConfig(name="EventEnvelopeNetwork"), workspace_path=None)
+    gateway = network.event_gateway
+    for agent_id in ["agent-a", "agent-b", "agent-c"]:
+        gateway.register_agent(agent_id)
+
+    await gateway.deliver_event(
+        Event(event_name="test.message", source_id="agent-a", destination_id="agent:broadcast")
+    )
+
+    envelopes_b = await gateway.poll_envelopes("agent-b")
+    envelopes_c = await gateway.poll_envelopes("agent-c")
+    assert len(envelopes_b) == len(envelopes_c) == 1
+    assert envelopes_b[0] is envelopes_c[0]
+    assert envelopes_b[0].to_dict() is envelopes_c[0].to_dict()
+    # The sender does not receive its own broadcast
+    assert await gateway.poll_envelopes("agent-a") == []
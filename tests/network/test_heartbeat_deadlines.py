@@ -0,0 +1,102 @@
+"""
+Test cases for heartbeat expiry tracking.
+
+This module verifies that HeartbeatDeadlines expires only agents whose deadline has
+passed, reschedules agents that sent heartbeats, and honours the grace period.
+"""
+
+import pytest
+
+from openagents.core.heartbeat_deadlines import HeartbeatDeadlines
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_expires_only_due_agents():
+    clock = FakeClock()
+    deadlines = HeartbeatDeadlines(timeout=10, clock=clock)
+    deadlines.touch("agent-a")
+    clock.now += 5
+    deadlines.touch("agent-b")
+
+    clock.now += 6
+    assert deadlines.pop_expired() == ["agent-a"]
+    assert "agent-a" not in deadlines
+    assert "agent-b" in deadlines
+    assert deadlines.next_deadline() == 1015.0
+
+
+def test_heartbeat_reschedules_deadline():
+    clock = FakeClock()
+    deadlines = HeartbeatDeadlines(timeout=10, clock=clock)
+    deadlines.touch("agent-a")
+    clock.now += 8
+    deadlines.touch("agent-a")
+
+    clock.now += 4
+    assert deadlines.pop_expired() == []
+    assert deadlines.get_stats()["rescheduled"] == 1
+
+    clock.now += 7
+    assert deadlines.pop_expired() == ["agent-a"]
+    assert deadlines.get_stats()["expired"] == 1
+
+
+def test_grace_period_delays_expiry():
+    clock = FakeClock()
+    deadlines = HeartbeatDeadlines(timeout=10, grace_period=5, clock=clock)
+    deadlines.touch("agent-a")
+
+    clock.now += 12
+    assert deadlines.pop_expired() == []
+    clock.now += 4
+    assert deadlines.pop_expired() == ["agent-a"]
+
+
+def test_removed_and_readded_agent_has_one_deadline():
+    clock = FakeClock()
+    deadlines = HeartbeatDeadlines(timeout=10, clock=clock)
+    deadlines.touch("agent-a")
+    deadlines.remove("agent-a")
+    clock.now += 5
+    deadlines.touch("agent-a")
+
+    clock.now += 6
+    assert deadlines.pop_expired() == []
+    assert deadlines.next_deadline() == 1015.0
+    clock.now += 5
+    assert deadlines.pop_expired() == ["agent-a"]
+    assert deadlines.next_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_topology_tracks_registered_agents():
+    """Registering, heartbeating and unregistering keep the deadlines in sync."""
+    from openagents.core.network import AgentNetwork
+    from openagents.models.network_config import NetworkConfig
+    from openagents.models.transport import AgentConnection, TransportType
+
+    network = AgentNetwork(
+        NetworkConfig(name="HeartbeatNetwork", agent_timeout=60, heartbeat_grace_period=5),
+        workspace_path=None,
+    )
+    topology = network.topology
+    assert topology.heartbeat_deadlines.expiry_after == 65
+
+    await topology.register_agent(
+        AgentConnection(agent_id="agent-a", transport_type=TransportType.HTTP)
+    )
+    assert "agent-a" in topology.heartbeat_deadlines
+
+    await topology.record_heartbeat("agent-a")
+    assert topology.heartbeat_deadlines.pop_expired() == []
+
+    await topology.unregister_agent("agent-a")
+    assert "agent-a" not in topology.heartbeat_deadlines
+    assert network.event_gateway.get_stats()["heartbeats"]["tracked_agents"] == 0
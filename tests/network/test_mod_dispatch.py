@@ -0,0 +1,128 @@
+"""
+Test cases for indexed mod dispatch.
+
+This module verifies that ModEventProcessor only awaits mods whose handlers can
+match an event, keeps first-responder-wins ordering, and rebuilds its dispatch
+table once invalidated after mods or handlers change.
+"""
+
+from collections import OrderedDict
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from openagents.core.base_mod import BaseMod, mod_event_handler
+from openagents.core.event_processor import ModEventProcessor
+from openagents.models.event import Event
+from openagents.models.event_response import EventResponse
+
+
+class ProjectMod(BaseMod):
+    def __init__(self, mod_name: str):
+        super().__init__(mod_name)
+        self.calls = []
+
+    @mod_event_handler("project.*")
+    async def handle_project(self, event: Event) -> Optional[EventResponse]:
+        self.calls.append(event.event_name)
+        return EventResponse(success=True, message=self.mod_name)
+
+
+class PassiveMod(BaseMod):
+    def __init__(self, mod_name: str):
+        super().__init__(mod_name)
+        self.calls = []
+
+    @mod_event_handler("project.run.*")
+    async def observe_run(self, event: Event) -> Optional[EventResponse]:
+        self.calls.append(event.event_name)
+        return None
+
+
+class CustomMod(BaseMod):
+    """Overrides process_event, so it must see every event."""
+
+    def __init__(self, mod_name: str):
+        super().__init__(mod_name)
+        self.calls = []
+
+    async def process_event(self, event: Event) -> Optional[EventResponse]:
+        self.calls.append(event.event_name)
+        return None
+
+
+def _event(event_name: str) -> Event:
+    return Event(event_name=event_name, source_id="agent-a")
+
+
+@pytest.mark.asyncio
+async def test_dispatch_skips_mods_without_matching_handlers():
+    passive = PassiveMod("passive")
+    custom = CustomMod("custom")
+    first = ProjectMod("first")
+    second = ProjectMod("second")
+    processor = ModEventProcessor(
+        OrderedDict([("passive", passive), ("custom", custom), ("first", first), ("second", second)])
+    )
+
+    assert [name for name, _ in processor.get_dispatch_mods("chat.message")] == ["custom"]
+    assert await processor.process_event(_event("chat.message")) is None
+
+    # First responder wins and later mods are not awaited
+    response = await processor.process_event(_event("project.run.started"))
+    assert response.message == "first"
+    assert passive.calls == ["project.run.started"]
+    assert custom.calls == ["chat.message", "project.run.started"]
+    assert second.calls == []
+
+
+@pytest.mark.asyncio
+async def test_dispatch_table_rebuilds_on_changes():
+    custom = CustomMod("custom")
+    mods = OrderedDict([("custom", custom)])
+    processor = ModEventProcessor(mods)
+
+    assert await processor.process_event(_event("project.created")) is None
+
+    # Changing the mods takes effect once the table is invalidated
+    mods["project"] = ProjectMod("project")
+    assert processor.get_dispatch_mods("project.created") == [("custom", custom)]
+    processor.invalidate_dispatch_table()
+    response = await processor.process_event(_event("project.created"))
+    assert response.message == "project"
+
+    # Registering a handler on a bound mod invalidates the network's table
+    network = MagicMock()
+    network.event_gateway.mod_event_processor = processor
+    mods["project"].bind_network(network)
+
+    async def handle_chat(event: Event) -> Optional[EventResponse]:
+        return EventResponse(success=True, message="chat")
+
+    mods["project"].register_event_handler(handle_chat, "chat.*")
+    response = await processor.process_event(_event("chat.message"))
+    assert response.message == "chat"
+
+    mods["project"].unregister_event_handler(handle_chat)
+    del mods["project"]
+    processor.invalidate_dispatch_table()
+    assert await processor.process_event(_event("chat.message")) is None
+
+
+def test_dispatch_tables_are_kept_per_processor():
+    first = ModEventProcessor(OrderedDict([("project", ProjectMod("project"))]))
+    other_mod = CustomMod("custom")
+    second = ModEventProcessor(OrderedDict([("custom", other_mod)]))
+    network = MagicMock()
+    network.event_gateway.mod_event_processor = second
+    other_mod.bind_network(network)
+
+    first.get_dispatch_mods("project.created")
+    table = first._dispatch_table
+
+    # Handler changes on another network's mods do not drop this table
+    other_mod.register_event_handler(other_mod.process_event, "chat.*")
+    assert second.mods_version == 1
+    first.get_dispatch_mods("project.created")
+    assert first._dispatch_table is table
@@ -0,0 +1,71 @@
+"""
+Test cases for multicast event delivery.
+
+This module verifies that an event processed with an explicit recipient set is
+delivered to exactly those agents, sharing one envelope between them.
+"""
+
+import pytest
+
+from openagents.core.network import AgentNetwork
+from openagents.models.event import Event
+from openagents.models.network_config import NetworkConfig
+
+
+@pytest.fixture
+def gateway():
+    network = AgentNetwork(
+        NetworkConfig(name="MulticastDeliveryNetwork"), workspace_path=None
+    )
+    gateway = network.event_gateway
+    for agent_id in ("alice", "bob", "carol", "dave"):
+        gateway.register_agent(agent_id)
+    return gateway
+
+
+@pytest.mark.asyncio
+async def test_multicast_delivers_to_recipients_only(gateway):
+    """The recipient set overrides the event's destination."""
+    gateway.create_channel("general")
+    for agent_id in ("alice", "bob", "carol", "dave"):
+        gateway.add_channel_member("general", agent_id)
+
+    event = Event(
+        event_name="thread.channel_message.notification",
+        source_id="alice",
+        destination_id="channel:general",
+        payload={"text": "hello"},
+    )
+    response = await gateway.process_event(event, recipient_ids={"bob", "carol"})
+    assert response.success
+
+    bob_envelopes = await gateway.poll_envelopes("bob")
+    carol_envelopes = await gateway.poll_envelopes("carol")
+    assert len(bob_envelopes) == 1
+    assert len(carol_envelopes) == 1
+    assert bob_envelopes[0] is carol_envelopes[0]
+    assert bob_envelopes[0].event.payload == {"text": "hello"}
+
+    assert await gateway.poll_events("alice") == []
+    assert await gateway.poll_events("dave") == []
+
+
+@pytest.mark.asyncio
+async def test_multicast_skips_unknown_recipients(gateway):
+    event = Event(event_name="test.message", source_id="alice")
+    response = await gateway.process_event(event, recipient_ids=["bob", "unknown"])
+    assert response.success
+
+    assert len(await gateway.poll_events("bob")) == 1
+    assert "unknown" not in gateway.agent_event_queues
+
+
+@pytest.mark.asyncio
+async def test_empty_recipient_set_delivers_nothing(gateway):
+    event = Event(
+        event_name="test.message", source_id="alice", destination_id="agent:broadcast"
+    )
+    await gateway.process_event(event, recipient_ids=[])
+
+    for agent_id in ("alice", "bob", "carol", "dave"):
+        assert await gateway.poll_events(agent_id) == []
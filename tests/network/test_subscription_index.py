@@ -0,0 +1,111 @@
+"""
+Test cases for the subscription routing index.
+
+This module verifies that SubscriptionIndex resolves the same subscriptions as
+EventSubscription.matches_event and that the event gateway keeps it in sync.
+"""
+
+import pytest
+
+from openagents.core.subscription_index import SubscriptionIndex
+from openagents.models.event import Event, EventSubscription, EventVisibility
+
+
+PATTERNS = [
+    "*",
+    "project.*",
+    "project.run.*",
+    "project.run.completed",
+    "proj*",
+    "channel.message*",
+    "channel.message.posted",
+    "agent.direct_message.sent",
+]
+
+EVENT_NAMES = [
+    "project.created",
+    "project.run.completed",
+    "project.run.failed",
+    "projects.archive.created",
+    "channel.message.posted",
+    "channel.messages.cleared",
+    "channel.joined",
+    "agent.direct_message.sent",
+]
+
+
+def test_index_matches_linear_scan():
+    """The index must return exactly the subscriptions that match_pattern would."""
+    index = SubscriptionIndex()
+    subscriptions = []
+    for i, pattern in enumerate(PATTERNS):
+        subscription = EventSubscription(agent_id=f"agent-{i}", event_patterns=[pattern])
+        subscriptions.append(subscription)
+        index.add(subscription)
+
+    for event_name in EVENT_NAMES:
+        event = Event(event_name=event_name, source_id="sender")
+        expected = {
+            s.agent_id for s in subscriptions
+            if any(event.matches_pattern(p) for p in s.event_patterns)
+        }
+        assert index.matching_agents(event_name) == expected, event_name
+
+
+def test_index_remove_prunes_matches():
+    """Removed subscriptions no longer match and shared nodes stay intact."""
+    index = SubscriptionIndex()
+    first = EventSubscription(agent_id="agent-1", event_patterns=["project.run.*"])
+    second = EventSubscription(agent_id="agent-2", event_patterns=["project.*", "project.run.completed"])
+    index.add(first)
+    index.add(second)
+
+    assert index.matching_agents("project.run.completed") == {"agent-1", "agent-2"}
+
+    index.remove(first.subscription_id)
+    assert index.matching_agents("project.run.completed") == {"agent-2"}
+    assert first.subscription_id not in index
+
+    index.remove(second.subscription_id)
+    assert index.matching_agents("project.run.completed") == set()
+    assert len(index) == 0
+
+
+@pytest.mark.asyncio
+async def test_gateway_delivery_uses_index():
+    """Gateway delivery honours index matches, active state and visibility."""
+    from openagents.core.network import AgentNetwork
+    from openagents.models.network_config import NetworkConfig
+
+    network = AgentNetwork(NetworkConfig(name="SubscriptionIndexNetwork"), workspace_path=None)
+    gateway = network.event_gateway
+    for agent_id in ["agent-a", "agent-b", "agent-c"]:
+        gateway.register_agent(agent_id)
+
+    gateway.subscribe("agent-a", ["code.*"])
+    inactive = gateway.subscribe("agent-b", ["code.review.*"])
+    inactive.is_active = False
+
+    await gateway.deliver_event(
+        Event(event_name="code.review.completed", source_id="sender", destination_id="agent:broadcast")
+    )
+    await gateway.deliver_event(
+        Event(
+            event_name="code.review.started",
+            source_id="sender",
+            destination_id="agent:broadcast",
+            visibility=EventVisibility.RESTRICTED,
+            allowed_agents={"agent-c"},
+        )
+    )
+
+    agent_a_events = await gateway.poll_events("agent-a")
+    assert [e.event_name for e in agent_a_events] == ["code.review.completed"]
+    assert await gateway.poll_events("agent-b") == []
+    # agent-c has no subscriptions and receives everything
+    assert len(await gateway.poll_events("agent-c")) == 2
+
+    gateway.unsubscribe_agent("agent-a")
+    assert len(gateway.subscription_index) == 1
+    await gateway.cleanup_agent("agent-b")
+    assert len(gateway.subscription_index) == 0
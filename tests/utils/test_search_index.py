@@ -0,0 +1,117 @@
+"""
+Tests for the incremental full-text search index.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from openagents.utils.search_index import SearchIndex, tokenize
+
+FIELDS = {"title": 2.0, "content": 1.0}
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory)
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex(FIELDS)
+    index.add("notes", {"title": "Release Notes", "content": "What changed"}, timestamp=1)
+    index.add("prep", {"title": "Planning", "content": "release preparation"}, timestamp=2)
+    index.add("other", {"title": "Security", "content": "Policies"}, timestamp=3)
+    return index
+
+
+def test_tokenize():
+    assert tokenize("Hello, World-42!") == ["hello", "world", "42"]
+    assert tokenize(["Tag One", "two"]) == ["tag", "one", "two"]
+    assert tokenize(None) == []
+
+
+def test_title_matches_rank_first(index):
+    assert index.search("release") == (["notes", "prep"], 2)
+
+
+def test_prefix_and_all_terms_must_match(index):
+    assert index.search("rel")[1] == 2
+    assert index.search("release prep") == (["prep"], 1)
+    assert index.search("release security") == ([], 0)
+
+
+def test_pagination(index):
+    assert index.search("release", offset=1, limit=1) == (["prep"], 2)
+    assert index.search("release", offset=5) == ([], 2)
+
+
+def test_edit_and_remove_update_postings(index):
+    index.add("notes", {"title": "Roadmap", "content": "Next quarter"})
+    assert index.search("release") == (["prep"], 1)
+    assert index.search("roadmap") == (["notes"], 1)
+
+    index.remove("prep")
+    assert index.search("release") == ([], 0)
+    assert "prep" not in index
+
+
+def test_group_filtering():
+    index = SearchIndex(FIELDS)
+    index.add("public", {"title": "Budget"})
+    index.add("private", {"title": "Budget"}, allowed_groups=["finance"], owner_id="alice")
+
+    assert index.search("budget")[0] == ["public"]
+    assert sorted(index.search("budget", groups=["finance"])[0]) == ["private", "public"]
+    assert sorted(index.search("budget", agent_id="alice")[0]) == ["private", "public"]
+
+
+def test_accept_filter(index):
+    assert index.search("release", accept=lambda doc_id: doc_id != "notes") == (
+        ["prep"],
+        1,
+    )
+
+
+def test_persistence_replays_log_and_snapshot(temp_dir):
+    index = SearchIndex(FIELDS, storage_dir=temp_dir, compaction_records=3)
+    index.add("a", {"title": "Alpha"})
+    index.add("b", {"title": "Beta"}, allowed_groups=["team"])
+    index.add("c", {"title": "Gamma"})  # triggers compaction
+    index.remove("a")
+
+    assert (temp_dir / "search_index.json").exists()
+    assert len((temp_dir / "search_index.log.jsonl").read_text().splitlines()) == 1
+
+    reloaded = SearchIndex(FIELDS, storage_dir=temp_dir)
+    assert reloaded.load()
+    assert reloaded.document_ids() == {"b", "c"}
+    assert reloaded.search("beta") == ([], 0)
+    assert reloaded.search("beta", groups=["team"]) == (["b"], 1)
+
+
+def test_changed_fields_discard_persisted_index(temp_dir):
+    index = SearchIndex(FIELDS, storage_dir=temp_dir)
+    index.add("a", {"title": "Alpha"})
+    index.save()
+
+    assert not SearchIndex({"title": 1.0}, storage_dir=temp_dir).load()
+
+
+def test_reconcile(index):
+    missing = index.reconcile(["notes", "new"])
+    assert missing == {"new"}
+    assert index.document_ids() == {"notes"}
+
+
+def test_prefix_matches_every_expansion():
+    index = SearchIndex(FIELDS)
+    for i in range(100):
+        index.add(f"r{i:03d}", {"title": f"report{i:03d}"}, timestamp=i)
+    index.add("reporting", {"title": "reporting"}, timestamp=100)
+
+    doc_ids, total = index.search("report", limit=200)
+    assert total == 101
+    assert "reporting" in doc_ids
@@ -23,6 +23,7 @@ from typing import List, Dict, Any, Callable
 
 from openagents.core.client import AgentClient
 from openagents.core.network import create_network
+from openagents.core.dedup_window import EventDedupWindow
 from openagents.launchers.network_launcher import load_network_config
 from openagents.core.workspace import Workspace
 from openagents.agents.worker_agent import (
@@ -54,7 +55,7 @@ class MockWorkerAgent(WorkerAgent):
         self._tools = []
         self._supported_mods = None
         self._running = False
-        self._processed_message_ids = set()
+        self._processed_message_ids = EventDedupWindow()
         self._interval = kwargs.get("interval", 1)
         self._ignored_sender_ids = set(kwargs.get("ignored_sender_ids", []))
 